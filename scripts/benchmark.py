@@ -0,0 +1,441 @@
+#!/usr/bin/env python
+"""
+Offscreen benchmark suite for startup and everyday interactions.
+
+Runs the real application headless (QT_QPA_PLATFORM=offscreen) against a
+throw-away config directory, measures the scenarios below, writes a JSON
+report and compares it with a stored baseline:
+
+    startup          time to MainWindow.show() and to its first paint
+                     (fresh process per run, through AppBootstrap)
+    theme_toggle     light <-> dark switch until the event queue is idle
+    language_toggle  ru <-> en switch until the event queue is idle
+    console_flush    GUI-thread time per second of traffic at 1k and 10k lines/s
+    search_100k      console search over 100k stored lines
+    export_8mb       log export of an 8 MB port history
+
+Usage:
+    python scripts/benchmark.py
+    python scripts/benchmark.py --only theme_toggle,search_100k
+    python scripts/benchmark.py --update-baseline
+    python scripts/benchmark.py --baseline other.json --output report.json --no-fail
+
+Exit status is 1 when a metric regressed past its tolerance.
+"""
+
+from __future__ import annotations
+
+import time
+
+_PROCESS_START = time.perf_counter()
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+REPORT_VERSION = 1
+DEFAULT_BASELINE = ROOT / "scripts" / "benchmark_baseline.json"
+# A metric regresses when it exceeds baseline * (1 + tolerance) + slack
+DEFAULT_TOLERANCE = 0.25
+DEFAULT_SLACK_MS = 2.0
+
+# Scenario sizes
+SEARCH_LINES = 100_000
+EXPORT_BYTES = 8 * 1024 * 1024
+FLUSH_RATES = (1_000, 10_000)
+FLUSH_SECONDS = 2.0
+TOGGLE_ROUNDS = 10
+
+
+@dataclass(slots=True)
+class Comparison:
+    metric: str
+    value: float
+    baseline: float | None
+    limit: float | None
+
+    @property
+    def regressed(self) -> bool:
+        return self.limit is not None and self.value > self.limit
+
+
+def compare(report: dict[str, Any], baseline: dict[str, Any]) -> list[Comparison]:
+    """Check every metric of ``report`` against ``baseline`` and its tolerances."""
+    base_metrics = baseline.get("metrics", {})
+    tolerances = baseline.get("tolerance", {})
+    default_tolerance = tolerances.get("default", DEFAULT_TOLERANCE)
+    slack = baseline.get("slack_ms", DEFAULT_SLACK_MS)
+    result = []
+    for metric, value in sorted(report["metrics"].items()):
+        base = base_metrics.get(metric)
+        limit = None
+        if base is not None:
+            limit = base * (1 + tolerances.get(metric, default_tolerance)) + slack
+        result.append(Comparison(metric, value, base, limit))
+    return result
+
+
+def format_comparison(rows: list[Comparison]) -> str:
+    lines = [f"{'metric':<34}{'value':>10}{'baseline':>10}{'limit':>10}"]
+    for row in rows:
+        base = f"{row.baseline:.1f}" if row.baseline is not None else "-"
+        limit = f"{row.limit:.1f}" if row.limit is not None else "-"
+        flag = "  REGRESSED" if row.regressed else ""
+        lines.append(f"{row.metric:<34}{row.value:>10.1f}{base:>10}{limit:>10}{flag}")
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Startup: one fresh interpreter per run
+# ---------------------------------------------------------------------------
+
+def _startup_probe() -> None:
+    """Child-process entry: boot the app, print show/first-paint times as JSON."""
+    from PySide6 import QtCore
+    from PySide6.QtWidgets import QApplication
+
+    from src.bootstrap.app_bootstrap import AppBootstrap
+
+    timings: dict[str, float] = {}
+    bootstrap = AppBootstrap(args=[sys.argv[0]])
+    show_main_window = bootstrap._show_main_window
+
+    class _FirstPaint(QtCore.QObject):
+        def eventFilter(self, obj, event):  # noqa: N802 - Qt override
+            if event.type() == QtCore.QEvent.Type.Paint and "first_paint_ms" not in timings:
+                timings["first_paint_ms"] = (time.perf_counter() - _PROCESS_START) * 1000
+                QtCore.QTimer.singleShot(0, QApplication.instance().quit)
+            return False
+
+    first_paint = _FirstPaint()
+
+    def shown(splash):
+        window = bootstrap._main_window
+        window.installEventFilter(first_paint)
+        show_main_window(splash)
+        timings["show_ms"] = (time.perf_counter() - _PROCESS_START) * 1000
+        # Offscreen windows without a paint request would never report one
+        QtCore.QTimer.singleShot(5000, QApplication.instance().quit)
+
+    bootstrap._show_main_window = shown
+    bootstrap.run()
+    if bootstrap._main_window is not None:
+        for viewmodel in bootstrap._main_window._port_viewmodels.values():
+            viewmodel.shutdown()
+    print(json.dumps(timings))
+
+
+def bench_startup(config_dir: Path, runs: int) -> dict[str, float]:
+    """Median of ``runs`` cold-process startups (the first run also warms disk caches)."""
+    samples: dict[str, list[float]] = {}
+    env = {**os.environ, "UART_CTRL_CONFIG_DIR": str(config_dir), "QT_QPA_PLATFORM": "offscreen"}
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, str(Path(__file__).resolve()), "--startup-probe"],
+            env=env, cwd=ROOT, capture_output=True, text=True, timeout=120, check=True,
+        ).stdout
+        probe = json.loads(output.strip().splitlines()[-1])
+        for key, value in probe.items():
+            samples.setdefault(key, []).append(value)
+    return {
+        "startup_show_ms": statistics.median(samples["show_ms"]),
+        "startup_first_paint_ms": statistics.median(samples.get("first_paint_ms", samples["show_ms"])),
+    }
+
+
+# ---------------------------------------------------------------------------
+# In-process scenarios on one MainWindow
+# ---------------------------------------------------------------------------
+
+class Session:
+    """A shown MainWindow plus helpers shared by the interaction scenarios."""
+
+    def __init__(self) -> None:
+        from PySide6.QtWidgets import QApplication
+
+        self.app = QApplication.instance() or QApplication([sys.argv[0]])
+        self.app.setStyle("Fusion")
+        from src.utils.theme_manager import theme_manager
+        from src.views.main_window import MainWindow
+
+        theme_manager.apply_theme(force=True)
+        self.window = MainWindow()
+        self.window.show()
+        self.idle()
+        self.console = self.window._console_panel
+        self.port = self.console._port_labels[0]
+
+    def idle(self) -> None:
+        """Drain posted events and zero-delay timers (deferred repolish, coalesced updates)."""
+        for _ in range(3):
+            self.app.processEvents()
+
+    def close(self) -> None:
+        for viewmodel in self.window._port_viewmodels.values():
+            viewmodel.shutdown()
+        self.window.close()
+        self.idle()
+
+
+def _median_ms(action: Callable[[], None], rounds: int) -> float:
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        action()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def bench_theme_toggle(session: Session) -> dict[str, float]:
+    from src.utils.theme_manager import theme_manager
+
+    original = theme_manager.get_theme()
+    themes = iter(["light", "dark"] * (TOGGLE_ROUNDS + 1))
+
+    def toggle() -> None:
+        theme_manager.set_theme(next(themes))
+        session.idle()
+
+    toggle(), toggle()  # warm-up: both compiled stylesheets cached
+    value = _median_ms(toggle, TOGGLE_ROUNDS)
+    theme_manager.set_theme(original)
+    session.idle()
+    return {"theme_toggle_ms": value}
+
+
+def bench_language_toggle(session: Session) -> dict[str, float]:
+    from src.utils.translator import translator
+
+    original = translator.get_language()
+    languages = iter(["en_US", "ru_RU"] * (TOGGLE_ROUNDS + 1))
+
+    def toggle() -> None:
+        translator.set_language(next(languages))
+        session.idle()
+
+    toggle(), toggle()
+    value = _median_ms(toggle, TOGGLE_ROUNDS)
+    translator.set_language(original)
+    session.idle()
+    return {"language_toggle_ms": value}
+
+
+def _line(index: int, width: int = 80) -> str:
+    return f"T={index:08d} V=3.30 I=0.10 ".ljust(width - 1, "x") + "\n"
+
+
+def bench_console_flush(session: Session) -> dict[str, float]:
+    """GUI-thread CPU per second of traffic and worst event-loop stall, per line rate."""
+    console, port = session.console, session.port
+    result = {}
+    tick = 0.01
+    for rate in FLUSH_RATES:
+        console.clear_all()
+        session.idle()
+        per_tick = max(1, int(rate * tick))
+        ticks = int(FLUSH_SECONDS / tick)
+        worst_lag = 0.0
+        cpu_start = time.thread_time()
+        start = time.perf_counter()
+        for index in range(ticks):
+            for offset in range(per_tick):
+                console.append_rx(port, _line(index * per_tick + offset))
+            due = start + (index + 1) * tick
+            while True:
+                session.app.processEvents()
+                now = time.perf_counter()
+                if now >= due:
+                    worst_lag = max(worst_lag, now - due)
+                    break
+                time.sleep(min(0.001, due - now))
+        console._flush_pending_updates()
+        cpu = time.thread_time() - cpu_start
+        label = f"{rate // 1000}k"
+        result[f"console_flush_{label}_cpu_ms_per_s"] = cpu * 1000 / FLUSH_SECONDS
+        result[f"console_flush_{label}_max_stall_ms"] = worst_lag * 1000
+    console.clear_all()
+    session.idle()
+    return result
+
+
+def _fill_console(session: Session, lines: int) -> None:
+    console, port = session.console, session.port
+    console.clear_all()
+    batch = 1000
+    for first in range(0, lines, batch):
+        for index in range(first, min(lines, first + batch)):
+            console.append_rx(port, _line(index, 84) if index % 100 else _line(index, 76) + "needle\n")
+        console._flush_pending_updates()
+    session.idle()
+
+
+def bench_search(session: Session) -> dict[str, float]:
+    console = session.console
+    _fill_console(session, SEARCH_LINES)
+
+    def search() -> None:
+        console._search_text = "needle"
+        console._perform_search()
+
+    value = _median_ms(search, 3)
+    matches = len(console._search_results)
+    console._search_text = ""
+    console._perform_search()
+    return {"search_100k_ms": value, "search_100k_matches": float(matches)}
+
+
+def bench_export(session: Session, target: Path) -> dict[str, float]:
+    from src.utils.log_exporter import ExportRequest
+
+    console, port = session.console, session.port
+    history = console._history_files.get(port)
+    if history is None or len(history.read_all().encode("utf-8")) < EXPORT_BYTES * 0.9:
+        _fill_console(session, SEARCH_LINES)
+    request = ExportRequest(
+        target_dir=target,
+        chunk_bytes=EXPORT_BYTES,
+        port_files={port: console._history_files[port]._path},
+        include_history=True,
+    )
+    target.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    console._start_export_worker(request)
+    while console._export_worker is not None:
+        session.app.processEvents()
+        time.sleep(0.001)
+    elapsed = (time.perf_counter() - start) * 1000
+    written = (target / f"{port}.txt").stat().st_size
+    return {"export_8mb_ms": elapsed, "export_8mb_bytes_mb": written / (1024 * 1024)}
+
+
+SCENARIOS = ("startup", "theme_toggle", "language_toggle", "console_flush", "search_100k", "export_8mb")
+
+
+def run(selected: list[str], config_dir: Path, startup_runs: int) -> dict[str, Any]:
+    metrics: dict[str, float] = {}
+    if "startup" in selected:
+        metrics.update(bench_startup(config_dir, startup_runs))
+    interactive = [name for name in selected if name != "startup"]
+    if interactive:
+        session = Session()
+        try:
+            for name in interactive:
+                if name == "theme_toggle":
+                    metrics.update(bench_theme_toggle(session))
+                elif name == "language_toggle":
+                    metrics.update(bench_language_toggle(session))
+                elif name == "console_flush":
+                    metrics.update(bench_console_flush(session))
+                elif name == "search_100k":
+                    metrics.update(bench_search(session))
+                elif name == "export_8mb":
+                    metrics.update(bench_export(session, config_dir / "export"))
+        finally:
+            session.close()
+
+    from PySide6 import __version__ as pyside_version
+
+    return {
+        "version": REPORT_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "pyside6": pyside_version,
+            "platform": platform.platform(),
+            "qpa": os.environ.get("QT_QPA_PLATFORM", ""),
+        },
+        "scenarios": selected,
+        # Timings are compared with the baseline; the rest only sanity-checks the workload
+        "metrics": {key: round(value, 3) for key, value in metrics.items() if _is_timing(key)},
+        "info": {key: round(value, 3) for key, value in metrics.items() if not _is_timing(key)},
+    }
+
+
+def _is_timing(metric: str) -> bool:
+    return metric.endswith(("_ms", "_ms_per_s"))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Offscreen startup/interaction benchmarks")
+    parser.add_argument("--only", default="", help=f"comma-separated subset of: {', '.join(SCENARIOS)}")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="baseline report to compare with")
+    parser.add_argument("--output", "-o", type=Path, help="report path (default: logs/benchmarks/<timestamp>.json)")
+    parser.add_argument("--update-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--no-fail", action="store_true", help="exit 0 even if metrics regressed")
+    parser.add_argument("--startup-runs", type=int, default=3, help="fresh processes for the startup median")
+    parser.add_argument("--config-dir", type=Path, help="config directory to use (default: temporary copy)")
+    parser.add_argument("--startup-probe", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.startup_probe:
+        _startup_probe()
+        return 0
+
+    selected = [name.strip() for name in args.only.split(",") if name.strip()] or list(SCENARIOS)
+    unknown = sorted(set(selected) - set(SCENARIOS))
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    scratch = None
+    config_dir = args.config_dir
+    if config_dir is None:
+        # Never touch the user's history files, caches or config.ini
+        scratch = tempfile.mkdtemp(prefix="uart_bench_")
+        config_dir = Path(scratch) / "config"
+        config_dir.mkdir()
+        shutil.copy2(ROOT / "config" / "config.defaults.ini", config_dir / "config.ini")
+    # Read once by src.utils.paths: set before the first application import
+    os.environ["UART_CTRL_CONFIG_DIR"] = str(config_dir)
+    try:
+        report = run(selected, config_dir, args.startup_runs)
+    finally:
+        if scratch is not None:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+    from src.styles.constants import LoggingConfig
+
+    output = args.output or LoggingConfig.LOG_DIR / "benchmarks" / f"benchmark_{datetime.now():%Y%m%d_%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"Report written to {output}")
+
+    if args.update_baseline:
+        previous = json.loads(args.baseline.read_text(encoding="utf-8")) if args.baseline.exists() else {}
+        baseline = {
+            **report,
+            "tolerance": previous.get("tolerance", {"default": DEFAULT_TOLERANCE}),
+            "slack_ms": previous.get("slack_ms", DEFAULT_SLACK_MS),
+        }
+        args.baseline.write_text(json.dumps(baseline, indent=2) + "\n", encoding="utf-8")
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(format_comparison(compare(report, {})))
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one")
+        return 0
+    rows = compare(report, json.loads(args.baseline.read_text(encoding="utf-8")))
+    print(format_comparison(rows))
+    regressed = [row.metric for row in rows if row.regressed]
+    if regressed:
+        print(f"Regressed: {', '.join(regressed)}")
+        return 0 if args.no_fail else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
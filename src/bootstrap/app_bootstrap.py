@@ -2,19 +2,31 @@
 
 from __future__ import annotations
 
+import importlib
 import os
 import sys
-from typing import Iterable
+from typing import TYPE_CHECKING, Iterable, Iterator
 
-from PySide6.QtCore import QTimer
-from PySide6.QtWidgets import QApplication
+from PySide6.QtWidgets import QApplication, QMessageBox
 
+from src.bootstrap.staged_loader import StagedLoader
+from src.utils import get_sampling_profiler
+from src.utils.config_loader import config_loader
+from src.utils.icon_cache import get_icon_cache
 from src.utils.logger import get_logger, setup_logging
+from src.utils.paths import get_config_dir
 from src.utils.theme_manager import theme_manager
 from src.utils.translator import translator, tr
-from src.views.main_window import MainWindow
 from src.views.splash_screen import ModernSplashScreen, SplashController
 
+if TYPE_CHECKING:
+    from src.views.main_window import MainWindow
+
+# Measured stage costs of the last start, used to weight splash progress
+STARTUP_PROFILE_FILE = "startup_profile.json"
+# Icons the main window shows right away
+STARTUP_ICONS = ("paper-plane", "magnifying-glass", "floppy-disk", "trash", "clock-rotate-left")
+
 
 class AppBootstrap:
     """Encapsulates application startup logic."""
@@ -26,6 +38,7 @@ class AppBootstrap:
         self._logger = get_logger(__name__)
         self._app: QApplication | None = None
         self._main_window: MainWindow | None = None
+        self._splash: ModernSplashScreen | None = None
         self._previous_dpi: float | None = None
 
     def run(self) -> int:
@@ -33,12 +46,48 @@ class AppBootstrap:
         self._app = QApplication(self._args)
         self._app.setStyle("Fusion")
         self._connect_screen_change_handler()
-        self._prepare_theme()
-        splash, controller = self._create_splash()
+        self._start_sampling_profiler()
+        loader = self._create_loader()
+        loader.failed.connect(self._on_startup_failed)
+        # The splash is styled by the app stylesheet: run the "styles" stage first
+        loader.step()
+        if loader.error is not None:
+            return 1
+        splash, controller = self._create_splash(loader)
+        self._splash = splash
         controller.finished.connect(lambda: self._show_main_window(splash))
-        self._execute_load_steps(splash, controller)
+        controller.start()
         return self._app.exec()
 
+    def _on_startup_failed(self, stage: str, error: str) -> None:
+        """Replace the splash with an error box and end the event loop."""
+        self._logger.error("Startup failed in stage %s: %s", stage, error)
+        if self._splash is not None:
+            self._splash.close()
+        QMessageBox.critical(
+            None,
+            tr("error", "Error"),
+            tr("startup_failed", "Application failed to start: {error}", error=error),
+        )
+        if self._app is not None:
+            self._app.exit(1)
+
+    def _start_sampling_profiler(self) -> None:
+        """Sample from the first frame when [profiling] sampling_autostart is on."""
+        if not config_loader.get_profiling_config().sampling_autostart or not self._app:
+            return
+        profiler = get_sampling_profiler()
+        profiler.start()
+        self._app.aboutToQuit.connect(profiler.stop)
+
+    def _create_loader(self) -> StagedLoader:
+        loader = StagedLoader(get_config_dir() / STARTUP_PROFILE_FILE, parent=self._app)
+        loader.add_stage("styles", tr("loading_styles", "Applying styles..."), self._prepare_theme)
+        loader.add_stage("modules", tr("loading_models", "Initializing models..."), self._import_main_window)
+        loader.add_stage("icons", tr("loading_icons", "Loading icons..."), self._preload_icons)
+        loader.add_stage("window", tr("loading_ui", "Building user interface..."), self._build_main_window)
+        return loader
+
     def _connect_screen_change_handler(self) -> None:
         if not self._app:
             return
@@ -64,9 +113,32 @@ class AppBootstrap:
         handle_screen_change()
 
     def _prepare_theme(self) -> None:
+        # The only theme application during startup
         theme_manager.apply_theme(force=True)
-
-    def _create_splash(self) -> tuple[ModernSplashScreen, SplashController]:
+        # Rasterize the first-paint icons on a worker while modules import
+        get_icon_cache().preload_async(list(STARTUP_ICONS), themes=(theme_manager._get_effective_theme(),))
+
+    def _import_main_window(self) -> None:
+        importlib.import_module("src.views.main_window")
+
+    def _preload_icons(self) -> Iterator[None]:
+        cache = get_icon_cache()
+        while cache.is_preloading():
+            # Let queued results reach the GUI thread between short waits
+            cache.wait_for_preload(0.005)
+            yield
+        cache.preload(list(STARTUP_ICONS))  # anything the worker did not cover
+        # Remaining icons and the other theme, so a theme switch renders nothing
+        cache.preload_async()
+
+    def _build_main_window(self) -> Iterator[str]:
+        from src.views.main_window import MainWindow
+
+        self._main_window = MainWindow(staged=True)
+        yield "created"
+        yield from self._main_window.build_stages()
+
+    def _create_splash(self, loader: StagedLoader) -> tuple[ModernSplashScreen, SplashController]:
         effective_theme = (
             theme_manager._get_effective_theme()  # type: ignore[attr-defined]
             if hasattr(theme_manager, "_get_effective_theme")
@@ -74,47 +146,20 @@ class AppBootstrap:
         )
         language = translator.get_language()
         splash = ModernSplashScreen(theme_mode=effective_theme, language=language)
+        controller = SplashController(splash, loader)
         splash.show()
         app = QApplication.instance()
         if app:
             app.processEvents()
-        controller = SplashController(splash, duration_ms=3000)
         return splash, controller
 
     def _show_main_window(self, splash: ModernSplashScreen) -> None:
-        splash.close()
-        theme_manager.apply_theme(force=True)
-        self._main_window = MainWindow()
+        if self._main_window is None:
+            return
         self._main_window.show()
-
-    def _execute_load_steps(self, splash: ModernSplashScreen, controller: SplashController) -> None:
-        load_steps = [
-            (10, tr("loading_initializing", "Initializing application...")),
-            (25, tr("loading_theme_manager", "Loading theme manager...")),
-            (40, tr("loading_translator", "Loading translator...")),
-            (55, tr("loading_models", "Initializing models...")),
-            (70, tr("loading_ui", "Building user interface...")),
-            (85, tr("loading_styles", "Applying styles...")),
-            (95, tr("loading_almost_ready", "Almost ready...")),
-        ]
-
-        def execute_step(index: int) -> None:
-            if index < len(load_steps):
-                progress, message = load_steps[index]
-                controller._elapsed_ms = int(progress / 100.0 * 3000)
-                splash.update_progress(progress, message)
-                app = QApplication.instance()
-                if app:
-                    app.processEvents()
-                QTimer.singleShot(100, lambda i=index + 1: execute_step(i))
-            else:
-                controller.start()
-
-        splash.update_progress(0, tr("loading", "Initializing..."))
-        app = QApplication.instance()
-        if app:
-            app.processEvents()
-        execute_step(0)
+        splash.close()
+        # Pick up edits to config.ini while the app runs
+        config_loader.start_watching()
 
 
 def run_bootstrap(env: str | None = None) -> int:
@@ -0,0 +1,513 @@
+"""
+Headless daemon: serial logging and scripted TX without any widgets.
+
+Runs the same :class:`SerialWorkerSupervisor` / :class:`SerialWorker` stack as
+the GUI under a ``QCoreApplication``. Every port appends RX to its
+memory-mapped console history and to a rotating ``rx_<label>.log`` file, and
+a local control socket (``QLocalServer``) accepts newline-delimited JSON
+commands, one JSON reply per line::
+
+    {"cmd": "ping"}
+    {"cmd": "ports"}
+    {"cmd": "send", "port": "CPU1", "data": "status", "eol": "\\r\\n"}
+    {"cmd": "send", "port": "TLM", "hex": "c0 01 02 c0"}
+    {"cmd": "stats", "port": "CPU1"}
+    {"cmd": "tail", "port": "CPU1", "bytes": 4096}
+    {"cmd": "profile", "action": "start" | "stop" | "stats" | "export", "path": "..."}
+    {"cmd": "metrics"}
+    {"cmd": "trace", "action": "start" | "stop" | "export", "path": "..."}
+    {"cmd": "quit"}
+
+The sampling profiler also exports on ``SIGUSR1`` (POSIX) and starts with the
+daemon when ``[profiling] sampling_autostart`` is on.
+
+Nothing here imports QtWidgets, QtGui-based views, the theme or the
+translator-driven UI, which keeps start-up and memory far below the GUI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import logging.handlers
+import os
+import signal
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Iterable
+
+from PySide6 import QtCore, QtNetwork
+
+from src.styles.constants import LoggingConfig
+from src.models.async_serial_backend import AsyncSerialWorker
+from src.models.serial_worker import SerialWorker
+from src.models.worker_events import WorkerStatus
+from src.supervisors.serial_supervisor import SerialWorkerSupervisor
+from src.utils import get_sampling_profiler
+from src.utils.config_loader import config_loader
+from src.utils.logger import get_logger, setup_logging
+from src.utils.metrics import metrics
+from src.utils.mmap_log_history import MemoryMappedLogHistory, create_history_for_port
+from src.utils.port_stats import PortStats
+
+logger = get_logger(__name__)
+
+DEFAULT_SOCKET_NAME = "uart_ctrl"
+DEFAULT_BAUD_RATE = 115200
+# Largest command line accepted from a control client
+MAX_COMMAND_BYTES = 1 << 20
+# Covers the longest uninterruptible connection retry sleep of a worker
+STOP_TIMEOUT_MS = 5000
+
+
+@dataclass(frozen=True, slots=True)
+class HeadlessPortSpec:
+    """One port given on the command line as ``LABEL=DEVICE[@BAUD]``."""
+
+    label: str
+    device: str
+    baud_rate: int = DEFAULT_BAUD_RATE
+
+
+def parse_port_spec(text: str) -> HeadlessPortSpec:
+    """Parse ``CPU1=/dev/ttyUSB0@921600``; raises ValueError on malformed specs."""
+    label, sep, rest = text.partition("=")
+    device, at, baud = rest.partition("@")
+    label, device = label.strip(), device.strip()
+    if not sep or not label or not device:
+        raise ValueError(f"Invalid port spec {text!r}, expected LABEL=DEVICE[@BAUD]")
+    try:
+        baud_rate = int(baud) if at else DEFAULT_BAUD_RATE
+    except ValueError:
+        raise ValueError(f"Invalid baud rate in port spec {text!r}") from None
+    if baud_rate <= 0:
+        raise ValueError(f"Invalid baud rate in port spec {text!r}")
+    return HeadlessPortSpec(label, device, baud_rate)
+
+
+def _port_worker_config(label: str) -> dict[str, Any]:
+    """RX mode, framing and pipelines for ``label`` from the [ports] section."""
+    ports_cfg = config_loader.get_ports_config()
+    number = next(
+        (key[len("port_"):-len("_label")] for key, value in ports_cfg.items()
+         if key.startswith("port_") and key.endswith("_label") and value.strip() == label),
+        None,
+    )
+
+    def option(name: str) -> str:
+        return ports_cfg.get(f"port_{number}_{name}", "") if number else ""
+
+    return {
+        "rx_mode": option("rx_mode") or "text",
+        "framing": option("framing").strip(),
+        "rx_pipeline": option("rx_pipeline"),
+        "tx_pipeline": option("tx_pipeline"),
+    }
+
+
+class HeadlessPort(QtCore.QObject):
+    """One supervised serial port writing RX to history and a rotating log."""
+
+    def __init__(
+        self,
+        spec: HeadlessPortSpec,
+        *,
+        history_bytes: int,
+        history_dir: Path | None = None,
+        log_dir: Path | None = None,
+        worker_class: type[SerialWorker] | None = None,
+        parent: QtCore.QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._spec = spec
+        self._worker_class = worker_class
+        self._stats = PortStats()
+        self._worker_config = {**_port_worker_config(spec.label), "stats": self._stats}
+        self._history: MemoryMappedLogHistory | None = (
+            create_history_for_port(spec.label, history_bytes, history_dir) if history_bytes else None
+        )
+        self._rx_log = self._create_rx_log(log_dir or LoggingConfig.LOG_DIR)
+        self._supervisor = SerialWorkerSupervisor(spec.label, ipc_ports=[spec.label], parent=self)
+        self._worker = None
+        self._last_status: WorkerStatus | str = ""
+        self._last_error = ""
+
+    def _create_rx_log(self, log_dir: Path) -> logging.Logger:
+        log_dir.mkdir(parents=True, exist_ok=True)
+        rx_logger = logging.getLogger(f"uart.rx.{self._spec.label}")
+        rx_logger.propagate = False
+        rx_logger.setLevel(logging.INFO)
+        for handler in rx_logger.handlers[:]:
+            rx_logger.removeHandler(handler)
+            handler.close()
+        handler = logging.handlers.RotatingFileHandler(
+            log_dir / f"rx_{self._spec.label.lower()}.log",
+            maxBytes=LoggingConfig.MAX_BYTES,
+            backupCount=LoggingConfig.BACKUP_COUNT,
+            encoding="utf-8",
+        )
+        handler.setFormatter(logging.Formatter("%(asctime)s.%(msecs)03d %(message)s", LoggingConfig.DATE_FORMAT))
+        rx_logger.addHandler(handler)
+        return rx_logger
+
+    @property
+    def label(self) -> str:
+        return self._spec.label
+
+    @property
+    def spec(self) -> HeadlessPortSpec:
+        return self._spec
+
+    @property
+    def stats(self) -> PortStats:
+        return self._stats
+
+    @property
+    def history(self) -> MemoryMappedLogHistory | None:
+        return self._history
+
+    @property
+    def is_connected(self) -> bool:
+        return self._worker is not None and self._worker.is_connected
+
+    def start(self) -> None:
+        self._worker = self._supervisor.spawn_worker(
+            port_name=self._spec.device,
+            baud_rate=self._spec.baud_rate,
+            on_rx=self._on_rx,
+            on_error=self._on_error,
+            on_status=self._on_status,
+            on_finished=self._on_finished,
+            on_rx_bytes=self._on_rx_bytes,
+            on_rx_frames=self._on_rx_frames,
+            config=self._worker_config,
+            worker_class=self._worker_class,
+        )
+
+    def stop(self) -> None:
+        worker, self._worker = self._worker, None
+        self._supervisor.stop_worker(self._spec.label)
+        if worker is not None and worker.isRunning():
+            worker.wait(STOP_TIMEOUT_MS)
+        for handler in self._rx_log.handlers[:]:
+            self._rx_log.removeHandler(handler)
+            handler.close()
+        if self._history is not None:
+            self._history.close()
+            self._history = None
+
+    def send(self, payload: str | bytes) -> bool:
+        if self._worker is None:
+            return False
+        if isinstance(payload, bytes):
+            return self._worker.write_bytes(payload)
+        return self._worker.write(payload)
+
+    def status(self) -> dict[str, Any]:
+        return {
+            **asdict(self._spec),
+            "connected": self.is_connected,
+            "status": str(self._last_status),
+            "error": self._last_error,
+            "rx_bytes": self._stats.snapshot().total_bytes,
+        }
+
+    def _on_rx(self, _label: str, text: str) -> None:
+        if self._history is not None:
+            self._history.append(text)
+        self._rx_log.info(text.rstrip("\r\n"))
+
+    def _on_rx_bytes(self, _label: str, data: bytes, _timestamp: float) -> None:
+        if self._history is not None:
+            self._history.append_bytes(data)
+        self._rx_log.info(data.hex(" "))
+
+    def _on_rx_frames(self, _label: str, frames: list, _timestamp: float) -> None:
+        for frame in frames:
+            self._on_rx_bytes(_label, bytes(frame), _timestamp)
+
+    def _on_status(self, _label: str, status: WorkerStatus | str) -> None:
+        # Kept as an event; translated only when a client asks for the status
+        self._last_status = status
+        logger.info("%s: %s", self._spec.label, status)
+
+    def _on_error(self, _label: str, message: str) -> None:
+        self._last_error = message
+        logger.error("%s: %s", self._spec.label, message)
+
+    def _on_finished(self) -> None:
+        logger.info("%s: worker finished", self._spec.label)
+
+
+class HeadlessDaemon(QtCore.QObject):
+    """Owns the headless ports and serves the local control socket."""
+
+    stopped = QtCore.Signal()
+
+    def __init__(
+        self,
+        specs: Iterable[HeadlessPortSpec],
+        *,
+        socket_name: str | None = DEFAULT_SOCKET_NAME,
+        history_bytes: int | None = None,
+        history_dir: Path | None = None,
+        log_dir: Path | None = None,
+        backend: str | None = None,
+        parent: QtCore.QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        if history_bytes is None:
+            history_bytes = config_loader.get_console_config().history_file_size_mb * 1024 * 1024
+        backend = backend or config_loader.get_serial_backend()
+        worker_class = AsyncSerialWorker if backend == "asyncio" else None
+        self._ports: dict[str, HeadlessPort] = {}
+        for spec in specs:
+            if spec.label in self._ports:
+                raise ValueError(f"Duplicate port label {spec.label!r}")
+            self._ports[spec.label] = HeadlessPort(
+                spec,
+                history_bytes=history_bytes,
+                history_dir=history_dir,
+                log_dir=log_dir,
+                worker_class=worker_class,
+                parent=self,
+            )
+        self._socket_name = socket_name
+        self._server: QtNetwork.QLocalServer | None = None
+        self._buffers: dict[QtNetwork.QLocalSocket, bytearray] = {}
+        self._running = False
+
+    @property
+    def ports(self) -> dict[str, HeadlessPort]:
+        return dict(self._ports)
+
+    @property
+    def server_name(self) -> str | None:
+        """Full socket path/name clients connect to (None when not listening)."""
+        return self._server.fullServerName() if self._server is not None else None
+
+    def start(self) -> bool:
+        """Start every port and the control socket; False if the socket cannot listen."""
+        self._running = True
+        for port in self._ports.values():
+            port.start()
+        if not self._socket_name:
+            return True
+        self._server = QtNetwork.QLocalServer(self)
+        self._server.setSocketOptions(QtNetwork.QLocalServer.UserAccessOption)
+        QtNetwork.QLocalServer.removeServer(self._socket_name)  # stale socket of a crashed daemon
+        if not self._server.listen(self._socket_name):
+            logger.error("Control socket %s: %s", self._socket_name, self._server.errorString())
+            return False
+        self._server.newConnection.connect(self._on_new_connection)
+        logger.info("Control socket listening on %s", self._server.fullServerName())
+        return True
+
+    def stop(self) -> None:
+        if not self._running:
+            return
+        self._running = False
+        if self._server is not None:
+            self._server.close()
+        for client in list(self._buffers):
+            client.disconnectFromServer()
+        self._buffers.clear()
+        for port in self._ports.values():
+            port.stop()
+        self.stopped.emit()
+
+    def handle_command(self, command: dict[str, Any]) -> dict[str, Any]:
+        """Execute one control command and return its JSON-serialisable reply."""
+        name = command.get("cmd")
+        if name == "ping":
+            return {"ok": True, "pid": os.getpid()}
+        if name == "ports":
+            return {"ok": True, "ports": [port.status() for port in self._ports.values()]}
+        if name == "quit":
+            QtCore.QTimer.singleShot(0, self.stop)
+            return {"ok": True}
+        if name == "profile":
+            return self._profile(command)
+        if name == "metrics":
+            return {"ok": True, "metrics": metrics.snapshot().to_dict()}
+        if name == "trace":
+            return self._trace(command)
+        if name not in ("send", "stats", "tail"):
+            return {"ok": False, "error": f"unknown command {name!r}"}
+
+        port = self._ports.get(str(command.get("port", "")))
+        if port is None:
+            return {"ok": False, "error": f"unknown port {command.get('port')!r}"}
+        if name == "send":
+            return self._send(port, command)
+        if name == "stats":
+            return {"ok": True, "stats": asdict(port.stats.snapshot())}
+        history = port.history
+        data = history.read_all_bytes() if history is not None else b""
+        limit = max(0, int(command.get("bytes", 4096)))
+        return {"ok": True, "data": data[-limit:].decode("utf-8", errors="replace") if limit else ""}
+
+    @staticmethod
+    def _profile(command: dict[str, Any]) -> dict[str, Any]:
+        profiler = get_sampling_profiler()
+        action = command.get("action", "stats")
+        if action == "start":
+            profiler.start()
+        elif action == "stop":
+            profiler.stop()
+        elif action == "export":
+            path = profiler.export(command.get("path"))
+            return {"ok": True, "path": str(path) if path is not None else None}
+        elif action != "stats":
+            return {"ok": False, "error": f"unknown profile action {action!r}"}
+        return {"ok": True, "running": profiler.is_running(), "stats": asdict(profiler.stats())}
+
+    @staticmethod
+    def _trace(command: dict[str, Any]) -> dict[str, Any]:
+        action = command.get("action")
+        if action in ("start", "stop"):
+            metrics.set_tracing(action == "start")
+            return {"ok": True, "tracing": metrics.tracing}
+        if action == "export":
+            path = metrics.export_chrome_trace(command.get("path"))
+            return {"ok": True, "path": str(path) if path is not None else None}
+        return {"ok": False, "error": f"unknown trace action {action!r}"}
+
+    @staticmethod
+    def _send(port: HeadlessPort, command: dict[str, Any]) -> dict[str, Any]:
+        if "hex" in command:
+            try:
+                payload: str | bytes = bytes.fromhex(str(command["hex"]))
+            except ValueError as exc:
+                return {"ok": False, "error": str(exc)}
+        else:
+            payload = str(command.get("data", "")) + str(command.get("eol", "\r\n"))
+        if not port.send(payload):
+            return {"ok": False, "error": f"{port.label} is not connected"}
+        return {"ok": True}
+
+    def _on_new_connection(self) -> None:
+        while self._server is not None and self._server.hasPendingConnections():
+            client = self._server.nextPendingConnection()
+            self._buffers[client] = bytearray()
+            client.readyRead.connect(lambda c=client: self._on_client_ready(c))
+            client.disconnected.connect(lambda c=client: self._on_client_gone(c))
+
+    def _on_client_gone(self, client: QtNetwork.QLocalSocket) -> None:
+        self._buffers.pop(client, None)
+        client.deleteLater()
+
+    def _on_client_ready(self, client: QtNetwork.QLocalSocket) -> None:
+        buffer = self._buffers.get(client)
+        if buffer is None:
+            return
+        buffer += client.readAll().data()
+        while (end := buffer.find(b"\n")) >= 0:
+            line = bytes(buffer[:end]).strip()
+            del buffer[:end + 1]
+            if line:
+                self._reply(client, self._dispatch_line(line))
+        if len(buffer) > MAX_COMMAND_BYTES:
+            self._reply(client, {"ok": False, "error": "command too long"})
+            client.disconnectFromServer()
+
+    def _dispatch_line(self, line: bytes) -> dict[str, Any]:
+        try:
+            command = json.loads(line)
+        except ValueError as exc:
+            return {"ok": False, "error": f"invalid JSON: {exc}"}
+        if not isinstance(command, dict):
+            return {"ok": False, "error": "command must be a JSON object"}
+        try:
+            return self.handle_command(command)
+        except Exception as exc:  # keep the daemon alive on bad input
+            logger.exception("Control command %r failed", command)
+            return {"ok": False, "error": str(exc)}
+
+    @staticmethod
+    def _reply(client: QtNetwork.QLocalSocket, reply: dict[str, Any]) -> None:
+        client.write(json.dumps(reply, ensure_ascii=False).encode("utf-8") + b"\n")
+        client.flush()
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="uart_ctrl --headless",
+        description="Log serial ports and accept scripted TX without the GUI.",
+    )
+    parser.add_argument(
+        "--port", dest="ports", action="append", default=[], metavar="LABEL=DEVICE[@BAUD]",
+        help="port to open; repeat for several ports",
+    )
+    parser.add_argument("--socket", default=DEFAULT_SOCKET_NAME,
+                        help="local control socket name ('' disables it)")
+    parser.add_argument("--history-mb", type=int, default=None,
+                        help="mmap history size per port (default: [console] history_file_size_mb)")
+    parser.add_argument("--history-dir", type=Path, default=None,
+                        help="directory of the mmap history files (default: config directory)")
+    parser.add_argument("--log-dir", type=Path, default=None,
+                        help="directory of the rotating RX logs (default: application log directory)")
+    parser.add_argument("--backend", choices=("thread", "asyncio"), default=None,
+                        help="worker backend (default: [serial] worker_backend)")
+    parser.add_argument("--env", default=None, help="logging environment (APP_ENV)")
+    return parser
+
+
+def run_headless(argv: list[str] | None = None) -> int:
+    """Entry point of ``python -m src.main --headless``."""
+    args = build_arg_parser().parse_args(argv)
+    setup_logging(env=args.env, console=True)
+    try:
+        specs = [parse_port_spec(item) for item in args.ports]
+    except ValueError as exc:
+        logger.error("%s", exc)
+        return 2
+    if not specs:
+        logger.error("No ports given; use --port LABEL=DEVICE[@BAUD]")
+        return 2
+
+    app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication(sys.argv[:1])
+    history_bytes = args.history_mb * 1024 * 1024 if args.history_mb is not None else None
+    daemon = HeadlessDaemon(
+        specs,
+        socket_name=args.socket or None,
+        history_bytes=history_bytes,
+        history_dir=args.history_dir,
+        log_dir=args.log_dir,
+        backend=args.backend,
+    )
+    daemon.stopped.connect(app.quit)
+    if not daemon.start():
+        daemon.stop()
+        return 1
+
+    # Python signal handlers only run between bytecodes; a short timer keeps them responsive
+    signal.signal(signal.SIGINT, lambda *_: daemon.stop())
+    signal.signal(signal.SIGTERM, lambda *_: daemon.stop())
+    profiler = get_sampling_profiler()
+    if hasattr(signal, "SIGUSR1"):
+        signal.signal(signal.SIGUSR1, lambda *_: profiler.export())
+    if config_loader.get_profiling_config().sampling_autostart:
+        profiler.start()
+    wake = QtCore.QTimer()
+    wake.start(200)
+    wake.timeout.connect(lambda: None)
+
+    logger.info("Headless daemon running: %s", ", ".join(spec.label for spec in specs))
+    code = app.exec()
+    daemon.stop()
+    profiler.stop()
+    return code
+
+
+__all__ = [
+    "DEFAULT_SOCKET_NAME",
+    "HeadlessDaemon",
+    "HeadlessPort",
+    "HeadlessPortSpec",
+    "build_arg_parser",
+    "parse_port_spec",
+    "run_headless",
+]
@@ -0,0 +1,178 @@
+"""
+Staged startup loader: runs real startup work on the event loop and reports
+progress weighted by how long each stage took on the previous start.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterator
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+logger = logging.getLogger(__name__)
+
+# Weight of a stage that has never been measured (seconds)
+DEFAULT_STAGE_COST = 0.05
+
+
+@dataclass(slots=True)
+class LoadStage:
+    """
+    One startup stage.
+
+    ``work`` either does everything in one call (returns None) or returns an
+    iterator; each ``next()`` is one chunk run in its own event-loop turn so
+    the splash keeps painting while e.g. the main window is built.
+    """
+
+    name: str
+    message: str
+    work: Callable[[], Iterator[object] | None]
+
+
+class StagedLoader(QObject):
+    """
+    Runs :class:`LoadStage` chunks one per event-loop turn.
+
+    Signals:
+        progress (int, str): Percent done and the current stage message
+        finished (): All stages ran; :attr:`timings` holds the measured costs
+        failed (str, str): A stage raised; stage name and error text. No
+            further stages run and ``finished`` is not emitted.
+    """
+
+    progress = Signal(int, str)
+    finished = Signal()
+    failed = Signal(str, str)
+
+    def __init__(self, profile_path: Path | None = None, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._profile_path = profile_path
+        self._expected = self._load_profile()
+        self._stages: list[LoadStage] = []
+        self._index = 0
+        self._chunks: Iterator[object] | None = None
+        self._stage_elapsed = 0.0
+        self._timings: dict[str, float] = {}
+        self._done = False
+        self._error: str | None = None
+        self._percent = 0
+
+    @property
+    def timings(self) -> dict[str, float]:
+        """Measured seconds per finished stage."""
+        return dict(self._timings)
+
+    @property
+    def percent(self) -> int:
+        return self._percent
+
+    @property
+    def is_finished(self) -> bool:
+        return self._done
+
+    @property
+    def error(self) -> str | None:
+        """Error text of the stage that failed, or None."""
+        return self._error
+
+    def add_stage(self, name: str, message: str, work: Callable[[], Iterator[object] | None]) -> None:
+        self._stages.append(LoadStage(name, message, work))
+
+    def start(self) -> None:
+        """Run the remaining stages asynchronously; ``finished`` fires at the end."""
+        QTimer.singleShot(0, self._run_next)
+
+    def step(self) -> bool:
+        """Run one chunk synchronously; returns False once everything is done."""
+        if self._done:
+            return False
+        if self._index >= len(self._stages):
+            self._finish()
+            return False
+        stage = self._stages[self._index]
+        started = time.perf_counter()
+        try:
+            if self._chunks is None:
+                result = stage.work()
+                self._chunks = iter(result) if result is not None else iter(())
+            next(self._chunks)
+            stage_done = False
+        except StopIteration:
+            stage_done = True
+        except Exception as exc:
+            logger.exception("Startup stage %s failed", stage.name)
+            self._fail(stage.name, str(exc) or type(exc).__name__)
+            return False
+        self._stage_elapsed += time.perf_counter() - started
+        if stage_done:
+            self._timings[stage.name] = self._stage_elapsed
+            logger.debug("Startup stage %s: %.1f ms", stage.name, self._stage_elapsed * 1000)
+            self._index += 1
+            self._chunks = None
+            self._stage_elapsed = 0.0
+        self._report()
+        return True
+
+    def _run_next(self) -> None:
+        if self.step():
+            QTimer.singleShot(0, self._run_next)
+
+    def _cost(self, name: str) -> float:
+        return max(self._expected.get(name, DEFAULT_STAGE_COST), 1e-4)
+
+    def _report(self) -> None:
+        total = sum(self._cost(stage.name) for stage in self._stages) or 1.0
+        done = sum(self._cost(stage.name) for stage in self._stages[: self._index])
+        if self._index < len(self._stages):
+            stage = self._stages[self._index]
+            # A chunked stage advances by measured time, capped below its share
+            done += min(self._stage_elapsed, self._cost(stage.name) * 0.95)
+            message = stage.message
+        else:
+            message = self._stages[-1].message if self._stages else ""
+        self._percent = min(100, int(done / total * 100))
+        self.progress.emit(self._percent, message)
+
+    def _finish(self) -> None:
+        self._done = True
+        self._percent = 100
+        self._save_profile()
+        self.finished.emit()
+
+    def _fail(self, stage_name: str, error: str) -> None:
+        self._done = True
+        self._error = error
+        self._chunks = None
+        self.failed.emit(stage_name, error)
+
+    def _load_profile(self) -> dict[str, float]:
+        if self._profile_path is None:
+            return {}
+        try:
+            data = json.loads(self._profile_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return {str(k): float(v) for k, v in data.items() if isinstance(v, (int, float))}
+
+    def _save_profile(self) -> None:
+        if self._profile_path is None or not self._timings:
+            return
+        try:
+            self._profile_path.parent.mkdir(parents=True, exist_ok=True)
+            self._profile_path.write_text(
+                json.dumps({k: round(v, 4) for k, v in self._timings.items()}, indent=2),
+                encoding="utf-8",
+            )
+        except OSError as exc:
+            logger.debug("Cannot save startup profile %s: %s", self._profile_path, exc)
+
+
+__all__ = ["DEFAULT_STAGE_COST", "LoadStage", "StagedLoader"]
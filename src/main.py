@@ -1,13 +1,21 @@
 import os
+import sys
 
 # Enable High DPI scaling before creating QApplication
 os.environ.setdefault("QT_ENABLE_HIGHDPI_SCALING", "1")
 os.environ.setdefault("QT_SCALE_FACTOR_ROUNDING_POLICY", "RoundPreferFloor")
 
-from src.bootstrap.app_bootstrap import run_bootstrap
 
+def main(argv: list[str] | None = None) -> int:
+    args = sys.argv[1:] if argv is None else argv
+    if "--headless" in args:
+        # Imported lazily so the daemon never loads widgets, splash or theme
+        from src.bootstrap.headless import run_headless
+
+        return run_headless([arg for arg in args if arg != "--headless"])
+
+    from src.bootstrap.app_bootstrap import run_bootstrap
 
-def main() -> int:
     return run_bootstrap()
 
 
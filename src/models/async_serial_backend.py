@@ -0,0 +1,432 @@
+"""
+asyncio serial backend: every port on one event loop thread.
+
+:class:`AsyncSerialWorker` keeps the :class:`SerialWorker` interface (signals,
+``start``/``stop``/``wait``, write queue, framing, pipelines, statistics) so
+the supervisor and view models use it unchanged, but instead of a QThread
+with a polling loop per port it runs one coroutine on the shared
+:class:`SerialEventLoop`:
+
+- opening retries with ``asyncio.sleep`` back-off and each attempt is bounded
+  by ``asyncio.wait_for(..., CONNECTION_TIMEOUT)``
+- on POSIX the port's non-blocking fd is registered with the loop's selector
+  (``add_reader``/``add_writer``); other platforms poll every read interval
+- writes wake the loop instead of waiting for the next poll, and partial
+  writes are finished from the writer callback
+
+Signals are not emitted from the loop thread directly: the loop appends them
+to a queue that the Qt side drains with one queued call per batch, so a burst
+of lines from dozens of ports costs one event-loop wakeup in the GUI.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Coroutine
+
+from PySide6 import QtCore
+
+from src.models.serial_worker import SerialException, SerialWorker
+from src.models.worker_events import WorkerEvent
+from src.utils import get_serial_event_loop
+from src.utils.metrics import metrics
+from src.utils.service_container import service_container
+from src.utils.translator import tr
+
+logger = logging.getLogger(__name__)
+
+# Same stages as the thread backend (see src.models.serial_worker)
+_READ_SPAN = metrics.histogram("serial.read")
+_EMIT_SPAN = metrics.histogram("serial.emit")
+
+
+class SerialEventLoop(QtCore.QObject):
+    """
+    One asyncio loop thread shared by all async ports, plus its Qt delivery queue.
+
+    Must be created in the thread that owns the receivers (the GUI thread):
+    :meth:`post` from any thread queues a callback there, and callbacks posted
+    before the queue is drained run together in one batch.
+    """
+
+    _wake = QtCore.Signal()
+
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._pending: deque[tuple[Callable[..., Any], tuple]] = deque()
+        self._scheduled = False
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._batches = 0
+        self._delivered = 0
+        self._wake.connect(self._drain, QtCore.Qt.QueuedConnection)
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The running loop; the thread starts on first use."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._loop = asyncio.new_event_loop()
+                started = threading.Event()
+                self._thread = threading.Thread(
+                    target=self._run_loop, args=(self._loop, started), name="serial-asyncio", daemon=True
+                )
+                self._thread.start()
+                started.wait()
+            return self._loop
+
+    @property
+    def thread(self) -> threading.Thread | None:
+        return self._thread
+
+    @property
+    def batches(self) -> int:
+        """Queued Qt deliveries so far (each carries one or more callbacks)."""
+        return self._batches
+
+    @property
+    def delivered(self) -> int:
+        """Callbacks delivered to the Qt side so far."""
+        return self._delivered
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop, started: threading.Event) -> None:
+        asyncio.set_event_loop(loop)
+        loop.call_soon(started.set)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    def submit(self, coro: Coroutine[Any, Any, Any]) -> concurrent.futures.Future:
+        """Run ``coro`` on the loop thread."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def call_soon(self, callback: Callable[..., Any], *args: Any) -> None:
+        """Schedule ``callback`` on the loop thread (thread-safe)."""
+        self.loop.call_soon_threadsafe(callback, *args)
+
+    def post(self, callback: Callable[..., Any], *args: Any) -> None:
+        """Queue ``callback(*args)`` for the Qt thread; thread-safe."""
+        with self._lock:
+            self._pending.append((callback, args))
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self._wake.emit()
+
+    def flush(self) -> None:
+        """Deliver everything queued so far (from the Qt thread)."""
+        self._drain()
+
+    def _drain(self) -> None:
+        with self._lock:
+            batch, self._pending = self._pending, deque()
+            self._scheduled = False
+        if not batch:
+            return
+        self._batches += 1
+        self._delivered += len(batch)
+        for callback, args in batch:
+            try:
+                callback(*args)
+            except RuntimeError as exc:  # receiver's C++ object already deleted
+                logger.debug("Dropped serial event %r: %s", callback, exc)
+
+    def shutdown(self, timeout: float = 2.0) -> None:
+        """Stop the loop thread; a later :attr:`loop` access starts a new one."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._thread = None
+        if loop is None or thread is None or not thread.is_alive():
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+
+
+class AsyncSerialWorker(SerialWorker):
+    """SerialWorker running as a coroutine on the shared :class:`SerialEventLoop`."""
+
+    def __init__(self, port_label: str, config: dict[str, Any] | None = None):
+        super().__init__(port_label, config)
+        self._event_loop: SerialEventLoop = self._config.get('event_loop') or get_serial_event_loop()
+        self._future: concurrent.futures.Future | None = None
+        self._task: asyncio.Task | None = None
+        self._done: asyncio.Future | None = None
+        self._fd: int | None = None
+        self._tx_buffer = bytearray()
+        self._writer_armed = False
+
+    @property
+    def event_loop(self) -> SerialEventLoop:
+        return self._event_loop
+
+    @property
+    def fd_driven(self) -> bool:
+        """True while reads/writes are driven by selector callbacks rather than polling."""
+        return self._fd is not None
+
+    # QThread-compatible lifecycle ------------------------------------------------
+
+    def start(self, *_args: Any) -> None:  # type: ignore[override]
+        if self.isRunning():
+            return
+        self._running = True
+        self._should_stop = False
+        self._future = self._event_loop.submit(self._main())
+        # Emitted once the future is done, so finished receivers see isRunning() False
+        self._future.add_done_callback(lambda _future: self._publish(self.finished))
+
+    def isRunning(self) -> bool:  # noqa: N802 - QThread API
+        return self._future is not None and not self._future.done()
+
+    def wait(self, timeout_ms: int = -1) -> bool:  # type: ignore[override]
+        future = self._future
+        if future is None:
+            return True
+        try:
+            future.result(timeout=None if timeout_ms < 0 else timeout_ms / 1000)
+        except concurrent.futures.TimeoutError:
+            return False
+        except BaseException:  # cancelled or failed: either way it is over
+            pass
+        return True
+
+    def stop(self) -> None:
+        logger.info(f"Stopping worker for {self._port_label}")
+        self._should_stop = True
+        self._running = False
+        if self.isRunning():
+            self._event_loop.call_soon(self._cancel)
+            self.wait(1000)
+
+    def _cancel(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+    # Writes ------------------------------------------------------------------------
+
+    def write(self, data: str) -> bool:
+        queued = super().write(data)
+        if queued and self.isRunning():
+            self._event_loop.call_soon(self._process_write)
+        return queued
+
+    def write_bytes(self, data: bytes) -> bool:
+        queued = super().write_bytes(data)
+        if queued and self.isRunning():
+            self._event_loop.call_soon(self._process_write)
+        return queued
+
+    def _process_write(self) -> None:
+        if self._ser is not None and not self._should_stop:
+            super()._process_write()
+
+    def _write_payload(self, payload: bytes) -> int | None:
+        if self._fd is None:
+            return super()._write_payload(payload)
+        self._tx_buffer += payload
+        self._flush_tx()
+        return len(payload)
+
+    def _flush_tx(self) -> None:
+        """Write as much of the TX buffer as the fd takes; the writer callback finishes it."""
+        try:
+            while self._tx_buffer:
+                written = os.write(self._fd, self._tx_buffer)
+                del self._tx_buffer[:written]
+        except BlockingIOError:
+            pass
+        except OSError as e:
+            self._tx_buffer.clear()
+            raise SerialException(f"write failed: {e}") from e
+        finally:
+            self._arm_writer(bool(self._tx_buffer))
+
+    def _arm_writer(self, armed: bool) -> None:
+        if armed == self._writer_armed or self._fd is None:
+            return
+        loop = asyncio.get_running_loop()
+        if armed:
+            loop.add_writer(self._fd, self._on_writable)
+        else:
+            loop.remove_writer(self._fd)
+        self._writer_armed = armed
+
+    def _on_writable(self) -> None:
+        try:
+            self._flush_tx()
+        except SerialException as e:
+            logger.warning(f"Write error on {self._port_label}: {e}")
+            self._emit_error(tr("worker_write_error", "Write error ({port_name}): {error}",
+                                port_name=self._port_name or "N/A", error=e))
+            if self._is_fatal_port_error(e):
+                self._fatal_error = True
+            self._finish()
+
+    # Signals -----------------------------------------------------------------------
+
+    def _publish(self, signal: Any, *args: Any) -> None:
+        start = time.perf_counter_ns()
+        self._event_loop.post(signal.emit, *args)
+        _EMIT_SPAN.record_since(start)
+
+    # Coroutine ---------------------------------------------------------------------
+
+    async def _main(self) -> None:
+        self._task = asyncio.current_task()
+        self._consecutive_errors = 0
+        self._bytes_received = 0
+        self._bytes_sent = 0
+        loop = asyncio.get_running_loop()
+        self._last_rate_check = self._last_tx_rate_check = loop.time()
+        self._emit_status(WorkerEvent.CONNECTING, port_name=self._port_name or "N/A")
+        ser: Any | None = None
+        try:
+            ser = await self._open_with_retry()
+            if ser is not None:
+                await self._serve(ser)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.exception(f"Fatal error in async worker {self._port_label}: {e}")
+            self._emit_error(tr("worker_fatal_error", "Fatal error: {error}", error=e))
+        finally:
+            self._detach()
+            self._cleanup(ser)
+            self._ser = None
+            self._task = None
+
+    async def _open_with_retry(self) -> Any | None:
+        for attempt in range(1, self.MAX_CONNECTION_ATTEMPTS + 1):
+            if self._should_stop:
+                return None
+            self._connection_attempts = attempt
+            opening = asyncio.get_running_loop().run_in_executor(None, self._open_connection)
+            try:
+                ser = await asyncio.wait_for(asyncio.shield(opening), self.CONNECTION_TIMEOUT)
+            except asyncio.CancelledError:
+                opening.add_done_callback(self._close_late_port)
+                raise
+            except asyncio.TimeoutError:
+                # The open call cannot be interrupted; close the port if it still succeeds
+                opening.add_done_callback(self._close_late_port)
+                logger.warning(f"Connection timeout for {self._port_label}")
+                self._emit_error(tr("worker_connection_timeout", "Connection timeout"))
+                # Treat connection timeout as fatal to avoid endless restarts
+                self._fatal_error = True
+                return None
+            if ser is not None:
+                self._ser = ser
+                self._emit_status(WorkerEvent.CONNECTED, port_name=self._port_name)
+                logger.info(f"Successfully connected to {self._port_name} on attempt {attempt}")
+                return ser
+            if self._should_stop:
+                return None
+            delay = self.CONNECTION_RETRY_DELAY * attempt
+            logger.warning(f"Retrying connection to {self._port_label} in {delay:.2f}s "
+                           f"(attempt {attempt}/{self.MAX_CONNECTION_ATTEMPTS})")
+            await asyncio.sleep(delay)
+        self._emit_error(tr("worker_connection_failed", "Failed to connect after {attempts} attempts",
+                            attempts=self.MAX_CONNECTION_ATTEMPTS))
+        return None
+
+    def _close_late_port(self, opening: asyncio.Future) -> None:
+        """Close a port whose open call finished after it was abandoned."""
+        if opening.cancelled() or opening.exception() is not None:
+            return
+        ser = opening.result()
+        if ser is None:
+            return
+        try:
+            ser.close()
+            logger.debug(f"Closed late-opened port {self._port_name}")
+        except Exception as e:
+            logger.warning(f"Error closing port: {e}")
+
+    async def _serve(self, ser: Any) -> None:
+        loop = asyncio.get_running_loop()
+        self._done = loop.create_future()
+        self._fd = self._nonblocking_fd(ser)
+        if self._fd is not None:
+            try:
+                loop.add_reader(self._fd, self._on_readable)
+            except NotImplementedError:  # e.g. Windows proactor loop
+                self._fd = None
+        # With a selector the timer only drives heartbeats and deferred (rate-limited) writes
+        interval = self._heartbeat_interval if self._fd is not None else self._read_interval
+        while not self._should_stop and not self._done.done():
+            if self._fd is None:
+                self._on_readable()
+            self._process_write()
+            self._emit_heartbeat()
+            try:
+                await asyncio.wait_for(asyncio.shield(self._done), interval)
+            except asyncio.TimeoutError:
+                pass
+
+    @staticmethod
+    def _nonblocking_fd(ser: Any) -> int | None:
+        """Switch a POSIX pyserial port to non-blocking reads and return its fd."""
+        try:
+            fd = ser.fileno()
+        except (AttributeError, OSError, ValueError, SerialException):
+            return None
+        if not isinstance(fd, int):
+            return None
+        ser.timeout = 0
+        os.set_blocking(fd, False)
+        return fd
+
+    def _on_readable(self) -> None:
+        ser = self._ser
+        if ser is None or self._should_stop:
+            return
+        try:
+            if self._fd is not None:
+                # One syscall for everything available; raises on a vanished device
+                start = time.perf_counter_ns()
+                data = ser.read(self.MAX_BUFFER_SIZE)
+                _READ_SPAN.record_since(start)
+                if data:
+                    self._accept_rx(data)
+                self._consecutive_errors = 0
+            elif not self._process_read(ser):
+                self._consecutive_errors += 1
+                if self._consecutive_errors >= self.MAX_CONSECUTIVE_ERRORS:
+                    logger.error(f"Too many consecutive errors, stopping {self._port_label}")
+                    self._emit_error(tr("worker_too_many_errors", "Too many errors, disconnecting"))
+                    self._finish()
+        except Exception as e:
+            if not self._handle_read_error(e) or self._fd is not None:
+                # A selector keeps reporting a dead fd as readable: never spin on it
+                self._finish()
+
+    def _finish(self) -> None:
+        self._should_stop = True
+        if self._done is not None and not self._done.done():
+            self._done.set_result(None)
+
+    def _detach(self) -> None:
+        if self._fd is None:
+            return
+        loop = asyncio.get_running_loop()
+        loop.remove_reader(self._fd)
+        if self._writer_armed:
+            loop.remove_writer(self._fd)
+            self._writer_armed = False
+        self._tx_buffer.clear()
+        self._fd = None
+
+
+service_container.register_singleton("serial_event_loop", SerialEventLoop)
+
+
+__all__ = ["AsyncSerialWorker", "SerialEventLoop"]
@@ -0,0 +1,123 @@
+"""
+ReplayWorker: plays a recorded session through the SerialWorker signal surface.
+
+Recorded RX chunks run through the same framing, pipeline and line
+splitting code as live data and come out of the same ``rx`` / ``rx_bytes``
+/ ``rx_frames`` signals, so everything downstream (view models, console,
+telemetry, statistics) behaves exactly as with hardware attached.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any
+
+from src.models.serial_worker import SerialWorker
+from src.models.worker_events import WorkerEvent
+from src.utils.sampling_profiler import label_current_thread
+from src.utils.session_recording import RecordKind, SessionReader
+from src.utils.translator import tr
+
+logger = logging.getLogger(__name__)
+
+
+class ReplayWorker(SerialWorker):
+    """
+    Worker that replays one port of a session recording instead of opening a port.
+
+    Extra config keys:
+        - 'session': path of the recording
+        - 'replay_speed': 1.0 for real time, N for N times faster,
+          0 (:attr:`SPEED_MAX`) for as fast as possible
+        - 'replay_port': recorded port label to play (default: this worker's label)
+        - 'replay_clock': ``time.monotonic()`` start shared by ports replayed together
+    """
+
+    SPEED_MAX = 0.0
+
+    def __init__(self, port_label: str, config: dict[str, Any] | None = None):
+        super().__init__(port_label, config)
+        self._session_path = self._config.get('session')
+        self._speed = max(0.0, float(self._config.get('replay_speed', 1.0)))
+        self._source_label: str = self._config.get('replay_port') or port_label
+        self._clock_start: float | None = self._config.get('replay_clock')
+        self._replay_done = False
+        self._replayed = 0
+
+    @property
+    def speed(self) -> float:
+        return self._speed
+
+    @property
+    def replayed(self) -> int:
+        """RX chunks replayed so far."""
+        return self._replayed
+
+    @property
+    def restartable(self) -> bool:
+        # Restarting would replay the session from the start again
+        return not self._fatal_error and not self._replay_done
+
+    def run(self) -> None:
+        self._running = True
+        self._should_stop = False
+        port_name = self._port_name or "N/A"
+        label_current_thread(f"ReplayWorker-{port_name}")
+        self._emit_status(WorkerEvent.CONNECTING, port_name=port_name)
+        try:
+            reader = SessionReader(self._session_path)
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Cannot open session recording {self._session_path}: {e}")
+            self._emit_error(tr("replay_open_error", "Cannot open recording: {error}", error=e))
+            self._fatal_error = True
+            self._replay_done = True
+            self._cleanup(None)
+            self.finished.emit()
+            return
+
+        self._emit_status(WorkerEvent.CONNECTED, port_name=port_name)
+        start = self._clock_start if self._clock_start is not None else time.monotonic()
+        try:
+            for record in reader.records(ports={self._source_label}):
+                if not self._wait_until(start, record.timestamp):
+                    break
+                if record.kind == RecordKind.RX:
+                    self._handle_rx_chunk(record.data)
+                    self._replayed += 1
+                else:
+                    self._emit_status(WorkerEvent.TX, data=repr(record.data))
+            else:
+                self._emit_status(WorkerEvent.REPLAY_FINISHED, count=self._replayed)
+        except Exception as e:
+            logger.exception(f"Replay failed for {self._port_label}: {e}")
+            self._emit_error(tr("worker_fatal_error", "Fatal error: {error}", error=e))
+        finally:
+            self._replay_done = True
+            self._cleanup(None)
+            self.finished.emit()
+
+    def _wait_until(self, start: float, timestamp: float) -> bool:
+        """Sleep until the record is due; returns False when asked to stop."""
+        if self._speed <= 0:
+            self._process_write()
+            self._emit_heartbeat()
+            return not self._should_stop
+        due = start + timestamp / self._speed
+        while not self._should_stop:
+            self._process_write()
+            self._emit_heartbeat()
+            remaining = due - time.monotonic()
+            if remaining <= 0:
+                return True
+            time.sleep(min(remaining, self._read_interval))
+        return False
+
+    def _process_write(self) -> None:
+        # A recording cannot be written to; drop queued commands
+        dropped = self.flush_queue()
+        if dropped:
+            logger.debug(f"Replay of {self._port_label}: ignored {dropped} queued writes")
+
+
+__all__ = ["ReplayWorker"]
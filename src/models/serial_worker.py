@@ -23,13 +23,22 @@ import os
 from enum import Enum
 
 from src.utils.translator import tr
+from src.models.worker_events import WorkerEvent, WorkerStatus
 from src.utils.config_loader import config_loader
 from src.styles.constants import CharsetConfig
-from src.utils.profiler import PerformanceTimer
 from src.exceptions import SerialWriteError
+from src.plugins.framing import FrameDecoder, create_frame_decoder
+from src.plugins.pipeline import ProcessorPipeline
+from src.utils.port_stats import PortStats
+from src.utils.session_recording import SessionRecorder
+from src.utils.metrics import metrics
+from src.utils.sampling_profiler import label_current_thread
 
-# Enable/disable profiling via environment variable
-_ENABLE_PROFILING = os.environ.get('APP_PROFILE', '').lower() == 'true'
+# RX path stages on the worker side; the GUI side continues in the viewmodel
+_READ_SPAN = metrics.histogram("serial.read")
+_FRAME_SPAN = metrics.histogram("serial.frame")
+_EMIT_SPAN = metrics.histogram("serial.emit")
+_RX_BYTES = metrics.counter("serial.rx_bytes")
 
 # Try to import pyserial, provide fallback
 try:
@@ -81,49 +90,81 @@ logging.addLevelName(logging.ERROR, 'ERROR')
 logger.setLevel(_get_effective_logging_level())
 
 
+class _TimingSetting:
+    """Class attribute backed by ``config_loader.get_serial_timing()[key]``.
+
+    Resolved on first access instead of when the class body runs, so importing
+    the worker module does not parse the config, and again after config.ini is
+    reloaded (workers read it when they are created). Subclasses and tests can
+    still override the attribute with a plain value.
+    """
+
+    __slots__ = ("_key", "_value")
+    _UNSET = object()
+
+    def __init__(self, key: str) -> None:
+        self._key = key
+        self._value: Any = self._UNSET
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if self._value is self._UNSET:
+            self._value = config_loader.get_serial_timing()[self._key]
+        return self._value
+
+    def reset(self) -> None:
+        self._value = self._UNSET
+
+
 class SerialWorker(QThread):
     """
     Worker for a single serial port running in its own QThread.
     
     Features:
     - Line buffering: Only emits complete lines (ending with \\r\\n, \\n, or \\r)
+    - Binary mode: emits raw ``bytes`` chunks with timestamps, no decoding
+    - Framed mode: a pluggable frame decoder (SLIP, COBS, length prefix, ...) cuts
+      the byte stream into packets, emitted as lists of ``bytes``
+    - Processor pipelines: optional RX/TX chains of DataProcessor stages
     - Write queueing: Thread-safe write queue
     - Signal-based events: rx, status, error signals for UI binding
     - Comprehensive error handling with logging
     
     Signals:
         rx (str, str): (port_label, data) - received data (complete line)
-        status (str, str): (port_label, status_message) - status updates
+        rx_bytes (str, bytes, float): (port_label, chunk, unix_time) - raw chunk in binary mode
+        rx_frames (str, list, float): (port_label, [frame, ...], unix_time) - decoded frames
+        status (str, WorkerStatus): (port_label, status) - status event codes, translated by the UI
         error (str, str): (port_label, error_message) - error messages
         finished (): Worker has finished execution
     """
     
     # Signals
     rx = Signal(str, str)         # port_label, data
-    status = Signal(str, str)     # port_label, message
+    rx_bytes = Signal(str, bytes, float)  # port_label, raw chunk, timestamp (binary mode)
+    rx_frames = Signal(str, list, float)  # port_label, frames completed by one read, timestamp
+    status = Signal(str, object)  # port_label, WorkerStatus
     error = Signal(str, str)       # port_label, error_message
     heartbeat = Signal(str, float) # port_label, timestamp
     finished = Signal()            # Worker finished
     
-    # Configuration defaults - load from config
-    _timing_config = config_loader.get_serial_timing()
+    # Configuration defaults - read from [serial] on first access
     DEFAULT_TIMEOUT: float = 0.1   # seconds
-    READ_INTERVAL: float = _timing_config["default_read_interval"]   # seconds
+    READ_INTERVAL: float = _TimingSetting("default_read_interval")   # seconds
     DEFAULT_BAUD: int = 115200
     
     # Connection timeout (5 seconds)
-    CONNECTION_TIMEOUT: float = _timing_config["connection_timeout"]  # seconds
+    CONNECTION_TIMEOUT: float = _TimingSetting("connection_timeout")  # seconds
     
     # Connection retry settings
-    MAX_CONNECTION_ATTEMPTS = _timing_config["max_connection_attempts"]
-    CONNECTION_RETRY_DELAY = _timing_config["connection_retry_delay"]  # seconds between retries
+    MAX_CONNECTION_ATTEMPTS: int = _TimingSetting("max_connection_attempts")
+    CONNECTION_RETRY_DELAY: float = _TimingSetting("connection_retry_delay")  # seconds between retries
     
     # Charset detection settings
     CHARSET_AUTO_DETECT = True
     CHARSET_DETECTION_LENGTH = 1024  # bytes to sample for auto-detection
     
     # Max consecutive errors before giving up
-    MAX_CONSECUTIVE_ERRORS = _timing_config["max_consecutive_errors"]
+    MAX_CONSECUTIVE_ERRORS: int = _TimingSetting("max_consecutive_errors")
     
     # Max buffer size for incoming data (64KB) - security hardending
     MAX_BUFFER_SIZE = 65536
@@ -139,6 +180,10 @@ class SerialWorker(QThread):
     
     # Max write batch size - prevent queue starvation
     MAX_WRITE_BATCH = 100
+
+    # RX modes: decoded complete lines or raw byte chunks
+    RX_MODE_TEXT = "text"
+    RX_MODE_BINARY = "binary"
     
     def __init__(self, port_label: str, config: dict[str, Any] | None = None):
         """
@@ -166,13 +211,37 @@ class SerialWorker(QThread):
         self._charset_errors: str = self._config.get('charset_errors', 'replace')  # 'replace', 'ignore', 'strict'
         self._charset_auto_detect: bool = self._config.get('charset_auto_detect', False)
         self._detected_charset: str | None = None
+
+        # RX mode ('text' or 'binary'); read by the worker thread on every chunk
+        self._rx_mode: str = self.normalize_rx_mode(self._config.get('rx_mode'))
+
+        # Optional frame decoder; takes precedence over the RX mode when set
+        self._frame_decoder: FrameDecoder | None = None
+        if self._config.get('framing'):
+            self.set_framing(self._config['framing'])
+
+        # Optional DataProcessor chains (RX: after framing, TX: on the wire payload)
+        self._rx_pipeline: ProcessorPipeline | None = None
+        self._tx_pipeline: ProcessorPipeline | None = None
+        if self._config.get('rx_pipeline'):
+            self.set_rx_pipeline(self._config['rx_pipeline'])
+        if self._config.get('tx_pipeline'):
+            self.set_tx_pipeline(self._config['tx_pipeline'])
+
+        # Rolling RX statistics; the owner may pass its own to keep them across restarts
+        self._stats: PortStats = self._config.get('stats') or PortStats()
+
+        # Optional session recorder: every RX chunk and TX write, shared by all ports
+        self._recorder: SessionRecorder | None = self._config.get('recorder')
         
         # Thread control
         self._running: bool = False
         self._write_q: queue.Queue = queue.Queue()
         
-        # Buffer for incomplete lines
+        # Buffer for incomplete lines; only the worker thread touches it, other
+        # threads request a reset through the flag
         self._read_buffer: str = ""
+        self._read_buffer_reset: bool = False
         
         # Serial port instance
         self._ser: Any | None = None
@@ -201,7 +270,7 @@ class SerialWorker(QThread):
             logger.setLevel(self._log_level)
 
         # Heartbeat tracking
-        self._heartbeat_interval = self._timing_config.get("heartbeat_interval", 0.5)
+        self._heartbeat_interval = config_loader.get_serial_timing().get("heartbeat_interval", 0.5)
         self._last_heartbeat_emit: float = 0.0
     
     @property
@@ -219,6 +288,101 @@ class SerialWorker(QThread):
         """Check if charset auto-detection is enabled."""
         return self._charset_auto_detect
     
+    @property
+    def rx_mode(self) -> str:
+        """Current RX mode: 'text' (decoded lines) or 'binary' (raw chunks)."""
+        return self._rx_mode
+
+    def set_rx_mode(self, mode: str) -> None:
+        """
+        Switch between decoded-line and raw-chunk reception.
+
+        Safe to call while the worker runs: a partial text line is discarded
+        by the worker thread before its next chunk when switching to binary mode.
+        """
+        mode = self.normalize_rx_mode(mode)
+        if mode == self.RX_MODE_BINARY:
+            self._read_buffer_reset = True
+        self._rx_mode = mode
+
+    @property
+    def recorder(self) -> SessionRecorder | None:
+        return self._recorder
+
+    def set_recorder(self, recorder: SessionRecorder | None) -> None:
+        """Start (or stop, with None) recording this port into a session file."""
+        self._recorder = recorder
+
+    @property
+    def stats(self) -> PortStats:
+        """Rolling RX statistics updated by the worker thread once per read."""
+        return self._stats
+
+    @property
+    def frame_decoder(self) -> FrameDecoder | None:
+        """Active frame decoder, or None for line/raw reception."""
+        return self._frame_decoder
+
+    def set_framing(self, spec: str | None) -> bool:
+        """
+        Install a frame decoder from a spec such as 'slip', 'cobs', 'u16le' or 'fixed_size:32'.
+
+        An empty spec removes the decoder. Invalid specs are logged and leave
+        framing disabled.
+
+        Returns:
+            True if the spec was valid
+        """
+        try:
+            self._frame_decoder = create_frame_decoder(spec)
+        except ValueError as exc:
+            logger.warning(f"{self._port_label}: invalid framing {spec!r}: {exc}")
+            self._frame_decoder = None
+            return False
+        return True
+
+    @property
+    def rx_pipeline(self) -> ProcessorPipeline | None:
+        """Processor chain applied to received frames or chunks."""
+        return self._rx_pipeline
+
+    @property
+    def tx_pipeline(self) -> ProcessorPipeline | None:
+        """Processor chain applied to outgoing payloads."""
+        return self._tx_pipeline
+
+    def set_rx_pipeline(self, spec: str | None) -> bool:
+        """Install the RX processor chain from a spec such as 'crc32, zlib@pool'."""
+        try:
+            self._rx_pipeline = ProcessorPipeline.from_spec(spec)
+        except ValueError as exc:
+            logger.warning(f"{self._port_label}: invalid RX pipeline {spec!r}: {exc}")
+            self._rx_pipeline = None
+            return False
+        return True
+
+    def set_tx_pipeline(self, spec: str | None) -> bool:
+        """Install the TX processor chain from a spec such as 'crc32:append'."""
+        try:
+            self._tx_pipeline = ProcessorPipeline.from_spec(spec)
+        except ValueError as exc:
+            logger.warning(f"{self._port_label}: invalid TX pipeline {spec!r}: {exc}")
+            self._tx_pipeline = None
+            return False
+        return True
+
+    def pipeline_stats(self) -> dict[str, list[dict[str, Any]]]:
+        """Per-stage counters of the RX and TX pipelines."""
+        return {
+            'rx': self._rx_pipeline.stats() if self._rx_pipeline else [],
+            'tx': self._tx_pipeline.stats() if self._tx_pipeline else [],
+        }
+
+    @classmethod
+    def normalize_rx_mode(cls, mode: str | None) -> str:
+        """Map a config value ('text', 'binary' or 'hex') to an RX mode constant."""
+        return cls.RX_MODE_BINARY if mode in (cls.RX_MODE_BINARY, "hex") else cls.RX_MODE_TEXT
+
     @property
     def connection_attempts(self) -> int:
         """Get number of connection attempts made."""
@@ -280,6 +444,14 @@ class SerialWorker(QThread):
         self._charset = config.get('charset', self._charset)
         self._charset_auto_detect = config.get('charset_auto_detect', self._charset_auto_detect)
         self._charset_errors = config.get('charset_errors', self._charset_errors)
+        if 'rx_mode' in config:
+            self.set_rx_mode(config['rx_mode'])
+        if 'framing' in config:
+            self.set_framing(config['framing'])
+        if 'rx_pipeline' in config:
+            self.set_rx_pipeline(config['rx_pipeline'])
+        if 'tx_pipeline' in config:
+            self.set_tx_pipeline(config['tx_pipeline'])
         
         # Set logging level if provided
         log_level = config.get('log_level')
@@ -327,7 +499,7 @@ class SerialWorker(QThread):
         """
         if not HAS_PYSERIAL or not self._port_name:
             logger.warning("pyserial not available, running in simulation mode")
-            self._emit_status(tr("worker_simulated", "Simulation mode (no pyserial)"))
+            self._emit_status(WorkerEvent.SIMULATED)
             return None
         
         try:
@@ -399,6 +571,7 @@ class SerialWorker(QThread):
         Main thread loop: handles reading and writing to serial port.
         Only emits complete lines (terminated by \\r, \\n, or \\r\\n).
         """
+        label_current_thread(f"SerialWorker-{self._port_name or '?'}")
         self._running = True
         self._should_stop = False
         self._consecutive_errors = 0
@@ -407,7 +580,7 @@ class SerialWorker(QThread):
         self._bytes_sent = 0
         self._last_tx_rate_check = time.monotonic()
         
-        self._emit_status(tr("worker_connecting_to", f"Connecting to {{port_name}}...", port_name=self._port_name or "N/A"))
+        self._emit_status(WorkerEvent.CONNECTING, port_name=self._port_name or "N/A")
         
         # Record connection start time for timeout tracking
         self._connection_start_time = time.monotonic()
@@ -425,7 +598,7 @@ class SerialWorker(QThread):
                 ser = self._open_connection()
                 self._ser = ser
                 if ser is not None:
-                    self._emit_status(tr("worker_connected_to", f"Connected to {{port_name}}", port_name=self._port_name))
+                    self._emit_status(WorkerEvent.CONNECTED, port_name=self._port_name)
                     logger.info(f"Successfully connected to {self._port_name} on attempt {attempt}")
                     break
             except Exception as e:
@@ -524,7 +697,7 @@ class SerialWorker(QThread):
         except Exception as e:
             logger.warning(f"Error closing port: {e}")
         
-        self._emit_status(tr("worker_disconnected_from", f"Disconnected from {{port_name}}", port_name=self._port_name or "N/A"))
+        self._emit_status(WorkerEvent.DISCONNECTED, port_name=self._port_name or "N/A")
     
     def _process_read(self, ser: Any | None) -> bool:
         """
@@ -539,44 +712,12 @@ class SerialWorker(QThread):
         try:
             # Check if data is available
             if hasattr(ser, 'in_waiting') and ser.in_waiting > 0:
+                start = time.perf_counter_ns()
                 data = ser.read(ser.in_waiting)
+                _READ_SPAN.record_since(start)
                 
                 if data:
-                    # Security: validate buffer size to prevent overflow
-                    if len(data) > self.MAX_BUFFER_SIZE:
-                        logger.warning(f"Received data exceeds MAX_BUFFER_SIZE ({len(data)} > {self.MAX_BUFFER_SIZE})")
-                        data = data[:self.MAX_BUFFER_SIZE]
-                    
-                    # Rate limiting: track bytes received
-                    self._bytes_received += len(data)
-                    current_time = time.monotonic()
-                    elapsed = current_time - self._last_rate_check
-                    
-                    # Reset rate tracking every second
-                    if elapsed >= 1.0:
-                        if self._bytes_received > self.MAX_BYTES_PER_SECOND:
-                            logger.warning(f"Rate limit exceeded: {self._bytes_received} bytes/sec (limit: {self.MAX_BYTES_PER_SECOND})")
-                        self._bytes_received = 0
-                        self._last_rate_check = current_time
-                    
-                    # Auto-detect charset if enabled and not yet detected
-                    if self._charset_auto_detect and self._detected_charset is None:
-                        detected = self._detect_charset(data)
-                        if detected:
-                            self._detected_charset = detected
-                            self._charset = detected
-                            logger.info(f"Auto-detected charset: {detected}")
-                    
-                    try:
-                        text = data.decode(self._charset, errors=self._charset_errors)
-                    except Exception as e:
-                        logger.debug(f"Decode error with charset {self._charset}: {e}")
-                        # Fallback to repr if decode fails
-                        text = repr(data)
-                    
-                    # Buffer data and emit only complete lines
-                    self._read_buffer += text
-                    self._emit_complete_lines()
+                    self._accept_rx(data)
             
             return True
         
@@ -591,8 +732,111 @@ class SerialWorker(QThread):
             logger.warning(f"Error reading from serial: {e}")
             return False
     
-    def _emit_complete_lines(self) -> None:
-        """Process read buffer and emit complete lines."""
+    def _accept_rx(self, data: bytes) -> None:
+        """Bound, record and rate-track one chunk read from the port, then process it."""
+        # Security: validate buffer size to prevent overflow
+        if len(data) > self.MAX_BUFFER_SIZE:
+            logger.warning(f"Received data exceeds MAX_BUFFER_SIZE ({len(data)} > {self.MAX_BUFFER_SIZE})")
+            self._stats.record_dropped_lines(max(1, data.count(b"\n", self.MAX_BUFFER_SIZE)))
+            data = data[:self.MAX_BUFFER_SIZE]
+
+        recorder = self._recorder
+        if recorder is not None:
+            recorder.record_rx(self._port_label, bytes(data))
+        
+        # Rate limiting: track bytes received
+        self._bytes_received += len(data)
+        current_time = time.monotonic()
+        elapsed = current_time - self._last_rate_check
+        
+        # Reset rate tracking every second
+        if elapsed >= 1.0:
+            if self._bytes_received > self.MAX_BYTES_PER_SECOND:
+                logger.warning(f"Rate limit exceeded: {self._bytes_received} bytes/sec (limit: {self.MAX_BYTES_PER_SECOND})")
+            self._bytes_received = 0
+            self._last_rate_check = current_time
+        
+        _RX_BYTES.add(len(data))
+        self._handle_rx_chunk(data)
+
+    def _handle_rx_chunk(self, data: bytes) -> None:
+        """Run one received chunk through framing, pipelines and line splitting, then emit it."""
+        # serial.frame covers decoding only; each emit is its own serial.emit span
+        start = time.perf_counter_ns()
+        outgoing = self._decode_rx_chunk(data)
+        _FRAME_SPAN.record_since(start)
+        for signal, args in outgoing:
+            self._publish(signal, *args)
+
+    def _decode_rx_chunk(self, data: bytes) -> list[tuple[Any, tuple]]:
+        """Frame, filter and split one chunk; returns the ``(signal, args)`` pairs to emit."""
+        if self._read_buffer_reset:
+            self._read_buffer_reset = False
+            self._read_buffer = ""
+        decoder = self._frame_decoder
+        pipeline = self._rx_pipeline
+        stats = self._stats
+        if decoder is not None:
+            dropped = decoder.dropped
+            frames = decoder.feed(data)
+            if decoder.dropped != dropped:
+                stats.record_decode_errors(decoder.dropped - dropped)
+            stats.record_rx(len(data), map(len, frames))
+            if frames and pipeline is not None:
+                frames = pipeline.run(frames)
+            if frames:
+                return [(self.rx_frames, (self._port_label, frames, time.time()))]
+            return []
+
+        wire_bytes = len(data)
+        if pipeline is not None:
+            data = b"".join(pipeline.run([bytes(data)]))
+            if not data:
+                stats.record_rx(wire_bytes)
+                return []
+
+        if self._rx_mode == self.RX_MODE_BINARY:
+            # Raw chunk straight to the UI; no decoding or line splitting
+            stats.record_rx(wire_bytes)
+            return [(self.rx_bytes, (self._port_label, bytes(data), time.time()))]
+
+        # Auto-detect charset if enabled and not yet detected
+        if self._charset_auto_detect and self._detected_charset is None:
+            detected = self._detect_charset(data)
+            if detected:
+                self._detected_charset = detected
+                self._charset = detected
+                logger.info(f"Auto-detected charset: {detected}")
+
+        try:
+            text = data.decode(self._charset, errors=self._charset_errors)
+        except (UnicodeDecodeError, LookupError) as e:
+            logger.debug(f"Decode error with charset {self._charset}: {e}")
+            # Strict/unknown charset: keep the stream readable instead of repr()
+            text = data.decode('latin-1')
+            stats.record_decode_errors()
+        if self._charset_errors == 'replace' and '\ufffd' in text:
+            stats.record_decode_errors(text.count('\ufffd'))
+
+        # Buffer data and emit only complete lines
+        self._read_buffer += text
+        lines = self._split_complete_lines()
+        stats.record_rx(wire_bytes, [self._encoded_length(line) for line in lines])
+        label = self._port_label
+        return [(self.rx, (label, line + '\n')) for line in lines]
+
+    def _encoded_length(self, line: str) -> int:
+        """Length of a decoded line in bytes of the port charset (for statistics)."""
+        if line.isascii():
+            return len(line)
+        try:
+            return len(line.encode(self._charset, errors='replace'))
+        except LookupError:
+            return len(line)  # unknown charset: the line was decoded as latin-1
+
+    def _split_complete_lines(self) -> list[str]:
+        """Take complete lines (without line endings) off the read buffer."""
+        lines: list[str] = []
         while True:
             # Check for any line ending: \r\n, \n, or \r
             idx_rn = self._read_buffer.find('\r\n')
@@ -621,8 +865,8 @@ class SerialWorker(QThread):
             else:
                 self._read_buffer = self._read_buffer[first_idx+1:]
             
-            # Emit complete line with line ending
-            self.rx.emit(self._port_label, line + '\n')
+            lines.append(line)
+        return lines
     
     def _process_write(self) -> None:
         """
@@ -686,6 +930,11 @@ class SerialWorker(QThread):
                     payload_bytes = data_to_send.encode()
                     sanitized_for_status = sanitized_data
 
+                if self._tx_pipeline is not None:
+                    payload_bytes = b"".join(self._tx_pipeline.run([payload_bytes]))
+                    if not payload_bytes:
+                        return True
+
                 # TX rate limiting check
                 current_time = time.monotonic()
                 elapsed = current_time - self._last_tx_rate_check
@@ -708,12 +957,16 @@ class SerialWorker(QThread):
                 self._bytes_sent += data_bytes
                 
                 try:
-                    bytes_written = self._ser.write(payload_bytes)
+                    bytes_written = self._write_payload(payload_bytes)
                     logger.debug(f"TX to {self._port_label}: {bytes_written} bytes")
                 except SerialException as e:
                     raise
+
+                recorder = self._recorder
+                if recorder is not None:
+                    recorder.record_tx(self._port_label, payload_bytes)
                 
-                self._emit_status(tr("worker_tx_message", f"TX: {{data}}", data=sanitized_for_status))
+                self._emit_status(WorkerEvent.TX, data=sanitized_for_status)
                 
                 # Echo for simulation mode
                 if self._ser is None:
@@ -740,20 +993,30 @@ class SerialWorker(QThread):
                 self._should_stop = True
             return False
     
-    def _emit_status(self, message: str) -> None:
-        """Emit status signal."""
-        self.status.emit(self._port_label, message)
+    def _write_payload(self, payload: bytes) -> int | None:
+        """Put one processed TX payload on the wire; returns the byte count written."""
+        return self._ser.write(payload)
+
+    def _publish(self, signal: Any, *args: Any) -> None:
+        """Emit a worker signal; backends without a QThread per port may batch delivery."""
+        start = time.perf_counter_ns()
+        signal.emit(*args)
+        _EMIT_SPAN.record_since(start)
+
+    def _emit_status(self, event: WorkerEvent, **params: Any) -> None:
+        """Emit status signal; the message is only formatted where it is shown."""
+        self._publish(self.status, self._port_label, WorkerStatus(event, params))
 
     def _emit_error(self, message: str) -> None:
         """Emit error signal."""
-        self.error.emit(self._port_label, message)
+        self._publish(self.error, self._port_label, message)
 
     def _emit_heartbeat(self) -> None:
         """Emit periodic heartbeat for watchdog supervision."""
         now = time.monotonic()
         if now - self._last_heartbeat_emit >= self._heartbeat_interval:
             self._last_heartbeat_emit = now
-            self.heartbeat.emit(self._port_label, now)
+            self._publish(self.heartbeat, self._port_label, now)
 
     def _is_fatal_port_error(self, error: Exception) -> bool:
         to_check = [error]
@@ -782,6 +1045,11 @@ class SerialWorker(QThread):
     def fatal_error(self) -> bool:
         return self._fatal_error
 
+    @property
+    def restartable(self) -> bool:
+        """Whether the supervisor may restart this worker after it finishes unexpectedly."""
+        return not self._fatal_error
+
     def write(self, data: str) -> bool:
         """
         Queue a string to be written to the serial port.
@@ -874,3 +1142,13 @@ class SerialWorker(QThread):
             Number of items in queue
         """
         return self._write_q.qsize()
+
+
+def _reset_timing_settings(_snapshot: object = None) -> None:
+    """Drop resolved [serial] timings so the next access reads the reloaded config."""
+    for value in vars(SerialWorker).values():
+        if isinstance(value, _TimingSetting):
+            value.reset()
+
+
+config_loader.config_changed.connect(_reset_timing_settings)
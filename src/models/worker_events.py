@@ -0,0 +1,62 @@
+"""
+Status events emitted by serial workers.
+
+Workers used to format a translated sentence for every status update on the
+serial thread, including one ``"TX: ..."`` line per transmitted command, and
+the viewmodel recognised state changes by formatting the same sentences
+again and comparing strings. Workers now emit a :class:`WorkerStatus`: an
+event code plus its raw parameters. Receivers branch on :attr:`event` and
+only the UI side turns it into text (``str(status)``), in the language that
+is current at that moment.
+
+Error messages keep being plain text: they are rare and receivers inspect
+their wording (see ``ComPortViewModel._is_fatal_access_error``).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+
+from src.utils.translator import tr
+
+
+class WorkerEvent(str, Enum):
+    """Status event codes; each value is the translation key of its message."""
+
+    CONNECTING = "worker_connecting_to"
+    CONNECTED = "worker_connected_to"
+    DISCONNECTED = "worker_disconnected_from"
+    SIMULATED = "worker_simulated"
+    TX = "worker_tx_message"
+    REPLAY_FINISHED = "replay_finished"
+
+
+# English fallbacks used when a key is missing from the translation tables
+_DEFAULT_TEXTS: dict[WorkerEvent, str] = {
+    WorkerEvent.CONNECTING: "Connecting to {port_name}...",
+    WorkerEvent.CONNECTED: "Connected to {port_name}",
+    WorkerEvent.DISCONNECTED: "Disconnected from {port_name}",
+    WorkerEvent.SIMULATED: "Simulation mode (no pyserial)",
+    WorkerEvent.TX: "TX: {data}",
+    WorkerEvent.REPLAY_FINISHED: "Replay finished: {count} chunks",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class WorkerStatus:
+    """One status update: an event code and the values for its message."""
+
+    event: WorkerEvent
+    params: dict[str, Any] = field(default_factory=dict)
+
+    def text(self) -> str:
+        """Translated message in the current language."""
+        return tr(self.event.value, _DEFAULT_TEXTS[self.event], **self.params)
+
+    def __str__(self) -> str:
+        return self.text()
+
+
+__all__ = ["WorkerEvent", "WorkerStatus"]
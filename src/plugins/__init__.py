@@ -73,8 +73,14 @@ class DataProcessor(ABC):
     
     Implement this to provide custom data transformation,
     filtering, or analysis.
+
+    Set ``thread_safe = True`` on stateless processors so a
+    :class:`~src.plugins.pipeline.ProcessorPipeline` may run them in its
+    thread pool.
     """
 
+    thread_safe: bool = False
+
     @abstractmethod
     def process(self, data: bytes) -> bytes:
         """
@@ -88,6 +94,15 @@ class DataProcessor(ABC):
         """
         ...
 
+    def process_batch(self, chunks: list[bytes]) -> list[bytes]:
+        """
+        Process a batch of chunks; empty results are dropped.
+        
+        Override when a whole batch can be handled cheaper than chunk by chunk.
+        """
+        process = self.process
+        return [out for out in map(process, chunks) if out]
+
     @abstractmethod
     def reset(self) -> None:
         """Reset processor state."""
@@ -157,7 +172,12 @@ def get_plugin_registry() -> PluginRegistry:
     """Get the global plugin registry."""
     global _registry
     if _registry is None:
+        from src.plugins.framing import register_frame_decoders
+        from src.plugins.processors import register_builtin_processors
+
         _registry = PluginRegistry()
+        register_frame_decoders(_registry)
+        register_builtin_processors(_registry)
     return _registry
 
 
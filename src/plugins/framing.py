@@ -0,0 +1,320 @@
+"""
+Frame decoders for binary serial protocols.
+
+Each decoder is a :class:`DataProcessor` that buffers a byte stream and
+cuts it into complete frames. Work is done with ``bytes``/``bytearray``
+primitives (``split``, ``replace``, slicing, ``struct.unpack_from``), so the
+Python-level loops run once per frame or COBS block, never once per byte.
+
+Decoders are registered in the plugin registry and built from a short spec
+string (as used by ``port_N_framing`` in config.ini)::
+
+    slip                  RFC 1055 SLIP, 0xC0 terminated
+    cobs                  COBS, 0x00 terminated
+    u8 | u16le | u16be | u32le | u32be   length prefix (payload only)
+    length_prefix:u16be   same as above, explicit form
+    fixed_size:32         fixed 32-byte records
+    delimiter:0d0a        split on a hex-encoded delimiter (default 0a)
+"""
+
+from __future__ import annotations
+
+import struct
+from abc import abstractmethod
+from typing import TYPE_CHECKING, ClassVar
+
+from src.plugins import DataProcessor
+
+if TYPE_CHECKING:
+    from src.plugins import PluginRegistry
+
+DEFAULT_MAX_FRAME_SIZE = 65536
+
+
+class FrameDecoder(DataProcessor):
+    """
+    Base class for stream-to-frame decoders.
+
+    :meth:`feed` returns the frames completed by a chunk; incomplete data is
+    kept until the next call. Malformed or oversized frames are dropped and
+    counted in :attr:`dropped`.
+    """
+
+    name: ClassVar[str] = ""
+
+    def __init__(self, max_frame_size: int = DEFAULT_MAX_FRAME_SIZE) -> None:
+        self.max_frame_size = max_frame_size
+        self.dropped = 0
+        self._buffer = bytearray()
+
+    @classmethod
+    def from_spec(cls, arg: str) -> FrameDecoder:
+        """Build a decoder from the argument part of a ``name:arg`` spec."""
+        if arg:
+            raise ValueError(f"{cls.name} framing takes no argument: {arg!r}")
+        return cls()
+
+    @abstractmethod
+    def feed(self, data: bytes | bytearray | memoryview) -> list[bytes]:
+        """Consume a chunk and return the frames it completed."""
+        ...
+
+    def process(self, data: bytes) -> bytes:
+        """Concatenated payloads of completed frames (boundaries are lost; prefer :meth:`feed`)."""
+        return b"".join(self.feed(data))
+
+    def process_batch(self, chunks: list[bytes]) -> list[bytes]:
+        """Frames completed by a batch of stream chunks (used as a pipeline stage)."""
+        frames: list[bytes] = []
+        for chunk in chunks:
+            frames += self.feed(chunk)
+        return frames
+
+    def reset(self) -> None:
+        self._buffer.clear()
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered bytes that do not form a complete frame yet."""
+        return len(self._buffer)
+
+
+class _TerminatedDecoder(FrameDecoder):
+    """Frames terminated by a delimiter; empty frames are skipped."""
+
+    delimiter: bytes = b"\n"
+
+    def feed(self, data: bytes | bytearray | memoryview) -> list[bytes]:
+        buffer = self._buffer
+        buffer += data
+        end = buffer.rfind(self.delimiter)
+        if end < 0:
+            if len(buffer) > self.max_frame_size:
+                buffer.clear()
+                self.dropped += 1
+            return []
+        parts = bytes(buffer[:end]).split(self.delimiter)
+        del buffer[:end + len(self.delimiter)]
+
+        frames: list[bytes] = []
+        limit = self.max_frame_size
+        for part in parts:
+            if not part:
+                continue
+            frame = self._decode(part) if len(part) <= limit else None
+            if frame is None:
+                self.dropped += 1
+            else:
+                frames.append(frame)
+        return frames
+
+    def _decode(self, frame: bytes) -> bytes | None:
+        return frame
+
+
+class DelimiterDecoder(_TerminatedDecoder):
+    """Split on an arbitrary byte sequence (the delimiter is not included)."""
+
+    name = "delimiter"
+
+    def __init__(self, delimiter: bytes = b"\n", max_frame_size: int = DEFAULT_MAX_FRAME_SIZE) -> None:
+        if not delimiter:
+            raise ValueError("delimiter must not be empty")
+        super().__init__(max_frame_size)
+        self.delimiter = bytes(delimiter)
+
+    @classmethod
+    def from_spec(cls, arg: str) -> FrameDecoder:
+        return cls(bytes.fromhex(arg) if arg else b"\n")
+
+
+class SlipDecoder(_TerminatedDecoder):
+    """RFC 1055 SLIP: END=0xC0, ESC=0xDB, ESC_END=0xDC, ESC_ESC=0xDD."""
+
+    name = "slip"
+    delimiter = b"\xc0"
+
+    def _decode(self, frame: bytes) -> bytes | None:
+        if b"\xdb" not in frame:
+            return frame
+        # Two whole-buffer passes; the first cannot create input for the second
+        return frame.replace(b"\xdb\xdc", b"\xc0").replace(b"\xdb\xdd", b"\xdb")
+
+
+class CobsDecoder(_TerminatedDecoder):
+    """Consistent Overhead Byte Stuffing with 0x00 frame delimiters."""
+
+    name = "cobs"
+    delimiter = b"\x00"
+
+    def _decode(self, frame: bytes) -> bytes | None:
+        out = bytearray()
+        size = len(frame)
+        pos = 0
+        while pos < size:
+            code = frame[pos]
+            end = pos + code
+            if end > size:
+                return None  # code points past the end of the frame
+            out += frame[pos + 1:end]
+            pos = end
+            if code != 0xFF and pos < size:
+                out.append(0)
+        return bytes(out)
+
+
+class LengthPrefixDecoder(FrameDecoder):
+    """Frames preceded by an unsigned 8/16/32-bit payload length."""
+
+    name = "length_prefix"
+    _FORMATS = {1: "B", 2: "H", 4: "I"}
+
+    def __init__(
+        self,
+        width: int = 2,
+        byteorder: str = "little",
+        include_header: bool = False,
+        max_frame_size: int = DEFAULT_MAX_FRAME_SIZE,
+    ) -> None:
+        if width not in self._FORMATS:
+            raise ValueError(f"length prefix width must be 1, 2 or 4 bytes, got {width}")
+        if byteorder not in ("little", "big"):
+            raise ValueError(f"byteorder must be 'little' or 'big', got {byteorder!r}")
+        super().__init__(max_frame_size)
+        self.width = width
+        self.byteorder = byteorder
+        self.include_header = include_header
+        order = "<" if byteorder == "little" else ">"
+        self._header = struct.Struct(order + self._FORMATS[width])
+
+    @classmethod
+    def from_spec(cls, arg: str) -> FrameDecoder:
+        arg = arg or "u16le"
+        widths = {"u8": 1, "u16": 2, "u32": 4}
+        if arg == "u8":
+            return cls(1)
+        base, order = arg[:-2], arg[-2:]
+        if base not in widths or order not in ("le", "be"):
+            raise ValueError(f"unknown length prefix format: {arg!r}")
+        return cls(widths[base], "little" if order == "le" else "big")
+
+    def feed(self, data: bytes | bytearray | memoryview) -> list[bytes]:
+        buffer = self._buffer
+        buffer += data
+        unpack_from = self._header.unpack_from
+        width = self.width
+        skip = 0 if self.include_header else width
+        size = len(buffer)
+        frames: list[bytes] = []
+        pos = 0
+        while size - pos >= width:
+            (length,) = unpack_from(buffer, pos)
+            if length > self.max_frame_size:
+                # A corrupt header leaves no way to resynchronise: drop the backlog
+                self.dropped += 1
+                pos = size
+                break
+            end = pos + width + length
+            if end > size:
+                break
+            frames.append(bytes(buffer[pos + skip:end]))
+            pos = end
+        del buffer[:pos]
+        return frames
+
+
+class FixedSizeDecoder(FrameDecoder):
+    """Fixed-length records."""
+
+    name = "fixed_size"
+
+    def __init__(self, size: int) -> None:
+        if size <= 0:
+            raise ValueError("frame size must be positive")
+        super().__init__(size)
+        self.size = size
+
+    @classmethod
+    def from_spec(cls, arg: str) -> FrameDecoder:
+        if not arg:
+            raise ValueError("fixed_size framing needs a size, e.g. fixed_size:32")
+        return cls(int(arg))
+
+    def feed(self, data: bytes | bytearray | memoryview) -> list[bytes]:
+        buffer = self._buffer
+        buffer += data
+        size = self.size
+        usable = len(buffer) - len(buffer) % size
+        if not usable:
+            return []
+        block = bytes(buffer[:usable])
+        del buffer[:usable]
+        return [block[pos:pos + size] for pos in range(0, usable, size)]
+
+
+BUILTIN_DECODERS: tuple[type[FrameDecoder], ...] = (
+    SlipDecoder,
+    CobsDecoder,
+    LengthPrefixDecoder,
+    FixedSizeDecoder,
+    DelimiterDecoder,
+)
+
+# Short spellings accepted in config: name -> (registered name, argument)
+_SPEC_ALIASES = {
+    "u8": ("length_prefix", "u8"),
+    "u16le": ("length_prefix", "u16le"),
+    "u16be": ("length_prefix", "u16be"),
+    "u32le": ("length_prefix", "u32le"),
+    "u32be": ("length_prefix", "u32be"),
+    "fixed": ("fixed_size", ""),
+}
+
+# Spec values meaning "no frame decoder" (newline-framed text)
+_NO_FRAMING = {"", "none", "line", "lines", "text"}
+
+
+def register_frame_decoders(registry: PluginRegistry) -> None:
+    """Register the built-in frame decoders as data processors."""
+    for decoder_class in BUILTIN_DECODERS:
+        registry.register_processor(decoder_class.name, decoder_class)
+
+
+def create_frame_decoder(spec: str | None) -> FrameDecoder | None:
+    """
+    Build a decoder from a ``name[:arg]`` spec, or ``None`` for line framing.
+
+    Names are resolved through the plugin registry, so third-party
+    :class:`FrameDecoder` subclasses registered there work as well.
+
+    Raises:
+        ValueError: Unknown decoder name or invalid argument
+    """
+    from src.plugins import get_plugin_registry
+
+    spec = (spec or "").strip()
+    if spec.lower() in _NO_FRAMING:
+        return None
+    name, _, arg = spec.partition(":")
+    name = name.strip().lower()
+    arg = arg.strip()
+    if name in _SPEC_ALIASES:
+        name, alias_arg = _SPEC_ALIASES[name]
+        arg = arg or alias_arg
+    decoder_class = get_plugin_registry().get_processor(name)
+    if decoder_class is None or not issubclass(decoder_class, FrameDecoder):
+        raise ValueError(f"unknown frame decoder: {name!r}")
+    return decoder_class.from_spec(arg.lower())
+
+
+__all__ = [
+    "BUILTIN_DECODERS",
+    "CobsDecoder",
+    "DelimiterDecoder",
+    "FixedSizeDecoder",
+    "FrameDecoder",
+    "LengthPrefixDecoder",
+    "SlipDecoder",
+    "create_frame_decoder",
+    "register_frame_decoders",
+]
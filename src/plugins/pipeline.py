@@ -0,0 +1,204 @@
+"""
+Ordered chains of data processors applied to batches of chunks.
+
+A port's RX and TX paths each own an optional :class:`ProcessorPipeline`.
+Every stage receives the whole batch produced by the previous stage (all
+frames completed by one read, for example) through
+:meth:`DataProcessor.process_batch`, so per-call overhead is paid once per
+batch rather than once per chunk. Each stage keeps its own timing counters.
+
+Stages whose processor is ``thread_safe`` may be marked to run in a shared
+thread pool: the batch is split into slices processed concurrently, which
+pays off for work that releases the GIL (zlib, CRC over large buffers).
+
+Pipelines are built from comma-separated specs (``port_N_rx_pipeline``)::
+
+    cobs, crc32, zlib@pool
+
+where each item is ``name[:arg]`` resolved through the plugin registry and
+an ``@pool`` suffix requests thread-pool execution.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Sequence
+
+from src.plugins import DataProcessor
+
+_POOL_SUFFIX = "@pool"
+_MAX_POOL_WORKERS = 4
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Shared pool for threaded stages of all ports (created on first use)."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            workers = min(_MAX_POOL_WORKERS, os.cpu_count() or 1)
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pipeline")
+        return _executor
+
+
+@dataclass(slots=True)
+class StageStats:
+    """Counters of one pipeline stage (updated by the thread running the pipeline)."""
+
+    batches: int = 0
+    chunks_in: int = 0
+    chunks_out: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    total_ns: int = 0
+    max_ns: int = 0
+
+    def as_dict(self) -> dict[str, int | float]:
+        avg_us = self.total_ns / self.batches / 1000 if self.batches else 0.0
+        return {
+            "batches": self.batches,
+            "chunks_in": self.chunks_in,
+            "chunks_out": self.chunks_out,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "total_ms": self.total_ns / 1e6,
+            "avg_batch_us": avg_us,
+            "max_batch_us": self.max_ns / 1000,
+        }
+
+
+@dataclass(slots=True)
+class PipelineStage:
+    """A processor plus its execution mode and counters."""
+
+    name: str
+    processor: DataProcessor
+    threaded: bool = False
+    stats: StageStats = field(default_factory=StageStats)
+
+    def __post_init__(self) -> None:
+        if self.threaded and not getattr(self.processor, "thread_safe", False):
+            raise ValueError(f"processor {self.name!r} is not thread-safe and cannot run in the pool")
+
+
+class ProcessorPipeline:
+    """Ordered chain of :class:`DataProcessor` stages run over chunk batches."""
+
+    def __init__(self, stages: Sequence[PipelineStage] = ()) -> None:
+        self._stages: tuple[PipelineStage, ...] = tuple(stages)
+
+    @classmethod
+    def from_spec(cls, spec: str | None) -> ProcessorPipeline | None:
+        """
+        Build a pipeline from a comma-separated spec; ``None`` if the spec is empty.
+
+        Raises:
+            ValueError: Unknown processor, bad argument or non thread-safe ``@pool`` stage
+        """
+        items = [item.strip() for item in (spec or "").split(",") if item.strip()]
+        if not items:
+            return None
+        stages = []
+        for item in items:
+            threaded = item.lower().endswith(_POOL_SUFFIX)
+            if threaded:
+                item = item[:-len(_POOL_SUFFIX)].strip()
+            stages.append(PipelineStage(item, create_processor(item), threaded))
+        return cls(stages)
+
+    @property
+    def stages(self) -> tuple[PipelineStage, ...]:
+        return self._stages
+
+    def __len__(self) -> int:
+        return len(self._stages)
+
+    def run(self, batch: list[bytes]) -> list[bytes]:
+        """Pass ``batch`` through every stage; stops early once a stage outputs nothing."""
+        for stage in self._stages:
+            if not batch:
+                break
+            stats = stage.stats
+            stats.batches += 1
+            stats.chunks_in += len(batch)
+            stats.bytes_in += sum(map(len, batch))
+            started = time.perf_counter_ns()
+            if stage.threaded and len(batch) > 1:
+                batch = self._run_in_pool(stage.processor, batch)
+            else:
+                batch = stage.processor.process_batch(batch)
+            elapsed = time.perf_counter_ns() - started
+            stats.total_ns += elapsed
+            if elapsed > stats.max_ns:
+                stats.max_ns = elapsed
+            stats.chunks_out += len(batch)
+            stats.bytes_out += sum(map(len, batch))
+        return batch
+
+    @staticmethod
+    def _run_in_pool(processor: DataProcessor, batch: list[bytes]) -> list[bytes]:
+        executor = _get_executor()
+        slices = min(_MAX_POOL_WORKERS, len(batch))
+        step = -(-len(batch) // slices)
+        futures = [
+            executor.submit(processor.process_batch, batch[start:start + step])
+            for start in range(0, len(batch), step)
+        ]
+        out: list[bytes] = []
+        for future in futures:
+            out += future.result()
+        return out
+
+    def reset(self) -> None:
+        """Reset processor state (e.g. partial frames) of every stage."""
+        for stage in self._stages:
+            stage.processor.reset()
+
+    def stats(self) -> list[dict[str, Any]]:
+        """Per-stage counter snapshot, in pipeline order."""
+        return [
+            {"name": stage.name, "threaded": stage.threaded, **stage.stats.as_dict()}
+            for stage in self._stages
+        ]
+
+
+def create_processor(spec: str) -> DataProcessor:
+    """
+    Instantiate a registered processor from a ``name[:arg]`` spec.
+
+    Frame decoder names and aliases (``slip``, ``u16le``, ...) are accepted
+    as well, so a framer can be the first stage of a pipeline.
+
+    Raises:
+        ValueError: Unknown processor name or invalid argument
+    """
+    from src.plugins import get_plugin_registry
+    from src.plugins.framing import FrameDecoder, create_frame_decoder
+
+    name, _, arg = spec.partition(":")
+    processor_class = get_plugin_registry().get_processor(name.strip().lower())
+    if processor_class is None or issubclass(processor_class, FrameDecoder):
+        decoder = create_frame_decoder(spec)  # raises ValueError for unknown names
+        if decoder is None:
+            raise ValueError(f"empty processor spec: {spec!r}")
+        return decoder
+    from_spec = getattr(processor_class, "from_spec", None)
+    if from_spec is not None:
+        return from_spec(arg.strip())
+    if arg.strip():
+        raise ValueError(f"processor {name!r} takes no argument: {arg!r}")
+    return processor_class()
+
+
+__all__ = [
+    "PipelineStage",
+    "ProcessorPipeline",
+    "StageStats",
+    "create_processor",
+]
@@ -0,0 +1,142 @@
+"""
+Built-in stateless data processors for port pipelines.
+
+All of them are ``thread_safe`` and can run as ``@pool`` stages::
+
+    crc32[:append]     check and strip (or append) a little-endian CRC-32 trailer
+    crc16[:append]     same with a big-endian CRC-16/CCITT (XMODEM) trailer
+    zlib[:compress]    inflate (or deflate) each chunk
+"""
+
+from __future__ import annotations
+
+import binascii
+import threading
+import zlib
+from abc import abstractmethod
+from typing import TYPE_CHECKING
+
+from src.plugins import DataProcessor
+
+if TYPE_CHECKING:
+    from src.plugins import PluginRegistry
+
+
+class _CountingProcessor(DataProcessor):
+    """Stateless processor with an error count shared by its pool threads."""
+
+    thread_safe = True
+
+    def __init__(self) -> None:
+        self.errors = 0
+        self._errors_lock = threading.Lock()
+
+    def _count_error(self) -> None:
+        # += is a read-modify-write: @pool stages run this on several threads
+        with self._errors_lock:
+            self.errors += 1
+
+    def reset(self) -> None:
+        with self._errors_lock:
+            self.errors = 0
+
+
+class _ChecksumProcessor(_CountingProcessor):
+    """Verify-and-strip or append a fixed-size checksum trailer."""
+
+    name = ""
+    size = 0
+
+    def __init__(self, append: bool = False) -> None:
+        super().__init__()
+        self.append = append
+
+    @classmethod
+    def from_spec(cls, arg: str) -> DataProcessor:
+        if arg not in ("", "check", "append"):
+            raise ValueError(f"{cls.name} mode must be 'check' or 'append', got {arg!r}")
+        return cls(append=arg == "append")
+
+    @abstractmethod
+    def _checksum(self, payload: bytes) -> bytes:
+        """Trailer bytes for ``payload``."""
+
+    def process(self, data: bytes) -> bytes:
+        if self.append:
+            return data + self._checksum(data)
+        size = self.size
+        if len(data) < size:
+            self._count_error()
+            return b""
+        payload = data[:-size]
+        if self._checksum(payload) != data[-size:]:
+            self._count_error()
+            return b""
+        return payload
+
+
+class Crc32Processor(_ChecksumProcessor):
+    """CRC-32 (zlib polynomial) stored little-endian after the payload."""
+
+    name = "crc32"
+    size = 4
+
+    def _checksum(self, payload: bytes) -> bytes:
+        return zlib.crc32(payload).to_bytes(4, "little")
+
+
+class Crc16Processor(_ChecksumProcessor):
+    """CRC-16/XMODEM (CCITT polynomial, init 0) stored big-endian after the payload."""
+
+    name = "crc16"
+    size = 2
+
+    def _checksum(self, payload: bytes) -> bytes:
+        return binascii.crc_hqx(payload, 0).to_bytes(2, "big")
+
+
+class ZlibProcessor(_CountingProcessor):
+    """Inflate (default) or deflate each chunk independently."""
+
+    name = "zlib"
+
+    def __init__(self, compress: bool = False) -> None:
+        super().__init__()
+        self.compress = compress
+
+    @classmethod
+    def from_spec(cls, arg: str) -> DataProcessor:
+        if arg not in ("", "decompress", "compress"):
+            raise ValueError(f"zlib mode must be 'decompress' or 'compress', got {arg!r}")
+        return cls(compress=arg == "compress")
+
+    def process(self, data: bytes) -> bytes:
+        if self.compress:
+            return zlib.compress(data)
+        try:
+            return zlib.decompress(data)
+        except zlib.error:
+            self._count_error()
+            return b""
+
+
+BUILTIN_PROCESSORS: tuple[type[DataProcessor], ...] = (
+    Crc32Processor,
+    Crc16Processor,
+    ZlibProcessor,
+)
+
+
+def register_builtin_processors(registry: PluginRegistry) -> None:
+    """Register the built-in pipeline processors."""
+    for processor_class in BUILTIN_PROCESSORS:
+        registry.register_processor(processor_class.name, processor_class)
+
+
+__all__ = [
+    "BUILTIN_PROCESSORS",
+    "Crc16Processor",
+    "Crc32Processor",
+    "ZlibProcessor",
+    "register_builtin_processors",
+]
@@ -33,7 +33,19 @@ class Colors:
 class Fonts:
     """Font definitions with lazy config access."""
 
-    _config = config_loader.get_fonts()
+    # [fonts] is read on first use rather than when this module is imported,
+    # and again after config.ini is reloaded (fonts created later pick it up)
+    _font_config = None
+
+    @classmethod
+    def _fonts(cls):
+        if cls._font_config is None:
+            cls._font_config = config_loader.get_fonts()
+        return cls._font_config
+
+    @classmethod
+    def _on_config_changed(cls, _snapshot: object = None) -> None:
+        cls._font_config = None
     
     # Monospace font families in order of preference
     MONOSPACE_FAMILIES = [
@@ -52,7 +64,7 @@ class Fonts:
         
         font = QFont()
         font.setFamily(available_family)
-        font.setPointSize(cls._config.monospace_size)
+        font.setPointSize(cls._fonts().monospace_size)
         font.setStyleStrategy(QFont.PreferAntialias)
         return font
     
@@ -71,22 +83,22 @@ class Fonts:
     @classmethod
     def get_default_font(cls) -> QFont:
         font = QFont()
-        font.setFamily(cls._config.default_family)
-        font.setPointSize(cls._config.default_size)
+        font.setFamily(cls._fonts().default_family)
+        font.setPointSize(cls._fonts().default_size)
         return font
 
     @classmethod
     def get_button_font(cls) -> QFont:
         font = QFont()
-        font.setFamily(cls._config.default_family)
-        font.setPointSize(cls._config.button_size)
+        font.setFamily(cls._fonts().default_family)
+        font.setPointSize(cls._fonts().button_size)
         return font
 
     @classmethod
     def get_title_font(cls) -> QFont:
         font = QFont()
-        font.setFamily(cls._config.default_family)
-        font.setPointSize(cls._config.title_size)
+        font.setFamily(cls._fonts().default_family)
+        font.setPointSize(cls._fonts().title_size)
         font.setBold(True)
         return font
     
@@ -94,8 +106,8 @@ class Fonts:
     def get_caption_font(cls) -> QFont:
         """Get small/caption text font."""
         font = QFont()
-        font.setFamily(cls._config.default_family)
-        font.setPointSize(cls._config.caption_size)
+        font.setFamily(cls._fonts().default_family)
+        font.setPointSize(cls._fonts().caption_size)
         return font
 
     # ==================== Typography Scale ====================
@@ -103,27 +115,30 @@ class Fonts:
     @classmethod
     def get_default_size_pt(cls) -> int:
         """Get default body text size in points."""
-        return cls._config.default_size
+        return cls._fonts().default_size
     
     @classmethod
     def get_title_size_pt(cls) -> int:
         """Get title text size in points."""
-        return cls._config.title_size
+        return cls._fonts().title_size
     
     @classmethod
     def get_button_size_pt(cls) -> int:
         """Get button text size in points."""
-        return cls._config.button_size
+        return cls._fonts().button_size
     
     @classmethod
     def get_caption_size_pt(cls) -> int:
         """Get caption/small text size in points."""
-        return cls._config.caption_size
+        return cls._fonts().caption_size
     
     @classmethod
     def get_monospace_size_pt(cls) -> int:
         """Get monospace (console) text size in points."""
-        return cls._config.monospace_size
+        return cls._fonts().monospace_size
+
+
+config_loader.config_changed.connect(Fonts._on_config_changed)
 
 
 # ==================== Sizes ====================
@@ -259,9 +274,6 @@ class SerialConfig:
     _cfg = config_loader.get_serial_config()
     DEFAULT_BAUD = int(_cfg.get("default_baud", 115200))
     BAUD_RATES = [int(b) for b in _cfg.get("baud_rates", "1200,2400,4800,9600,19200,38400,57600,115200").split(",")]
-    PORT_LABEL_1 = _cfg.get("port_label_1", "CPU1")
-    PORT_LABEL_2 = _cfg.get("port_label_2", "CPU2")
-    PORT_LABEL_TLM = _cfg.get("port_label_3", "TLM")
     DEFAULT_PORTS = _cfg.get("default_ports", "COM1,COM2,COM3,COM4,COM5").split(",")
 
 
@@ -291,6 +303,8 @@ class ConsoleLimits:
     # Threshold (0-1) before dropping: fraction of MAX_PENDING_CHUNKS
     BACK_PRESSURE_THRESHOLD = min(1.0, max(0.1, _cfg.back_pressure_threshold))
     EXPORT_CHUNK_MB = max(1, _cfg.export_chunk_mb)
+    # Lines rendered per event-loop tick when a hidden tab catches up
+    CATCH_UP_PAGE_LINES = max(20, _cfg.catch_up_page_lines)
 
 
 # ==================== Charset Detection ====================
@@ -24,6 +24,7 @@ class WorkerSpec:
     port_name: str
     baud_rate: int
     config: dict[str, Any]
+    worker_class: type[SerialWorker] | None = None  # None: SerialWorker
 
 
 @dataclass(slots=True)
@@ -32,6 +33,8 @@ class WorkerCallbacks:
     on_error: WorkerHook
     on_status: WorkerHook
     on_finished: Callable[[], None]
+    on_rx_bytes: WorkerHook | None = None
+    on_rx_frames: WorkerHook | None = None
 
 
 @dataclass(slots=True)
@@ -78,9 +81,14 @@ class SerialWorkerSupervisor(QtCore.QObject):
         on_status: WorkerHook,
         on_finished: Callable[[], None],
         config: dict[str, Any] | None = None,
+        on_rx_bytes: WorkerHook | None = None,
+        on_rx_frames: WorkerHook | None = None,
+        worker_class: type[SerialWorker] | None = None,
     ) -> SerialWorker:
-        spec = WorkerSpec(port_name=port_name, baud_rate=baud_rate, config=config or {})
-        callbacks = WorkerCallbacks(on_rx, on_error, on_status, on_finished)
+        spec = WorkerSpec(
+            port_name=port_name, baud_rate=baud_rate, config=config or {}, worker_class=worker_class
+        )
+        callbacks = WorkerCallbacks(on_rx, on_error, on_status, on_finished, on_rx_bytes, on_rx_frames)
         return self._start_worker(spec, callbacks)
 
     def stop_worker(self, port_label: str) -> None:
@@ -96,9 +104,13 @@ class SerialWorkerSupervisor(QtCore.QObject):
         if context:
             self.stop_worker(port_label)
 
-        worker = SerialWorker(port_label, spec.config)
+        worker = (spec.worker_class or SerialWorker)(port_label, spec.config)
         worker.configure(spec.port_name, spec.baud_rate)
         worker.rx.connect(callbacks.on_rx)
+        if callbacks.on_rx_bytes is not None:
+            worker.rx_bytes.connect(callbacks.on_rx_bytes)
+        if callbacks.on_rx_frames is not None:
+            worker.rx_frames.connect(callbacks.on_rx_frames)
         worker.error.connect(callbacks.on_error)
         worker.status.connect(callbacks.on_status)
         worker.heartbeat.connect(self._handle_heartbeat)
@@ -140,7 +152,7 @@ class SerialWorkerSupervisor(QtCore.QObject):
             self._contexts.pop(port_label, None)
             return
 
-        if ctx.worker.fatal_error:
+        if not ctx.worker.restartable:
             ctx.callbacks.on_finished()
             self._contexts.pop(port_label, None)
             return
@@ -0,0 +1,113 @@
+"""
+Precompiled translation tables.
+
+``STRINGS`` is keyed by message and then by language, which suits editing
+but not lookups: the translator used to walk all of it on every language
+switch to build a flat dict, and ``tr()`` re-parsed the format template on
+every call. This module compiles ``STRINGS`` once, at first import, into one
+read-only table per language whose values are pre-parsed :class:`Template`
+objects, so a language switch is a single dict lookup and a message without
+placeholders is returned without calling ``str.format`` at all.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from string import Formatter
+from types import MappingProxyType
+from typing import Any, Mapping
+
+from src.translations.strings import STRINGS
+
+# Root of a replacement field name: "error" for "{error}", "{error.args}", "{error[0]}"
+_FIELD_ROOT = re.compile(r"[.\[]")
+
+
+class Template:
+    """A translation text with its replacement fields parsed once."""
+
+    __slots__ = ("text", "fields", "_literal")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        try:
+            parsed = list(Formatter().parse(text))
+        except ValueError:
+            # Malformed braces: never formatted, the text is shown as is
+            self.fields: frozenset[str] | None = None
+            self._literal = text
+            return
+        self.fields = frozenset(
+            _FIELD_ROOT.split(name, 1)[0] for _, name, _, _ in parsed if name is not None
+        )
+        # Text with "{{" / "}}" unescaped, used when kwargs are given but not needed
+        self._literal = "".join(literal for literal, *_ in parsed)
+
+    def format(self, values: Mapping[str, Any]) -> str:
+        """Substitute ``values``; the raw text is returned if any field is missing."""
+        if not values:
+            return self.text
+        fields = self.fields
+        if fields is None:
+            return self.text
+        if not fields:
+            return self._literal
+        if not fields <= values.keys():
+            return self.text
+        try:
+            return self.text.format_map(values)
+        except (KeyError, ValueError):
+            return self.text
+
+    def __repr__(self) -> str:
+        return f"Template({self.text!r})"
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledLanguage:
+    """Read-only lookup tables for one language code."""
+
+    code: str
+    texts: Mapping[str, str]
+    templates: Mapping[str, Template]
+
+
+@lru_cache(maxsize=1024)
+def compile_template(text: str) -> Template:
+    """Shared :class:`Template` for a fallback text passed to ``tr()``."""
+    return Template(text)
+
+
+def compile_strings(strings: Mapping[str, Mapping[str, str]]) -> dict[str, CompiledLanguage]:
+    """Split ``key -> {lang -> text}`` into frozen per-language tables."""
+    texts: dict[str, dict[str, str]] = {}
+    for key, translations in strings.items():
+        if not isinstance(translations, dict):
+            continue
+        for code, text in translations.items():
+            texts.setdefault(code, {})[key] = text
+    return {
+        code: CompiledLanguage(
+            code=code,
+            texts=MappingProxyType(table),
+            templates=MappingProxyType({key: Template(text) for key, text in table.items()}),
+        )
+        for code, table in texts.items()
+    }
+
+
+CATALOG: Mapping[str, CompiledLanguage] = MappingProxyType(compile_strings(STRINGS))
+
+EMPTY_LANGUAGE = CompiledLanguage(code="", texts=MappingProxyType({}), templates=MappingProxyType({}))
+
+
+__all__ = [
+    "CATALOG",
+    "EMPTY_LANGUAGE",
+    "CompiledLanguage",
+    "Template",
+    "compile_strings",
+    "compile_template",
+]
@@ -40,10 +40,18 @@ STRINGS: Final[dict[str, dict[str, str]]] = {
         "ru": "Применение стилей...",
         "en": "Applying styles...",
     },
+    "loading_icons": {
+        "ru": "Загрузка иконок...",
+        "en": "Loading icons...",
+    },
     "loading_almost_ready": {
         "ru": "Почти готово...",
         "en": "Almost ready...",
     },
+    "startup_failed": {
+        "ru": "Не удалось запустить приложение: {error}",
+        "en": "Application failed to start: {error}",
+    },
     "error": {
         "ru": "Ошибка",
         "en": "Error",
@@ -1210,6 +1218,170 @@ STRINGS: Final[dict[str, dict[str, str]]] = {
         "ru": "Фильтр",
         "en": "Filter",
     },
+    "tail_filter_hide": {
+        "ru": "Скрывать строки: {text}",
+        "en": "Hide lines like: {text}",
+    },
+    "tail_filter_only": {
+        "ru": "Показывать только строки: {text}",
+        "en": "Show only lines like: {text}",
+    },
+    "tail_filter_clear": {
+        "ru": "Сбросить живой фильтр",
+        "en": "Clear live filter",
+    },
+    "tail_filter_stats": {
+        "ru": "Живой фильтр: показано {matched}, скрыто {suppressed}",
+        "en": "Live filter: {matched} shown, {suppressed} hidden",
+    },
+    "hex_view": {
+        "ru": "Hex-режим (сырые байты)",
+        "en": "Hex view (raw bytes)",
+    },
+    "empty_frame": {
+        "ru": "(пустой кадр)",
+        "en": "(empty frame)",
+    },
+    "telemetry_source": {
+        "ru": "Порт-источник телеметрии",
+        "en": "Telemetry source port",
+    },
+    "telemetry_channels": {
+        "ru": "Каналы",
+        "en": "Channels",
+    },
+    "telemetry_window": {
+        "ru": "Окно времени",
+        "en": "Time window",
+    },
+    "telemetry_no_source": {
+        "ru": "Нет источника телеметрии: опишите кадры в telemetry_schema.yaml",
+        "en": "No telemetry source: describe frames in telemetry_schema.yaml",
+    },
+    "telemetry_needs_numpy": {
+        "ru": "Для графиков телеметрии нужен numpy",
+        "en": "Telemetry plotting requires numpy",
+    },
+    "rate_label": {
+        "ru": "Скорость: {bytes}/с, {lines} строк/с",
+        "en": "Rate: {bytes}/s, {lines} lines/s",
+    },
+    "stats_bytes_rate": {
+        "ru": "Байт/с ({windows}): {values}",
+        "en": "Bytes/s ({windows}): {values}",
+    },
+    "stats_lines_rate": {
+        "ru": "Строк/с ({windows}): {values}",
+        "en": "Lines/s ({windows}): {values}",
+    },
+    "stats_max_burst": {
+        "ru": "Макс. пачка: {bytes} Б, {lines} строк",
+        "en": "Max burst: {bytes} B, {lines} lines",
+    },
+    "stats_errors": {
+        "ru": "Ошибки декодирования: {errors}, потеряно строк: {dropped}",
+        "en": "Decode errors: {errors}, dropped lines: {dropped}",
+    },
+    "stats_gaps": {
+        "ru": "Интервалы между строками, мс: {histogram}",
+        "en": "Line gaps, ms: {histogram}",
+    },
+    "stats_lengths": {
+        "ru": "Длины строк, байт: {histogram}",
+        "en": "Line lengths, bytes: {histogram}",
+    },
+    "record_session": {
+        "ru": "Записать сеанс...",
+        "en": "Record Session...",
+    },
+    "replay_session": {
+        "ru": "Воспроизвести сеанс...",
+        "en": "Replay Session...",
+    },
+    "session_file_filter": {
+        "ru": "Записи сеансов (*.uartrec);;Все файлы (*)",
+        "en": "Session recordings (*.uartrec);;All files (*)",
+    },
+    "session_error": {
+        "ru": "Ошибка сеанса: {error}",
+        "en": "Session error: {error}",
+    },
+    "profiler_menu": {
+        "ru": "Профилировщик",
+        "en": "Profiler",
+    },
+    "sampling_profiler": {
+        "ru": "Сэмплирующий профилировщик",
+        "en": "Sampling Profiler",
+    },
+    "export_flamegraph": {
+        "ru": "Экспорт flame graph...",
+        "en": "Export Flame Graph...",
+    },
+    "folded_file_filter": {
+        "ru": "Свёрнутые стеки (*.folded *.txt);;Все файлы (*)",
+        "en": "Folded stacks (*.folded *.txt);;All files (*)",
+    },
+    "profiler_started": {
+        "ru": "Профилировщик запущен ({hz} Гц)",
+        "en": "Sampling profiler started ({hz} Hz)",
+    },
+    "profiler_no_samples": {
+        "ru": "Сэмплы ещё не собраны",
+        "en": "No samples collected yet",
+    },
+    "profiler_exported": {
+        "ru": "Профиль сохранён: {path}",
+        "en": "Profile saved: {path}",
+    },
+    "profiler_export_error": {
+        "ru": "Не удалось сохранить профиль: {error}",
+        "en": "Profile export failed: {error}",
+    },
+    "record_trace": {
+        "ru": "Запись трассировки",
+        "en": "Record Trace",
+    },
+    "export_trace": {
+        "ru": "Экспорт Chrome trace...",
+        "en": "Export Chrome Trace...",
+    },
+    "trace_file_filter": {
+        "ru": "Chrome trace (*.json);;Все файлы (*)",
+        "en": "Chrome trace (*.json);;All files (*)",
+    },
+    "trace_no_spans": {
+        "ru": "Спаны не записаны; сначала включите запись трассировки",
+        "en": "No spans recorded; enable Record Trace first",
+    },
+    "session_recording_started": {
+        "ru": "Запись сеанса в {path}",
+        "en": "Recording session to {path}",
+    },
+    "session_recording_stopped": {
+        "ru": "Сеанс сохранён: {count} записей",
+        "en": "Session saved: {count} records",
+    },
+    "session_replay_started": {
+        "ru": "Воспроизведение {count} портов из {path}",
+        "en": "Replaying {count} ports from {path}",
+    },
+    "replay_speed": {
+        "ru": "Скорость:",
+        "en": "Speed:",
+    },
+    "replay_speed_max": {
+        "ru": "Максимально быстро",
+        "en": "As fast as possible",
+    },
+    "replay_open_error": {
+        "ru": "Не удалось открыть запись: {error}",
+        "en": "Cannot open recording: {error}",
+    },
+    "replay_finished": {
+        "ru": "Воспроизведение завершено: {count} фрагментов",
+        "en": "Replay finished: {count} chunks",
+    },
     
     # Confirmation dialogs
     "confirm_clear": {
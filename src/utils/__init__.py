@@ -2,44 +2,105 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import importlib
+from typing import TYPE_CHECKING, Any
 
 from src.utils.service_container import service_container
 
 if TYPE_CHECKING:  # pragma: no cover - imported only for typing
+    from src.models.async_serial_backend import SerialEventLoop
     from src.utils.theme_manager import ThemeManager
     from src.utils.config_loader import ConfigLoader
+    from src.utils.metrics import MetricsRegistry
     from src.utils.quick_blocks_repository import QuickBlocksRepository
+    from src.utils.sampling_profiler import SamplingProfiler
+    from src.utils.signal_coalescer import SignalCoalescer
     from src.utils.stopwatch import StopwatchService
+    from src.utils.style_refresh import StyleRefresher
+    from src.utils.telemetry_hub import TelemetryHub
     from src.utils.widget_settings_store import WidgetSettingsStore
     from src.viewmodels.widget_host_viewmodel import WidgetHostViewModel
 
+# Module that registers each service on import. Getters import it on first
+# use so callers do not have to import the provider eagerly just to make the
+# registration happen.
+_SERVICE_MODULES = {
+    "theme_manager": "src.utils.theme_manager",
+    "config_loader": "src.utils.config_loader",
+    "quick_blocks_repository": "src.utils.quick_blocks_repository",
+    "stopwatch_service": "src.utils.stopwatch",
+    "style_refresher": "src.utils.style_refresh",
+    "counter_coalescer": "src.utils.signal_coalescer",
+    "serial_event_loop": "src.models.async_serial_backend",
+    "telemetry_hub": "src.utils.telemetry_hub",
+    "sampling_profiler": "src.utils.sampling_profiler",
+    "metrics_registry": "src.utils.metrics",
+    "widget_settings_store": "src.utils.widget_settings_store",
+    "widget_host_viewmodel": "src.viewmodels.widget_host_viewmodel",
+}
+
+
+def _resolve(key: str) -> Any:
+    if not service_container.is_registered(key) and key in _SERVICE_MODULES:
+        importlib.import_module(_SERVICE_MODULES[key])
+    return service_container.resolve(key)
+
 
 def get_theme_manager() -> "ThemeManager":
     """Resolve global theme manager instance via service container."""
-    return service_container.resolve("theme_manager")
+    return _resolve("theme_manager")
 
 
 def get_config_loader() -> "ConfigLoader":
     """Resolve global config loader from service container."""
-    return service_container.resolve("config_loader")
+    return _resolve("config_loader")
 
 
 def get_quick_blocks_repository() -> "QuickBlocksRepository":
     """Resolve Quick Blocks repository instance."""
-    return service_container.resolve("quick_blocks_repository")
+    return _resolve("quick_blocks_repository")
 
 
 def get_stopwatch_service() -> "StopwatchService":
     """Resolve application-wide stopwatch service instance."""
-    return service_container.resolve("stopwatch_service")
+    return _resolve("stopwatch_service")
+
+
+def get_style_refresher() -> "StyleRefresher":
+    """Resolve the batched repolish engine used on theme changes."""
+    return _resolve("style_refresher")
+
+
+def get_counter_coalescer() -> "SignalCoalescer":
+    """Resolve the shared timer that rate-limits counter signals."""
+    return _resolve("counter_coalescer")
+
+
+def get_serial_event_loop() -> "SerialEventLoop":
+    """Resolve the event loop thread shared by asyncio serial workers."""
+    return _resolve("serial_event_loop")
+
+
+def get_telemetry_hub() -> "TelemetryHub":
+    """Resolve the registry of live telemetry rings."""
+    return _resolve("telemetry_hub")
+
+
+def get_sampling_profiler() -> "SamplingProfiler":
+    """Resolve the in-app sampling profiler."""
+    return _resolve("sampling_profiler")
+
+
+def get_metrics_registry() -> "MetricsRegistry":
+    """Resolve the hot-path counters, histograms and span recorder."""
+    return _resolve("metrics_registry")
 
 
 def get_widget_settings_store() -> "WidgetSettingsStore":
     """Resolve shared widget host settings store."""
-    return service_container.resolve("widget_settings_store")
+    return _resolve("widget_settings_store")
 
 
 def get_widget_host_viewmodel() -> "WidgetHostViewModel":
     """Resolve shared widget host viewmodel."""
-    return service_container.resolve("widget_host_viewmodel")
+    return _resolve("widget_host_viewmodel")
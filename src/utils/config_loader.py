@@ -1,18 +1,42 @@
-"""Application configuration loader with theme-aware color/size/font access."""
+"""
+Application configuration loader with theme-aware color/size/font access.
+
+config.ini is parsed once into an immutable :class:`ConfigSnapshot`. Typed
+getters build their result from the snapshot on first use and serve the
+same (frozen) object afterwards, so hot paths such as theme switches no
+longer re-parse strings. :meth:`ConfigLoader.start_watching` polls the file
+mtime; when the contents change a new snapshot replaces the old one, the
+memoized results are dropped and ``config_changed`` is emitted. Colors,
+fonts, [serial] timings and metrics settings follow a reload; values read
+once at import (e.g. [sizes]) take effect on the next start.
+"""
 
 from __future__ import annotations
 
 import configparser
+import functools
+import logging
+import os
+import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import NamedTuple
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, NamedTuple, TypeVar
 
 import sys
 import shutil
 
+from PySide6 import QtCore
+
 from src.utils.service_container import service_container
 from src.utils.paths import get_config_file, get_root_dir, get_config_dir
 
+logger = logging.getLogger(__name__)
+
+_PORT_LABEL_KEY = re.compile(r"port_(\d+)_label")
+_EMPTY_SECTION: Mapping[str, str] = MappingProxyType({})
+_T = TypeVar("_T")
+
 
 class Margins(NamedTuple):
     """Immutable margins tuple (left, top, right, bottom)."""
@@ -22,7 +46,7 @@ class Margins(NamedTuple):
     bottom: int
 
 
-@dataclass
+@dataclass(frozen=True)
 class ThemeColors:
     timestamp: str
     rx_text: str
@@ -37,20 +61,11 @@ class ThemeColors:
         return f"ThemeColors(timestamp={self.timestamp!r}, rx_text={self.rx_text!r}, ...)"
 
 
-@dataclass
+@dataclass(frozen=True)
 class ButtonColors:
     command_combo_active: str
     command_combo_connecting: str
     command_combo_inactive: str
-    command_cpu1_active: str
-    command_cpu1_connecting: str
-    command_cpu1_inactive: str
-    command_cpu2_active: str
-    command_cpu2_connecting: str
-    command_cpu2_inactive: str
-    command_tlm_active: str
-    command_tlm_connecting: str
-    command_tlm_inactive: str
     command_text_active: str
     command_text_connecting: str
     command_text_inactive: str
@@ -59,7 +74,7 @@ class ButtonColors:
         return f"ButtonColors(command_combo_active={self.command_combo_active!r}, ...)"
 
 
-@dataclass
+@dataclass(frozen=True)
 class FontConfig:
     default_family: str
     default_size: int
@@ -73,7 +88,7 @@ class FontConfig:
         return f"FontConfig(default_family={self.default_family!r}, default_size={self.default_size!r}, ...)"
 
 
-@dataclass
+@dataclass(frozen=True)
 class SizeConfig:
     window_min_width: int
     window_min_height: int
@@ -99,7 +114,7 @@ class SizeConfig:
         return f"SizeConfig(window_min_width={self.window_min_width}, ...)"
 
 
-@dataclass
+@dataclass(frozen=True)
 class PaletteColors:
     """QPalette colors for theme application."""
 
@@ -117,7 +132,7 @@ class PaletteColors:
         return f"PaletteColors(window={self.window!r}, base={self.base!r}, ...)"
 
 
-@dataclass
+@dataclass(frozen=True)
 class ConsoleConfig:
     """Конфигурация консоли/логов."""
 
@@ -130,12 +145,13 @@ class ConsoleConfig:
     max_pending_chunks: int
     back_pressure_threshold: float
     export_chunk_mb: int
+    catch_up_page_lines: int
     
     def __repr__(self) -> str:
         return f"ConsoleConfig(max_html_length={self.max_html_length}, max_document_lines={self.max_document_lines}, ...)"
 
 
-@dataclass
+@dataclass(frozen=True)
 class ToastConfig:
     """Конфигурация toast-уведомлений."""
 
@@ -152,7 +168,26 @@ class ToastConfig:
         return f"ToastConfig(toast_min_width={self.toast_min_width}, toast_duration_ms={self.toast_duration_ms}, ...)"
 
 
-@dataclass
+@dataclass(frozen=True)
+class ProfilingConfig:
+    """Settings of the built-in sampling profiler ([profiling])."""
+
+    sampling_hz: int
+    sampling_max_stacks: int
+    sampling_max_depth: int
+    sampling_autostart: bool
+
+
+@dataclass(frozen=True)
+class MetricsConfig:
+    """Hot-path metrics and span tracing settings ([metrics])."""
+
+    enabled: bool
+    tracing: bool
+    trace_capacity: int
+
+
+@dataclass(frozen=True)
 class QuickCommand:
     label: str
     command: str
@@ -161,11 +196,63 @@ class QuickCommand:
         return f"QuickCommand(label={self.label!r}, command={self.command!r})"
 
 
-class ConfigLoader:
-    """Loads application settings from config/config.ini with defaults."""
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """Read-only sections of config.ini as parsed at one point in time."""
+
+    sections: Mapping[str, Mapping[str, str]]
+    mtime_ns: int = 0
+    size: int = -1
+
+    def section(self, name: str) -> Mapping[str, str]:
+        return self.sections.get(name, _EMPTY_SECTION)
+
+    @classmethod
+    def from_parser(cls, parser: configparser.ConfigParser, mtime_ns: int = 0, size: int = -1) -> ConfigSnapshot:
+        sections = {name: MappingProxyType(dict(parser[name])) for name in parser.sections()}
+        return cls(MappingProxyType(sections), mtime_ns, size)
+
+
+def _memoized(method: Callable[..., _T]) -> Callable[..., _T]:
+    """Cache a getter's result until the next snapshot; dicts and lists are copied out."""
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self: ConfigLoader, *args: Any) -> _T:
+        memo = self._memo
+        key = (name, *args)
+        try:
+            value = memo[key]
+        except KeyError:
+            value = memo[key] = method(self, *args)
+        if type(value) is dict:
+            return dict(value)  # type: ignore[return-value]
+        if type(value) is list:
+            return list(value)  # type: ignore[return-value]
+        return value
+
+    return wrapper
+
+
+class ConfigLoader(QtCore.QObject):
+    """
+    Loads application settings from config/config.ini with defaults.
+
+    Signals:
+        config_changed (ConfigSnapshot): config.ini changed on disk and was reloaded
+    """
+
+    config_changed = QtCore.Signal(object)
+
+    # Poll interval of start_watching() when [ui] config_poll_interval_ms is absent
+    DEFAULT_POLL_INTERVAL_MS = 1000
 
     def __init__(self, config_path: Path | None = None) -> None:
+        super().__init__()
         self._config = configparser.ConfigParser()
+        self._snapshot = ConfigSnapshot(_EMPTY_SECTION)  # type: ignore[arg-type]
+        self._memo: dict[tuple[Any, ...], Any] = {}
+        self._watch_timer: QtCore.QTimer | None = None
         # defaults (must be defined before ensure_default_config)
         self._default_colors = {
             "dark": ThemeColors(
@@ -195,15 +282,6 @@ class ConfigLoader:
                 command_combo_active="#3b82f6",
                 command_combo_connecting="#3b82f6",
                 command_combo_inactive="#1e3a5f",
-                command_cpu1_active="#3b82f6",
-                command_cpu1_connecting="#3b82f6",
-                command_cpu1_inactive="#1e3a5f",
-                command_cpu2_active="#3b82f6",
-                command_cpu2_connecting="#3b82f6",
-                command_cpu2_inactive="#1e3a5f",
-                command_tlm_active="#3b82f6",
-                command_tlm_connecting="#3b82f6",
-                command_tlm_inactive="#1e3a5f",
                 command_text_active="#f8fafc",
                 command_text_connecting="#0f172a",
                 command_text_inactive="#7f8596",
@@ -212,15 +290,6 @@ class ConfigLoader:
                 command_combo_active="#3b82f6",
                 command_combo_connecting="#3b82f6",
                 command_combo_inactive="#dbeafe",
-                command_cpu1_active="#3b82f6",
-                command_cpu1_connecting="#3b82f6",
-                command_cpu1_inactive="#dbeafe",
-                command_cpu2_active="#3b82f6",
-                command_cpu2_connecting="#3b82f6",
-                command_cpu2_inactive="#dbeafe",
-                command_tlm_active="#3b82f6",
-                command_tlm_connecting="#3b82f6",
-                command_tlm_inactive="#dbeafe",
                 command_text_active="#ffffff",
                 command_text_connecting="#0f172a",
                 command_text_inactive="#5a6370",
@@ -274,13 +343,8 @@ class ConfigLoader:
         defaults_source = get_root_dir() / "config" / "config.defaults.ini"
         self._ensure_default_config(default_path, defaults_source)
 
-        # Error handling for config parsing with fallback to defaults
-        try:
-            self._config.read(config_path or default_path, encoding="utf-8")
-        except (configparser.Error, OSError) as e:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(f"Failed to parse config file: {e}. Using default values.")
+        self._config_path = Path(config_path or default_path)
+        self._snapshot = self._read_snapshot()
 
     def _ensure_default_config(self, target: Path, defaults_source: Path) -> None:
         """Ensure the user config exists by copying defaults from repository resource."""
@@ -330,10 +394,68 @@ class ConfigLoader:
             merged.write(fh)
 
 
+    def _read_snapshot(self) -> ConfigSnapshot:
+        """Parse config.ini into a new snapshot (empty sections if unreadable)."""
+        parser = configparser.ConfigParser()
+        try:
+            stat = os.stat(self._config_path)
+            mtime_ns, size = stat.st_mtime_ns, stat.st_size
+        except OSError:
+            mtime_ns, size = 0, -1
+        # Error handling for config parsing with fallback to defaults
+        try:
+            parser.read(self._config_path, encoding="utf-8")
+        except (configparser.Error, OSError) as e:
+            logger.warning(f"Failed to parse config file: {e}. Using default values.")
+            parser = configparser.ConfigParser()
+        self._config = parser
+        return ConfigSnapshot.from_parser(parser, mtime_ns, size)
+
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        """Current immutable view of config.ini."""
+        return self._snapshot
+
+    def reload_if_changed(self) -> bool:
+        """Re-read config.ini if its mtime or size changed; True if the contents differ."""
+        try:
+            stat = os.stat(self._config_path)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return False
+        current = self._snapshot
+        if stamp == (current.mtime_ns, current.size):
+            return False
+        snapshot = self._read_snapshot()
+        self._snapshot = snapshot
+        if snapshot.sections == current.sections:
+            return False  # touched or rewritten with the same values
+        self._memo = {}
+        logger.info("Configuration reloaded from %s", self._config_path)
+        self.config_changed.emit(snapshot)
+        return True
+
+    def start_watching(self, interval_ms: int | None = None) -> bool:
+        """Poll config.ini for changes ([ui] config_poll_interval_ms, 0 disables)."""
+        if interval_ms is None:
+            interval_ms = self._get_int(
+                self._get_section("ui"), "config_poll_interval_ms", self.DEFAULT_POLL_INTERVAL_MS
+            )
+        if interval_ms <= 0:
+            self.stop_watching()
+            return False
+        if self._watch_timer is None:
+            self._watch_timer = QtCore.QTimer(self)
+            self._watch_timer.timeout.connect(self.reload_if_changed)
+        self._watch_timer.start(interval_ms)
+        return True
+
+    def stop_watching(self) -> None:
+        if self._watch_timer is not None:
+            self._watch_timer.stop()
+
     def _get_section(self, section: str) -> dict[str, str]:
-        if self._config.has_section(section):
-            return dict(self._config[section])
-        return {}
+        return dict(self._snapshot.section(section))
 
     @staticmethod
     def _parse_int_value(value: object, default: int) -> int:
@@ -356,6 +478,19 @@ class ConfigLoader:
                 return default
         return default
 
+    @staticmethod
+    def _get_bool(section: dict[str, str], key: str, default: bool) -> bool:
+        """Get a true/false, yes/no, on/off or 1/0 value, ignoring inline comments."""
+        value = section.get(key)
+        if value is None:
+            return default
+        cleaned = value.split(";", 1)[0].split("#", 1)[0].strip().lower()
+        if cleaned in ("1", "true", "yes", "on"):
+            return True
+        if cleaned in ("0", "false", "no", "off"):
+            return False
+        return default
+
     def _get_int(self, section: dict[str, str], key: str, default: int | None = None) -> int:
         """Get integer value from section. If default is None, the key is required in config.ini."""
         if key not in section:
@@ -364,6 +499,7 @@ class ConfigLoader:
             return default
         return self._parse_int_value(section[key], default)
 
+    @_memoized
     def get_colors(self, theme: str) -> ThemeColors:
         section = self._get_section(f"colors.{theme}")
         defaults = self._default_colors.get(theme, self._default_colors["dark"])
@@ -378,6 +514,7 @@ class ConfigLoader:
             console_contour=section.get("console_contour", defaults.console_contour),
         )
 
+    @_memoized
     def get_button_colors(self, theme: str) -> ButtonColors:
         section = self._get_section(f"button_colors.{theme}")
         defaults = self._default_button_colors.get(theme, self._default_button_colors["dark"])
@@ -389,20 +526,12 @@ class ConfigLoader:
             command_combo_active=_get("command_combo_active", defaults.command_combo_active),
             command_combo_connecting=_get("command_combo_connecting", defaults.command_combo_connecting),
             command_combo_inactive=_get("command_combo_inactive", defaults.command_combo_inactive),
-            command_cpu1_active=_get("command_cpu1_active", defaults.command_cpu1_active),
-            command_cpu1_connecting=_get("command_cpu1_connecting", defaults.command_cpu1_connecting),
-            command_cpu1_inactive=_get("command_cpu1_inactive", defaults.command_cpu1_inactive),
-            command_cpu2_active=_get("command_cpu2_active", defaults.command_cpu2_active),
-            command_cpu2_connecting=_get("command_cpu2_connecting", defaults.command_cpu2_connecting),
-            command_cpu2_inactive=_get("command_cpu2_inactive", defaults.command_cpu2_inactive),
-            command_tlm_active=_get("command_tlm_active", defaults.command_tlm_active),
-            command_tlm_connecting=_get("command_tlm_connecting", defaults.command_tlm_connecting),
-            command_tlm_inactive=_get("command_tlm_inactive", defaults.command_tlm_inactive),
             command_text_active=_get("command_text_active", defaults.command_text_active),
             command_text_connecting=_get("command_text_connecting", defaults.command_text_connecting),
             command_text_inactive=_get("command_text_inactive", defaults.command_text_inactive),
         )
 
+    @_memoized
     def get_palette_colors(self, theme: str) -> PaletteColors:
         """Get QPalette colors for theme application."""
         section = self._get_section(f"palette.{theme}")
@@ -423,6 +552,7 @@ class ConfigLoader:
             highlighted_text=_get("highlighted_text", defaults.highlighted_text),
         )
 
+    @_memoized
     def get_fonts(self) -> FontConfig:
         section = self._get_section("fonts")
         return FontConfig(
@@ -435,6 +565,7 @@ class ConfigLoader:
             monospace_size=self._get_int(section, "monospace_size"),
         )
 
+    @_memoized
     def get_sizes(self) -> SizeConfig:
         section = self._get_section("sizes")
         return SizeConfig(
@@ -459,12 +590,36 @@ class ConfigLoader:
             search_field_max_width=self._get_int(section, "search_field_max_width"),
         )
 
+    @_memoized
     def get_serial_config(self) -> dict[str, str]:
         return self._get_section("serial_config")
 
+    @_memoized
     def get_ports_config(self) -> dict[str, str]:
         return self._get_section("ports")
 
+    @_memoized
+    def get_port_labels(self) -> list[tuple[int, str]]:
+        """
+        ``(N, label)`` pairs from [ports] port_N_label, ordered by N.
+
+        Any number of ports may be declared. N is kept as written, so a gapped
+        config still finds its port_N_* options; labels that differ only in
+        case are dropped after the first. The classic CPU1/CPU2/TLM trio is
+        used when none is configured.
+        """
+        section = self._get_section("ports")
+        numbered: list[tuple[int, str]] = []
+        for key, value in section.items():
+            match = _PORT_LABEL_KEY.fullmatch(key)
+            if match and value.strip():
+                numbered.append((int(match.group(1)), value.strip()))
+        ports: dict[str, tuple[int, str]] = {}
+        for number, label in sorted(numbered):
+            ports.setdefault(label.lower(), (number, label))
+        return list(ports.values()) or [(1, "CPU1"), (2, "CPU2"), (3, "TLM")]
+
+    @_memoized
     def get_serial_timing(self) -> dict[str, float]:
         """Get serial worker timing settings."""
         section = self._get_section("serial")
@@ -476,11 +631,54 @@ class ConfigLoader:
             "max_consecutive_errors": int(section.get("max_consecutive_errors", "3")),
         }
 
+    @_memoized
+    def get_serial_backend(self) -> str:
+        """Worker backend from [serial] worker_backend: 'thread' (default) or 'asyncio'."""
+        backend = self._get_section("serial").get("worker_backend", "thread").strip().lower()
+        return backend if backend in ("thread", "asyncio") else "thread"
+
+    @_memoized
+    def get_ui_timing(self) -> dict[str, int]:
+        """Get UI refresh intervals from the [ui] section (milliseconds)."""
+        section = self._get_section("ui")
+        return {
+            "stats_poll_interval_ms": max(50, self._get_int(section, "stats_poll_interval_ms", 1000)),
+            "counter_coalesce_ms": max(0, self._get_int(section, "counter_coalesce_ms", 100)),
+        }
+
+    @_memoized
+    def get_max_history_items(self) -> int:
+        """Command history size from [ui] max_history_items."""
+        return self._get_int(self._get_section("ui"), "max_history_items", 200)
+
+    @_memoized
+    def get_profiling_config(self) -> ProfilingConfig:
+        """Sampling profiler settings from the [profiling] section."""
+        section = self._get_section("profiling")
+        return ProfilingConfig(
+            sampling_hz=min(1000, max(1, self._get_int(section, "sampling_hz", 100))),
+            sampling_max_stacks=max(1, self._get_int(section, "sampling_max_stacks", 5000)),
+            sampling_max_depth=max(1, self._get_int(section, "sampling_max_depth", 64)),
+            sampling_autostart=self._get_bool(section, "sampling_autostart", False),
+        )
+
+    @_memoized
+    def get_metrics_config(self) -> MetricsConfig:
+        """Metrics registry settings from the [metrics] section."""
+        section = self._get_section("metrics")
+        return MetricsConfig(
+            enabled=self._get_bool(section, "enabled", True),
+            tracing=self._get_bool(section, "tracing", False),
+            trace_capacity=max(1, self._get_int(section, "trace_capacity", 20000)),
+        )
+
+    @_memoized
     def get_app_version(self) -> str:
         """Get application version from [app] section."""
         section = self._get_section("app")
         return section.get("version", "0.0.0")
 
+    @_memoized
     def get_default_theme(self) -> str:
         """
         Get default theme from [default_theme] section with validation
@@ -502,6 +700,7 @@ class ConfigLoader:
                 return next(iter(supported))
         return theme
 
+    @_memoized
     def get_console_config(self) -> ConsoleConfig:
         """
         Лимиты консоли/логов.
@@ -519,8 +718,10 @@ class ConfigLoader:
             max_pending_chunks=self._get_int(section, "log_max_pending_chunks", 200),
             back_pressure_threshold=self._get_int(section, "log_back_pressure_threshold", 50) / 100,
             export_chunk_mb=self._get_int(section, "log_export_chunk_mb", 2),
+            catch_up_page_lines=self._get_int(section, "catch_up_page_lines", 200),
         )
 
+    @_memoized
     def get_toast_config(self) -> ToastConfig:
         """
         Конфигурация toast-уведомлений.
@@ -552,6 +753,7 @@ class ConfigLoader:
             toast_corner_radius=self._get_int(section, "toast_corner_radius"),
         )
 
+    @_memoized
     def get_quick_commands(self) -> list[QuickCommand]:
         section = self._get_section("quick_commands")
         raw = section.get("commands", "")
@@ -576,6 +778,7 @@ class ConfigLoader:
             return list(self._default_quick_commands)
         return commands
 
+    @_memoized
     def get_quick_block_shortcuts(self) -> dict[str, str]:
         section = self._get_section("quick_block_shortcuts")
         shortcuts = {k: v.strip() for k, v in section.items() if v.strip()}
@@ -0,0 +1,36 @@
+"""Hexdump formatting for binary serial streams."""
+
+from __future__ import annotations
+
+ROW_BYTES = 16
+
+# Printable ASCII maps to itself, everything else to '.'
+_ASCII_TABLE = bytes(b if 0x20 <= b < 0x7F else 0x2E for b in range(256))
+
+
+def hexdump_rows(data: bytes, offset: int = 0, width: int = ROW_BYTES) -> list[str]:
+    """
+    Format ``data`` as ``offset  hex bytes  |ascii|`` rows of ``width`` bytes.
+
+    The hex and ASCII columns are produced for the whole chunk at once with
+    ``bytes.hex(' ')`` and a ``translate`` lookup table; rows are then plain
+    string slices, so the per-byte cost stays in C.
+    """
+    if not data:
+        return []
+    hex_text = data.hex(" ")
+    ascii_text = data.translate(_ASCII_TABLE).decode("ascii")
+    hex_width = width * 3 - 1
+    return [
+        f"{offset + start:08x}  {hex_text[start * 3:start * 3 + hex_width]:<{hex_width}}  "
+        f"|{ascii_text[start:start + width]}|"
+        for start in range(0, len(data), width)
+    ]
+
+
+def hexdump(data: bytes, offset: int = 0, width: int = ROW_BYTES) -> str:
+    """Multi-line hexdump of ``data`` (no trailing newline)."""
+    return "\n".join(hexdump_rows(data, offset, width))
+
+
+__all__ = ["ROW_BYTES", "hexdump", "hexdump_rows"]
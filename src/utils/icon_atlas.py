@@ -0,0 +1,207 @@
+"""
+Pre-rendered icon atlas: persistent DPI-aware raster cache for IconCache.
+
+Every icon is rasterized once per (name, theme, size, device pixel ratio)
+into a PNG under ``<config>/cache/icons`` and reused on later runs. The PNG
+file name embeds a stat fingerprint (mtime + size) of the source file, so an
+edited icon is re-rendered without hashing any content.
+
+Rasterization uses ``QImage`` only (``QSvgRenderer`` painting into a
+``QImage`` for SVG, ``QImageReader`` for bitmaps), which is safe off the GUI
+thread; :class:`IconPreloader` runs it on a worker thread and hands finished
+images back through a queued signal. Converting to ``QPixmap``/``QIcon``
+stays on the GUI thread.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Iterable, Sequence
+
+from PySide6.QtCore import QObject, QSize, Qt, Signal
+from PySide6.QtGui import QImage, QImageReader, QPainter
+
+logger = logging.getLogger(__name__)
+
+# Logical sizes rendered for every icon (toolbars use 16-24, dialogs up to 64)
+ICON_SIZES = (16, 20, 24, 32, 48, 64)
+# Bitmap sources larger than the biggest size also keep this native size
+MAX_NATIVE_SIZE = 256
+
+
+def file_fingerprint(path: str | os.PathLike[str]) -> str:
+    """Short token for ``path`` from its mtime and size (no content read)."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return "missing"
+    raw = f"{os.fspath(path)}:{stat.st_mtime_ns}:{stat.st_size}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:10]
+
+
+def _source_size(path: str) -> QSize:
+    if Path(path).suffix.lower() == ".svg":
+        from PySide6.QtSvg import QSvgRenderer
+
+        size = QSvgRenderer(path).defaultSize()
+    else:
+        size = QImageReader(path).size()
+    return size if size.isValid() and not size.isEmpty() else QSize(64, 64)
+
+
+def icon_sizes(path: str) -> tuple[int, ...]:
+    """Logical sizes to rasterize for ``path`` (standard sizes + native size)."""
+    source = _source_size(path)
+    native = max(source.width(), source.height())
+    sizes = set(ICON_SIZES)
+    if native > max(ICON_SIZES):
+        sizes.add(min(native, MAX_NATIVE_SIZE))
+    return tuple(sorted(sizes))
+
+
+def rasterize(path: str, size: int, dpr: float) -> QImage:
+    """Render ``path`` into a square ARGB image of ``size * dpr`` pixels (thread-safe)."""
+    pixels = max(1, round(size * dpr))
+    if Path(path).suffix.lower() == ".svg":
+        from PySide6.QtSvg import QSvgRenderer
+
+        image = QImage(pixels, pixels, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+        renderer = QSvgRenderer(path)
+        if renderer.isValid():
+            painter = QPainter(image)
+            renderer.render(painter)
+            painter.end()
+    else:
+        source = QImageReader(path).read()
+        if source.isNull():
+            return QImage()
+        image = source.scaled(
+            pixels, pixels, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
+        )
+    image.setDevicePixelRatio(dpr)
+    return image
+
+
+class IconAtlas:
+    """Disk-backed store of rasterized icons."""
+
+    def __init__(self, cache_dir: Path | None) -> None:
+        self._cache_dir = cache_dir
+        self._lock = threading.Lock()
+        self.rendered = 0
+        self.loaded = 0
+
+    @property
+    def cache_dir(self) -> Path | None:
+        return self._cache_dir
+
+    def images(self, name: str, theme: str, path: str, dpr: float) -> list[QImage]:
+        """All sizes of one icon, from disk when possible, rendering what is missing."""
+        fingerprint = file_fingerprint(path)
+        result: list[QImage] = []
+        for size in icon_sizes(path):
+            image = self._load(name, theme, size, dpr, fingerprint)
+            if image is None:
+                image = rasterize(path, size, dpr)
+                if image.isNull():
+                    continue
+                self._store(name, theme, size, dpr, fingerprint, image)
+                with self._lock:
+                    self.rendered += 1
+            else:
+                with self._lock:
+                    self.loaded += 1
+            result.append(image)
+        return result
+
+    def _stem(self, name: str, theme: str, size: int, dpr: float) -> str:
+        return f"{name}_{theme}_{size}@{round(dpr * 100)}"
+
+    def _load(self, name: str, theme: str, size: int, dpr: float, fingerprint: str) -> QImage | None:
+        if self._cache_dir is None:
+            return None
+        path = self._cache_dir / f"{self._stem(name, theme, size, dpr)}_{fingerprint}.png"
+        if not path.exists():
+            return None
+        image = QImage(str(path))
+        if image.isNull():
+            return None
+        image.setDevicePixelRatio(dpr)
+        return image
+
+    def _store(self, name: str, theme: str, size: int, dpr: float, fingerprint: str, image: QImage) -> None:
+        if self._cache_dir is None:
+            return
+        stem = self._stem(name, theme, size, dpr)
+        target = self._cache_dir / f"{stem}_{fingerprint}.png"
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            for stale in self._cache_dir.glob(f"{stem}_*.png"):
+                stale.unlink(missing_ok=True)
+            tmp = target.with_suffix(f".{threading.get_ident()}.tmp")
+            if image.save(str(tmp), "PNG"):
+                os.replace(tmp, target)
+            else:
+                tmp.unlink(missing_ok=True)
+        except OSError as exc:
+            logger.debug("Cannot store icon raster %s: %s", target, exc)
+
+
+class IconPreloader(QObject):
+    """
+    Rasterizes icons on a worker thread.
+
+    Signals:
+        rasterized (str, str, list): Icon name, theme and its list of QImages
+        finished (): Every job of the current run is done
+    """
+
+    rasterized = Signal(str, str, list)
+    finished = Signal()
+
+    def __init__(self, atlas: IconAtlas, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._atlas = atlas
+        self._thread: threading.Thread | None = None
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, jobs: Sequence[tuple[str, str, str]], dpr: float) -> bool:
+        """Rasterize ``(name, theme, path)`` jobs in the background; False if busy."""
+        if self.is_running() or not jobs:
+            return False
+        self._thread = threading.Thread(
+            target=self._run, args=(list(jobs), dpr), name="icon-preload", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def wait(self, timeout: float | None = None) -> None:
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self, jobs: Iterable[tuple[str, str, str]], dpr: float) -> None:
+        for name, theme, path in jobs:
+            try:
+                images = self._atlas.images(name, theme, path, dpr)
+            except Exception:  # pragma: no cover - never kill the worker on one bad file
+                logger.exception("Icon preload failed for %s (%s)", name, theme)
+                continue
+            self.rasterized.emit(name, theme, images)
+        self.finished.emit()
+
+
+__all__ = [
+    "ICON_SIZES",
+    "IconAtlas",
+    "IconPreloader",
+    "file_fingerprint",
+    "icon_sizes",
+    "rasterize",
+]
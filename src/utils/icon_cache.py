@@ -18,11 +18,11 @@ import shutil
 import sys
 from pathlib import Path
 
-from PySide6.QtCore import QObject, Signal, Slot, QSize, Qt
-from PySide6.QtGui import QIcon, QPixmap, QPainter, QIconEngine, QImage, QScreen
-from PySide6.QtSvg import QSvgRenderer
-from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtCore import QObject, Signal, Slot
+from PySide6.QtGui import QIcon, QPixmap, QImage
+from PySide6.QtWidgets import QApplication
 
+from src.utils.icon_atlas import IconAtlas, IconPreloader
 from src.utils.theme_manager import ThemeManager
 from src.utils.paths import get_config_dir, get_root_dir
 
@@ -64,6 +64,10 @@ class IconCache(QObject):
         self._theme_suffix_cache: dict[str, str] = {}  # theme -> suffix mapping
         self._icon_manifest: dict[str, str] = {}
         self._manifest_path = get_config_dir() / "assets" / "icon_manifest.json"
+        # Rasterized sizes persisted across runs; preloading runs off the GUI thread
+        self._atlas = IconAtlas(get_config_dir() / "cache" / "icons")
+        self._preloader = IconPreloader(self._atlas, self)
+        self._preloader.rasterized.connect(self._on_rasterized)
 
         # Get base icons directory
         self._load_manifest()
@@ -80,7 +84,7 @@ class IconCache(QObject):
         version_token = str(int(os.path.getmtime(source)))
         target_root = get_config_dir() / "assets"
         versioned_dir = target_root / "icons" / version_token
-        checksum = self._calculate_directory_checksum(source)
+        checksum = self._directory_fingerprint(source)
         manifest_entry = self._icon_manifest.get(checksum)
         if manifest_entry and Path(manifest_entry).exists():
             return manifest_entry
@@ -160,19 +164,23 @@ class IconCache(QObject):
         self._logger.warning(f"Icons directory not found. Using fallback: {fallback}")
         return str(fallback)
 
-    def _calculate_directory_checksum(self, source: Path) -> str:
-        digest = hashlib.sha256()
+    def _directory_fingerprint(self, source: Path) -> str:
+        """Manifest key for ``source`` from each file's relative path, size and mtime.
+
+        Only ``stat`` is used, so a frozen start does not read every icon to
+        decide whether the mirrored copy is current.
+        """
+        digest = hashlib.sha1()
         try:
             for root, _dirs, files in os.walk(source):
                 for name in sorted(files):
                     file_path = Path(root) / name
-                    digest.update(str(file_path.relative_to(source)).encode("utf-8"))
                     try:
-                        with open(file_path, "rb") as fh:
-                            for chunk in iter(lambda: fh.read(8192), b""):
-                                digest.update(chunk)
+                        stat = file_path.stat()
                     except OSError:
                         continue
+                    entry = f"{file_path.relative_to(source)}:{stat.st_size}:{stat.st_mtime_ns}\n"
+                    digest.update(entry.encode("utf-8"))
         except OSError:
             return ""
         return digest.hexdigest()
@@ -193,6 +201,11 @@ class IconCache(QObject):
         except OSError:
             pass
     
+    def _device_pixel_ratio(self) -> float:
+        """Device pixel ratio icons are rasterized for (primary screen)."""
+        app = QApplication.instance()
+        return float(app.devicePixelRatio()) if app else 1.0
+
     def _get_dpi_scale_factor(self) -> float:
         """Get the current DPI scale factor."""
         app = QApplication.instance()
@@ -302,32 +315,16 @@ class IconCache(QObject):
         self._logger.warning(f"Icon not found: {name} (theme: {theme})")
         return None
     
-    def _render_svg_icon(self, path: str) -> QIcon:
-        renderer = QSvgRenderer(path)
-        if not renderer.isValid():
-            self._logger.warning("SVG renderer invalid for %s", path)
-            return QIcon()
-
-        default_size = renderer.defaultSize()
-        if not default_size.isValid() or default_size.width() == 0 or default_size.height() == 0:
-            default_size = QSize(64, 64)
-
-        pixmap = QPixmap(default_size)
-        pixmap.fill(Qt.GlobalColor.transparent)
-
-        painter = QPainter(pixmap)
-        renderer.render(painter)
-        painter.end()
-
-        icon = QIcon(pixmap)
-        icon.addPixmap(pixmap)
+    @staticmethod
+    def _icon_from_images(images: list[QImage]) -> QIcon:
+        """Build a QIcon from pre-rendered sizes (GUI thread only)."""
+        icon = QIcon()
+        for image in images:
+            icon.addPixmap(QPixmap.fromImage(image))
         return icon
 
     def _create_icon(self, path: str) -> QIcon:
-        suffix = Path(path).suffix.lower()
-        if suffix == ".svg":
-            return self._render_svg_icon(path)
-
+        """Fallback for files the atlas cannot rasterize."""
         icon = QIcon(path)
         pixmap = QPixmap(path)
         if not pixmap.isNull():
@@ -351,7 +348,8 @@ class IconCache(QObject):
         if icon_path is None:
             return QIcon()
 
-        icon = self._create_icon(icon_path)
+        images = self._atlas.images(name, theme, icon_path, self._device_pixel_ratio())
+        icon = self._icon_from_images(images) if images else self._create_icon(icon_path)
 
         if icon.isNull():
             self._logger.warning("Failed to create icon from %s", icon_path)
@@ -428,6 +426,49 @@ class IconCache(QObject):
                 themed_cache[theme] = icon
                 
         self._logger.debug(f"Preloaded {len(icon_names)} icons for theme: {theme}")
+
+    def available_icons(self) -> list[str]:
+        """Names of the icons shipped in the theme folders."""
+        names: set[str] = set()
+        for theme in ("light", "dark"):
+            folder = Path(self._base_icons_dir) / theme
+            if folder.is_dir():
+                names.update(entry.stem for entry in folder.iterdir() if entry.is_file())
+        return sorted(names)
+
+    def preload_async(self, icon_names: list[str] | None = None,
+                      themes: tuple[str, ...] = ("light", "dark")) -> bool:
+        """
+        Rasterize icons for ``themes`` on a worker thread.
+
+        Paths are resolved here; the worker only produces QImages (loaded from
+        the on-disk atlas or rendered) and the icons are assembled on the GUI
+        thread as results arrive. Icons already cached are skipped. Returns
+        False if there is nothing to do or a preload is still running.
+        """
+        names = self.available_icons() if icon_names is None else icon_names
+        jobs = []
+        for theme in themes:
+            for name in names:
+                if theme in self._icon_cache.get(name, {}):
+                    continue
+                path = self._resolve_icon_path(name, theme)
+                if path is not None:
+                    jobs.append((name, theme, path))
+        return self._preloader.start(jobs, self._device_pixel_ratio())
+
+    def is_preloading(self) -> bool:
+        return self._preloader.is_running()
+
+    def wait_for_preload(self, timeout: float | None = None) -> None:
+        """Block until the worker is done; queued results still need the event loop."""
+        self._preloader.wait(timeout)
+
+    @Slot(str, str, list)
+    def _on_rasterized(self, name: str, theme: str, images: list) -> None:
+        themed_cache = self._icon_cache.setdefault(name, {})
+        if theme not in themed_cache and images:
+            themed_cache[theme] = self._icon_from_images(images)
     
     def clear_cache(self) -> None:
         """Clear the icon cache. Useful after theme change."""
@@ -454,9 +495,10 @@ class IconCache(QObject):
             theme: New theme name ("light" or "dark")
         """
         self._logger.info(f"IconCache: Theme changed to {theme}")
-        
-        # Clear cache to force reload with new theme
-        self.clear_cache()
+
+        # Entries are keyed by effective theme, so nothing has to be dropped:
+        # get() resolves the new theme's icons on demand and toggling back
+        # reuses the previous ones (clear_cache() would also pump events).
         
         # Emit signal for widgets to update
         # Note: Individual widgets should connect to theme_manager.theme_changed
@@ -0,0 +1,41 @@
+"""
+Lazy package exports.
+
+Packages whose public names live in heavy modules (views, viewmodels, widgets)
+resolve them on first attribute access instead of importing every submodule in
+``__init__``. The package calls :func:`lazy_exports` once and binds the result
+to its module-level ``__all__``, ``__getattr__`` and ``__dir__``.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import Any, Callable, Mapping
+
+
+def lazy_exports(
+    package: str, exports: Mapping[str, str]
+) -> tuple[list[str], Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build ``(__all__, __getattr__, __dir__)`` for ``package``.
+
+    ``exports`` maps each public name to the module defining it; relative module
+    names are resolved against ``package``. A resolved value is stored in the
+    package namespace, so later lookups skip ``__getattr__``.
+    """
+    exports = dict(exports)
+    names = list(exports)
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(names))
+
+    return names, __getattr__, __dir__
@@ -11,6 +11,8 @@ from typing import Callable
 
 from PySide6 import QtCore
 
+from src.utils.sampling_profiler import label_current_thread
+
 
 @dataclasses.dataclass(slots=True)
 class ExportRequest:
@@ -60,6 +62,7 @@ class LogExportWorker(QtCore.QThread):
         self._cancelled = True
 
     def run(self) -> None:  # noqa: D401
+        label_current_thread("LogExportWorker")
         try:
             total_ports = len(self._request.port_files)
             
@@ -0,0 +1,284 @@
+"""
+Compiled multi-term log filters.
+
+Query syntax (case-insensitive, terms separated by whitespace)::
+
+    error timeout          both terms must match (implicit AND)
+    error OR warn          either clause may match (``|`` is accepted too)
+    -debug / NOT debug     exclude lines containing the term
+    "link up"              quoted phrase
+    /crc=\\d+/  re:crc=\\d+  regular expression
+    dir:rx  dir:tx,sys     direction predicate
+    since:12:30  until:12:45:10  since:5m   time predicates (clock or age)
+
+The query is parsed once into clauses (OR of ANDs); an ``OR`` with no terms
+on one side adds nothing. Age terms (``since:5m``) are resolved against the
+compile time, and :class:`IncrementalFilter` recompiles such filters on every
+update so the window keeps sliding. All positive text terms are additionally
+folded into one alternation regex which rejects most lines with a single
+``search`` call before individual terms are evaluated. Malformed pieces
+degrade to literal substrings, so the filter never raises while the user is
+still typing.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Iterator
+
+from src.utils.log_store import ColumnarLogStore, LogDirection, LogEntry
+
+_TOKEN_RE = re.compile(r'-?"[^"]*"?|\S+')
+_CLOCK_RE = re.compile(r"^(\d{1,2}):(\d{2})(?::(\d{2}))?$")
+_AGE_RE = re.compile(r"^(\d+)([smh])$")
+_AGE_UNITS = {"s": 1, "m": 60, "h": 3600}
+_OR_TOKENS = {"OR", "|", "||"}
+_NOT_TOKENS = {"NOT", "!"}
+
+
+@dataclass(frozen=True, slots=True)
+class _Clause:
+    """Conjunction of predicates; a line matches when all of them hold."""
+
+    include: tuple[re.Pattern[str], ...] = ()
+    exclude: tuple[re.Pattern[str], ...] = ()
+    directions: frozenset[LogDirection] | None = None
+    since: float | None = None
+    until: float | None = None
+
+    def matches(self, text: str, direction: LogDirection, timestamp: float) -> bool:
+        if self.directions is not None and direction not in self.directions:
+            return False
+        if self.since is not None and timestamp < self.since:
+            return False
+        if self.until is not None and timestamp > self.until:
+            return False
+        for pattern in self.include:
+            if pattern.search(text) is None:
+                return False
+        for pattern in self.exclude:
+            if pattern.search(text) is not None:
+                return False
+        return True
+
+
+class LogFilter:
+    """Filter query compiled once and evaluated per log row."""
+
+    __slots__ = ("query", "relative", "_clauses", "_prefilter", "_match_all")
+
+    def __init__(self, query: str, clauses: list[_Clause], *, relative: bool = False) -> None:
+        self.query = query
+        self.relative = relative  # depends on the compile time (``since:5m``)
+        self._clauses = tuple(clauses)
+        self._match_all = any(clause == _Clause() for clause in clauses)
+        self._prefilter = None if self._match_all else self._build_prefilter(self._clauses)
+
+    @classmethod
+    def compile(cls, query: str, *, now: float | None = None) -> LogFilter:
+        """Parse ``query``; relative time terms are resolved against ``now``."""
+        now = time.time() if now is None else now
+        states: list[dict] = [_new_clause_state()]
+        negate = False
+        for token in _TOKEN_RE.findall(query):
+            if token in _OR_TOKENS:
+                # A leading, trailing or doubled OR must not add a match-all clause
+                if states[-1]["terms"]:
+                    states.append(_new_clause_state())
+                negate = False
+                continue
+            if token == "AND":
+                continue
+            if token in _NOT_TOKENS:
+                negate = not negate
+                continue
+            if len(token) > 1 and token[0] in "-!":
+                negate, token = not negate, token[1:]
+            _apply_term(states[-1], token, negate, now)
+            negate = False
+        if len(states) > 1 and not states[-1]["terms"]:
+            states.pop()
+        clauses = [_finish_clause(state) for state in states]
+        return cls(
+            query,
+            [clause for clause in clauses if clause is not None],
+            relative=any(state["relative"] for state in states),
+        )
+
+    @staticmethod
+    def _build_prefilter(clauses: tuple[_Clause, ...]) -> re.Pattern[str] | None:
+        # Sound only if every clause requires at least one positive text term
+        if any(not clause.include for clause in clauses):
+            return None
+        # Joining renumbers groups, so a backreference would point at another term's group
+        if any(pattern.groups for clause in clauses for pattern in clause.include):
+            return None
+        sources = {f"(?:{pattern.pattern})" for clause in clauses for pattern in clause.include}
+        try:
+            return re.compile("|".join(sorted(sources)), re.IGNORECASE)
+        except re.error:
+            return None
+
+    @property
+    def matches_everything(self) -> bool:
+        return self._match_all
+
+    def matches(self, text: str, direction: LogDirection, timestamp: float) -> bool:
+        if self._match_all:
+            return True
+        if self._prefilter is not None and self._prefilter.search(text) is None:
+            return False
+        return any(clause.matches(text, direction, timestamp) for clause in self._clauses)
+
+    def __call__(self, entry: LogEntry) -> bool:
+        return self.matches(entry.text, entry.direction, entry.timestamp)
+
+
+def _new_clause_state() -> dict:
+    return {
+        "include": [], "exclude": [], "directions": None, "since": None, "until": None,
+        "terms": 0, "relative": False,
+    }
+
+
+def _finish_clause(state: dict) -> _Clause | None:
+    directions = state["directions"]
+    if directions is not None and not directions:
+        return None  # contradictory direction terms: the clause can never match
+    return _Clause(
+        include=tuple(state["include"]),
+        exclude=tuple(state["exclude"]),
+        directions=frozenset(directions) if directions is not None else None,
+        since=state["since"],
+        until=state["until"],
+    )
+
+
+def _apply_term(state: dict, token: str, negate: bool, now: float) -> None:
+    state["terms"] += 1
+    key, _, value = token.partition(":")
+    key = key.lower()
+    if value and key == "dir":
+        selected = _parse_directions(value)
+        if selected is not None:
+            if negate:
+                selected = set(LogDirection) - selected
+            current = state["directions"]
+            state["directions"] = selected if current is None else current & selected
+            return
+    if value and key in ("since", "until"):
+        moment = _parse_time(value, now)
+        if moment is not None:
+            state["relative"] = state["relative"] or _AGE_RE.match(value) is not None
+            bound = key if not negate else ("until" if key == "since" else "since")
+            if bound == "since":
+                state["since"] = moment if state["since"] is None else max(state["since"], moment)
+            else:
+                state["until"] = moment if state["until"] is None else min(state["until"], moment)
+            return
+    (state["exclude"] if negate else state["include"]).append(compile_text_term(token))
+
+
+def _parse_directions(value: str) -> set[LogDirection] | None:
+    selected: set[LogDirection] = set()
+    for name in value.upper().split(","):
+        if name not in LogDirection.__members__:
+            return None
+        selected.add(LogDirection[name])
+    return selected
+
+
+def _parse_time(value: str, now: float) -> float | None:
+    age = _AGE_RE.match(value)
+    if age:
+        return now - int(age.group(1)) * _AGE_UNITS[age.group(2)]
+    clock = _CLOCK_RE.match(value)
+    if clock:
+        hours, minutes, seconds = int(clock.group(1)), int(clock.group(2)), int(clock.group(3) or 0)
+        if hours > 23 or minutes > 59 or seconds > 59:
+            return None
+        local = time.localtime(now)
+        return time.mktime(
+            (local.tm_year, local.tm_mon, local.tm_mday, hours, minutes, seconds, 0, 0, -1)
+        )
+    return None
+
+
+def compile_text_term(token: str) -> re.Pattern[str]:
+    """Compile one text term: ``/regex/`` or ``re:regex``, else a literal (optionally quoted)."""
+    source: str | None = None
+    if token.startswith("re:") and len(token) > 3:
+        source = token[3:]
+    elif len(token) > 2 and token.startswith("/") and token.endswith("/"):
+        source = token[1:-1]
+    if source is not None:
+        try:
+            return re.compile(source, re.IGNORECASE)
+        except re.error:
+            pass  # fall back to a literal search for half-typed expressions
+    if token.startswith('"'):
+        token = token[1:-1] if len(token) > 1 and token.endswith('"') else token[1:]
+    return re.compile(re.escape(token), re.IGNORECASE)
+
+
+class IncrementalFilter:
+    """
+    Filtered projection of a :class:`ColumnarLogStore`.
+
+    :meth:`update` tests only rows appended since the previous call and
+    appends rendered matches, so a live filter costs O(new lines). Matches
+    whose rows were evicted from the store are dropped from the front. A
+    :attr:`LogFilter.relative` filter is recompiled and re-evaluated over the
+    whole store on each update instead, since its time window moves.
+    """
+
+    def __init__(
+        self,
+        store: ColumnarLogStore,
+        log_filter: LogFilter,
+        render: Callable[[LogEntry], str],
+    ) -> None:
+        self._store = store
+        self._filter = log_filter
+        self._render = render
+        self._parts: deque[tuple[int, str]] = deque()
+        self._next_seq = store.first_seq
+
+    @property
+    def query(self) -> str:
+        return self._filter.query
+
+    @property
+    def store(self) -> ColumnarLogStore:
+        return self._store
+
+    def __len__(self) -> int:
+        return len(self._parts)
+
+    def update(self, *, now: float | None = None) -> int:
+        """Evaluate newly appended rows; returns the number of new matches."""
+        store = self._store
+        parts = self._parts
+        if self._filter.relative:
+            self._filter = LogFilter.compile(self._filter.query, now=now)
+            parts.clear()
+            self._next_seq = store.first_seq
+        while parts and parts[0][0] < store.first_seq:
+            parts.popleft()
+        matched = 0
+        log_filter = self._filter
+        for entry in store.entries(max(self._next_seq, store.first_seq)):
+            if log_filter(entry):
+                parts.append((entry.seq, self._render(entry)))
+                matched += 1
+        self._next_seq = store.next_seq
+        return matched
+
+    def matched_seqs(self) -> Iterator[int]:
+        return (seq for seq, _ in self._parts)
+
+    def text(self) -> str:
+        return "".join(part for _, part in self._parts)
@@ -0,0 +1,226 @@
+"""Columnar in-memory log storage shared by console views, search and export."""
+
+from __future__ import annotations
+
+import re
+import time
+from array import array
+from enum import IntEnum
+from typing import Callable, Iterable, Iterator, NamedTuple
+
+
+class LogDirection(IntEnum):
+    """Origin of a stored log line."""
+
+    RX = 0
+    TX = 1
+    SYS = 2
+
+
+class LogEntry(NamedTuple):
+    """Materialized view of one row of a :class:`ColumnarLogStore`."""
+
+    seq: int
+    timestamp: float
+    direction: LogDirection
+    text: str
+
+
+class _StringTable:
+    """Reference-counted interning table so repeated lines share one ``str``."""
+
+    __slots__ = ("_ids", "_strings", "_refs", "_free")
+
+    def __init__(self) -> None:
+        self._ids: dict[str, int] = {}
+        self._strings: list[str | None] = []
+        self._refs = array("I")
+        self._free: list[int] = []
+
+    def acquire(self, text: str) -> int:
+        sid = self._ids.get(text)
+        if sid is not None:
+            self._refs[sid] += 1
+            return sid
+        if self._free:
+            sid = self._free.pop()
+            self._strings[sid] = text
+            self._refs[sid] = 1
+        else:
+            sid = len(self._strings)
+            self._strings.append(text)
+            self._refs.append(1)
+        self._ids[text] = sid
+        return sid
+
+    def release(self, sid: int) -> None:
+        refs = self._refs[sid] - 1
+        self._refs[sid] = refs
+        if refs == 0:
+            del self._ids[self._strings[sid]]
+            self._strings[sid] = None
+            self._free.append(sid)
+
+    def __getitem__(self, sid: int) -> str:
+        return self._strings[sid]  # type: ignore[return-value]
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def matching_ids(self, predicate: Callable[[str], object]) -> set[int]:
+        """Return ids of live strings for which ``predicate`` is truthy."""
+        return {sid for text, sid in self._ids.items() if predicate(text)}
+
+    def clear(self) -> None:
+        self._ids.clear()
+        self._strings.clear()
+        self._refs = array("I")
+        self._free.clear()
+
+
+class ColumnarLogStore:
+    """
+    Fixed-capacity ring of log lines kept as parallel typed columns.
+
+    Timestamps, direction and string-table ids live in ``array`` columns, so a
+    row costs 13 bytes plus its (shared) text. Rows are addressed by a
+    monotonically increasing sequence number that stays valid until the row
+    is evicted by newer data.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self._capacity = capacity
+        self._timestamps = array("d")
+        self._directions = array("B")
+        self._text_ids = array("I")
+        self._strings = _StringTable()
+        self._start = 0  # physical index of the oldest row
+        self._first_seq = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def first_seq(self) -> int:
+        """Sequence number of the oldest retained row."""
+        return self._first_seq
+
+    @property
+    def next_seq(self) -> int:
+        """Sequence number the next appended row will receive."""
+        return self._first_seq + len(self._text_ids)
+
+    @property
+    def unique_texts(self) -> int:
+        return len(self._strings)
+
+    def __len__(self) -> int:
+        return len(self._text_ids)
+
+    def append(
+        self,
+        text: str,
+        direction: LogDirection = LogDirection.RX,
+        timestamp: float | None = None,
+    ) -> int:
+        """Store a line and return its sequence number."""
+        ts = time.time() if timestamp is None else timestamp
+        sid = self._strings.acquire(text)
+        count = len(self._text_ids)
+        if count < self._capacity:
+            self._timestamps.append(ts)
+            self._directions.append(direction)
+            self._text_ids.append(sid)
+            return self._first_seq + count
+
+        pos = self._start
+        self._strings.release(self._text_ids[pos])
+        self._timestamps[pos] = ts
+        self._directions[pos] = direction
+        self._text_ids[pos] = sid
+        self._start = (pos + 1) % self._capacity
+        self._first_seq += 1
+        return self._first_seq + count - 1
+
+    def _position(self, seq: int) -> int:
+        return (self._start + seq - self._first_seq) % self._capacity
+
+    def __contains__(self, seq: object) -> bool:
+        return isinstance(seq, int) and self._first_seq <= seq < self.next_seq
+
+    def get(self, seq: int) -> LogEntry | None:
+        """Return the row for ``seq`` or ``None`` if it was evicted."""
+        if seq not in self:
+            return None
+        pos = self._position(seq)
+        return LogEntry(
+            seq,
+            self._timestamps[pos],
+            LogDirection(self._directions[pos]),
+            self._strings[self._text_ids[pos]],
+        )
+
+    def _seq_range(self, start_seq: int | None, stop_seq: int | None) -> range:
+        start = self._first_seq if start_seq is None else max(start_seq, self._first_seq)
+        stop = self.next_seq if stop_seq is None else min(stop_seq, self.next_seq)
+        return range(start, max(start, stop))
+
+    def entries(
+        self, start_seq: int | None = None, stop_seq: int | None = None
+    ) -> Iterator[LogEntry]:
+        """Iterate retained rows in order, optionally limited to ``[start, stop)``."""
+        for seq in self._seq_range(start_seq, stop_seq):
+            pos = self._position(seq)
+            yield LogEntry(
+                seq,
+                self._timestamps[pos],
+                LogDirection(self._directions[pos]),
+                self._strings[self._text_ids[pos]],
+            )
+
+    def select(self, seqs: Iterable[int]) -> list[LogEntry]:
+        """Return rows for the given sequence numbers, skipping evicted ones."""
+        return [entry for entry in map(self.get, seqs) if entry is not None]
+
+    def texts(
+        self, start_seq: int | None = None, stop_seq: int | None = None
+    ) -> Iterator[str]:
+        strings = self._strings
+        for seq in self._seq_range(start_seq, stop_seq):
+            yield strings[self._text_ids[self._position(seq)]]
+
+    def to_text(self) -> str:
+        """Plain-text dump of all retained rows, one per line."""
+        return "".join(f"{text}\n" for text in self.texts())
+
+    def search(self, pattern: re.Pattern[str] | str) -> list[int]:
+        """
+        Return sequence numbers of rows matching ``pattern``.
+
+        A plain string is matched case-insensitively as a substring. Each
+        distinct text is tested once, however many rows reference it.
+        """
+        if isinstance(pattern, str):
+            needle = pattern.lower()
+            matching = self._strings.matching_ids(lambda text: needle in text.lower())
+        else:
+            matching = self._strings.matching_ids(pattern.search)
+        if not matching:
+            return []
+        text_ids = self._text_ids
+        return [
+            seq for seq in self._seq_range(None, None)
+            if text_ids[self._position(seq)] in matching
+        ]
+
+    def clear(self) -> None:
+        """Drop all rows; sequence numbers keep increasing across clears."""
+        self._first_seq = self.next_seq
+        self._timestamps = array("d")
+        self._directions = array("B")
+        self._text_ids = array("I")
+        self._strings.clear()
+        self._start = 0
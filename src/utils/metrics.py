@@ -0,0 +1,448 @@
+"""
+Hot-path metrics: counters, gauges, latency histograms and span tracing.
+
+``PerformanceTimer`` logged one line per timed call and only ran when the
+``APP_PROFILE`` environment variable was set, so per-stage latency of the RX
+path was invisible in normal runs. The :data:`metrics` registry is always on
+and cheap enough for per-line use:
+
+* :class:`Counter` and :class:`Histogram` write to a shard owned by the
+  calling thread (keyed by ``threading.get_ident()``), so recording takes no
+  lock; shards are merged when a snapshot is read. A reader may see a sample
+  counted but not yet summed - snapshots are statistics, not transactions.
+* Histograms use HDR-style log-linear buckets: exact below 16, then 16
+  buckets per power of two (at most 6.25% error), so nanosecond latencies
+  from 1 ns to minutes fit in a few hundred sparse buckets.
+* :meth:`Histogram.record_since` also appends a trace event when tracing is
+  on. Events go to a bounded ring per thread and are exported as Chrome
+  trace-event JSON (``chrome://tracing``, Perfetto, speedscope).
+
+The RX path records one span per stage, in order: ``serial.read`` ->
+``serial.frame`` -> ``serial.emit`` (worker thread), ``viewmodel.rx`` ->
+``console.format`` -> ``console.flush`` -> ``console.history_append`` (GUI
+thread).
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from src.utils.config_loader import config_loader
+from src.utils.sampling_profiler import current_thread_name
+from src.utils.service_container import service_container
+
+logger = logging.getLogger(__name__)
+
+_SUB_BITS = 4
+_SUB_BUCKETS = 1 << _SUB_BITS
+DEFAULT_TRACE_CAPACITY = 20000
+
+_get_ident = threading.get_ident
+_now_ns = time.perf_counter_ns
+
+
+def bucket_index(value: int) -> int:
+    """Log-linear bucket of a non-negative integer value."""
+    if value < _SUB_BUCKETS:
+        return max(0, value)
+    shift = value.bit_length() - _SUB_BITS - 1
+    return ((shift + 1) << _SUB_BITS) + (value >> shift) - _SUB_BUCKETS
+
+
+def bucket_bounds(index: int) -> tuple[int, int]:
+    """Inclusive ``(low, high)`` values of a bucket."""
+    if index < _SUB_BUCKETS:
+        return index, index
+    shift = (index >> _SUB_BITS) - 1
+    mantissa = (index & (_SUB_BUCKETS - 1)) + _SUB_BUCKETS
+    return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+
+class _CounterShard:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0
+
+
+class _HistogramShard:
+    __slots__ = ("buckets", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self.buckets: dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+
+class Counter:
+    """Monotonic count, sharded per thread."""
+
+    __slots__ = ("name", "_shards")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._shards: dict[int, _CounterShard] = {}
+
+    def add(self, amount: int = 1) -> None:
+        shard = self._shards.get(_get_ident())
+        if shard is None:
+            shard = self._shards.setdefault(_get_ident(), _CounterShard())
+        shard.value += amount
+
+    @property
+    def value(self) -> int:
+        return sum(shard.value for shard in list(self._shards.values()))
+
+    def reset(self) -> None:
+        self._shards = {}
+
+
+class Gauge:
+    """Last value set; a single store, so no sharding is needed."""
+
+    __slots__ = ("name", "value")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.value: float = 0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def reset(self) -> None:
+        self.value = 0
+
+
+@dataclass(frozen=True, slots=True)
+class HistogramSnapshot:
+    """Merged contents of a histogram at one point in time."""
+
+    name: str
+    count: int
+    total: int
+    min: int
+    max: int
+    buckets: tuple[tuple[int, int], ...]  # (bucket index, count), ascending
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> int:
+        """Upper bound of the bucket holding the ``q``-th percentile (0..100)."""
+        if not self.count:
+            return 0
+        rank = max(1, round(self.count * min(max(q, 0.0), 100.0) / 100))
+        seen = 0
+        for index, count in self.buckets:
+            seen += count
+            if seen >= rank:
+                return min(bucket_bounds(index)[1], self.max)
+        return self.max
+
+    def summary(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "mean": round(self.mean, 1),
+            "min": self.min,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+
+class Histogram:
+    """Latency (or size) distribution in log-linear buckets, sharded per thread."""
+
+    __slots__ = ("name", "_registry", "_shards")
+
+    def __init__(self, name: str, registry: MetricsRegistry) -> None:
+        self.name = name
+        self._registry = registry
+        self._shards: dict[int, _HistogramShard] = {}
+
+    def record(self, value: int) -> None:
+        shard = self._shards.get(_get_ident())
+        if shard is None:
+            shard = self._shards.setdefault(_get_ident(), _HistogramShard())
+        # bucket_index(), inlined: this runs several times per received line
+        if value < _SUB_BUCKETS:
+            index = value if value > 0 else 0
+        else:
+            shift = value.bit_length() - _SUB_BITS - 1
+            index = ((shift + 1) << _SUB_BITS) + (value >> shift) - _SUB_BUCKETS
+        buckets = shard.buckets
+        buckets[index] = buckets.get(index, 0) + 1
+        if not shard.count or value < shard.min:
+            shard.min = value
+        if value > shard.max:
+            shard.max = value
+        shard.count += 1
+        shard.total += value
+
+    def record_since(self, start_ns: int) -> None:
+        """Record ``perf_counter_ns() - start_ns`` and trace it as a span of this name."""
+        registry = self._registry
+        if not registry.enabled:
+            return
+        end_ns = _now_ns()
+        self.record(end_ns - start_ns)
+        if registry.tracing:
+            registry._trace(self.name, start_ns, end_ns)
+
+    def time(self) -> Span:
+        """Context manager recording the duration of its block."""
+        return Span(self)
+
+    def snapshot(self) -> HistogramSnapshot:
+        merged: dict[int, int] = {}
+        count = total = 0
+        low = high = 0
+        for shard in list(self._shards.values()):
+            if not shard.count:
+                continue
+            for index, hits in list(shard.buckets.items()):
+                merged[index] = merged.get(index, 0) + hits
+            low = shard.min if not count else min(low, shard.min)
+            high = max(high, shard.max)
+            count += shard.count
+            total += shard.total
+        return HistogramSnapshot(self.name, count, total, low, high, tuple(sorted(merged.items())))
+
+    def reset(self) -> None:
+        self._shards = {}
+
+
+class Span:
+    """``with histogram.time():`` helper around :meth:`Histogram.record_since`."""
+
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: Histogram) -> None:
+        self._histogram = histogram
+        self._start = 0
+
+    def __enter__(self) -> Span:
+        self._start = _now_ns()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._histogram.record_since(self._start)
+
+
+class _TraceBuffer:
+    """Bounded span ring of one thread."""
+
+    __slots__ = ("thread_name", "events")
+
+    def __init__(self, thread_name: str, capacity: int) -> None:
+        self.thread_name = thread_name
+        self.events: deque[tuple[str, int, int]] = deque(maxlen=capacity)
+
+
+@dataclass(frozen=True, slots=True)
+class MetricsSnapshot:
+    """Merged values of every metric."""
+
+    counters: dict[str, int]
+    gauges: dict[str, float]
+    histograms: dict[str, HistogramSnapshot]
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-friendly form; histogram values in the unit they were recorded in."""
+        return {
+            "counters": dict(self.counters),
+            "gauges": dict(self.gauges),
+            "histograms": {name: hist.summary() for name, hist in self.histograms.items()},
+        }
+
+
+class MetricsRegistry:
+    """Named metrics plus the span recorder behind Chrome trace export."""
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        tracing: bool = False,
+        trace_capacity: int = DEFAULT_TRACE_CAPACITY,
+        output_dir: Path | None = None,
+    ) -> None:
+        self.enabled = enabled
+        self.tracing = tracing
+        self._trace_capacity = max(1, trace_capacity)
+        self._output_dir = output_dir
+        self._lock = threading.Lock()
+        self._counters: dict[str, Counter] = {}
+        self._gauges: dict[str, Gauge] = {}
+        self._histograms: dict[str, Histogram] = {}
+        # Keyed by (thread ident, thread name): a restarted worker may reuse an ident.
+        # Each thread finds its own buffer through thread-local storage, which a new
+        # thread starts without even when its ident is reused
+        self._traces: dict[tuple[int, str], _TraceBuffer] = {}
+        self._local = threading.local()
+        self._epoch_ns = _now_ns()
+
+    # Metric handles: look up once (module level) and keep -----------------------
+
+    def counter(self, name: str) -> Counter:
+        metric = self._counters.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._counters.setdefault(name, Counter(name))
+        return metric
+
+    def gauge(self, name: str) -> Gauge:
+        metric = self._gauges.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._gauges.setdefault(name, Gauge(name))
+        return metric
+
+    def histogram(self, name: str) -> Histogram:
+        metric = self._histograms.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._histograms.setdefault(name, Histogram(name, self))
+        return metric
+
+    def span(self, name: str) -> Span:
+        """``with metrics.span("stage"):`` for code that is not hot enough to keep a handle."""
+        return Span(self.histogram(name))
+
+    # Configuration ----------------------------------------------------------------
+
+    def configure(self, enabled: bool, tracing: bool, trace_capacity: int) -> None:
+        self.enabled = enabled
+        self.tracing = tracing
+        if trace_capacity != self._trace_capacity:
+            self._trace_capacity = max(1, trace_capacity)
+            with self._lock:
+                self._traces = {}
+                self._local = threading.local()
+
+    def set_tracing(self, tracing: bool) -> None:
+        self.tracing = tracing
+
+    # Reading ----------------------------------------------------------------------
+
+    def snapshot(self) -> MetricsSnapshot:
+        with self._lock:
+            counters = list(self._counters.values())
+            gauges = list(self._gauges.values())
+            histograms = list(self._histograms.values())
+        return MetricsSnapshot(
+            counters={metric.name: metric.value for metric in counters},
+            gauges={metric.name: metric.value for metric in gauges},
+            histograms={metric.name: metric.snapshot() for metric in histograms},
+        )
+
+    def reset(self) -> None:
+        """Zero every metric and drop recorded spans; handles stay valid."""
+        with self._lock:
+            for metric in (*self._counters.values(), *self._gauges.values(), *self._histograms.values()):
+                metric.reset()
+            self._traces = {}
+            self._local = threading.local()
+            self._epoch_ns = _now_ns()
+
+    # Tracing ----------------------------------------------------------------------
+
+    def _trace(self, name: str, start_ns: int, end_ns: int) -> None:
+        local = self._local
+        buffer = getattr(local, "buffer", None)
+        if buffer is None:
+            key = (_get_ident(), current_thread_name())
+            buffer = local.buffer = self._traces.setdefault(
+                key, _TraceBuffer(key[1], self._trace_capacity)
+            )
+        buffer.events.append((name, start_ns, end_ns))
+
+    def trace_events(self) -> list[dict[str, Any]]:
+        """Recorded spans as Chrome trace events (complete ``X`` events, microseconds)."""
+        pid = os.getpid()
+        epoch = self._epoch_ns
+        events: list[dict[str, Any]] = []
+        used: set[int] = set()
+        spare = 0
+        for (ident, _), buffer in list(self._traces.items()):
+            tid = ident
+            while tid in used:  # a reused ident gets a small spare id: one track per thread
+                spare += 1
+                tid = spare
+            used.add(tid)
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                           "args": {"name": buffer.thread_name}})
+            for name, start_ns, end_ns in list(buffer.events):
+                if start_ns < epoch:
+                    continue
+                events.append({
+                    "name": name,
+                    "cat": name.split(".", 1)[0],
+                    "ph": "X",
+                    "ts": (start_ns - epoch) / 1000,
+                    "dur": (end_ns - start_ns) / 1000,
+                    "pid": pid,
+                    "tid": tid,
+                })
+        return events
+
+    def default_trace_path(self) -> Path:
+        if self._output_dir is None:
+            from src.styles.constants import LoggingConfig
+
+            self._output_dir = LoggingConfig.LOG_DIR / "traces"
+        stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        return self._output_dir / f"trace_{stamp}.json"
+
+    def export_chrome_trace(self, path: str | Path | None = None) -> Path | None:
+        """Write recorded spans and current metric values; None when no span was recorded."""
+        events = self.trace_events()
+        if not any(event["ph"] == "X" for event in events):
+            return None
+        target = Path(path) if path is not None else self.default_trace_path()
+        target.parent.mkdir(parents=True, exist_ok=True)
+        document = {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": self.snapshot().to_dict(),
+        }
+        target.write_text(json.dumps(document), encoding="utf-8")
+        logger.info("Chrome trace saved to %s (%d events)", target, len(events))
+        return target
+
+
+def _apply_config(_snapshot: object = None) -> None:
+    config = config_loader.get_metrics_config()
+    metrics.configure(config.enabled, config.tracing, config.trace_capacity)
+
+
+metrics = MetricsRegistry()
+_apply_config()
+config_loader.config_changed.connect(_apply_config)
+service_container.register_singleton("metrics_registry", lambda: metrics)
+
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "HistogramSnapshot",
+    "MetricsRegistry",
+    "MetricsSnapshot",
+    "Span",
+    "bucket_bounds",
+    "bucket_index",
+    "metrics",
+]
@@ -15,12 +15,12 @@ class MemoryMappedLogHistory:
 
     _HEADER = struct.Struct("<QQ")  # write_offset, total_written
 
-    def __init__(self, port_label: str, capacity_bytes: int) -> None:
+    def __init__(self, port_label: str, capacity_bytes: int, directory: Path | None = None) -> None:
         if capacity_bytes <= self._HEADER.size:
             raise ValueError("capacity_bytes must exceed header size")
 
         safe_label = port_label.lower().replace("/", "_")
-        self._path = get_config_dir() / f"console_history_{safe_label}.bin"
+        self._path = (directory or get_config_dir()) / f"console_history_{safe_label}.bin"
         self._total_size = capacity_bytes
         self._payload_size = self._total_size - self._HEADER.size
 
@@ -54,7 +54,12 @@ class MemoryMappedLogHistory:
         payload = text.replace("\r\n", "\n").encode("utf-8")
         if not payload.endswith(b"\n"):
             payload += b"\n"
+        self.append_bytes(payload)
 
+    def append_bytes(self, payload: bytes) -> None:
+        """Append raw bytes verbatim (no newline handling)."""
+        if not payload:
+            return
         if len(payload) >= self._payload_size:
             payload = payload[-self._payload_size :]
 
@@ -77,23 +82,28 @@ class MemoryMappedLogHistory:
         self._write_header()
 
     def read_all(self) -> str:
+        buf = self.read_all_bytes()
+        if self._total_written < self._payload_size:
+            buf = buf.rstrip(b"\x00")
+        return buf.decode("utf-8", errors="ignore")
+
+    def read_all_bytes(self) -> bytes:
+        """Return retained payload bytes, oldest first."""
         if self._payload_size <= 0:
-            return ""
+            return b""
         payload_offset = self._HEADER.size
         data_len = min(self._total_written, self._payload_size)
         if data_len <= 0:
-            return ""
+            return b""
 
         if self._total_written < self._payload_size:
-            buf = self._mmap[payload_offset : payload_offset + data_len]
-            return buf.rstrip(b"\x00").decode("utf-8", errors="ignore")
+            return self._mmap[payload_offset : payload_offset + data_len]
 
         offset = self._write_offset
         end = payload_offset + self._payload_size
         tail = self._mmap[payload_offset + offset : end]
         head = self._mmap[payload_offset : payload_offset + offset]
-        buf = tail + head
-        return buf.decode("utf-8", errors="ignore")
+        return tail + head
 
     def close(self) -> None:
         try:
@@ -105,5 +115,7 @@ class MemoryMappedLogHistory:
                 self._file.close()
 
 
-def create_history_for_port(port_label: str, capacity_bytes: int) -> MemoryMappedLogHistory:
-    return MemoryMappedLogHistory(port_label, capacity_bytes)
+def create_history_for_port(
+    port_label: str, capacity_bytes: int, directory: Path | None = None
+) -> MemoryMappedLogHistory:
+    return MemoryMappedLogHistory(port_label, capacity_bytes, directory)
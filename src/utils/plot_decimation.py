@@ -0,0 +1,33 @@
+"""Min/max-per-pixel decimation for line plots."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from src.utils.telemetry_decoder import HAS_NUMPY
+
+if HAS_NUMPY:
+    import numpy as np
+
+
+def minmax_decimate(values: Any, buckets: int) -> tuple[Any, Any]:
+    """
+    Reduce ``values`` to per-bucket minima and maxima.
+
+    Each of the ``buckets`` output columns covers a contiguous run of
+    samples, so drawing a vertical segment from min to max per pixel column
+    keeps every spike visible while the draw cost depends only on the
+    widget width. With fewer samples than buckets the samples are returned
+    as both minima and maxima.
+    """
+    count = len(values)
+    if buckets <= 0 or count == 0:
+        empty = values[:0]
+        return empty, empty
+    if count <= buckets:
+        return values, values
+    edges = np.linspace(0, count, buckets + 1).astype(np.intp)[:-1]
+    return np.minimum.reduceat(values, edges), np.maximum.reduceat(values, edges)
+
+
+__all__ = ["minmax_decimate"]
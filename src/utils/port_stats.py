@@ -0,0 +1,195 @@
+"""
+Rolling per-port reception statistics.
+
+:class:`PortStats` is written by the serial worker thread once per read and
+read by the UI through :meth:`PortStats.snapshot` at a low polling rate, so
+the GUI never receives a signal per increment. All storage is fixed-size:
+
+- byte and line counts in a ring of 100 ms buckets covering the longest
+  window (60 s); rates for the 1 s / 10 s / 60 s windows are summed from it
+- log2 histograms of inter-line gaps (milliseconds) and line lengths (bytes)
+
+Every update is O(1) (advancing the ring clears at most the skipped
+buckets, bounded by the ring size). In framed mode a "line" is one frame.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+# Rate windows in seconds
+WINDOWS: tuple[int, ...] = (1, 10, 60)
+
+BUCKET_SECONDS = 0.1
+_BUCKETS_PER_SECOND = 10
+_SLOTS = WINDOWS[-1] * _BUCKETS_PER_SECOND
+
+# Histogram bucket i counts values v with v.bit_length() == i: 0, 1, 2-3, 4-7, ...
+GAP_BUCKETS = 18     # last bucket: gaps of 131 s and more
+LENGTH_BUCKETS = 17  # last bucket: lines of 64 KiB and more
+
+
+def histogram_bounds(buckets: int) -> tuple[int, ...]:
+    """Inclusive lower bound of every log2 histogram bucket: 0, 1, 2, 4, 8, ..."""
+    return (0,) + tuple(1 << (i - 1) for i in range(1, buckets))
+
+
+def format_byte_rate(value: float) -> str:
+    """Compact byte count for rate labels: ``512 B``, ``12.5 KB``, ``1.2 MB``."""
+    for unit in ("B", "KB"):
+        if value < 1024:
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} MB"
+
+
+@dataclass(frozen=True, slots=True)
+class PortStatsSnapshot:
+    """Point-in-time copy of :class:`PortStats` that is safe to hand to the UI."""
+
+    total_bytes: int
+    total_lines: int
+    bytes_per_second: dict[int, float]
+    lines_per_second: dict[int, float]
+    gap_histogram_ms: tuple[int, ...]
+    line_length_histogram: tuple[int, ...]
+    max_burst_bytes: int
+    max_burst_lines: int
+    decode_errors: int
+    dropped_lines: int
+
+
+class PortStats:
+    """Thread-safe rolling counters for one port (writer: worker, reader: UI)."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._bytes = [0] * _SLOTS
+            self._lines = [0] * _SLOTS
+            self._gaps = [0] * GAP_BUCKETS
+            self._lengths = [0] * LENGTH_BUCKETS
+            self._tick: int | None = None  # absolute bucket number of the newest slot
+            self._first_tick = 0
+            self._last_line_time: float | None = None
+            self._total_bytes = 0
+            self._total_lines = 0
+            self._max_burst_bytes = 0
+            self._max_burst_lines = 0
+            self._decode_errors = 0
+            self._dropped_lines = 0
+
+    def _advance(self, now: float) -> int:
+        """Move the ring to ``now``, clearing skipped buckets; returns the current slot."""
+        tick = int(now * _BUCKETS_PER_SECOND)
+        last = self._tick
+        if last is None:
+            self._tick = self._first_tick = tick
+        elif tick > last:
+            for step in range(last + 1, last + 1 + min(tick - last, _SLOTS)):
+                slot = step % _SLOTS
+                self._bytes[slot] = 0
+                self._lines[slot] = 0
+            self._tick = tick
+        return self._tick % _SLOTS
+
+    def record_rx(
+        self,
+        nbytes: int,
+        line_lengths: Iterable[int] = (),
+        now: float | None = None,
+    ) -> None:
+        """
+        Account one read: ``nbytes`` from the wire and the lines (or frames) it completed.
+
+        Lines completed by the same read share its timestamp, so all but the
+        first fall into the zero-gap bucket.
+        """
+        if now is None:
+            now = self._clock()
+        lengths = list(line_lengths)
+        count = len(lengths)
+        with self._lock:
+            slot = self._advance(now)
+            self._bytes[slot] += nbytes
+            self._total_bytes += nbytes
+            if nbytes > self._max_burst_bytes:
+                self._max_burst_bytes = nbytes
+            if not count:
+                return
+            self._lines[slot] += count
+            self._total_lines += count
+            if count > self._max_burst_lines:
+                self._max_burst_lines = count
+            if self._last_line_time is not None:
+                gap_ms = max(0, int((now - self._last_line_time) * 1000))
+                self._gaps[min(gap_ms.bit_length(), GAP_BUCKETS - 1)] += 1
+            self._gaps[0] += count - 1
+            self._last_line_time = now
+            last_bucket = LENGTH_BUCKETS - 1
+            histogram = self._lengths
+            for length in lengths:
+                histogram[min(length.bit_length(), last_bucket)] += 1
+
+    def record_decode_errors(self, count: int = 1) -> None:
+        with self._lock:
+            self._decode_errors += count
+
+    def record_dropped_lines(self, count: int = 1) -> None:
+        with self._lock:
+            self._dropped_lines += count
+
+    def snapshot(self, now: float | None = None) -> PortStatsSnapshot:
+        """
+        Copy the counters and compute windowed rates.
+
+        Rates use completed buckets only (the current 100 ms bucket is still
+        filling) and shorter spans while less than a full window has elapsed.
+        """
+        if now is None:
+            now = self._clock()
+        with self._lock:
+            current = self._advance(now) if self._tick is not None else 0
+            elapsed = 0 if self._tick is None else self._tick - self._first_tick
+            bytes_per_second: dict[int, float] = {}
+            lines_per_second: dict[int, float] = {}
+            for window in WINDOWS:
+                span = min(window * _BUCKETS_PER_SECOND, elapsed)
+                if span <= 0:
+                    bytes_per_second[window] = lines_per_second[window] = 0.0
+                    continue
+                slots = [(current - offset) % _SLOTS for offset in range(1, span + 1)]
+                seconds = span / _BUCKETS_PER_SECOND
+                bytes_per_second[window] = sum(self._bytes[s] for s in slots) / seconds
+                lines_per_second[window] = sum(self._lines[s] for s in slots) / seconds
+            return PortStatsSnapshot(
+                total_bytes=self._total_bytes,
+                total_lines=self._total_lines,
+                bytes_per_second=bytes_per_second,
+                lines_per_second=lines_per_second,
+                gap_histogram_ms=tuple(self._gaps),
+                line_length_histogram=tuple(self._lengths),
+                max_burst_bytes=self._max_burst_bytes,
+                max_burst_lines=self._max_burst_lines,
+                decode_errors=self._decode_errors,
+                dropped_lines=self._dropped_lines,
+            )
+
+
+__all__ = [
+    "BUCKET_SECONDS",
+    "GAP_BUCKETS",
+    "LENGTH_BUCKETS",
+    "PortStats",
+    "PortStatsSnapshot",
+    "WINDOWS",
+    "format_byte_rate",
+    "histogram_bounds",
+]
@@ -0,0 +1,366 @@
+"""
+Continuous sampling profiler.
+
+``Profiler`` and ``profile_function`` wrap code in cProfile: every Python call
+is instrumented, which inflates tight loops, covers only the calling thread and
+has to be placed around the suspect code in advance. :class:`SamplingProfiler`
+instead wakes up ``hz`` times a second on its own thread, reads the current
+stack of every thread with ``sys._current_frames()`` (GUI thread, serial
+workers, the asyncio loop, exporters) and counts identical stacks. Nothing
+runs inside the sampled threads, so the cost is one short GIL hold per sample
+and the profiler can stay on for a whole session. A thread whose innermost
+frame is the same frame object as on the previous tick (idle in an event loop,
+blocked in a read) has the same stack, so its stack is not walked again.
+
+Stacks are kept as tuples of code object ids and turned into text only on
+export, in the "folded" format (``thread;outer;...;inner count``) read by
+flamegraph.pl, speedscope and inferno. Memory is bounded: at most
+``max_stacks`` distinct stacks are kept (samples of newer stacks are counted
+as ``[other]`` of their thread) and at most ``max_depth`` innermost frames per
+stack (deeper stacks get a ``[truncated]`` root).
+
+Threads started by Qt rather than :mod:`threading` (``QThread`` workers) have
+no Python-side name; they call :func:`label_current_thread` to be shown by
+name instead of ``thread-<ident>``.
+"""
+
+from __future__ import annotations
+
+import datetime
+import logging
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from types import CodeType, FrameType
+
+from PySide6 import QtCore
+
+from src.utils.service_container import service_container
+
+logger = logging.getLogger(__name__)
+
+OTHER_FRAME = "[other]"
+TRUNCATED_FRAME = "[truncated]"
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# ident -> name of threads that are not known to the threading module
+_thread_labels: dict[int, str] = {}
+_labels_version = 0
+
+
+def label_current_thread(name: str) -> None:
+    """Show the calling thread as ``name`` in profiles."""
+    global _labels_version
+    _thread_labels[threading.get_ident()] = name
+    _labels_version += 1
+
+
+def current_thread_name() -> str:
+    """Name of the calling thread as shown in profiles."""
+    thread = threading.current_thread()
+    if isinstance(thread, threading._DummyThread):
+        return _thread_labels.get(thread.ident, thread.name)
+    return thread.name
+
+
+def frame_label(code: CodeType) -> str:
+    """``qualname (path:line)`` of a code object, with the path relative to the project."""
+    filename = code.co_filename
+    try:
+        path = Path(filename).resolve().relative_to(_PROJECT_ROOT).as_posix()
+    except (ValueError, OSError):
+        path = Path(filename).name or filename
+    name = getattr(code, "co_qualname", code.co_name)
+    # ';' separates frames in the folded format
+    return f"{name} ({path}:{code.co_firstlineno})".replace(";", ",")
+
+
+@dataclass(frozen=True, slots=True)
+class SamplingStats:
+    """Counters of one profiling session (since the last :meth:`SamplingProfiler.reset`)."""
+
+    samples: int
+    stacks: int
+    dropped: int
+    elapsed_s: float
+    cpu_s: float
+
+    @property
+    def overhead(self) -> float:
+        """
+        CPU time spent taking samples as a fraction of wall time.
+
+        The timer wakeup between ticks is left out: on a busy single-core host it
+        is mostly scheduler and interrupt time charged to whichever thread wakes,
+        so including it would make the figure depend on the core count.
+        """
+        return self.cpu_s / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+
+# (thread name, ids of code objects innermost first or None for [other], truncated)
+_StackKey = tuple[str, "tuple[int, ...] | None", bool]
+
+
+class SamplingProfiler(QtCore.QObject):
+    """Background sampler of all thread stacks with folded-stack export."""
+
+    running_changed = QtCore.Signal(bool)
+    exported = QtCore.Signal(str)
+
+    DEFAULT_HZ = 100
+    DEFAULT_MAX_STACKS = 5000
+    DEFAULT_MAX_DEPTH = 64
+
+    def __init__(
+        self,
+        hz: float = DEFAULT_HZ,
+        max_stacks: int = DEFAULT_MAX_STACKS,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        output_dir: Path | None = None,
+        parent: QtCore.QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._hz = max(1.0, float(hz))
+        self._max_stacks = max(1, int(max_stacks))
+        self._max_depth = max(1, int(max_depth))
+        self._output_dir = output_dir
+        self._lock = threading.Lock()
+        self._counts: dict[_StackKey, int] = {}
+        self._codes: dict[int, CodeType] = {}
+        self._thread_names: dict[int, str] = {}
+        # ident -> (innermost frame, stack key, codes) of the previous tick; holding
+        # the frame keeps it alive, so an identical object means an unchanged stack
+        self._last_stacks: dict[int, tuple[FrameType, _StackKey, list[CodeType]]] = {}
+        self._labels_seen = -1
+        self._samples = 0
+        self._dropped = 0
+        self._elapsed_s = 0.0
+        self._cpu_s = 0.0
+        self._thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
+
+    # Lifecycle ------------------------------------------------------------------
+
+    @property
+    def hz(self) -> float:
+        return self._hz
+
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    @QtCore.Slot()
+    def start(self, hz: float | None = None) -> bool:
+        """Start sampling; returns False if already running."""
+        if self._thread is not None:
+            return False
+        if hz is not None:
+            self._hz = max(1.0, float(hz))
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(self._stop_event,), name="sampling-profiler", daemon=True
+        )
+        self._thread.start()
+        logger.info("Sampling profiler started at %.0f Hz", self._hz)
+        self.running_changed.emit(True)
+        return True
+
+    @QtCore.Slot()
+    def stop(self) -> None:
+        thread = self._thread
+        if thread is None:
+            return
+        self._stop_event.set()
+        thread.join(timeout=2.0)
+        self._thread = None
+        self._last_stacks = {}  # release the cached frames
+        logger.info("Sampling profiler stopped: %s", self.stats())
+        self.running_changed.emit(False)
+
+    def reset(self) -> None:
+        """Drop collected stacks and counters; sampling continues if running."""
+        with self._lock:
+            self._counts.clear()
+            self._codes.clear()
+            self._samples = 0
+            self._dropped = 0
+            self._elapsed_s = 0.0
+            self._cpu_s = 0.0
+
+    def _run(self, stop_event: threading.Event) -> None:
+        own = threading.get_ident()
+        interval = 1.0 / self._hz
+        started = last = time.perf_counter()
+        next_tick = started
+        while not stop_event.is_set():
+            cpu_start = time.thread_time()
+            self.sample(skip=own)
+            now = time.perf_counter()
+            cpu_now = time.thread_time()
+            with self._lock:
+                self._elapsed_s += now - last
+                self._cpu_s += cpu_now - cpu_start
+            last = now
+            next_tick += interval
+            if next_tick < now:
+                # Fell behind (suspended process, long GIL hold): skip missed ticks
+                next_tick = now
+            stop_event.wait(next_tick - now)
+
+    # Sampling -------------------------------------------------------------------
+
+    def sample(self, skip: int | None = None) -> None:
+        """Record the current stack of every thread except ``skip``."""
+        frames = sys._current_frames()
+        if self._labels_seen != _labels_version:
+            self._refresh_thread_names()
+        names = self._thread_names
+        max_depth = self._max_depth
+        last_stacks = self._last_stacks
+        current_stacks: dict[int, tuple[FrameType, _StackKey, list[CodeType]]] = {}
+        stacks = []
+        for ident, top in frames.items():
+            if ident == skip:
+                continue
+            name = names.get(ident)
+            if name is None:
+                names = self._refresh_thread_names()
+                name = names.setdefault(ident, f"thread-{ident}")
+            cached = last_stacks.get(ident)
+            if cached is not None and cached[0] is top and cached[1][0] == name:
+                current_stacks[ident] = cached
+                stacks.append(cached)
+                continue
+            codes = []
+            append = codes.append
+            frame = top
+            for _ in range(max_depth):
+                if frame is None:
+                    break
+                append(frame.f_code)
+                frame = frame.f_back
+            # Code objects hash their bytecode on every call; their ids hash for free
+            # and stay unique because every stored code object is kept in _codes
+            entry = (top, (name, tuple(map(id, codes)), frame is not None), codes)
+            current_stacks[ident] = entry
+            stacks.append(entry)
+        self._last_stacks = current_stacks
+        frame = top = None
+        del frames
+
+        with self._lock:
+            counts = self._counts
+            for _, key, codes in stacks:
+                count = counts.get(key)
+                if count is None:
+                    if len(counts) >= self._max_stacks:
+                        key = (key[0], None, False)
+                        count = counts.get(key, 0)
+                        self._dropped += 1
+                    else:
+                        count = 0
+                        for code in codes:
+                            self._codes.setdefault(id(code), code)
+                counts[key] = count + 1
+            self._samples += 1
+
+    def _refresh_thread_names(self) -> dict[int, str]:
+        """Rebuild the ident -> name map (new thread seen or a label was set)."""
+        self._labels_seen = _labels_version
+        current = sys._current_frames().keys()
+        for stale in [ident for ident in list(_thread_labels) if ident not in current]:
+            _thread_labels.pop(stale, None)
+        names = {}
+        for thread in threading.enumerate():
+            # Labels only name threads not started by threading (seen as dummies once
+            # they log); a reused ident or a direct run() call keeps the real name
+            label = _thread_labels.get(thread.ident) if isinstance(thread, threading._DummyThread) else None
+            names[thread.ident] = label or thread.name
+        for ident, label in list(_thread_labels.items()):
+            names.setdefault(ident, label)
+        self._thread_names = {ident: name for ident, name in names.items() if ident in current}
+        return self._thread_names
+
+    # Export ---------------------------------------------------------------------
+
+    def stats(self) -> SamplingStats:
+        with self._lock:
+            return SamplingStats(
+                samples=self._samples,
+                stacks=len(self._counts),
+                dropped=self._dropped,
+                elapsed_s=self._elapsed_s,
+                cpu_s=self._cpu_s,
+            )
+
+    def folded(self) -> dict[str, int]:
+        """Collected samples as ``{"thread;outer;...;inner": count}``."""
+        with self._lock:
+            items = list(self._counts.items())
+            codes = dict(self._codes)
+        labels: dict[int, str] = {}
+        folded: Counter[str] = Counter()
+        for (thread, code_ids, truncated), count in items:
+            parts = [thread]
+            if code_ids is None:
+                parts.append(OTHER_FRAME)
+            else:
+                if truncated:
+                    parts.append(TRUNCATED_FRAME)
+                for code_id in reversed(code_ids):
+                    label = labels.get(code_id)
+                    if label is None:
+                        label = labels[code_id] = frame_label(codes[code_id])
+                    parts.append(label)
+            folded[";".join(parts)] += count
+        return dict(folded)
+
+    def default_path(self) -> Path:
+        if self._output_dir is None:
+            from src.styles.constants import LoggingConfig
+
+            self._output_dir = LoggingConfig.LOG_DIR / "profiles"
+        stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        return self._output_dir / f"samples_{stamp}.folded"
+
+    @QtCore.Slot()
+    def export(self, path: str | Path | None = None) -> Path | None:
+        """Write folded stacks for flamegraph tools; None when nothing was sampled."""
+        folded = self.folded()
+        if not folded:
+            return None
+        target = Path(path) if path is not None else self.default_path()
+        target.parent.mkdir(parents=True, exist_ok=True)
+        lines = [f"{stack} {count}" for stack, count in sorted(folded.items())]
+        target.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        logger.info("Sampling profile saved to %s (%d stacks)", target, len(lines))
+        self.exported.emit(str(target))
+        return target
+
+
+def _create_sampling_profiler() -> SamplingProfiler:
+    from src.utils.config_loader import config_loader
+
+    config = config_loader.get_profiling_config()
+    return SamplingProfiler(
+        hz=config.sampling_hz,
+        max_stacks=config.sampling_max_stacks,
+        max_depth=config.sampling_max_depth,
+    )
+
+
+service_container.register_singleton("sampling_profiler", _create_sampling_profiler)
+
+
+__all__ = [
+    "OTHER_FRAME",
+    "TRUNCATED_FRAME",
+    "SamplingProfiler",
+    "SamplingStats",
+    "current_thread_name",
+    "frame_label",
+    "label_current_thread",
+]
@@ -24,6 +24,11 @@ class ServiceContainer:
                 # Drop existing instance to force recreation on next resolve
                 del self._instances[key]
 
+    def is_registered(self, key: str) -> bool:
+        """Return True if a factory is registered under key."""
+        with self._lock:
+            return key in self._factories
+
     def resolve(self, key: str) -> Any:
         """Get singleton instance, creating via factory on first call."""
         with self._lock:
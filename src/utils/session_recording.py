@@ -0,0 +1,255 @@
+"""
+Multi-port session recording in a compact length-prefixed binary file.
+
+Layout (little-endian)::
+
+    header   b"UARTSES1" | started_at: f64 (unix time)
+    record   kind: u8 | port: u16 | t: f64 | length: u32 | payload
+    ...
+    index    b"UARTIDX1" | ports: u16 | (len: u16, utf-8 label)*
+                         | entries: u32 | (t: f64, offset: u64)*
+    footer   index_offset: u64 | b"UARTEND1"
+
+``t`` is seconds since the start of the recording on the monotonic clock.
+A ``PORT`` record declares a port label the first time it is seen, so a
+file cut short by a crash (no index/footer) is still readable front to
+back; the index only speeds up seeking and duration queries.
+"""
+
+from __future__ import annotations
+
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from enum import IntEnum
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+MAGIC = b"UARTSES1"
+INDEX_MAGIC = b"UARTIDX1"
+FOOTER_MAGIC = b"UARTEND1"
+
+_HEADER = struct.Struct("<8sd")
+_RECORD = struct.Struct("<BHdI")
+_FOOTER = struct.Struct("<Q8s")
+_INDEX_ENTRY = struct.Struct("<dQ")
+
+# One index entry per this many seconds of recording
+INDEX_INTERVAL = 1.0
+
+
+class RecordKind(IntEnum):
+    PORT = 0  # payload: utf-8 port label
+    RX = 1
+    TX = 2
+
+
+@dataclass(frozen=True, slots=True)
+class SessionRecord:
+    """One recorded chunk."""
+
+    timestamp: float  # seconds since the start of the recording
+    kind: RecordKind
+    port_label: str
+    data: bytes
+
+
+class SessionRecorder:
+    """
+    Appends RX chunks and TX writes of any number of ports to one file.
+
+    Thread-safe: every serial worker records from its own thread.
+    """
+
+    def __init__(self, path: str | Path, *, clock=time.monotonic) -> None:
+        self._path = Path(path)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._file: BinaryIO | None = open(self._path, "wb", buffering=1 << 20)
+        self._file.write(_HEADER.pack(MAGIC, time.time()))
+        self._offset = _HEADER.size
+        self._t0 = clock()
+        self._ports: dict[str, int] = {}
+        self._index: list[tuple[float, int]] = []
+        self._next_index_time = 0.0
+        self._records = 0
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def records(self) -> int:
+        """RX/TX records written so far."""
+        return self._records
+
+    @property
+    def closed(self) -> bool:
+        return self._file is None
+
+    def record_rx(self, port_label: str, data: bytes) -> None:
+        self._write(RecordKind.RX, port_label, data)
+
+    def record_tx(self, port_label: str, data: bytes) -> None:
+        self._write(RecordKind.TX, port_label, data)
+
+    def _write(self, kind: RecordKind, port_label: str, data: bytes) -> None:
+        with self._lock:
+            if self._file is None:
+                return
+            t = self._clock() - self._t0
+            port = self._ports.get(port_label)
+            if port is None:
+                port = self._ports[port_label] = len(self._ports)
+                self._put(RecordKind.PORT, port, t, port_label.encode("utf-8"))
+            if t >= self._next_index_time:
+                self._index.append((t, self._offset))
+                self._next_index_time = t + INDEX_INTERVAL
+            self._put(kind, port, t, data)
+            self._records += 1
+
+    def _put(self, kind: RecordKind, port: int, t: float, payload: bytes) -> None:
+        self._file.write(_RECORD.pack(kind, port, t, len(payload)))
+        self._file.write(payload)
+        self._offset += _RECORD.size + len(payload)
+
+    def close(self) -> None:
+        """Write the index and footer; further records are ignored."""
+        with self._lock:
+            if self._file is None:
+                return
+            labels = sorted(self._ports, key=self._ports.__getitem__)
+            parts = [INDEX_MAGIC, struct.pack("<H", len(labels))]
+            for label in labels:
+                encoded = label.encode("utf-8")
+                parts.append(struct.pack("<H", len(encoded)) + encoded)
+            parts.append(struct.pack("<I", len(self._index)))
+            parts.extend(_INDEX_ENTRY.pack(t, offset) for t, offset in self._index)
+            self._file.write(b"".join(parts))
+            self._file.write(_FOOTER.pack(self._offset, FOOTER_MAGIC))
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> SessionRecorder:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class SessionReader:
+    """Reads a recording; uses the index when present and scans otherwise."""
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        self._ports: list[str] = []
+        self._index: list[tuple[float, int]] = []
+        self._data_end: int | None = None
+        with open(self._path, "rb") as fh:
+            header = fh.read(_HEADER.size)
+            if len(header) != _HEADER.size or header[:8] != MAGIC:
+                raise ValueError(f"{self._path.name} is not a session recording")
+            self.started_at: float = _HEADER.unpack(header)[1]
+            self._load_index(fh)
+
+    def _load_index(self, fh: BinaryIO) -> None:
+        size = fh.seek(0, 2)
+        if size < _HEADER.size + _FOOTER.size:
+            return
+        fh.seek(size - _FOOTER.size)
+        index_offset, magic = _FOOTER.unpack(fh.read(_FOOTER.size))
+        if magic != FOOTER_MAGIC or not _HEADER.size <= index_offset < size:
+            return
+        fh.seek(index_offset)
+        block = fh.read(size - _FOOTER.size - index_offset)
+        if block[:8] != INDEX_MAGIC:
+            return
+        pos = 8
+        (count,) = struct.unpack_from("<H", block, pos)
+        pos += 2
+        for _ in range(count):
+            (length,) = struct.unpack_from("<H", block, pos)
+            self._ports.append(block[pos + 2:pos + 2 + length].decode("utf-8"))
+            pos += 2 + length
+        (entries,) = struct.unpack_from("<I", block, pos)
+        pos += 4
+        self._index = [_INDEX_ENTRY.unpack_from(block, pos + i * _INDEX_ENTRY.size) for i in range(entries)]
+        self._data_end = index_offset
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def indexed(self) -> bool:
+        """False for recordings that were not closed cleanly."""
+        return self._data_end is not None
+
+    @property
+    def ports(self) -> list[str]:
+        if not self.indexed:
+            self._ports = list(dict.fromkeys(r.port_label for r in self.records()))
+        return list(self._ports)
+
+    @property
+    def duration(self) -> float:
+        last = 0.0
+        start = self._index[-1][0] if self._index else 0.0
+        for record in self.records(start):
+            last = record.timestamp
+        return last
+
+    def records(
+        self,
+        start: float = 0.0,
+        *,
+        ports: set[str] | None = None,
+        kinds: set[RecordKind] | None = None,
+    ) -> Iterator[SessionRecord]:
+        """
+        Yield records with ``timestamp >= start`` in recording order.
+
+        Args:
+            start: Seconds from the beginning; the index jumps close to it
+            ports: Only these port labels (all when None)
+            kinds: Only these kinds (RX and TX when None)
+        """
+        wanted = kinds or {RecordKind.RX, RecordKind.TX}
+        labels: dict[int, str] = dict(enumerate(self._ports)) if self.indexed else {}
+        offset = _HEADER.size
+        if labels:
+            for t, entry_offset in self._index:
+                if t > start:
+                    break
+                offset = entry_offset
+        end = self._data_end
+        with open(self._path, "rb") as fh:
+            fh.seek(offset)
+            while end is None or offset < end:
+                head = fh.read(_RECORD.size)
+                if len(head) < _RECORD.size:
+                    return
+                kind, port, t, length = _RECORD.unpack(head)
+                payload = fh.read(length)
+                if len(payload) < length:
+                    return  # truncated tail of an unclosed recording
+                offset += _RECORD.size + length
+                if kind == RecordKind.PORT:
+                    labels[port] = payload.decode("utf-8")
+                    continue
+                if t < start or kind not in wanted:
+                    continue
+                label = labels.get(port, str(port))
+                if ports is not None and label not in ports:
+                    continue
+                yield SessionRecord(t, RecordKind(kind), label, payload)
+
+
+__all__ = [
+    "INDEX_INTERVAL",
+    "RecordKind",
+    "SessionReader",
+    "SessionRecord",
+    "SessionRecorder",
+]
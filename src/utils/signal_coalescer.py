@@ -0,0 +1,74 @@
+"""Shared timer that coalesces high-frequency notifications into periodic publishes."""
+
+from __future__ import annotations
+
+import logging
+from typing import Callable
+
+from PySide6 import QtCore
+
+from src.utils.config_loader import config_loader
+from src.utils.service_container import service_container
+
+logger = logging.getLogger(__name__)
+
+Publisher = Callable[[], None]
+
+
+class SignalCoalescer(QtCore.QObject):
+    """
+    Dirty-flag publisher driven by one single-shot timer.
+
+    Producers keep their state exact and call :meth:`mark_dirty` with the
+    function that emits it; each dirty publisher runs once per interval no
+    matter how many times it was marked. The timer only runs while
+    something is pending, so an idle application gets no wakeups.
+    Must be used from the thread that owns the coalescer (the GUI thread).
+    """
+
+    def __init__(self, interval_ms: int = 100, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self._dirty: dict[Publisher, None] = {}  # ordered set
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(max(0, interval_ms))
+        self._timer.timeout.connect(self.flush)
+
+    @property
+    def interval_ms(self) -> int:
+        return self._timer.interval()
+
+    def set_interval(self, interval_ms: int) -> None:
+        self._timer.setInterval(max(0, interval_ms))
+
+    def mark_dirty(self, publish: Publisher) -> None:
+        """Schedule ``publish`` for the next tick (no-op if it is already pending)."""
+        self._dirty[publish] = None
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def discard(self, publish: Publisher) -> None:
+        """Drop a pending publish, e.g. when its owner shuts down or publishes directly."""
+        self._dirty.pop(publish, None)
+
+    def is_pending(self, publish: Publisher) -> bool:
+        return publish in self._dirty
+
+    def flush(self) -> None:
+        """Run every pending publisher now."""
+        self._timer.stop()
+        pending, self._dirty = self._dirty, {}
+        for publish in pending:
+            try:
+                publish()
+            except RuntimeError as exc:  # owner's C++ object already deleted
+                logger.debug("Dropped coalesced publish %r: %s", publish, exc)
+
+
+service_container.register_singleton(
+    "counter_coalescer",
+    lambda: SignalCoalescer(config_loader.get_ui_timing()["counter_coalesce_ms"]),
+)
+
+
+__all__ = ["SignalCoalescer"]
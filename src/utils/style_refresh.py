@@ -0,0 +1,100 @@
+"""
+Batched style repolish for theme changes.
+
+Views used to ``unpolish``/``polish`` every themed widget synchronously in
+their ``theme_changed`` slots (some followed by ``processEvents``), so one
+theme switch re-ran the style engine per widget, per view, with repaints in
+between. :class:`StyleRefresher` collects the widgets whose style-relevant
+properties actually changed and repolishes them in one deferred pass with
+updates disabled on their top-level windows, so each window repaints once.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any
+
+from PySide6 import QtCore, QtWidgets
+from shiboken6 import isValid
+
+from src.utils.service_container import service_container
+
+logger = logging.getLogger(__name__)
+
+THEME_CLASS_PROPERTY = "themeClass"
+
+
+class StyleRefresher(QtCore.QObject):
+    """
+    Coalesces widget repolish requests into a single pass per event-loop turn.
+
+    Signals:
+        flushed (int, float): Widgets repolished and the pass duration in ms
+    """
+
+    flushed = QtCore.Signal(int, float)
+
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self._pending: dict[int, QtWidgets.QWidget] = {}
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self.flush)
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def set_property(self, widget: QtWidgets.QWidget, name: str, value: Any) -> bool:
+        """Set a style-relevant property; schedules a repolish only if it changed."""
+        if widget.property(name) == value:
+            return False
+        widget.setProperty(name, value)
+        self.schedule(widget)
+        return True
+
+    def set_theme_class(self, widget: QtWidgets.QWidget, theme_class: str) -> bool:
+        return self.set_property(widget, THEME_CLASS_PROPERTY, theme_class)
+
+    def schedule(self, widget: QtWidgets.QWidget) -> None:
+        """Queue ``widget`` for the next repolish pass."""
+        self._pending[id(widget)] = widget
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self) -> int:
+        """Repolish every queued widget now; returns how many were repolished."""
+        self._timer.stop()
+        if not self._pending:
+            return 0
+        widgets = [widget for widget in self._pending.values() if isValid(widget)]
+        self._pending.clear()
+        started = time.perf_counter()
+
+        frozen: list[QtWidgets.QWidget] = []
+        for window in {id(w.window()): w.window() for w in widgets}.values():
+            if window.updatesEnabled():
+                window.setUpdatesEnabled(False)
+                frozen.append(window)
+        try:
+            for widget in widgets:
+                style = widget.style()
+                style.unpolish(widget)
+                style.polish(widget)
+        finally:
+            # Re-enabling updates schedules one repaint per window
+            for window in frozen:
+                window.setUpdatesEnabled(True)
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        logger.debug("Repolished %d widgets in %.1f ms", len(widgets), elapsed_ms)
+        self.flushed.emit(len(widgets), elapsed_ms)
+        return len(widgets)
+
+
+service_container.register_singleton("style_refresher", lambda: StyleRefresher())
+
+
+__all__ = ["THEME_CLASS_PROPERTY", "StyleRefresher"]
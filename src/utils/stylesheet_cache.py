@@ -0,0 +1,118 @@
+"""
+Compiled stylesheet cache.
+
+The global QSS is compiled from the template file, the theme's button colours
+and the scaled typography. The result only depends on those inputs, so it is
+kept in memory and in ``<config>/cache/stylesheets/<digest>.qss``: a theme
+switch or a restart with unchanged inputs reuses the compiled text without
+reading the template or doing any string replacement.
+
+The key is a digest of (template path, mtime, size), the effective theme, the
+scale factor and a hash of the colour/font values fed into the template.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Bump when the compilation in ThemeManager changes its output format
+CACHE_FORMAT_VERSION = 1
+# Compiled stylesheets kept on disk (theme x scale combinations in use)
+MAX_DISK_ENTRIES = 16
+
+
+def source_fingerprint(path: str | os.PathLike[str]) -> str:
+    """Identity of the template file from its stat, without reading it."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return f"{os.fspath(path)}:missing"
+    return f"{os.fspath(path)}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def stylesheet_key(source: str, theme: str, scale: float, inputs: object) -> str:
+    """Digest identifying one compiled stylesheet."""
+    inputs_hash = hashlib.sha1(repr(inputs).encode("utf-8")).hexdigest()
+    raw = f"{CACHE_FORMAT_VERSION}|{source}|{theme}|{scale:.4f}|{inputs_hash}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class StylesheetCache:
+    """In-memory + on-disk store of compiled stylesheets by :func:`stylesheet_key`."""
+
+    def __init__(self, cache_dir: Path | None = None) -> None:
+        self._cache_dir = cache_dir
+        self._memory: dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def cache_dir(self) -> Path | None:
+        return self._cache_dir
+
+    def get(self, key: str) -> str | None:
+        css = self._memory.get(key)
+        if css is None:
+            css = self._read(key)
+            if css is not None:
+                self._memory[key] = css
+        if css is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return css
+
+    def put(self, key: str, css: str) -> None:
+        self._memory[key] = css
+        self._write(key, css)
+
+    def clear(self) -> None:
+        """Drop the in-memory entries (disk entries are left for the next start)."""
+        self._memory.clear()
+
+    def _path(self, key: str) -> Path | None:
+        return self._cache_dir / f"{key}.qss" if self._cache_dir is not None else None
+
+    def _read(self, key: str) -> str | None:
+        path = self._path(key)
+        if path is None:
+            return None
+        try:
+            return path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def _write(self, key: str, css: str) -> None:
+        path = self._path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(css, encoding="utf-8")
+            os.replace(tmp, path)
+            self._prune()
+        except OSError as exc:
+            logger.debug("Cannot write compiled stylesheet %s: %s", path, exc)
+
+    def _prune(self) -> None:
+        entries = sorted(self._cache_dir.glob("*.qss"), key=lambda p: p.stat().st_mtime_ns)
+        for stale in entries[:-MAX_DISK_ENTRIES]:
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+
+
+__all__ = [
+    "CACHE_FORMAT_VERSION",
+    "MAX_DISK_ENTRIES",
+    "StylesheetCache",
+    "source_fingerprint",
+    "stylesheet_key",
+]
@@ -0,0 +1,122 @@
+"""Persistent per-port live tail filters applied to the RX stream."""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from src.utils.log_filter import compile_text_term
+from src.utils.paths import ensure_dir, get_config_file
+
+_logger = logging.getLogger(__name__)
+
+_SETTINGS_FILE = "tail_filters.json"
+
+
+def _combine(terms: tuple[str, ...]) -> tuple[re.Pattern[str], ...]:
+    """One joined pattern for ``terms`` when possible, else one pattern per term."""
+    patterns = tuple(compile_text_term(term) for term in terms)
+    # Joining renumbers groups, so a backreference would point at another term's group
+    if len(patterns) < 2 or any(pattern.groups for pattern in patterns):
+        return patterns
+    try:
+        return (re.compile("|".join(f"(?:{pattern.pattern})" for pattern in patterns), re.IGNORECASE),)
+    except re.error:  # inline flags in user regexes cannot be combined
+        return patterns
+
+
+@dataclass(slots=True)
+class TailFilter:
+    """
+    Include/exclude filter evaluated on every received line before formatting.
+
+    A line is shown when it matches any include term (or there are none) and
+    no exclude term. Terms use the same syntax as search terms: ``/regex/``,
+    ``re:regex`` or a case-insensitive literal.
+    """
+
+    include: tuple[str, ...] = ()
+    exclude: tuple[str, ...] = ()
+    matched: int = 0
+    suppressed: int = 0
+    _include_res: tuple[re.Pattern[str], ...] = field(default=(), init=False, repr=False)
+    _exclude_res: tuple[re.Pattern[str], ...] = field(default=(), init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.include = tuple(term for term in self.include if term)
+        self.exclude = tuple(term for term in self.exclude if term)
+        self._include_res = _combine(self.include)
+        self._exclude_res = _combine(self.exclude)
+
+    @property
+    def is_active(self) -> bool:
+        return bool(self.include or self.exclude)
+
+    def accepts(self, text: str) -> bool:
+        """Return True if the line should be displayed and update counters."""
+        if (self._include_res and not any(p.search(text) for p in self._include_res)) or (
+            any(p.search(text) for p in self._exclude_res)
+        ):
+            self.suppressed += 1
+            return False
+        self.matched += 1
+        return True
+
+    def reset_counters(self) -> None:
+        self.matched = 0
+        self.suppressed = 0
+
+    def to_dict(self) -> dict[str, list[str]]:
+        return {"include": list(self.include), "exclude": list(self.exclude)}
+
+
+def load_tail_filter(port_key: str) -> TailFilter:
+    """Load the persisted filter for a port (empty filter if none is stored)."""
+    entry = _load_all().get(port_key) or {}
+    return TailFilter(
+        include=tuple(_as_terms(entry.get("include"))),
+        exclude=tuple(_as_terms(entry.get("exclude"))),
+    )
+
+
+def save_tail_filter(port_key: str, tail_filter: TailFilter) -> bool:
+    """Persist the terms of ``tail_filter`` for a port; inactive filters are removed."""
+    settings = _load_all()
+    if tail_filter.is_active:
+        settings[port_key] = tail_filter.to_dict()
+    else:
+        settings.pop(port_key, None)
+    cfg_path = get_config_file(_SETTINGS_FILE)
+    try:
+        ensure_dir(cfg_path)
+        with cfg_path.open("w", encoding="utf-8") as handle:
+            json.dump(settings, handle, ensure_ascii=False, indent=2)
+        return True
+    except OSError as exc:  # pragma: no cover - disk errors
+        _logger.error("Failed to save tail filters to %s: %s", cfg_path, exc)
+        return False
+
+
+def _load_all() -> dict:
+    cfg_path = get_config_file(_SETTINGS_FILE)
+    try:
+        if cfg_path.exists():
+            with cfg_path.open("r", encoding="utf-8") as handle:
+                data = json.load(handle)
+            if isinstance(data, dict):
+                return data
+    except Exception as exc:  # pragma: no cover - protection in case of corrupted file
+        _logger.warning("Failed to load tail filters from %s: %s", cfg_path, exc)
+    return {}
+
+
+def _as_terms(value: object) -> Iterable[str]:
+    if not isinstance(value, list):
+        return ()
+    return (str(term) for term in value if str(term).strip())
+
+
+__all__ = ["TailFilter", "load_tail_filter", "save_tail_filter"]
@@ -0,0 +1,161 @@
+"""
+Schema-driven telemetry decoding into column rings.
+
+A :class:`TelemetryDecoder` turns a batch of frames into one NumPy
+structured array with a single ``numpy.frombuffer`` call: the schema is
+compiled once into a structured dtype (names, formats, offsets, itemsize),
+so there is no per-frame ``struct.unpack``. Decoded batches are appended to
+a :class:`TelemetryRing`, a fixed-capacity ring of one native-endian array
+per field plus an arrival-time column, which plotting and statistics read.
+
+NumPy is optional: :data:`HAS_NUMPY` tells whether decoding is available.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+from src.exceptions import ConfigurationError
+from src.utils.telemetry_schema import FIELD_TYPES, TelemetrySchemaModel
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None  # type: ignore
+    HAS_NUMPY = False
+
+TIME_COLUMN = "_time"
+
+
+def _require_numpy() -> None:
+    if not HAS_NUMPY:
+        raise ConfigurationError("Telemetry decoding requires numpy", key="numpy")
+
+
+class TelemetryDecoder:
+    """Vectorised decoder for fixed-layout frames described by a schema."""
+
+    def __init__(self, schema: TelemetrySchemaModel) -> None:
+        _require_numpy()
+        self.schema = schema
+        order = "<" if schema.byteorder == "little" else ">"
+        layout = schema.layout()
+        self.dtype = np.dtype({
+            "names": [name for name, _, _ in layout],
+            "formats": [order + FIELD_TYPES[kind][0] for _, kind, _ in layout],
+            "offsets": [offset for _, _, offset in layout],
+            "itemsize": schema.itemsize,
+        })
+        self.rejected = 0
+
+    @property
+    def field_names(self) -> tuple[str, ...]:
+        return self.dtype.names or ()
+
+    def decode(self, frames: Iterable[bytes]) -> Any:
+        """
+        Decode frames of exactly ``itemsize`` bytes into a structured array.
+
+        Frames of any other length are skipped and counted in :attr:`rejected`.
+        """
+        size = self.dtype.itemsize
+        frames = list(frames)
+        valid = [frame for frame in frames if len(frame) == size]
+        self.rejected += len(frames) - len(valid)
+        return np.frombuffer(b"".join(valid), dtype=self.dtype)
+
+    def decode_buffer(self, buffer: bytes | bytearray | memoryview) -> Any:
+        """Decode back-to-back frames from one buffer (trailing partial frame ignored)."""
+        size = self.dtype.itemsize
+        count = len(buffer) // size
+        return np.frombuffer(buffer, dtype=self.dtype, count=count)
+
+
+class TelemetryRing:
+    """
+    Fixed-capacity ring of decoded samples, one contiguous array per field.
+
+    Columns are stored native-endian so readers get plain arrays; a batch
+    append is a couple of slice assignments per column.
+    """
+
+    def __init__(self, dtype: Any, capacity: int) -> None:
+        _require_numpy()
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self._capacity = capacity
+        self._columns: dict[str, Any] = {
+            name: np.zeros(capacity, dtype=dtype.fields[name][0].newbyteorder("="))
+            for name in dtype.names
+        }
+        self._columns[TIME_COLUMN] = np.zeros(capacity, dtype=np.float64)
+        self._head = 0  # next write position
+        self._size = 0
+        self._total = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def total(self) -> int:
+        """Samples appended since creation (including overwritten ones)."""
+        return self._total
+
+    @property
+    def field_names(self) -> tuple[str, ...]:
+        return tuple(name for name in self._columns if name != TIME_COLUMN)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, records: Any, timestamp: float) -> int:
+        """Append a decoded batch stamped with ``timestamp``; returns the sample count."""
+        count = len(records)
+        if not count:
+            return 0
+        capacity = self._capacity
+        self._total += count
+        if count > capacity:
+            records = records[-capacity:]
+            count = capacity
+        head = self._head
+        first = min(count, capacity - head)
+        for name, column in self._columns.items():
+            if name == TIME_COLUMN:
+                column[head:head + first] = timestamp
+                column[:count - first] = timestamp
+            else:
+                values = records[name]
+                column[head:head + first] = values[:first]
+                column[:count - first] = values[first:]
+        self._head = (head + count) % capacity
+        self._size = min(self._size + count, capacity)
+        return count
+
+    def column(self, name: str, last: int | None = None) -> Any:
+        """Oldest-to-newest copy of a column (``last`` limits it to the newest samples)."""
+        data = self._columns[name]
+        size = self._size
+        count = size if last is None else max(0, min(last, size))
+        start = (self._head - count) % self._capacity
+        if start + count <= self._capacity:
+            return data[start:start + count].copy()
+        return np.concatenate((data[start:], data[:self._head]))
+
+    def times(self, last: int | None = None) -> Any:
+        """Arrival timestamps aligned with :meth:`column`."""
+        return self.column(TIME_COLUMN, last)
+
+    def clear(self) -> None:
+        self._head = 0
+        self._size = 0
+
+
+__all__ = [
+    "HAS_NUMPY",
+    "TIME_COLUMN",
+    "TelemetryDecoder",
+    "TelemetryRing",
+]
@@ -0,0 +1,57 @@
+"""Registry of live telemetry rings, shared by plots and statistics."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from PySide6 import QtCore
+
+from src.utils.service_container import service_container
+
+if TYPE_CHECKING:  # pragma: no cover - numpy/pydantic load only with a schema
+    from src.utils.telemetry_decoder import TelemetryRing
+
+
+@dataclass(slots=True)
+class TelemetrySource:
+    """Decoded telemetry of one port."""
+
+    port_label: str
+    ring: TelemetryRing
+    units: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def channels(self) -> tuple[str, ...]:
+        return self.ring.field_names
+
+
+class TelemetryHub(QtCore.QObject):
+    """Ports publish their telemetry ring here; consumers poll the rings."""
+
+    sources_changed = QtCore.Signal()
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._sources: dict[str, TelemetrySource] = {}
+
+    def register_source(self, source: TelemetrySource) -> None:
+        """Publish (or replace) the ring of ``source.port_label``."""
+        self._sources[source.port_label] = source
+        self.sources_changed.emit()
+
+    def unregister_source(self, port_label: str) -> None:
+        if self._sources.pop(port_label, None) is not None:
+            self.sources_changed.emit()
+
+    def source(self, port_label: str) -> TelemetrySource | None:
+        return self._sources.get(port_label)
+
+    def sources(self) -> list[TelemetrySource]:
+        return list(self._sources.values())
+
+
+service_container.register_singleton("telemetry_hub", lambda: TelemetryHub())
+
+
+__all__ = ["TelemetryHub", "TelemetrySource"]
@@ -0,0 +1,166 @@
+"""Pydantic schemas for telemetry_schema.yaml (binary frame layouts)."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Literal
+
+import yaml
+from pydantic import BaseModel, Field, ValidationError, model_validator
+
+from src.exceptions import ConfigurationError
+from src.utils.paths import get_config_file
+
+# Field type -> (NumPy type code without byte order, size in bytes)
+FIELD_TYPES: dict[str, tuple[str, int]] = {
+    "u8": ("u1", 1),
+    "i8": ("i1", 1),
+    "u16": ("u2", 2),
+    "i16": ("i2", 2),
+    "u32": ("u4", 4),
+    "i32": ("i4", 4),
+    "u64": ("u8", 8),
+    "i64": ("i8", 8),
+    "f32": ("f4", 4),
+    "f64": ("f8", 8),
+}
+
+
+class TelemetryFieldModel(BaseModel):
+    """One named field of a frame, or padding (``type: pad``)."""
+
+    name: str = ""
+    type: Literal["u8", "i8", "u16", "i16", "u32", "i32", "u64", "i64", "f32", "f64", "pad"]
+    offset: int | None = Field(None, ge=0)
+    size: int | None = Field(None, ge=1)
+    unit: str = ""
+
+    @model_validator(mode="after")
+    def _check_field(self) -> TelemetryFieldModel:
+        if self.type == "pad":
+            if self.size is None:
+                raise ValueError("pad fields need a size")
+        elif not self.name:
+            raise ValueError(f"{self.type} field needs a name")
+        return self
+
+    @property
+    def byte_size(self) -> int:
+        return self.size if self.type == "pad" else FIELD_TYPES[self.type][1]
+
+
+class TelemetrySchemaModel(BaseModel):
+    """Layout of the frames received on one port."""
+
+    id: str
+    port: str
+    byteorder: Literal["little", "big"] = "little"
+    frame_size: int | None = Field(None, ge=1)
+    capacity: int = Field(100_000, ge=1)
+    enabled: bool = True
+    fields: list[TelemetryFieldModel] = Field(min_length=1)
+
+    @model_validator(mode="after")
+    def _check_layout(self) -> TelemetrySchemaModel:
+        names = [f.name for f in self.fields if f.type != "pad"]
+        if len(names) != len(set(names)):
+            raise ValueError(f"duplicate field names in schema '{self.id}'")
+        if self.frame_size is not None and self.frame_size < self.layout_size():
+            raise ValueError(
+                f"frame_size {self.frame_size} is smaller than the fields of '{self.id}'"
+            )
+        return self
+
+    def layout(self) -> list[tuple[str, str, int]]:
+        """Resolved ``(name, type, offset)`` of every non-padding field."""
+        resolved = []
+        position = 0
+        for item in self.fields:
+            offset = position if item.offset is None else item.offset
+            position = offset + item.byte_size
+            if item.type != "pad":
+                resolved.append((item.name, item.type, offset))
+        return resolved
+
+    def layout_size(self) -> int:
+        position = end = 0
+        for item in self.fields:
+            offset = position if item.offset is None else item.offset
+            position = offset + item.byte_size
+            end = max(end, position)
+        return end
+
+    @property
+    def itemsize(self) -> int:
+        """Bytes per frame (explicit ``frame_size`` or the end of the last field)."""
+        return self.frame_size or self.layout_size()
+
+    @property
+    def units(self) -> dict[str, str]:
+        return {f.name: f.unit for f in self.fields if f.type != "pad" and f.unit}
+
+
+class TelemetrySchemaDocument(BaseModel):
+    """Root document of telemetry_schema.yaml."""
+
+    configuration_version: int = Field(1, ge=1)
+    schemas: list[TelemetrySchemaModel] = Field(default_factory=list)
+
+
+# path -> (mtime_ns, size, schemas or the error they raised); every port looks up
+# its schema here, so the file is parsed once per change rather than once per port
+_loaded: dict[Path, tuple[int, int, list[TelemetrySchemaModel] | ConfigurationError]] = {}
+
+
+def load_telemetry_schemas(path: Path | None = None) -> list[TelemetrySchemaModel]:
+    """
+    Load frame layouts; a missing file means no telemetry decoding.
+
+    The parsed result is cached by path, mtime and size.
+
+    Raises:
+        ConfigurationError: The file is not valid YAML or violates the schema
+    """
+    target = path or get_config_file("telemetry_schema.yaml")
+    try:
+        stat = os.stat(target)
+    except OSError:
+        _loaded.pop(target, None)
+        return []
+    cached = _loaded.get(target)
+    if cached is None or cached[:2] != (stat.st_mtime_ns, stat.st_size):
+        try:
+            with open(target, "r", encoding="utf-8") as fh:
+                data = yaml.safe_load(fh) or {}
+            result: list[TelemetrySchemaModel] | ConfigurationError = (
+                TelemetrySchemaDocument.model_validate(data).schemas
+            )
+        except (yaml.YAMLError, ValidationError) as exc:
+            result = ConfigurationError(f"Invalid {target.name}: {exc}", key=target.name, cause=exc)
+        cached = _loaded[target] = (stat.st_mtime_ns, stat.st_size, result)
+    result = cached[2]
+    if isinstance(result, ConfigurationError):
+        raise result
+    return list(result)
+
+
+def find_schema_for_port(
+    schemas: list[TelemetrySchemaModel], port_label: str
+) -> TelemetrySchemaModel | None:
+    """First enabled schema bound to ``port_label`` (case-insensitive)."""
+    wanted = port_label.casefold()
+    for schema in schemas:
+        if schema.enabled and schema.port.casefold() == wanted:
+            return schema
+    return None
+
+
+__all__ = [
+    "FIELD_TYPES",
+    "TelemetryFieldModel",
+    "TelemetrySchemaModel",
+    "TelemetrySchemaDocument",
+    "find_schema_for_port",
+    "load_telemetry_schemas",
+]
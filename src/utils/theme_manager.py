@@ -3,6 +3,7 @@ Theme Manager - handles application theme switching.
 Supports light, dark and system themes with QSettings persistence.
 """
 
+import dataclasses
 import logging
 import sys
 import threading
@@ -13,7 +14,8 @@ from PySide6.QtGui import QPalette, QColor
 
 from src.utils.service_container import service_container
 from src.utils.config_loader import ConfigLoader
-from src.utils.paths import get_stylesheet_path
+from src.utils.paths import get_config_dir, get_stylesheet_path
+from src.utils.stylesheet_cache import StylesheetCache, source_fingerprint, stylesheet_key
 from src.styles.constants import Fonts
 
 
@@ -40,14 +42,15 @@ class ThemeManager(QObject):
         # Stored logical theme: "light" | "dark" | "system"
         self.current_theme = "light"
         self.settings = QSettings("UART_CTRL", "ThemeSettings")
-        self._stylesheet_cache: str | None = None
-        self._last_modified: float = 0.0
         self._qss_path = str(get_stylesheet_path("app_optimized.qss"))
+        # Compiled (themed + scaled) stylesheets, in memory and on disk
+        self._compiled_stylesheets = StylesheetCache(get_config_dir() / "cache" / "stylesheets")
         self._logger = logging.getLogger(__name__)
         self._theme_applied = False      # flag for tracking theme application
         self._last_applied_theme = None  # last applied effective theme
         self._last_logical_theme = None  # last logical theme
         self._scale_factor: float = 1.0
+        self._config_loader.config_changed.connect(self._on_config_changed)
         self.load_theme()
 
     def load_theme(self):
@@ -94,6 +97,13 @@ class ThemeManager(QObject):
         self.save_theme()
         return True
 
+    def _on_config_changed(self, _snapshot: object) -> None:
+        """Re-apply colors from a reloaded config.ini; views re-read theirs on theme_changed."""
+        if QApplication.instance() is None:
+            return
+        self.apply_theme(force=True)
+        self.theme_changed.emit(self.current_theme)
+
     # --------- Theme resolution helpers ---------
     def _detect_system_theme(self) -> str:
         """
@@ -140,11 +150,6 @@ class ThemeManager(QObject):
 
         effective = self._get_effective_theme()
         logical = self.current_theme
-        
-        # Always apply stylesheet on theme change - this ensures proper style application
-        # even when switching between same themes
-        # Invalidate stylesheet cache to ensure fresh load
-        self._stylesheet_cache = None
 
         # Apply theme only if it changed or forced
         if effective == "light":
@@ -210,7 +215,7 @@ class ThemeManager(QObject):
         palette.setColor(QPalette.Dark, QColor("#c0c5ce"))
         palette.setColor(QPalette.AlternateBase, QColor("#f3f4f7"))
 
-        app.setPalette(palette)
+        self._set_palette(app, palette)
 
     def _apply_dark_theme(self, app: QApplication) -> None:
         """Apply dark theme palette: dark blue + black."""
@@ -237,34 +242,53 @@ class ThemeManager(QObject):
         palette.setColor(QPalette.Dark, QColor("#111827"))
         palette.setColor(QPalette.AlternateBase, QColor("#0f172a"))
 
-        app.setPalette(palette)
+        self._set_palette(app, palette)
+
+    @staticmethod
+    def _set_palette(app: QApplication, palette: QPalette) -> None:
+        # An equal palette would still trigger a PaletteChange on every widget
+        if app.palette() != palette:
+            app.setPalette(palette)
 
     def _apply_stylesheet(self, app):
-        """Ensure the global QSS is loaded and applied with cache invalidation."""
-        # Check if stylesheet file has been modified
-        try:
-            import os
+        """Apply the compiled global QSS; ``setStyleSheet`` runs only when it changed."""
+        stylesheet = self._compiled_stylesheet()
+        if stylesheet and app.styleSheet() != stylesheet:
+            app.setStyleSheet(stylesheet)
 
-            current_modified = os.path.getmtime(self._qss_path)
-        except OSError:
-            current_modified = 0.0
-        
-        # Invalidate cache if file changed or theme requires fresh load
-        # Also invalidate if cache is empty to ensure styles are always applied
-        if (
-            self._stylesheet_cache is None or
-            current_modified > self._last_modified or
-            not self._stylesheet_cache
-        ):
-            self._stylesheet_cache = self._load_stylesheet()
-            self._last_modified = current_modified
-
-        if self._stylesheet_cache:
-            themed_stylesheet = self._format_stylesheet(self._stylesheet_cache)
-            scale_stylesheet = self._build_scale_stylesheet()
-            if scale_stylesheet:
-                themed_stylesheet = f"{themed_stylesheet}\n{scale_stylesheet}"
-            app.setStyleSheet(themed_stylesheet)
+    def _compiled_stylesheet(self) -> str:
+        """Themed + scaled stylesheet, compiled once per (template, theme, scale, colours)."""
+        theme = self._get_effective_theme()
+        key = stylesheet_key(
+            source_fingerprint(self._qss_path),
+            theme,
+            self._scale_factor,
+            self._stylesheet_inputs(theme),
+        )
+        stylesheet = self._compiled_stylesheets.get(key)
+        if stylesheet is not None:
+            return stylesheet
+
+        # Miss: the template changed on disk or this theme/scale is new
+        template = self._load_stylesheet()
+        if not template:
+            return ""
+        stylesheet = self._format_stylesheet(template)
+        scale_stylesheet = self._build_scale_stylesheet()
+        if scale_stylesheet:
+            stylesheet = f"{stylesheet}\n{scale_stylesheet}"
+        self._compiled_stylesheets.put(key, stylesheet)
+        return stylesheet
+
+    def _stylesheet_inputs(self, theme: str) -> tuple:
+        """Config values substituted into the stylesheet (part of the cache key)."""
+        return (
+            dataclasses.astuple(self._config_loader.get_button_colors(theme)),
+            Fonts.get_default_size_pt(),
+            Fonts.get_button_size_pt(),
+            Fonts.get_caption_size_pt(),
+            Fonts.get_monospace_size_pt(),
+        )
 
     def _load_stylesheet(self) -> str:
         """Load application stylesheet from disk."""
@@ -286,15 +310,6 @@ class ThemeManager(QObject):
             "$command_combo_active": button_colors.command_combo_active,
             "$command_combo_connecting": button_colors.command_combo_connecting,
             "$command_combo_inactive": button_colors.command_combo_inactive,
-            "$command_cpu1_active": button_colors.command_cpu1_active,
-            "$command_cpu1_connecting": button_colors.command_cpu1_connecting,
-            "$command_cpu1_inactive": button_colors.command_cpu1_inactive,
-            "$command_cpu2_active": button_colors.command_cpu2_active,
-            "$command_cpu2_connecting": button_colors.command_cpu2_connecting,
-            "$command_cpu2_inactive": button_colors.command_cpu2_inactive,
-            "$command_tlm_active": button_colors.command_tlm_active,
-            "$command_tlm_connecting": button_colors.command_tlm_connecting,
-            "$command_tlm_inactive": button_colors.command_tlm_inactive,
             "$command_text_active": button_colors.command_text_active,
             "$command_text_connecting": button_colors.command_text_connecting,
             "$command_text_inactive": button_colors.command_text_inactive,
@@ -1,6 +1,7 @@
-import os
 from PySide6.QtCore import QObject, Signal
 
+from src.translations.catalog import CATALOG, EMPTY_LANGUAGE, compile_template
+
 class Translator(QObject):
     """Class for managing application translations"""
     
@@ -11,7 +12,8 @@ class Translator(QObject):
         self.current_language = default_language
         # Language in code: ru or en
         self.current_lang_code = "en"
-        self.translations = {}
+        self.translations = EMPTY_LANGUAGE.texts
+        self.templates = EMPTY_LANGUAGE.templates
         self.available_languages = {
             "ru_RU": "Русский",
             "en_US": "English"
@@ -19,22 +21,14 @@ class Translator(QObject):
         self.load_translations()
     
     def load_translations(self):
-        """Load translations for current language"""
-        try:
-            from src.translations.strings import STRINGS
-            
-            # Determine language code
-            lang_code = "ru" if self.current_language == "ru_RU" else "en"
-            self.current_lang_code = lang_code
-            
-            # Convert format: STRINGS["key"]["lang"] -> translations["key"]
-            self.translations = {}
-            for key, translations_dict in STRINGS.items():
-                if isinstance(translations_dict, dict) and lang_code in translations_dict:
-                    self.translations[key] = translations_dict[lang_code]
-                    
-        except ImportError:
-            self.translations = {}
+        """Select the precompiled tables of the current language"""
+        # Language code: ru or en
+        lang_code = "ru" if self.current_language == "ru_RU" else "en"
+        self.current_lang_code = lang_code
+        # Read-only tables built once from STRINGS (src/translations/catalog.py)
+        language = CATALOG.get(lang_code, EMPTY_LANGUAGE)
+        self.translations = language.texts
+        self.templates = language.templates
     
     def set_language(self, language: str):
         """Set current language"""
@@ -81,12 +75,8 @@ def tr(key: str, template: str, **kwargs) -> str:
     Returns:
         Translated text with substituted variables
     """
-    result = translator.translate(key, template)
-    # If there are variables for substitution, perform replacement
-    if kwargs:
-        try:
-            result = result.format(**kwargs)
-        except (KeyError, ValueError):
-            # If substitution failed, return as is
-            pass
-    return result
+    compiled = translator.templates.get(key)
+    if compiled is None:
+        compiled = compile_template(template or key)
+    # Substitution failures (missing field, bad braces) return the text as is
+    return compiled.format(kwargs)
@@ -1,33 +1,43 @@
 """
 ViewModels package.
+
+Public names are resolved lazily through module ``__getattr__``; importing
+``src.viewmodels.<module>`` only loads that module and its own dependencies.
 """
 
-from src.viewmodels.main_viewmodel import MainViewModel
-from src.viewmodels.com_port_viewmodel import ComPortViewModel, PortConnectionState
-from src.viewmodels.factory import ViewModelFactory, get_viewmodel_factory
-from src.viewmodels.protocols import (
-    ComPortViewModelProtocol,
-    CommandHistoryModelProtocol,
-    ViewModelFactoryProtocol,
-)
-from src.viewmodels.widget_host_viewmodel import (
-    WidgetHostViewModel,
-    WidgetModuleRegistry,
-    WidgetModuleDescriptor,
-    ModuleDockItem,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.utils.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:  # pragma: no cover - imported only for typing
+    from src.viewmodels.main_viewmodel import MainViewModel
+    from src.viewmodels.com_port_viewmodel import ComPortViewModel, PortConnectionState
+    from src.viewmodels.factory import ViewModelFactory, get_viewmodel_factory
+    from src.viewmodels.protocols import (
+        ComPortViewModelProtocol,
+        CommandHistoryModelProtocol,
+        ViewModelFactoryProtocol,
+    )
+    from src.viewmodels.widget_host_viewmodel import (
+        WidgetHostViewModel,
+        WidgetModuleRegistry,
+        WidgetModuleDescriptor,
+        ModuleDockItem,
+    )
 
-__all__ = [
-    'MainViewModel',
-    'ComPortViewModel',
-    'PortConnectionState',
-    'ViewModelFactory',
-    'get_viewmodel_factory',
-    'ComPortViewModelProtocol',
-    'CommandHistoryModelProtocol',
-    'ViewModelFactoryProtocol',
-    'WidgetHostViewModel',
-    'WidgetModuleRegistry',
-    'WidgetModuleDescriptor',
-    'ModuleDockItem',
-]
+__all__, __getattr__, __dir__ = lazy_exports(__name__, {
+    'MainViewModel': 'src.viewmodels.main_viewmodel',
+    'ComPortViewModel': 'src.viewmodels.com_port_viewmodel',
+    'PortConnectionState': 'src.viewmodels.com_port_viewmodel',
+    'ViewModelFactory': 'src.viewmodels.factory',
+    'get_viewmodel_factory': 'src.viewmodels.factory',
+    'ComPortViewModelProtocol': 'src.viewmodels.protocols',
+    'CommandHistoryModelProtocol': 'src.viewmodels.protocols',
+    'ViewModelFactoryProtocol': 'src.viewmodels.protocols',
+    'WidgetHostViewModel': 'src.viewmodels.widget_host_viewmodel',
+    'WidgetModuleRegistry': 'src.viewmodels.widget_host_viewmodel',
+    'WidgetModuleDescriptor': 'src.viewmodels.widget_host_viewmodel',
+    'ModuleDockItem': 'src.viewmodels.widget_host_viewmodel',
+})
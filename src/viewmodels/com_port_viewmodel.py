@@ -3,9 +3,11 @@ ComPortViewModel: ViewModel for a single COM port.
 Handles all business logic for one serial port connection.
 """
 
+from __future__ import annotations
+
 from PySide6 import QtCore
 from PySide6.QtCore import Signal, QObject
-from typing import Any
+from typing import TYPE_CHECKING, Any
 import html
 import logging
 import threading
@@ -13,15 +15,31 @@ import time
 
 from src.utils.translator import tr
 from src.models.serial_worker import SerialWorker
+from src.models.worker_events import WorkerEvent, WorkerStatus
+from src.models.replay_worker import ReplayWorker
 from src.supervisors.serial_supervisor import SerialWorkerSupervisor
 from src.styles.constants import SerialConfig, SerialPorts, CommandConfig
 from src.utils.config_loader import config_loader
+from src.utils.metrics import metrics
 from src.utils.theme_manager import theme_manager
 from src.utils.port_manager import port_manager
 from src.utils.state_utils import PortConnectionState, normalize_state
+from src.utils.port_stats import PortStats, PortStatsSnapshot
+from src.utils.session_recording import SessionRecorder
+from src.utils.signal_coalescer import SignalCoalescer
+from src.utils.tail_filter import TailFilter, load_tail_filter, save_tail_filter
+from src.utils import get_counter_coalescer, get_telemetry_hub
+from src.exceptions import ConfigurationError
+
+if TYPE_CHECKING:  # pragma: no cover - telemetry modules load with a schema
+    from src.utils.telemetry_decoder import TelemetryDecoder, TelemetryRing
 
 logger = logging.getLogger(__name__)
 
+# RX path stage between the worker signal and the console (see src.utils.metrics)
+_RX_SPAN = metrics.histogram("viewmodel.rx")
+_RX_SUPPRESSED = metrics.counter("viewmodel.rx_suppressed")
+
 
 class ComPortViewModel(QObject):
     """
@@ -38,7 +56,12 @@ class ComPortViewModel(QObject):
         data_received (str): Received data text
         data_sent (str): Sent data text
         error_occurred (str): Error message
-        counter_updated (int, int): RX and TX counts
+        counter_updated (int, int): RX and TX counts, at most once per coalescing interval
+        data_suppressed (str): Received line hidden by the tail filter
+        data_bytes_received (bytes, float): Raw RX chunk and its timestamp (binary mode)
+        frames_received (list, float): Frames cut by the port's frame decoder and their timestamp
+        telemetry_updated (int): Number of samples decoded into the telemetry ring
+        tail_filter_stats_changed (int, int): Lines shown and suppressed by the tail filter
     """
     
     # Signals for View binding
@@ -48,6 +71,11 @@ class ComPortViewModel(QObject):
     send_completed = Signal()    # Emitted when TX is complete (success or error)
     error_occurred = Signal(str) # Error message
     counter_updated = Signal(int, int)  # rx_count, tx_count
+    data_suppressed = Signal(str)  # RX line hidden by the tail filter (history only)
+    data_bytes_received = Signal(bytes, float)  # raw RX chunk, unix timestamp (binary mode)
+    frames_received = Signal(list, float)  # decoded frames, unix timestamp (framed mode)
+    telemetry_updated = Signal(int)  # new samples in the telemetry ring
+    tail_filter_stats_changed = Signal(int, int)  # matched, suppressed
     
     def __init__(
         self, 
@@ -60,7 +88,7 @@ class ComPortViewModel(QObject):
         
         Args:
             port_label: Display label (e.g., "CPU1", "CPU2", "TLM")
-            port_number: Port number (1-based index)
+            port_number: Port number N from [ports] port_N_label
             config: Optional configuration dictionary
         """
         super().__init__()
@@ -74,9 +102,10 @@ class ComPortViewModel(QObject):
         self._port_name: str | None = None
         self._baud_rate: int = self._config.get('default_baud_rate', 115200)
         
-        # Counters
+        # Counters (exact; counter_updated is rate-limited by the shared coalescer)
         self._rx_count: int = 0
         self._tx_count: int = 0
+        self._counter_coalescer: SignalCoalescer = get_counter_coalescer()
         
         # Extended metrics for monitoring
         self._rx_bytes: int = 0
@@ -84,8 +113,47 @@ class ComPortViewModel(QObject):
         self._error_count: int = 0
         self._connection_time: float = 0.0  # Monotonic time when connected
         self._fatal_error_blocked: bool = False
+
+        # Rolling rates and histograms, written by the worker thread and polled by the UI
+        self._stats = PortStats()
         
-        # Serial worker
+        # RX mode: decoded text lines or raw binary chunks rendered as hexdump
+        ports_cfg = config_loader.get_ports_config()
+        self._rx_mode: str = SerialWorker.normalize_rx_mode(
+            self._config.get('rx_mode', ports_cfg.get(f"port_{port_number}_rx_mode"))
+        )
+        # Frame decoder spec (e.g. 'slip', 'cobs', 'u16le'); empty = line framing
+        self._framing: str = str(
+            self._config.get('framing', ports_cfg.get(f"port_{port_number}_framing", "")) or ""
+        ).strip()
+        # Shared with the supervisor so watchdog restarts keep the current mode
+        self._worker_config: dict[str, Any] = {
+            'rx_mode': self._rx_mode,
+            'framing': self._framing,
+            'rx_pipeline': self._config.get(
+                'rx_pipeline', ports_cfg.get(f"port_{port_number}_rx_pipeline", "")
+            ),
+            'tx_pipeline': self._config.get(
+                'tx_pipeline', ports_cfg.get(f"port_{port_number}_tx_pipeline", "")
+            ),
+            'stats': self._stats,
+            'recorder': None,
+        }
+
+        # Schema-driven telemetry decoding of frames (telemetry_schema.yaml)
+        self._telemetry_decoder: TelemetryDecoder | None = None
+        self._telemetry: TelemetryRing | None = None
+        self._init_telemetry()
+
+        # Live tail filter (persisted per port number)
+        self._tail_filter: TailFilter = load_tail_filter(self._tail_filter_key)
+
+        # Serial worker: QThread per port, or a coroutine on the shared asyncio loop
+        backend = self._config.get('worker_backend') or config_loader.get_serial_backend()
+        self._worker_class: type[SerialWorker] | None = None
+        if backend == "asyncio":
+            from src.models.async_serial_backend import AsyncSerialWorker
+            self._worker_class = AsyncSerialWorker
         self._supervisor = SerialWorkerSupervisor(port_label, ipc_ports=[port_label], parent=self)
         self._worker: SerialWorker | None = None
         
@@ -108,6 +176,96 @@ class ComPortViewModel(QObject):
         """Get port number (1-based)."""
         return self._port_number
     
+    @property
+    def rx_mode(self) -> str:
+        """RX mode: SerialWorker.RX_MODE_TEXT or SerialWorker.RX_MODE_BINARY."""
+        return self._rx_mode
+
+    def set_rx_mode(self, mode: str) -> None:
+        """Switch RX mode; applied immediately to a running worker."""
+        self._rx_mode = SerialWorker.normalize_rx_mode(mode)
+        self._worker_config['rx_mode'] = self._rx_mode
+        if self._worker is not None:
+            self._worker.set_rx_mode(self._rx_mode)
+
+    @property
+    def framing(self) -> str:
+        """Frame decoder spec, or an empty string for line framing."""
+        return self._framing
+
+    def set_framing(self, spec: str) -> None:
+        """Change the frame decoder; applied immediately to a running worker."""
+        self._framing = (spec or "").strip()
+        self._worker_config['framing'] = self._framing
+        if self._worker is not None:
+            self._worker.set_framing(self._framing)
+
+    @property
+    def telemetry(self) -> TelemetryRing | None:
+        """Decoded telemetry columns, or None if no schema applies to this port."""
+        return self._telemetry
+
+    @property
+    def telemetry_decoder(self) -> TelemetryDecoder | None:
+        return self._telemetry_decoder
+
+    def _init_telemetry(self) -> None:
+        # yaml/pydantic (schema) and numpy (decoder) load on first port creation
+        from src.utils.telemetry_schema import find_schema_for_port, load_telemetry_schemas
+
+        try:
+            schema = find_schema_for_port(load_telemetry_schemas(), self._port_label)
+        except ConfigurationError as exc:
+            logger.warning(f"Telemetry schema ignored for {self._port_label}: {exc}")
+            return
+        if schema is None:
+            return
+        from src.utils.telemetry_decoder import HAS_NUMPY, TelemetryDecoder, TelemetryRing
+        from src.utils.telemetry_hub import TelemetrySource
+
+        if not HAS_NUMPY:
+            logger.warning(f"Telemetry schema '{schema.id}' needs numpy; decoding disabled")
+            return
+        self._telemetry_decoder = TelemetryDecoder(schema)
+        self._telemetry = TelemetryRing(self._telemetry_decoder.dtype, schema.capacity)
+        get_telemetry_hub().register_source(
+            TelemetrySource(self._port_label, self._telemetry, schema.units)
+        )
+
+    def set_pipelines(self, rx_spec: str | None = None, tx_spec: str | None = None) -> None:
+        """Replace the RX and/or TX processor chains (None keeps the current one)."""
+        if rx_spec is not None:
+            self._worker_config['rx_pipeline'] = rx_spec
+            if self._worker is not None:
+                self._worker.set_rx_pipeline(rx_spec)
+        if tx_spec is not None:
+            self._worker_config['tx_pipeline'] = tx_spec
+            if self._worker is not None:
+                self._worker.set_tx_pipeline(tx_spec)
+
+    def pipeline_stats(self) -> dict[str, list[dict[str, Any]]]:
+        """Per-stage timing counters of the running worker's pipelines."""
+        if self._worker is None:
+            return {'rx': [], 'tx': []}
+        return self._worker.pipeline_stats()
+
+    @property
+    def stats(self) -> PortStats:
+        return self._stats
+
+    def stats_snapshot(self) -> PortStatsSnapshot:
+        """Current RX rates and histograms; meant to be polled at a low rate."""
+        return self._stats.snapshot()
+
+    @property
+    def tail_filter(self) -> TailFilter:
+        """Live include/exclude filter applied to received lines."""
+        return self._tail_filter
+
+    @property
+    def _tail_filter_key(self) -> str:
+        return f"port{self._port_number}"
+
     @property
     def state(self) -> PortConnectionState:
         """Get current connection state."""
@@ -243,11 +401,73 @@ class ComPortViewModel(QObject):
             on_error=self._on_error_occurred,
             on_status=self._on_status_changed,
             on_finished=self._on_worker_finished,
+            on_rx_bytes=self._on_bytes_received,
+            on_rx_frames=self._on_frames_received,
+            config=self._worker_config,
+            worker_class=self._worker_class,
         )
         
         logger.info(f"Connecting to {self._port_name} at {self._baud_rate} baud")
         return True
     
+    def start_replay(
+        self,
+        path: str,
+        speed: float = 1.0,
+        *,
+        source_label: str | None = None,
+        clock_start: float | None = None,
+    ) -> bool:
+        """
+        Play a recorded session into this port instead of connecting to hardware.
+
+        Args:
+            path: Session recording file
+            speed: 1.0 real time, N times faster, 0 as fast as possible
+            source_label: Recorded port to play (defaults to this port's label)
+            clock_start: Shared ``time.monotonic()`` start to keep several ports in step
+
+        Returns:
+            True if the replay worker was started
+        """
+        if self._state != PortConnectionState.DISCONNECTED:
+            logger.warning(f"Port {self._port_label} is busy; replay not started")
+            return False
+
+        self._set_state(PortConnectionState.CONNECTING)
+        config = dict(self._worker_config)
+        config.update({
+            'session': path,
+            'replay_speed': speed,
+            'replay_port': source_label or self._port_label,
+            'replay_clock': clock_start,
+            'recorder': None,  # never re-record a replay
+        })
+        self._worker = self._supervisor.spawn_worker(
+            port_name=self._port_name or "",
+            baud_rate=self._baud_rate,
+            on_rx=self._on_data_received,
+            on_error=self._on_error_occurred,
+            on_status=self._on_status_changed,
+            on_finished=self._on_worker_finished,
+            on_rx_bytes=self._on_bytes_received,
+            on_rx_frames=self._on_frames_received,
+            config=config,
+            worker_class=ReplayWorker,
+        )
+        logger.info(f"Replaying {path} into {self._port_label} at speed {speed}")
+        return True
+
+    @property
+    def recorder(self) -> SessionRecorder | None:
+        return self._worker_config['recorder']
+
+    def set_recorder(self, recorder: SessionRecorder | None) -> None:
+        """Record this port's RX chunks and TX writes into ``recorder`` (None stops)."""
+        self._worker_config['recorder'] = recorder
+        if self._worker is not None and not isinstance(self._worker, ReplayWorker):
+            self._worker.set_recorder(recorder)
+
     def connect_with_retry(self, max_attempts: int = 3, initial_backoff_ms: int = 500) -> bool:
         """
         Establish connection to the configured serial port with retry and exponential backoff.
@@ -316,6 +536,10 @@ class ComPortViewModel(QObject):
                 on_error=handle_worker_error,
                 on_status=self._on_status_changed,
                 on_finished=self._on_worker_finished,
+                on_rx_bytes=self._on_bytes_received,
+                on_rx_frames=self._on_frames_received,
+                config=self._worker_config,
+                worker_class=self._worker_class,
             )
 
             logger.info(
@@ -410,6 +634,35 @@ class ComPortViewModel(QObject):
             command = command + '\r\n'
         return self.send_data(command)
     
+    def set_tail_filter(
+        self,
+        include: tuple[str, ...] | list[str] = (),
+        exclude: tuple[str, ...] | list[str] = (),
+        *,
+        persist: bool = True,
+    ) -> None:
+        """
+        Replace the live tail filter for this port.
+
+        Args:
+            include: Terms of which at least one must match for a line to be shown
+            exclude: Terms hiding any line they match
+            persist: Store the terms so they survive restarts
+        """
+        self._tail_filter = TailFilter(include=tuple(include), exclude=tuple(exclude))
+        if persist:
+            save_tail_filter(self._tail_filter_key, self._tail_filter)
+        self._counter_coalescer.discard(self._emit_tail_filter_stats)
+        self._emit_tail_filter_stats()
+
+    def add_tail_filter_term(self, term: str, *, exclude: bool = True) -> None:
+        """Append one include or exclude term to the current tail filter."""
+        current = self._tail_filter
+        if exclude:
+            self.set_tail_filter(current.include, (*current.exclude, term))
+        else:
+            self.set_tail_filter((*current.include, term), current.exclude)
+
     def clear_counters(self) -> None:
         """Reset RX and TX counters to zero."""
         self._rx_count = 0
@@ -418,7 +671,13 @@ class ComPortViewModel(QObject):
         self._tx_bytes = 0
         self._error_count = 0
         self._connection_time = 0.0  # Will return 0.0 from property when disconnected
-        self._emit_counter_update()
+        self._stats.reset()
+        self._tail_filter.reset_counters()
+        # Show the reset right away instead of waiting for the next tick
+        self._counter_coalescer.discard(self._publish_counters)
+        self._counter_coalescer.discard(self._emit_tail_filter_stats)
+        self._publish_counters()
+        self._emit_tail_filter_stats()
     
     def _set_state(self, new_state: PortConnectionState | str) -> None:
         """
@@ -452,15 +711,64 @@ class ComPortViewModel(QObject):
             port_label: Source port label
             data: Received data text
         """
+        start = time.perf_counter_ns()
         # Update RX counter
         self._rx_count += 1
         self._emit_counter_update()
         
+        # Tail filter runs before any formatting; hidden lines only reach history
+        tail_filter = self._tail_filter
+        if tail_filter.is_active:
+            accepted = tail_filter.accepts(data)
+            self._counter_coalescer.mark_dirty(self._emit_tail_filter_stats)
+            if not accepted:
+                self.data_suppressed.emit(data)
+                _RX_SUPPRESSED.add()
+                _RX_SPAN.record_since(start)
+                return
+
         # Emit RX data for display (View will format)
         self.data_received.emit(data)
         
         logger.debug(f"RX from {port_label}: {data}")
+        _RX_SPAN.record_since(start)
     
+    def _on_bytes_received(self, port_label: str, data: bytes, timestamp: float) -> None:
+        """
+        Handle a raw chunk from a worker in binary mode.
+
+        Args:
+            port_label: Source port label
+            data: Raw bytes as read from the port
+            timestamp: Unix time the chunk was read
+        """
+        start = time.perf_counter_ns()
+        self._rx_count += 1
+        self._rx_bytes += len(data)
+        self._emit_counter_update()
+        self.data_bytes_received.emit(data, timestamp)
+        _RX_SPAN.record_since(start)
+
+    def _on_frames_received(self, port_label: str, frames: list, timestamp: float) -> None:
+        """
+        Handle frames completed by the worker's frame decoder.
+
+        Args:
+            port_label: Source port label
+            frames: Frame payloads (``bytes``) in arrival order
+            timestamp: Unix time the completing chunk was read
+        """
+        start = time.perf_counter_ns()
+        self._rx_count += len(frames)
+        self._rx_bytes += sum(map(len, frames))
+        self._emit_counter_update()
+        if self._telemetry_decoder is not None:
+            records = self._telemetry_decoder.decode(frames)
+            if self._telemetry.append(records, timestamp):
+                self.telemetry_updated.emit(len(records))
+        self.frames_received.emit(frames, timestamp)
+        _RX_SPAN.record_since(start)
+
     def _on_error_occurred(self, port_label: str, error_message: str) -> None:
         """
         Handle error from serial worker.
@@ -492,31 +800,27 @@ class ComPortViewModel(QObject):
         # Ensure worker is stopped
         self._safe_stop_worker()
 
-    def _on_status_changed(self, port_label: str, status_message: str) -> None:
+    def _on_status_changed(self, port_label: str, status: WorkerStatus | str) -> None:
         """
         Handle status update from serial worker.
 
         Args:
             port_label: Source port label
-            status_message: Status text
+            status: Worker status event (plain text from the supervisor)
         """
-        port_name = self._port_name or "N/A"
-
-        connected_msg = tr("worker_connected_to", f"Connected to {{port_name}}", port_name=port_name)
-        disconnected_msg = tr("worker_disconnected_from", f"Disconnected from {{port_name}}", port_name=port_name)
-        connecting_msg = tr("worker_connecting_to", f"Connecting to {{port_name}}...", port_name=port_name)
-
-        if status_message == connected_msg:
+        event = getattr(status, "event", None)
+        if event is WorkerEvent.CONNECTED:
             self._set_state(PortConnectionState.CONNECTED)
             # Track connection time using monotonic time (immune to system time changes)
             self._connection_time = time.monotonic()
-        elif status_message == disconnected_msg:
+        elif event is WorkerEvent.DISCONNECTED:
             if not self._fatal_error_blocked:
                 self._set_state(PortConnectionState.DISCONNECTED)
-        elif status_message == connecting_msg:
+        elif event is WorkerEvent.CONNECTING:
             self._set_state(PortConnectionState.CONNECTING)
 
-        logger.debug(f"Status {port_label}: {status_message}")
+        # Lazy %-formatting: the status is only translated if debug logging is on
+        logger.debug("Status %s: %s", port_label, status)
     
     def _format_rx_data(self, data: str) -> str:
         """
@@ -574,17 +878,31 @@ class ComPortViewModel(QObject):
         self.error_occurred.emit(formatted)
     
     def _emit_counter_update(self) -> None:
-        """Emit counter update signal."""
+        """Mark counters dirty; they are published on the next coalescer tick."""
+        self._counter_coalescer.mark_dirty(self._publish_counters)
+
+    def _publish_counters(self) -> None:
         self.counter_updated.emit(self._rx_count, self._tx_count)
+
+    def _emit_tail_filter_stats(self) -> None:
+        """Emit tail filter matched/suppressed counters (per line via the coalescer tick)."""
+        self.tail_filter_stats_changed.emit(self._tail_filter.matched, self._tail_filter.suppressed)
     
     def shutdown(self) -> None:
         """Clean shutdown of the port and worker."""
         self._safe_stop_worker()
+        self._counter_coalescer.discard(self._publish_counters)
+        self._counter_coalescer.discard(self._emit_tail_filter_stats)
         
         # Release port from active ports
         port_manager.release(self._port_name)
 
         self._set_state(PortConnectionState.DISCONNECTED)
+        if self._telemetry is not None:
+            hub = get_telemetry_hub()
+            published = hub.source(self._port_label)
+            if published is not None and published.ring is self._telemetry:
+                hub.unregister_source(self._port_label)
         logger.info(f"Shutdown complete for {self._port_label}")
         self._disconnect_theme_manager()
 
@@ -7,11 +7,11 @@ from pathlib import Path
 from typing import Iterable, NamedTuple
 import json
 import datetime
-import configparser
 import logging
 
 from PySide6 import QtCore
 
+from src.utils.config_loader import config_loader
 from src.utils.paths import get_config_file
 from src.utils.translator import tr
 
@@ -60,6 +60,7 @@ class CommandHistoryModel(QtCore.QObject):
         self._entries: list[CommandHistoryEntry] = []
         self._storage_path = self._resolve_storage_path()
         self._max_items = self._load_max_items()
+        config_loader.config_changed.connect(self._on_config_changed)
         self._logger = logging.getLogger(__name__)
 
         # Deferred save to disk
@@ -76,16 +77,17 @@ class CommandHistoryModel(QtCore.QObject):
         return get_config_file("command_history.json")
 
     def _load_max_items(self) -> int:
-        config_path = get_config_file("config.ini")
-        parser = configparser.ConfigParser()
-        try:
-            parser.read(config_path, encoding="utf-8")
-            return parser.getint("ui", "max_history_items", fallback=200)
-        except Exception as exc:  # pragma: no cover - protection against rare errors
-            logging.getLogger(__name__).warning(
-                "Failed to read max_history_items from %s: %s", config_path, exc
-            )
-            return 200
+        return config_loader.get_max_history_items()
+
+    def _on_config_changed(self, _snapshot: object) -> None:
+        max_items = self._load_max_items()
+        if max_items == self._max_items:
+            return
+        self._max_items = max_items
+        if len(self._entries) > max_items:
+            del self._entries[max_items:]
+            self.entries_changed.emit()
+            self._schedule_save()
 
     def load(self) -> None:
         if not self._storage_path.exists():
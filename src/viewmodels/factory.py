@@ -3,7 +3,7 @@ ViewModel Factory implementation.
 Creates ViewModel instances with proper dependency injection.
 """
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from src.viewmodels.com_port_viewmodel import ComPortViewModel
 from src.viewmodels.command_history_viewmodel import CommandHistoryModel
@@ -16,6 +16,9 @@ from src.viewmodels.protocols import (
 from src.viewmodels.stopwatch_viewmodel import StopwatchViewModel
 from src.utils.service_container import service_container
 
+if TYPE_CHECKING:  # pragma: no cover - numpy loads with the first plot
+    from src.viewmodels.telemetry_plot_viewmodel import TelemetryPlotViewModel
+
 
 class ViewModelFactory:
     """
@@ -69,6 +72,13 @@ class ViewModelFactory:
 
         return StopwatchViewModel()
 
+    def create_telemetry_plot_viewmodel(self) -> "TelemetryPlotViewModel":
+        """Create a live telemetry plot ViewModel bound to the telemetry hub."""
+
+        from src.viewmodels.telemetry_plot_viewmodel import TelemetryPlotViewModel
+
+        return TelemetryPlotViewModel()
+
 
 # Singleton instance for application-wide use
 _default_factory: ViewModelFactory | None = None
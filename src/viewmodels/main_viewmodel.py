@@ -6,17 +6,20 @@ Handles logging, filtering, formatting of console output from multiple serial po
 from PySide6 import QtCore
 from PySide6.QtCore import Signal, Qt
 from html import escape
-from collections import deque
-from typing import NamedTuple
+from typing import Iterable, NamedTuple
 import re
-import os
+import time
 
+from src.utils import get_counter_coalescer
 from src.utils.config_loader import config_loader
 from src.utils.theme_manager import theme_manager
-from src.utils.profiler import PerformanceTimer
+from src.utils.metrics import metrics
+from src.utils.log_store import ColumnarLogStore, LogDirection, LogEntry
+from src.utils.log_filter import IncrementalFilter, LogFilter
+from src.utils.signal_coalescer import SignalCoalescer
 
-# Enable/disable profiling via environment variable
-_ENABLE_PROFILING = os.environ.get('APP_PROFILE', '').lower() == 'true'
+_FORMAT_RX = metrics.histogram("viewmodel.format_rx")
+_FILTER_CACHE = metrics.histogram("viewmodel.filter_cache")
 
 
 class MainViewModel(QtCore.QObject):
@@ -30,14 +33,11 @@ class MainViewModel(QtCore.QObject):
     """
     
     # Signals for View binding
-    log_cpu1_changed = Signal(str)      # HTML for CPU1 log
-    log_cpu2_changed = Signal(str)      # HTML for CPU2 log
     log_all_changed = Signal(str)       # HTML for combined log
-    log_tlm_changed = Signal(str)       # HTML for TLM log
     
     class CounterSnapshot(NamedTuple):
-        rx_counts: tuple[int, int, int]
-        tx_counts: tuple[int, int, int]
+        rx_counts: tuple[int, ...]
+        tx_counts: tuple[int, ...]
 
     counters_changed = Signal(object)
     
@@ -46,7 +46,12 @@ class MainViewModel(QtCore.QObject):
     from src.styles.constants import ConsoleLimits as _ConsoleLimits  # local import to avoid cycles
     MAX_CACHE_LINES = _ConsoleLimits.MAX_CACHE_LINES
     
-    def __init__(self):
+    def __init__(self, log_stores: dict[str, ColumnarLogStore] | None = None):
+        """
+        Args:
+            log_stores: Per-port stores to filter, normally
+                ``ConsolePanelView.log_stores``; a private mapping if omitted
+        """
         super().__init__()
         
         # Display options
@@ -60,13 +65,22 @@ class MainViewModel(QtCore.QObject):
         self._colors = self._cached_palette[current_theme]
         theme_manager.theme_changed.connect(self._on_theme_changed)
         
-        # Counters for each port
-        self.rx_counts = [0, 0, 0]  # CPU1, CPU2, TLM
-        self.tx_counts = [0, 0, 0]
+        # Counters for each port; counters_changed is rate-limited by the shared coalescer
+        # One slot per configured port, in port order; numbers may have gaps (1, 2, 5)
+        self._port_slots: dict[int, int] = {
+            number: slot for slot, (number, _) in enumerate(config_loader.get_port_labels())
+        }
+        self._port_count = len(self._port_slots)
+        self.rx_counts = [0] * self._port_count
+        self.tx_counts = [0] * self._port_count
+        self._counter_coalescer: SignalCoalescer = get_counter_coalescer()
         
-        # Cache for filtering
-        self.log_cache = {}
-        self._filter_lower_cache: dict[str, deque[str]] = {}
+        # Columnar log store per cache key, shared with the console panel when
+        # injected; filter_cache renders from it on demand
+        self._owns_log_stores = log_stores is None
+        self.log_stores: dict[str, ColumnarLogStore] = {} if log_stores is None else log_stores
+        # Live filter per cache key: re-running the same query only tests new lines
+        self._live_filters: dict[str, IncrementalFilter] = {}
 
     def _current_theme(self) -> str:
         return "light" if theme_manager.is_light_theme() else "dark"
@@ -78,13 +92,22 @@ class MainViewModel(QtCore.QObject):
             colors = config_loader.get_colors(theme)
             self._cached_palette[theme] = colors
             self._colors = colors
+        self._live_filters.clear()
     
     def set_display_options(self, show_time: bool, show_source: bool) -> None:
         """Update display options for time and source visibility."""
         self.show_time = show_time
         self.show_source = show_source
+        self._live_filters.clear()
     
-    def _format_message(self, source: str, text: str, source_label: str, text_color: str) -> str:
+    def _format_message(
+        self,
+        source: str,
+        text: str,
+        source_label: str,
+        text_color: str,
+        timestamp: float | None = None,
+    ) -> str:
         """
         Common formatting logic for all message types.
         
@@ -93,6 +116,7 @@ class MainViewModel(QtCore.QObject):
             text (str): Message text
             source_label (str): Label prefix (e.g., 'RX', 'TX', 'SYS')
             text_color (str): CSS color for the text
+            timestamp (float | None): Unix time of the message (defaults to now)
             
         Returns:
             str: HTML formatted text
@@ -100,7 +124,7 @@ class MainViewModel(QtCore.QObject):
         if not text or not text.strip():
             return ""
             
-        ts = QtCore.QDateTime.currentDateTime().toString('hh:mm:ss')
+        ts = time.strftime('%H:%M:%S', time.localtime(timestamp))
         time_color = self._colors.timestamp
         time_part = f"<span style='color:{time_color}'>[{ts}]</span> " if self.show_time else ""
         source_part = f"<b style='color:{text_color}'>{source_label}({source}):</b> " if self.show_source else ""
@@ -122,10 +146,10 @@ class MainViewModel(QtCore.QObject):
         Returns:
             str: HTML formatted text
         """
-        if _ENABLE_PROFILING:
-            with PerformanceTimer('format_rx', logging.DEBUG):
-                return self._format_message(source, text, "RX", self._colors.rx_label)
-        return self._format_message(source, text, "RX", self._colors.rx_label)
+        start = time.perf_counter_ns()
+        html = self._format_message(source, text, "RX", self._colors.rx_label)
+        _FORMAT_RX.record_since(start)
+        return html
     
     def format_tx(self, source: str, text: str) -> str:
         """
@@ -153,89 +177,106 @@ class MainViewModel(QtCore.QObject):
         """
         return self._format_message(source, text, "SYS", self._colors.sys_label)
     
-    def increment_rx(self, port_index: int) -> int:
+    def increment_rx(self, port_number: int) -> int:
         """
         Increment RX counter for a port.
         
         Args:
-            port_index (int): Port index (1-3)
+            port_number (int): Configured port number N (port_N_label)
             
         Returns:
             int: New count
         """
-        idx = port_index - 1
-        if 0 <= idx < len(self.rx_counts):
+        idx = self._port_slots.get(port_number)
+        if idx is not None:
             self.rx_counts[idx] += 1
             self._emit_counters()
             return self.rx_counts[idx]
         return 0
     
-    def increment_tx(self, port_index: int) -> int:
+    def increment_tx(self, port_number: int) -> int:
         """
         Increment TX counter for a port.
         
         Args:
-            port_index (int): Port index (1-3)
+            port_number (int): Configured port number N (port_N_label)
             
         Returns:
             int: New count
         """
-        idx = port_index - 1
-        if 0 <= idx < len(self.tx_counts):
+        idx = self._port_slots.get(port_number)
+        if idx is not None:
             self.tx_counts[idx] += 1
             self._emit_counters()
             return self.tx_counts[idx]
         return 0
     
-    def get_rx_count(self, port_index: int) -> int:
-        """Get RX counter for a port."""
-        idx = port_index - 1
-        if 0 <= idx < len(self.rx_counts):
+    def get_rx_count(self, port_number: int) -> int:
+        """Get RX counter for configured port number ``port_number``."""
+        idx = self._port_slots.get(port_number)
+        if idx is not None:
             return self.rx_counts[idx]
         return 0
     
-    def get_tx_count(self, port_index: int) -> int:
-        """Get TX counter for a port."""
-        idx = port_index - 1
-        if 0 <= idx < len(self.tx_counts):
+    def get_tx_count(self, port_number: int) -> int:
+        """Get TX counter for configured port number ``port_number``."""
+        idx = self._port_slots.get(port_number)
+        if idx is not None:
             return self.tx_counts[idx]
         return 0
     
+    @property
+    def port_count(self) -> int:
+        return self._port_count
+
+    def set_port_numbers(self, numbers: Iterable[int]) -> None:
+        """Count the ports numbered ``numbers``, keeping the values of ports that remain."""
+        slots = {number: slot for slot, number in enumerate(dict.fromkeys(numbers))}
+        if slots == self._port_slots:
+            return
+        old_slots = self._port_slots
+        self.rx_counts = [self.get_rx_count(number) if number in old_slots else 0 for number in slots]
+        self.tx_counts = [self.get_tx_count(number) if number in old_slots else 0 for number in slots]
+        self._port_slots = slots
+        self._port_count = len(slots)
+        self._emit_counters()
+
     def clear_counters(self) -> None:
         """Reset all counters."""
-        self.rx_counts = [0, 0, 0]
-        self.tx_counts = [0, 0, 0]
-        self._emit_counters()
+        self.rx_counts = [0] * self._port_count
+        self.tx_counts = [0] * self._port_count
+        self._counter_coalescer.discard(self._publish_counters)
+        self._publish_counters()
 
-    def cache_log_line(self, cache_key: str, html: str, plain: str) -> None:
+    def cache_log_line(
+        self,
+        cache_key: str,
+        plain: str,
+        direction: LogDirection = LogDirection.RX,
+    ) -> None:
         """
         Cache a log line for filtering support with size limit.
-        Uses deque with maxlen for O(1) append operations.
+        Only the plain text is stored; HTML is rendered when filtering.
         
         Args:
             cache_key (str): Widget identifier (e.g., 'cpu1', 'cpu2', 'all')
-            html (str): HTML formatted version
-            plain (str): Plain text version (for filtering)
+            plain (str): Plain text of the line
+            direction (LogDirection): Message origin used for rendering
         """
-        if cache_key not in self.log_cache:
-            # Use deque with maxlen for automatic size limiting (O(1) operation)
-            self.log_cache[cache_key] = {
-                'html': deque(maxlen=self.MAX_CACHE_LINES),
-                'plain': deque(maxlen=self.MAX_CACHE_LINES)
-            }
-        
-        self.log_cache[cache_key]['html'].append(html)
-        self.log_cache[cache_key]['plain'].append(plain)
-
-        lower_key = f"{cache_key}__lower"
-        if lower_key not in self._filter_lower_cache:
-            self._filter_lower_cache[lower_key] = deque(maxlen=self.MAX_CACHE_LINES)
-        self._filter_lower_cache[lower_key].append(plain.lower())
+        store = self.log_stores.get(cache_key)
+        if store is None:
+            store = ColumnarLogStore(self.MAX_CACHE_LINES)
+            self.log_stores[cache_key] = store
+        store.append(plain.rstrip('\r\n'), direction)
     
     def clear_cache(self) -> None:
-        """Clear all cached logs."""
-        self.log_cache.clear()
-        self._filter_lower_cache.clear()
+        """Clear all cached logs (shared stores keep their keys, only their rows go)."""
+        if self._owns_log_stores:
+            self.log_stores.clear()
+        else:
+            for store in self.log_stores.values():
+                store.clear()
+        self._live_filters.clear()
     
     @staticmethod
     def strip_html(html_text: str) -> str:
@@ -258,7 +299,12 @@ class MainViewModel(QtCore.QObject):
     
     def filter_cache(self, cache_key: str, search_text: str) -> str:
         """
-        Filter cached logs by search text, preserving HTML formatting.
+        Filter cached logs by a query, preserving HTML formatting.
+
+        The query supports AND/OR/NOT terms, regex, ``dir:`` and
+        ``since:``/``until:`` predicates (see :mod:`src.utils.log_filter`).
+        Repeating the last query for a key only evaluates lines cached since
+        the previous call.
         
         Args:
             cache_key (str): Widget identifier
@@ -267,39 +313,43 @@ class MainViewModel(QtCore.QObject):
         Returns:
             str: Filtered HTML content
         """
-        if _ENABLE_PROFILING:
-            with PerformanceTimer('filter_cache', logging.DEBUG):
-                return self._filter_cache_impl(cache_key, search_text)
-        return self._filter_cache_impl(cache_key, search_text)
+        with _FILTER_CACHE.time():
+            return self._filter_cache_impl(cache_key, search_text)
     
     def _filter_cache_impl(self, cache_key: str, search_text: str) -> str:
         """Internal implementation of filter_cache."""
-        if cache_key not in self.log_cache:
+        store = self.log_stores.get(cache_key)
+        if store is None:
             return ""
-        
-        cache_data = self.log_cache[cache_key]
-        if 'html' not in cache_data:
-            return ""
-        
-        html_lines = cache_data['html']
-        lower_key = f"{cache_key}__lower"
-        lower_lines = self._filter_lower_cache.get(lower_key)
-        if not lower_lines:
-            lower_lines = deque((plain.lower() for plain in cache_data['plain']), maxlen=self.MAX_CACHE_LINES)
-            self._filter_lower_cache[lower_key] = lower_lines
 
-        if search_text.strip():
-            search_lower = search_text.lower()
-            filtered_html = [
-                html for html, plain_lower in zip(html_lines, lower_lines)
-                if search_lower in plain_lower
-            ]
-        else:
-            filtered_html = html_lines
-        
-        return ''.join(filtered_html)
+        query = search_text.strip()
+        live = self._live_filters.get(cache_key)
+        if live is None or live.query != query or live.store is not store:
+            live = IncrementalFilter(
+                store,
+                LogFilter.compile(query),
+                lambda entry, source=cache_key.upper(): self._render_entry(source, entry),
+            )
+            self._live_filters[cache_key] = live
+        live.update()
+        return live.text()
+
+    def _render_entry(self, source: str, entry: LogEntry) -> str:
+        """Render one stored row with the current display options and palette."""
+        label_color = {
+            LogDirection.RX: self._colors.rx_label,
+            LogDirection.TX: self._colors.tx_label,
+            LogDirection.SYS: self._colors.sys_label,
+        }[entry.direction]
+        return self._format_message(
+            source, entry.text, entry.direction.name, label_color, entry.timestamp
+        )
 
     def _emit_counters(self) -> None:
+        """Mark counters dirty; the snapshot is published on the next coalescer tick."""
+        self._counter_coalescer.mark_dirty(self._publish_counters)
+
+    def _publish_counters(self) -> None:
         """Emit aggregated counter snapshot for observers."""
         snapshot = self.CounterSnapshot(
             tuple(self.rx_counts),
@@ -147,6 +147,10 @@ class ViewModelFactoryProtocol(Protocol):
         """Create stopwatch ViewModel."""
         ...
 
+    def create_telemetry_plot_viewmodel(self) -> Any:
+        """Create live telemetry plot ViewModel."""
+        ...
+
 
 @runtime_checkable
 class StopwatchViewModelProtocol(Protocol):
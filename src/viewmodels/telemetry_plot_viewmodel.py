@@ -0,0 +1,133 @@
+"""ViewModel of the live telemetry plot: selection state and decimated series."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from PySide6 import QtCore
+
+from src.utils import get_telemetry_hub
+from src.utils.plot_decimation import minmax_decimate
+from src.utils.telemetry_decoder import HAS_NUMPY
+from src.utils.telemetry_hub import TelemetryHub, TelemetrySource
+
+if HAS_NUMPY:
+    import numpy as np
+
+WINDOW_CHOICES: tuple[float, ...] = (1.0, 10.0, 60.0)
+
+
+@dataclass(slots=True)
+class PlotSeries:
+    """One channel reduced to per-pixel minima/maxima."""
+
+    name: str
+    mins: Any
+    maxs: Any
+    unit: str = ""
+
+
+class TelemetryPlotViewModel(QtCore.QObject):
+    """Tracks the selected port, channels and time window of a telemetry plot."""
+
+    sources_changed = QtCore.Signal(list)  # port labels
+    channels_changed = QtCore.Signal(list)  # available channel names
+
+    def __init__(
+        self,
+        parent: QtCore.QObject | None = None,
+        *,
+        hub: TelemetryHub | None = None,
+        window_seconds: float = 10.0,
+    ) -> None:
+        super().__init__(parent)
+        self._hub = hub or get_telemetry_hub()
+        self._source_label: str | None = None
+        self._selected: list[str] = []
+        self._window_seconds = window_seconds
+        self._hub.sources_changed.connect(self._on_sources_changed)
+        self._on_sources_changed()
+
+    @property
+    def available(self) -> bool:
+        return HAS_NUMPY
+
+    @property
+    def source_labels(self) -> list[str]:
+        return [source.port_label for source in self._hub.sources()]
+
+    @property
+    def source_label(self) -> str | None:
+        return self._source_label
+
+    @property
+    def channels(self) -> list[str]:
+        source = self._source()
+        return list(source.channels) if source else []
+
+    @property
+    def selected_channels(self) -> list[str]:
+        return list(self._selected)
+
+    @property
+    def window_seconds(self) -> float:
+        return self._window_seconds
+
+    def select_source(self, port_label: str | None) -> None:
+        if port_label == self._source_label:
+            return
+        self._source_label = port_label
+        channels = self.channels
+        # Default to the first channel so a fresh plot shows something
+        self._selected = channels[:1]
+        self.channels_changed.emit(channels)
+
+    def set_channel_selected(self, name: str, selected: bool) -> None:
+        if selected and name not in self._selected and name in self.channels:
+            self._selected.append(name)
+        elif not selected and name in self._selected:
+            self._selected.remove(name)
+
+    def set_window_seconds(self, seconds: float) -> None:
+        self._window_seconds = max(0.001, float(seconds))
+
+    def revision(self) -> int:
+        """Changes whenever new samples arrive; lets the view skip idle repaints."""
+        source = self._source()
+        return source.ring.total if source else -1
+
+    def series(self, width: int) -> list[PlotSeries]:
+        """
+        Selected channels over the time window, decimated to ``width`` columns.
+
+        The window ends at the newest sample (not the wall clock), so a
+        paused or replayed stream still shows its last data.
+        """
+        source = self._source()
+        if source is None or width <= 0 or not self._selected or not len(source.ring):
+            return []
+        ring = source.ring
+        times = ring.times()
+        start = int(np.searchsorted(times, times[-1] - self._window_seconds, side="left"))
+        count = len(times) - start
+        result = []
+        for name in self._selected:
+            values = ring.column(name, last=count)
+            mins, maxs = minmax_decimate(values, width)
+            result.append(PlotSeries(name, mins, maxs, source.units.get(name, "")))
+        return result
+
+    def _source(self) -> TelemetrySource | None:
+        if self._source_label is None:
+            return None
+        return self._hub.source(self._source_label)
+
+    def _on_sources_changed(self) -> None:
+        labels = self.source_labels
+        if self._source_label not in labels:
+            self.select_source(labels[0] if labels else None)
+        self.sources_changed.emit(labels)
+
+
+__all__ = ["PlotSeries", "TelemetryPlotViewModel", "WINDOW_CHOICES"]
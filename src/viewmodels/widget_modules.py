@@ -55,6 +55,37 @@ class StopwatchHostAdapter(WidgetHostModuleAdapter):
         )
 
 
+class TelemetryPlotHostAdapter(WidgetHostModuleAdapter):
+    """Adapter wiring TelemetryPlotWidget to the telemetry hub."""
+
+    def build(self) -> WidgetModuleDescriptor:
+        from src.views.widgets.telemetry_plot_widget import TelemetryPlotWidget
+
+        module_id = self._entry["id"]
+        title = self._entry.get("title", "Telemetry")
+        icon = self._entry.get("icon")
+        layout_hint = self._entry.get("layout_hint")
+
+        def viewmodel_factory() -> QtCore.QObject | None:
+            factory = service_container.resolve("viewmodel_factory")
+            return factory.create_telemetry_plot_viewmodel()
+
+        def view_factory(
+            parent: QtWidgets.QWidget | None, viewmodel: QtCore.QObject | None
+        ) -> QtWidgets.QWidget:
+            vm = viewmodel or viewmodel_factory()
+            return TelemetryPlotWidget(vm, parent)
+
+        return WidgetModuleDescriptor(
+            module_id=module_id,
+            title=title,
+            view_factory=view_factory,
+            viewmodel_factory=viewmodel_factory,
+            icon_name=icon,
+            layout_hint=layout_hint,
+        )
+
+
 class LogsHostAdapter(WidgetHostModuleAdapter):
     """Adapter embedding ConsolePanelView inside Widget Host."""
 
@@ -113,6 +144,7 @@ MODULE_ADAPTERS: dict[str, type[WidgetHostModuleAdapter]] = {
     "stopwatch": StopwatchHostAdapter,
     "logs": LogsHostAdapter,
     "quick_commands": QuickCommandsHostAdapter,
+    "telemetry_plot": TelemetryPlotHostAdapter,
 }
 
 
@@ -121,5 +153,6 @@ __all__ = [
     "StopwatchHostAdapter",
     "LogsHostAdapter",
     "QuickCommandsHostAdapter",
+    "TelemetryPlotHostAdapter",
     "MODULE_ADAPTERS",
 ]
@@ -1,16 +1,27 @@
 """
 Views package.
+
+Public names are resolved lazily through module ``__getattr__`` so importing
+a single view (e.g. the splash screen during startup) does not pull in
+``MainWindow`` and everything it depends on.
 """
 
-from src.views.main_window import MainWindow
-from src.views.port_panel_view import PortPanelView
-from src.views.console_panel_view import ConsolePanelView
-from src.views.splash_screen import ModernSplashScreen, SplashController
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.utils.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:  # pragma: no cover - imported only for typing
+    from src.views.main_window import MainWindow
+    from src.views.port_panel_view import PortPanelView
+    from src.views.console_panel_view import ConsolePanelView
+    from src.views.splash_screen import ModernSplashScreen, SplashController
 
-__all__ = [
-    'MainWindow',
-    'PortPanelView',
-    'ConsolePanelView',
-    'ModernSplashScreen',
-    'SplashController',
-]
+__all__, __getattr__, __dir__ = lazy_exports(__name__, {
+    'MainWindow': 'src.views.main_window',
+    'PortPanelView': 'src.views.port_panel_view',
+    'ConsolePanelView': 'src.views.console_panel_view',
+    'ModernSplashScreen': 'src.views.splash_screen',
+    'SplashController': 'src.views.splash_screen',
+})
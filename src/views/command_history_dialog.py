@@ -12,6 +12,7 @@ from src.viewmodels.command_history_viewmodel import (
     CommandHistoryEntry,
 )
 from src.utils.translator import tr, translator
+from src.utils import get_style_refresher
 from src.utils.theme_manager import theme_manager
 from src.utils.icon_cache import get_icon
 from src.styles.constants import Sizes, Colors
@@ -286,17 +287,12 @@ class CommandHistoryDialog(QtWidgets.QDialog):
         # Apply to all widgets and their children
         widgets = [self, self._toolbar, self._search, self._table, self._lbl_summary, self._btn_close]
         widgets.extend(self.findChildren(QtWidgets.QWidget))
+        refresher = get_style_refresher()
         for widget in widgets:
-            widget.setProperty("themeClass", theme_class)
-            widget.style().unpolish(widget)
-            widget.style().polish(widget)
-            widget.update()
-        
+            refresher.set_theme_class(widget, theme_class)
+
         # Update toolbar action icons for theme
         self._update_toolbar_icons()
-        # Process events to ensure icons are updated
-        from PySide6.QtWidgets import QApplication
-        QApplication.processEvents()
     
     def _update_toolbar_icons(self) -> None:
         """Update toolbar action icons when theme changes."""
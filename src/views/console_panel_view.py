@@ -4,9 +4,9 @@ Reusable widget for showing RX/TX data from multiple ports.
 """
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 from PySide6 import QtWidgets, QtCore, QtGui
 from PySide6.QtCore import Signal, Qt, QTimer
-from collections import deque
 import html
 import re
 import time
@@ -14,10 +14,31 @@ import time
 from src.utils.translator import tr, translator
 from src.styles.constants import Fonts, Sizes, ConsoleLimits
 from src.utils.config_loader import config_loader
+from src.utils import get_style_refresher
 from src.utils.theme_manager import theme_manager
 from src.utils.icon_cache import get_icon, get_icon_cache
 from src.utils.mmap_log_history import create_history_for_port, MemoryMappedLogHistory
-from src.utils.log_exporter import ExportRequest, LogExportWorker
+from src.utils.log_store import ColumnarLogStore, LogDirection, LogEntry
+from src.utils.hexdump import hexdump_rows
+from src.utils.metrics import metrics
+
+if TYPE_CHECKING:  # pragma: no cover - the exporter loads on first export
+    from src.utils.log_exporter import ExportRequest, LogExportWorker
+
+# Tab icons for well-known port labels; any other port gets the default
+_PORT_ICONS = {"TLM": "magnifying-glass"}
+_DEFAULT_PORT_ICON = "paper-plane"
+
+# GUI-side RX path stages after the viewmodel (see src.utils.metrics)
+_FORMAT_SPAN = metrics.histogram("console.format")
+_FLUSH_SPAN = metrics.histogram("console.flush")
+_HISTORY_SPAN = metrics.histogram("console.history_append")
+_FLUSH_ROWS = metrics.gauge("console.flush_rows")
+_DROPPED_UPDATES = metrics.counter("console.dropped_updates")
+
+
+def _port_icon_name(port_label: str) -> str:
+    return _PORT_ICONS.get(port_label.upper(), _DEFAULT_PORT_ICON)
 
 class LogWidget:
     """Container for log widget and its label."""
@@ -170,7 +191,7 @@ class ConsolePanelView(QtWidgets.QWidget):
     UI component for displaying console logs from serial ports.
     
     Features:
-    - Multiple log panels (CPU1, CPU2, TLM, Combined)
+    - Multiple log panels (one per configured port, plus Combined)
     - Search functionality
     - Clear and save operations
     - Timestamps and source labels
@@ -180,12 +201,19 @@ class ConsolePanelView(QtWidgets.QWidget):
         search_changed (str): Search text changed
         clear_requested (): Clear all logs requested
         save_requested (): Save logs requested
+        tail_filter_requested (str, str, str): Port label, action (include/exclude/clear), term
+        rx_mode_requested (str, bool): Port label, hex (binary) mode enabled
     """
     
     search_changed = Signal(str)
     clear_requested = Signal()
     save_requested = Signal()
     file_dropped = Signal(str)  # Signal for file drop - emits file path
+    tail_filter_requested = Signal(str, str, str)
+    rx_mode_requested = Signal(str, bool)
+
+    # Hexdump rows per stored entry: keeps one rendered entry below MAX_HTML_LENGTH
+    HEX_ROWS_PER_ENTRY = 16
     
     def __init__(
         self, 
@@ -205,15 +233,22 @@ class ConsolePanelView(QtWidgets.QWidget):
         self.setFocusPolicy(QtCore.Qt.StrongFocus)
         
         self._config = config or {}
-        self._port_labels: list[str] = ['CPU1', 'CPU2', 'TLM']
+        # Ports are whatever [ports] declares; the combined tab shows the first two
+        self._port_labels: list[str] = list(
+            self._config.get('port_labels')
+            or [label for _, label in config_loader.get_port_labels()]
+        )
         self._log_widgets: dict[str, LogWidget] = {}
         self._combined_log_widgets: dict[str, QtWidgets.QTextEdit] = {}
-        self._combined_cache: dict[str, deque[str]] = {}
-        # Ring buffer storage for in-memory log rendering
-        self._log_cache: dict[str, deque[str]] = {}
+        # Columnar ring store per port; views, search and export read from it by index
+        self._log_stores: dict[str, ColumnarLogStore] = {}
         # Memory-mapped history storage per port
         self._history_files: dict[str, MemoryMappedLogHistory] = {}
-        self._export_worker: LogExportWorker | None = None
+        # Raw byte history for ports in binary mode (created on first chunk)
+        self._raw_history_files: dict[str, MemoryMappedLogHistory] = {}
+        self._hex_offsets: dict[str, int] = {}
+        self._binary_ports: set[str] = set()
+        self._export_worker: "LogExportWorker | None" = None
         self._export_dialog: QtWidgets.QProgressDialog | None = None
         self._recent_export_dir: Path | None = None
         from src.styles.constants import ConsoleLimits as _ConsoleLimits  # local import to avoid cycles
@@ -234,7 +269,11 @@ class ConsolePanelView(QtWidgets.QWidget):
         
         # Throttled update state
         from src.styles.constants import ConsoleLimits as _ConsoleLimits  # local import to avoid cycles
-        self._pending_updates: dict[str, list[tuple[str, str]]] = {}
+        self._pending_updates: dict[str, list[int]] = {}  # store sequence numbers
+        # Plain lines awaiting the history file, including lines hidden by tail filters
+        self._pending_history: dict[str, list[str]] = {}
+        self._pending_raw: dict[str, list[bytes]] = {}
+        self._tail_filter_stats: dict[str, tuple[int, int]] = {}
         self._dropped_updates: dict[str, int] = {}
         self._dropped_updates_total: int = 0
         self._last_flush_timestamp: float = 0.0
@@ -250,6 +289,16 @@ class ConsolePanelView(QtWidgets.QWidget):
         )
         self._back_pressure_threshold: float = threshold
 
+        # Hidden-tab render suspension: views whose tab is not current only
+        # accumulate into their port store and are rebuilt on activation.
+        self._view_pages: dict[str, QtWidgets.QWidget] = {}
+        self._view_edits: dict[str, QtWidgets.QTextEdit] = {}
+        self._stale_views: set[str] = set()
+        self._catch_up_generation: dict[str, int] = {}
+        self._catch_up_page_lines: int = int(
+            self._config.get('catch_up_page_lines', _ConsoleLimits.CATCH_UP_PAGE_LINES)
+        )
+
         # Search debounce timer (300ms)
         self._search_timer: QTimer | None = None
         self._search_debounce_ms: int = 300
@@ -475,28 +524,24 @@ class ConsolePanelView(QtWidgets.QWidget):
     def _create_log_tabs(self) -> None:
         """Create log tabs for each port and combined view."""
         
-        # Icon mapping for ports
-        PORT_ICONS = {
-            "CPU1": "paper-plane",
-            "CPU2": "paper-plane",
-            "TLM": "magnifying-glass",
-        }
-
-        # Combined tab (CPU1 + CPU2) uses cached mirror, без дублирования QTextEdit
+        # Combined tab (first two ports) renders from the port stores, без дублирования QTextEdit
         combined_widget = self._create_combined_widget()
         self._tab_widget.addTab(combined_widget, tr("combined", "1+2"))
         self._tab_widget.setTabIcon(0, get_icon("paper-plane"))
-        self._combined_cache: dict[str, deque[str]] = {}
         
         # Individual tabs
         for i, port_label in enumerate(self._port_labels):
             tab_widget = self._create_single_log_widget(port_label)
             self._tab_widget.addTab(tab_widget, tr(port_label.lower(), port_label))
             tab_index = i + 1
-            self._tab_widget.setTabIcon(tab_index, get_icon(PORT_ICONS.get(port_label, "paper-plane")))
+            self._tab_widget.setTabIcon(tab_index, get_icon(_port_icon_name(port_label)))
     
+    def _combined_labels(self) -> list[str]:
+        """Ports shown side by side in the combined tab (the "1+2" pair)."""
+        return self._port_labels[:2]
+
     def _create_combined_widget(self) -> QtWidgets.QWidget:
-        """Create combined view that renders from caches to avoid QTextEdit duplication."""
+        """Create combined view that renders from the port stores to avoid QTextEdit duplication."""
         widget = QtWidgets.QWidget()
         widget.setProperty("class", "console-tab-page")
         layout = QtWidgets.QVBoxLayout(widget)
@@ -506,7 +551,7 @@ class ConsolePanelView(QtWidgets.QWidget):
         columns = QtWidgets.QHBoxLayout()
         columns.setSpacing(Sizes.LAYOUT_SPACING)
 
-        for label in ["CPU1", "CPU2"]:
+        for label in self._combined_labels():
             column = QtWidgets.QVBoxLayout()
             header = QtWidgets.QLabel(label)
             header.setProperty("class", "console-section-label")
@@ -517,7 +562,8 @@ class ConsolePanelView(QtWidgets.QWidget):
             column.addWidget(text_edit, 1)
 
             self._combined_log_widgets[label] = text_edit
-            self._combined_cache[label] = deque(maxlen=self._max_lines)
+            self._view_pages[f"combined:{label}"] = widget
+            self._view_edits[f"combined:{label}"] = text_edit
 
             columns.addLayout(column, 1)
 
@@ -544,8 +590,10 @@ class ConsolePanelView(QtWidgets.QWidget):
         log_widget.text_edit = log_edit
         self._log_widgets[port_label] = log_widget
         
-        # Initialize cache for this port
-        self._log_cache[port_label] = deque(maxlen=self._max_lines)
+        # Initialize store for this port
+        self._store_for(port_label)
+        self._view_pages[port_label] = widget
+        self._view_edits[port_label] = log_edit
 
         self._register_console_page(widget)
         return widget
@@ -581,13 +629,50 @@ class ConsolePanelView(QtWidgets.QWidget):
         
         # Filter by selection
         cursor = text_edit.textCursor()
+        port_label = self._port_for_edit(text_edit)
         if cursor.hasSelection():
             selected_text = cursor.selectedText()
             filter_action = QtGui.QAction(f"{tr('filter', 'Filter')}: {selected_text[:20]}...", menu)
             filter_action.triggered.connect(lambda: self._filter_by_text(selected_text))
             menu.addAction(filter_action)
+            if port_label:
+                hide_action = QtGui.QAction(
+                    tr("tail_filter_hide", "Hide lines like: {text}", text=selected_text[:20]), menu
+                )
+                hide_action.triggered.connect(
+                    lambda: self.tail_filter_requested.emit(port_label, "exclude", selected_text)
+                )
+                menu.addAction(hide_action)
+                only_action = QtGui.QAction(
+                    tr("tail_filter_only", "Show only lines like: {text}", text=selected_text[:20]), menu
+                )
+                only_action.triggered.connect(
+                    lambda: self.tail_filter_requested.emit(port_label, "include", selected_text)
+                )
+                menu.addAction(only_action)
+        if port_label:
+            hex_action = QtGui.QAction(tr("hex_view", "Hex view (raw bytes)"), menu)
+            hex_action.setCheckable(True)
+            hex_action.setChecked(port_label in self._binary_ports)
+            hex_action.toggled.connect(
+                lambda checked: self.rx_mode_requested.emit(port_label, checked)
+            )
+            menu.addAction(hex_action)
+        if port_label and port_label in self._tail_filter_stats:
+            clear_action = QtGui.QAction(tr("tail_filter_clear", "Clear live filter"), menu)
+            clear_action.triggered.connect(
+                lambda: self.tail_filter_requested.emit(port_label, "clear", "")
+            )
+            menu.addAction(clear_action)
         
         menu.exec(text_edit.mapToGlobal(pos))
+
+    def _port_for_edit(self, text_edit: QtWidgets.QTextEdit) -> str | None:
+        """Port whose lines a log view shows, or None for unknown widgets."""
+        for view_key, edit in self._view_edits.items():
+            if edit is text_edit:
+                return self._view_port(view_key)
+        return None
     
     def _copy_all_text(self, text_edit: QtWidgets.QTextEdit) -> None:
         """Copy all text from the text edit to clipboard."""
@@ -623,6 +708,26 @@ class ConsolePanelView(QtWidgets.QWidget):
         truncated += "...<span style='color:gray'> [truncated]</span>"
         return truncated
     
+    def _header_may_match(self, search_text: str, use_regex: bool) -> bool:
+        """
+        Whether a search could match the rendered ``[time] RX(port):`` header.
+
+        The stores hold message text only, so their pre-screen is exact only
+        for queries that cannot start inside the header.
+        """
+        if not (self._show_time or self._show_source):
+            return False
+        if use_regex:
+            return True
+        header_chars = set(" []()")
+        if self._show_time:
+            header_chars.update("0123456789:")
+        if self._show_source:
+            header_chars.update(":rxtsy")
+            for label in self._log_stores:
+                header_chars.update(label.lower())
+        return search_text[0].lower() in header_chars
+
     def _init_update_timer(self) -> None:
         """Initialize the throttled update timer."""
         self._update_timer = QTimer(self)
@@ -666,12 +771,23 @@ class ConsolePanelView(QtWidgets.QWidget):
                 pattern = re.compile(re.escape(search_text), re.IGNORECASE)
         except re.error:
             pattern = None
+
+        # Pre-screen on the port stores: only ports with a matching line are
+        # rendered (if their view is stale) and scanned block by block.
+        if self._header_may_match(search_text, use_regex):
+            matching_ports = set(self._log_stores)
+        else:
+            matching_ports = {
+                label for label, store in self._log_stores.items()
+                if store.search(pattern if pattern is not None else search_text)
+            }
+        self._catch_up_views_for(matching_ports)
         
-        # Define search order: Combined (1+2), CPU1, CPU2, TLM
+        # Define search order: Combined (1+2), then every port in tab order
         search_order = []
         
-        # First: Combined tab (CPU1+CPU2 together)
-        if 'CPU1' in self._combined_log_widgets and 'CPU2' in self._combined_log_widgets:
+        # First: Combined tab (first two ports together)
+        if self._combined_log_widgets:
             # Combined widgets are Direct QTextEdit, not LogWidget
             combined_widgets = {}
             for k, v in self._combined_log_widgets.items():
@@ -680,14 +796,16 @@ class ConsolePanelView(QtWidgets.QWidget):
                 combined_widgets[k] = wrapper
             search_order.append(('COMBINED', combined_widgets, 'COMBINED'))
         
-        # Then individual ports in order: CPU1, CPU2, TLM
-        for port_label in ['CPU1', 'CPU2', 'TLM']:
+        # Then individual ports in tab order
+        for port_label in self._port_labels:
             if port_label in self._log_widgets:
                 search_order.append((port_label, {port_label: self._log_widgets[port_label]}, port_label))
         
         # Search in defined order
         for port_group_label, widgets, tab_name in search_order:
             for port_label, widget in widgets.items():
+                if port_label not in matching_ports:
+                    continue
                 # Handle both LogWidget (with .text_edit) and direct QTextEdit
                 text_edit = getattr(widget, 'text_edit', widget)
                 if not text_edit:
@@ -792,7 +910,7 @@ class ConsolePanelView(QtWidgets.QWidget):
         # Clear all highlights first
         self._clear_all_highlights()
         
-        # Apply highlights to individual port widgets (CPU1, CPU2, TLM)
+        # Apply highlights to individual port widgets
         for port_label, widget in self._log_widgets.items():
             if not widget.text_edit:
                 continue
@@ -840,7 +958,7 @@ class ConsolePanelView(QtWidgets.QWidget):
             
             text_edit.setExtraSelections(selections)
         
-        # Apply highlights to Combined tab widgets (CPU1 and CPU2 in combined view)
+        # Apply highlights to Combined tab widgets (first two ports)
         for combined_key, text_edit in self._combined_log_widgets.items():
             if not text_edit:
                 continue
@@ -928,7 +1046,7 @@ class ConsolePanelView(QtWidgets.QWidget):
        
         text_edit = None
         
-        # For Combined tab, use the specific widget (CPU1 or CPU2)
+        # For Combined tab, use the specific widget (first or second port)
         if tab_name == 'COMBINED' and port_label in self._combined_log_widgets:
             text_edit = self._combined_log_widgets[port_label]
         else:
@@ -990,34 +1108,180 @@ class ConsolePanelView(QtWidgets.QWidget):
     
     def _flush_pending_updates(self) -> None:
         """Flush all pending log updates to UI."""
-        for port_label, updates in self._pending_updates.items():
-            if port_label in self._log_widgets:
-                widget = self._log_widgets[port_label]
-                if widget.text_edit:
-                    # Batch all updates for this port
-                    truncated_html = self._truncate_html("".join([u[0] for u in updates]))
-                    cursor = widget.text_edit.textCursor()
-                    cursor.movePosition(QtGui.QTextCursor.End)
-                    cursor.insertHtml(truncated_html)
-                    widget.text_edit.setTextCursor(cursor)
-                    self._trim_document_if_needed(widget.text_edit)
-                    self._append_to_combined(port_label, truncated_html)
-                    if port_label in self._history_files:
-                        all_plain = "".join([u[1] for u in updates])
-                        self._history_files[port_label].append(all_plain)
+        start = time.perf_counter_ns()
+        _FLUSH_ROWS.set(sum(map(len, self._pending_updates.values())))
+        for port_label, seqs in self._pending_updates.items():
+            store = self._log_stores.get(port_label)
+            if store is None or port_label not in self._log_widgets:
+                continue
+            entries = store.select(seqs)
+            if not entries:
+                continue
+            # Batch all updates for this port; HTML is rendered only here
+            needs_html = any(map(self._view_needs_render, self._port_view_keys(port_label)))
+            if needs_html:
+                html_chunk = self._render_entries(port_label, entries)
+                self._render_or_defer(port_label, html_chunk)
+                self._append_to_combined(port_label, html_chunk)
+            else:
+                self._stale_views.update(self._port_view_keys(port_label))
+        history_start = time.perf_counter_ns()
+        for port_label, texts in self._pending_history.items():
+            history = self._history_files.get(port_label)
+            if history is not None:
+                history.append("".join(f"{text}\n" for text in texts))
+        for port_label, chunks in self._pending_raw.items():
+            raw_history = self._raw_history_for(port_label)
+            if raw_history is not None:
+                raw_history.append_bytes(b"".join(chunks))
+        if self._pending_history or self._pending_raw:
+            _HISTORY_SPAN.record_since(history_start)
         # Update telemetry after flush
         self._pending_updates.clear()
+        self._pending_history.clear()
+        self._pending_raw.clear()
         self._last_flush_timestamp = time.monotonic()
+        _FLUSH_SPAN.record_since(start)
 
     def _append_to_combined(self, port_label: str, html_chunk: str) -> None:
-        """Mirror CPU1/CPU2 updates inside the combined tab."""
+        """Mirror updates of the first two ports inside the combined tab."""
         if port_label not in self._combined_log_widgets:
             return
-        self._combined_cache.setdefault(port_label, deque(maxlen=self._max_lines)).append(html_chunk)
-        text_edit = self._combined_log_widgets[port_label]
-        text_edit.clear()
-        text_edit.append("".join(self._combined_cache[port_label]))
+        self._render_or_defer(f"combined:{port_label}", html_chunk)
+
+    def _port_view_keys(self, port_label: str) -> list[str]:
+        """Views rendering a port's store: its own tab and, for the first two ports, the combined column."""
+        keys = [port_label]
+        if port_label in self._combined_log_widgets:
+            keys.append(f"combined:{port_label}")
+        return keys
+
+    def _view_needs_render(self, view_key: str) -> bool:
+        return (
+            view_key in self._view_edits
+            and view_key not in self._stale_views
+            and self._is_view_active(view_key)
+        )
+
+    def _is_view_active(self, view_key: str) -> bool:
+        """Return True when the tab hosting the view is the current one."""
+        page = self._view_pages.get(view_key)
+        return page is not None and page is self._tab_widget.currentWidget()
+
+    @staticmethod
+    def _view_port(view_key: str) -> str:
+        """Port whose store a view is rebuilt from when it catches up."""
+        return view_key.split(":", 1)[1] if view_key.startswith("combined:") else view_key
+
+    def _render_or_defer(self, view_key: str, html_chunk: str) -> None:
+        """Insert a chunk into a visible view; hidden views are only marked stale."""
+        text_edit = self._view_edits.get(view_key)
+        if text_edit is None:
+            return
+        if view_key in self._stale_views or not self._is_view_active(view_key):
+            self._stale_views.add(view_key)
+            return
+        self._append_html(text_edit, html_chunk)
         self._trim_document_if_needed(text_edit)
+
+    @staticmethod
+    def _append_html(text_edit: QtWidgets.QTextEdit, html_chunk: str) -> None:
+        """Append HTML as new blocks at the end and keep the caret there (auto-scroll)."""
+        cursor = text_edit.textCursor()
+        cursor.movePosition(QtGui.QTextCursor.End)
+        if not text_edit.document().isEmpty():
+            # Start a fresh block so the first line is not merged into the previous one
+            cursor.insertBlock()
+        cursor.insertHtml(html_chunk)
+        text_edit.setTextCursor(cursor)
+
+    @staticmethod
+    def _prepend_html(text_edit: QtWidgets.QTextEdit, html_chunk: str) -> None:
+        """Insert HTML before the first block without moving the visible viewport."""
+        scrollbar = text_edit.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum()
+        offset_from_bottom = scrollbar.maximum() - scrollbar.value()
+        document = text_edit.document()
+        was_empty = document.isEmpty()
+        cursor = QtGui.QTextCursor(document)
+        cursor.movePosition(QtGui.QTextCursor.Start)
+        cursor.insertHtml(html_chunk)
+        if not was_empty:
+            cursor.insertBlock()
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+        else:
+            scrollbar.setValue(scrollbar.maximum() - offset_from_bottom)
+
+    def _screenful_lines(self, text_edit: QtWidgets.QTextEdit) -> int:
+        """Estimate how many log lines fit into the visible viewport."""
+        line_height = max(1, text_edit.fontMetrics().lineSpacing())
+        visible = text_edit.viewport().height() // line_height
+        return max(visible + 1, self._catch_up_page_lines // 4)
+
+    def _catch_up_view(self, view_key: str, *, lazy: bool = True) -> None:
+        """
+        Rebuild a stale view from its port store.
+
+        The last screenful is rendered immediately; older lines are paged in
+        from the event loop so tab activation never blocks on a full re-render.
+        With ``lazy=False`` everything is rendered synchronously.
+        """
+        text_edit = self._view_edits.get(view_key)
+        if text_edit is None:
+            return
+        self._stale_views.discard(view_key)
+        generation = self._catch_up_generation.get(view_key, 0) + 1
+        self._catch_up_generation[view_key] = generation
+
+        port_label = self._view_port(view_key)
+        store = self._log_stores.get(port_label)
+        text_edit.clear()
+        if store is None or not len(store):
+            return
+        first = max(store.first_seq, store.next_seq - ConsoleLimits.MAX_DOCUMENT_LINES)
+        split = store.next_seq - self._screenful_lines(text_edit) if lazy else first
+        split = max(first, split)
+
+        recent = list(store.entries(split))
+        if recent:
+            self._append_html(text_edit, self._render_entries(port_label, recent))
+        if split > first:
+            older = list(range(first, split))
+            QTimer.singleShot(0, lambda: self._page_in_older(view_key, older, generation))
+
+    def _page_in_older(self, view_key: str, older: list[int], generation: int) -> None:
+        """Prepend one page of older lines, rescheduling until the view is complete."""
+        if self._catch_up_generation.get(view_key) != generation:
+            return
+        if not self._is_view_active(view_key):
+            # Tab was hidden mid catch-up: rebuild from scratch on next activation
+            self._stale_views.add(view_key)
+            return
+        text_edit = self._view_edits.get(view_key)
+        if text_edit is None:
+            return
+        port_label = self._view_port(view_key)
+        store = self._log_stores.get(port_label)
+        page = older[-self._catch_up_page_lines:]
+        del older[-self._catch_up_page_lines:]
+        entries = store.select(page) if store is not None else []
+        if entries:
+            self._prepend_html(text_edit, self._render_entries(port_label, entries))
+        if older:
+            QTimer.singleShot(0, lambda: self._page_in_older(view_key, older, generation))
+
+    def _catch_up_active_views(self) -> None:
+        """Render stale views hosted by the current tab."""
+        for view_key in list(self._stale_views):
+            if self._is_view_active(view_key):
+                self._catch_up_view(view_key)
+
+    def _catch_up_views_for(self, port_labels: set[str]) -> None:
+        """Synchronously render stale views of the given ports (used before document-wide search)."""
+        for view_key in list(self._stale_views):
+            if self._view_port(view_key) in port_labels:
+                self._catch_up_view(view_key, lazy=False)
     
     def _trim_document_if_needed(self, text_edit: QtWidgets.QTextEdit) -> None:
         """
@@ -1040,27 +1304,48 @@ class ConsolePanelView(QtWidgets.QWidget):
                 cursor.movePosition(QtGui.QTextCursor.Down, QtGui.QTextCursor.KeepAnchor)
             cursor.deleteChar()
     
-    def append_log(self, port_label: str, html_content: str, plain_text: str) -> None:
+    @property
+    def log_stores(self) -> dict[str, ColumnarLogStore]:
+        """Per-port stores backing the views, search and export (live, not a copy)."""
+        return self._log_stores
+
+    def _store_for(self, port_label: str) -> ColumnarLogStore:
+        store = self._log_stores.get(port_label)
+        if store is None:
+            store = ColumnarLogStore(self._max_lines)
+            self._log_stores[port_label] = store
+        return store
+
+    def append_log(
+        self,
+        port_label: str,
+        text: str,
+        direction: LogDirection = LogDirection.SYS,
+    ) -> None:
         """
         Append log content to a specific port's log.
         Uses throttled updates for better performance.
         
         Args:
-            port_label: Port identifier (CPU1, CPU2, TLM)
-            html_content: HTML formatted content
-            plain_text: Plain text version
+            port_label: Port identifier (e.g. CPU1)
+            text: Plain message text
+            direction: Message origin used for colouring and the source label
         """
-        # Add to cache immediately (deque with maxlen handles size limit automatically)
-        if port_label not in self._log_cache:
-            self._log_cache[port_label] = deque(maxlen=self._max_lines)
-        
-        self._log_cache[port_label].append(html_content)
+        text = self._normalize_text(text)
+        if not text:
+            return
+        # Store immediately (the ring store evicts the oldest rows by itself)
+        seq = self._store_for(port_label).append(text, direction)
+        self._pending_history.setdefault(port_label, []).append(text)
+        self._queue_render(port_label, seq)
 
+    def _queue_render(self, port_label: str, seq: int) -> None:
+        """Queue a stored row for the next throttled flush, applying back-pressure."""
         # Queue UI update for throttling
         if port_label not in self._pending_updates:
             self._pending_updates[port_label] = []
         queue = self._pending_updates[port_label]
-        queue.append((html_content, plain_text))
+        queue.append(seq)
 
         # Apply back-pressure if queue grows beyond threshold
         max_chunks = max(1, self._max_pending_chunks)
@@ -1070,11 +1355,13 @@ class ConsolePanelView(QtWidgets.QWidget):
             drops = self._dropped_updates.get(port_label, 0) + 1
             self._dropped_updates[port_label] = drops
             self._dropped_updates_total += 1
+            _DROPPED_UPDATES.add()
         if len(queue) > threshold:
             queue.pop(0)
             drops = self._dropped_updates.get(port_label, 0) + 1
             self._dropped_updates[port_label] = drops
             self._dropped_updates_total += 1
+            _DROPPED_UPDATES.add()
 
         # Trigger timer if not already running
         if self._update_timer and not self._update_timer.isActive():
@@ -1088,8 +1375,7 @@ class ConsolePanelView(QtWidgets.QWidget):
             port_label: Port identifier
             data: Received data
         """
-        formatted = self._format_rx(port_label, data)
-        self.append_log(port_label, formatted, data)
+        self.append_log(port_label, data, LogDirection.RX)
     
     def append_tx(self, port_label: str, data: str) -> None:
         """
@@ -1099,8 +1385,7 @@ class ConsolePanelView(QtWidgets.QWidget):
             port_label: Port identifier
             data: Sent data
         """
-        formatted = self._format_tx(port_label, data)
-        self.append_log(port_label, formatted, data)
+        self.append_log(port_label, data, LogDirection.TX)
     
     def append_system(self, port_label: str, message: str) -> None:
         """
@@ -1110,52 +1395,152 @@ class ConsolePanelView(QtWidgets.QWidget):
             port_label: Port identifier
             message: System message
         """
-        formatted = self._format_system(port_label, message)
-        self.append_log(port_label, formatted, message)
-    
-    def _format_rx(self, port_label: str, data: str) -> str:
-        """Format received data for display."""
-        return self._format_message(port_label, data, "RX")
-    
-    def _format_tx(self, port_label: str, data: str) -> str:
-        """Format transmitted data for display."""
-        return self._format_message(port_label, data, "TX")
-    
-    def _format_system(self, port_label: str, message: str) -> str:
-        """Format system message for display."""
-        return self._format_message(port_label, message, "SYS")
+        self.append_log(port_label, message, LogDirection.SYS)
+
+    def append_rx_bytes(self, port_label: str, data: bytes, timestamp: float | None = None) -> None:
+        """
+        Append a raw binary chunk: rendered as hexdump rows, kept raw in history.
+        
+        Args:
+            port_label: Port identifier
+            data: Raw received bytes
+            timestamp: Unix time the chunk was read (defaults to now)
+        """
+        if not data:
+            return
+        offset = self._hex_offsets.get(port_label, 0)
+        self._hex_offsets[port_label] = offset + len(data)
+        self._append_hex_rows(port_label, hexdump_rows(data, offset), timestamp)
+        self._pending_raw.setdefault(port_label, []).append(data)
+
+    def append_rx_frames(
+        self, port_label: str, frames: list[bytes], timestamp: float | None = None
+    ) -> None:
+        """
+        Append decoded frames: each frame is a hexdump starting at offset 0.
+        
+        Args:
+            port_label: Port identifier
+            frames: Frame payloads from the port's frame decoder
+            timestamp: Unix time the frames were completed (defaults to now)
+        """
+        for frame in frames:
+            self._append_hex_rows(port_label, hexdump_rows(frame) or [tr("empty_frame", "(empty frame)")], timestamp)
+        if frames:
+            self._pending_raw.setdefault(port_label, []).extend(frames)
+
+    def _append_hex_rows(self, port_label: str, rows: list[str], timestamp: float | None) -> None:
+        store = self._store_for(port_label)
+        step = self.HEX_ROWS_PER_ENTRY
+        for start in range(0, len(rows), step):
+            seq = store.append("\n".join(rows[start:start + step]), LogDirection.RX, timestamp)
+            self._queue_render(port_label, seq)
+
+    def set_port_rx_mode(self, port_label: str, binary: bool) -> None:
+        """Reflect a port's RX mode (used for the context menu check state)."""
+        if binary:
+            self._binary_ports.add(port_label)
+        else:
+            self._binary_ports.discard(port_label)
+
+    def _raw_history_for(self, port_label: str) -> MemoryMappedLogHistory | None:
+        raw_history = self._raw_history_files.get(port_label)
+        if raw_history is None:
+            capacity = max(self._history_capacity_bytes, 1024 * 1024)
+            try:
+                raw_history = create_history_for_port(f"{port_label}_raw", capacity)
+            except OSError:
+                return None
+            self._raw_history_files[port_label] = raw_history
+        return raw_history
+
+    def record_suppressed(self, port_label: str, data: str) -> None:
+        """
+        Keep a received line hidden by a tail filter: it goes to the history
+        file only and is never stored, formatted or rendered.
+        
+        Args:
+            port_label: Port identifier
+            data: Received data
+        """
+        text = self._normalize_text(data)
+        if not text:
+            return
+        self._pending_history.setdefault(port_label, []).append(text)
+        if self._update_timer and not self._update_timer.isActive():
+            self._update_timer.start(self._update_interval_ms)
+
+    def set_tail_filter_stats(self, port_label: str, matched: int, suppressed: int) -> None:
+        """Show tail filter counters in the port tab tooltip."""
+        self._tail_filter_stats[port_label] = (matched, suppressed)
+        page = self._view_pages.get(port_label)
+        if page is None:
+            return
+        index = self._tab_widget.indexOf(page)
+        if index >= 0:
+            self._tab_widget.setTabToolTip(
+                index,
+                tr(
+                    "tail_filter_stats",
+                    "Live filter: {matched} shown, {suppressed} hidden",
+                    matched=matched,
+                    suppressed=suppressed,
+                ),
+            )
+
+    def clear_tail_filter_stats(self, port_label: str) -> None:
+        """Forget tail filter counters once the port has no active filter."""
+        self._tail_filter_stats.pop(port_label, None)
+        page = self._view_pages.get(port_label)
+        if page is not None:
+            index = self._tab_widget.indexOf(page)
+            if index >= 0:
+                self._tab_widget.setTabToolTip(index, "")
+
+    @staticmethod
+    def _normalize_text(text: str) -> str:
+        """Remove trailing line endings and empty lines; returns "" for blank input."""
+        if not text or not text.strip():
+            return ""
+        text = text.rstrip('\r\n')
+        return "\n".join(line for line in text.splitlines() if line.strip())
+
+    def _render_entries(self, port_label: str, entries: list[LogEntry]) -> str:
+        """Render stored rows to display HTML, truncating each overlong line."""
+        start = time.perf_counter_ns()
+        html_chunk = "".join(
+            self._truncate_html(
+                self._format_message(port_label, entry.text, entry.direction.name, entry.timestamp)
+            )
+            for entry in entries
+        )
+        _FORMAT_SPAN.record_since(start)
+        return html_chunk
     
     def _format_message(
         self, 
         port_label: str, 
         text: str, 
-        msg_type: str
+        msg_type: str,
+        timestamp: float | None = None,
     ) -> str:
         """
-        Format a message for log display.
+        Format a normalized message for log display.
         
         Args:
             port_label: Port identifier
             text: Message text
             msg_type: Message type (RX, TX, SYS)
-            color: CSS color for text
+            timestamp: Unix time the line was stored at (defaults to now)
             
         Returns:
             HTML formatted string
         """
-        if not text or not text.strip():
-            return ""
-        
-        # Remove trailing line endings and remove empty lines
-        text = text.rstrip('\r\n')
-        lines = [line for line in text.splitlines() if line.strip()]
-        text = "\n".join(lines)
-        
         header_parts = []
         colors = self._colors
-        timestamp = QtCore.QDateTime.currentDateTime().toString('hh:mm:ss')
         if self._show_time:
-            header_parts.append(f"<span style='color:{colors.timestamp}'>[{timestamp}]</span>")
+            stamp = time.strftime('%H:%M:%S', time.localtime(timestamp))
+            header_parts.append(f"<span style='color:{colors.timestamp}'>[{stamp}]</span>")
         if self._show_source:
             label_color = {
                 "RX": colors.rx_label,
@@ -1186,34 +1571,20 @@ class ConsolePanelView(QtWidgets.QWidget):
         self._colors = config_loader.get_colors(theme)
         self._apply_theme_to_buttons()
         self._update_icons_on_theme_change()
-        # Process events to ensure icons are updated
-        from PySide6.QtWidgets import QApplication
-        QApplication.processEvents()
 
         theme_class = "light" if theme_manager.is_light_theme() else "dark"
+        refresher = get_style_refresher()
 
-        # Apply theme to toolbar container and all its child widgets
+        # Toolbar container and its children; only changed widgets get repolished
         if hasattr(self, '_toolbar_container'):
-            # Update themeClass on container
-            self._toolbar_container.setProperty("themeClass", theme_class)
-
-            # Apply theme to all child widgets in toolbar for consistency
-            toolbar_widgets = self._toolbar_container.findChildren(QtWidgets.QWidget)
-            for widget in toolbar_widgets:
-                widget.setProperty("themeClass", theme_class)
-
-            # Use polish for smooth style update without full redraw
-            self._toolbar_container.style().unpolish(self._toolbar_container)
-            self._toolbar_container.style().polish(self._toolbar_container)
-            self._toolbar_container.update()
+            refresher.set_theme_class(self._toolbar_container, theme_class)
+            for widget in self._toolbar_container.findChildren(QtWidgets.QWidget):
+                refresher.set_theme_class(widget, theme_class)
 
         if hasattr(self, '_tab_widget'):
-            self._tab_widget.setProperty("themeClass", theme_class)
             if isinstance(self._tab_widget, ContourTabWidget):
                 self._tab_widget.set_theme_class(theme_class)
-            self._tab_widget.style().unpolish(self._tab_widget)
-            self._tab_widget.style().polish(self._tab_widget)
-            self._tab_widget.update()
+            refresher.set_theme_class(self._tab_widget, theme_class)
 
         for edit in getattr(self, '_log_text_edits', []):
             self._apply_theme_to_log_edit(edit)
@@ -1225,18 +1596,16 @@ class ConsolePanelView(QtWidgets.QWidget):
         """Apply theme class to a single button for consistent styling."""
         is_light = theme_manager.is_light_theme()
         class_name = "light" if is_light else "dark"
-        button.setProperty("class", class_name)
+        get_style_refresher().set_property(button, "class", class_name)
 
     def _apply_theme_to_log_edit(self, edit: QtWidgets.QTextEdit) -> None:
         """Set theme-dependent properties on console log editors."""
         theme_class = "light" if theme_manager.is_light_theme() else "dark"
-        edit.setProperty("themeClass", theme_class)
-        self._refresh_widget_style(edit)
+        get_style_refresher().set_theme_class(edit, theme_class)
 
     def _apply_theme_to_console_page(self, widget: QtWidgets.QWidget) -> None:
         theme_class = "light" if theme_manager.is_light_theme() else "dark"
-        widget.setProperty("themeClass", theme_class)
-        self._refresh_widget_style(widget)
+        get_style_refresher().set_theme_class(widget, theme_class)
 
     def _refresh_widget_style(self, widget: QtWidgets.QWidget) -> None:
         widget.style().unpolish(widget)
@@ -1264,13 +1633,6 @@ class ConsolePanelView(QtWidgets.QWidget):
         if not hasattr(self, '_tab_widget') or not hasattr(self, '_log_widgets'):
             return
         
-        # Icon mapping for ports
-        PORT_ICONS = {
-            "CPU1": "paper-plane",
-            "CPU2": "paper-plane",
-            "TLM": "magnifying-glass",
-        }
-        
         # Update combined tab icon
         icon_cache = get_icon_cache()
         self._tab_widget.setTabIcon(0, icon_cache.get("paper-plane"))
@@ -1278,8 +1640,7 @@ class ConsolePanelView(QtWidgets.QWidget):
         # Update port-specific tab icons
         tab_index = 1  # Start after combined tab
         for port_label in self._log_widgets.keys():
-            icon_name = PORT_ICONS.get(port_label, "paper-plane")
-            self._tab_widget.setTabIcon(tab_index, icon_cache.get(icon_name))
+            self._tab_widget.setTabIcon(tab_index, icon_cache.get(_port_icon_name(port_label)))
             tab_index += 1
         
         # Force repaint of tab bar
@@ -1309,7 +1670,7 @@ class ConsolePanelView(QtWidgets.QWidget):
     def clear_all(self) -> None:
         """Clear all logs."""
         # Delete old history files to ensure clean state
-        for history in self._history_files.values():
+        for history in (*self._history_files.values(), *self._raw_history_files.values()):
             history.close()
             try:
                 if history._path.exists():
@@ -1323,7 +1684,16 @@ class ConsolePanelView(QtWidgets.QWidget):
         for text_edit in self._combined_log_widgets.values():
             text_edit.clear()
         
-        self._log_cache.clear()
+        for store in self._log_stores.values():
+            store.clear()
+        self._pending_updates.clear()
+        self._pending_history.clear()
+        self._pending_raw.clear()
+        self._raw_history_files.clear()
+        self._hex_offsets.clear()
+        self._stale_views.clear()
+        for view_key in self._catch_up_generation:
+            self._catch_up_generation[view_key] += 1
         self._history_files.clear()
         self._initialize_history_files()
     
@@ -1383,6 +1753,7 @@ class ConsolePanelView(QtWidgets.QWidget):
                 # Use empty path as placeholder - worker will use cache instead
                 files[label] = Path()
         
+        from src.utils.log_exporter import ExportRequest
         request = ExportRequest(
             target_dir=self._recent_export_dir,
             chunk_bytes=ConsoleLimits.EXPORT_CHUNK_MB * 1024 * 1024,
@@ -1391,7 +1762,7 @@ class ConsolePanelView(QtWidgets.QWidget):
         )
         self._start_export_worker(request)
 
-    def _start_export_worker(self, request: ExportRequest) -> None:
+    def _start_export_worker(self, request: "ExportRequest") -> None:
         """
         Start asynchronous export worker with progress dialog.
         
@@ -1421,12 +1792,13 @@ class ConsolePanelView(QtWidgets.QWidget):
             return ""
         
         def text_fetcher(port_label: str) -> str:
-            cache = self._log_cache.get(port_label)
-            if cache:
-                return "".join(cache)
+            store = self._log_stores.get(port_label)
+            if store:
+                return store.to_text()
             return ""
         
         # Create and configure worker
+        from src.utils.log_exporter import LogExportWorker
         self._export_worker = LogExportWorker(
             request=request,
             history_reader=history_reader,
@@ -1515,9 +1887,9 @@ class ConsolePanelView(QtWidgets.QWidget):
             history = self._history_files.get(port_label)
             if history:
                 return history.read_all()
-            cache = self._log_cache.get(port_label)
-            if cache:
-                return "".join(cache)
+            store = self._log_stores.get(port_label)
+            if store:
+                return store.to_text()
             return ""
 
         logs = []
@@ -1526,16 +1898,16 @@ class ConsolePanelView(QtWidgets.QWidget):
         if logs:
             return "\n".join(logs)
 
-        for cache in self._log_cache.values():
-            logs.append("".join(cache))
+        for store in self._log_stores.values():
+            logs.append(store.to_text())
         return "\n".join(logs)
     
     def get_log_count(self, port_label: str | None = None) -> int:
         """Get number of log lines."""
-        if port_label and port_label in self._log_cache:
-            return len(self._log_cache[port_label])
+        if port_label and port_label in self._log_stores:
+            return len(self._log_stores[port_label])
         elif not port_label:
-            return sum(len(cache) for cache in self._log_cache.values())
+            return sum(len(store) for store in self._log_stores.values())
         return 0
     
     def scroll_to_bottom(self, port_label: str | None = None) -> None:
@@ -1648,16 +2020,18 @@ class ConsolePanelView(QtWidgets.QWidget):
 
     def _on_tab_changed(self, index: int) -> None:
         self._update_tab_page_states()
+        self._catch_up_active_views()
 
     def _update_tab_page_states(self) -> None:
         if not hasattr(self, '_tab_widget'):
             return
         current_index = self._tab_widget.currentIndex()
         current_widget = self._tab_widget.widget(current_index) if current_index >= 0 else None
+        # Only the pages whose state flipped are repolished, in the batched pass
+        refresher = get_style_refresher()
         for page in self._console_pages:
             is_active = page is current_widget
-            page.setProperty("activeTab", "true" if is_active else "false")
-            self._refresh_widget_style(page)
+            refresher.set_property(page, "activeTab", "true" if is_active else "false")
 
     def _update_toolbar_responsive_class(self, *, force: bool = False) -> None:
         if not hasattr(self, '_toolbar_container') or not self._toolbar_container:
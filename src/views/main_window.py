@@ -4,14 +4,16 @@ MVVM Architecture: View layer for the application.
 Refactored to use reusable components.
 
 Features:
-- Console logging with 3 serial ports
+- Console logging for any number of serial ports
 - Real-time counters
 - Search/filter functionality
 - Command history
 - Port management via ComPortViewModel
 """
 
+from collections.abc import Iterator
 from functools import partial
+from typing import TYPE_CHECKING
 
 from PySide6 import QtWidgets, QtCore, QtGui
 from PySide6.QtCore import Qt, Signal, QTimer
@@ -38,7 +40,8 @@ if sys.platform == "win32":
 else:
     HAS_WIN32_API = False
 
-from src.utils import get_config_loader, get_quick_blocks_repository
+from src.utils import get_config_loader, get_quick_blocks_repository, get_sampling_profiler
+from src.utils.metrics import metrics
 from src.utils.theme_manager import theme_manager
 from src.utils.windows11 import apply_windows_11_style, is_windows_11_or_later, GlobalHotkeyManager, VK, MOD_CONTROL, MOD_ALT, MOD_SHIFT
 from src.utils.translator import translator, tr
@@ -46,13 +49,19 @@ from src.styles.constants import Fonts, Sizes, SerialConfig, FlashAnimation
 from src.views.port_panel_view import PortPanelView
 from src.views.console_panel_view import ConsolePanelView
 from src.views.quick_blocks_panel import QuickBlocksPanel
-from src.views.widget_host_window import WidgetHostWindow
 from src.utils.quick_blocks_repository import QuickBlock
 from src.viewmodels.com_port_viewmodel import ComPortViewModel, PortConnectionState
+from src.models.serial_worker import SerialWorker
 from src.viewmodels.command_history_viewmodel import CommandHistoryModel
 from src.viewmodels.factory import ViewModelFactory, get_viewmodel_factory
-from src.views.command_history_dialog import CommandHistoryDialog
 from src.utils.config_loader import QuickCommand
+from src.utils.port_stats import WINDOWS, PortStatsSnapshot, format_byte_rate, histogram_bounds
+from src.utils.session_recording import SessionReader, SessionRecorder
+
+if TYPE_CHECKING:  # pragma: no cover - dialogs and windows load on first open
+    from src.views.command_history_dialog import CommandHistoryDialog
+    from src.views.stopwatch_window import StopwatchWindow
+    from src.views.widget_host_window import WidgetHostWindow
 
 
 from PySide6.QtCore import QAbstractNativeEventFilter
@@ -96,6 +105,8 @@ class MainWindow(QtWidgets.QMainWindow):
     def __init__(
         self,
         viewmodel_factory: ViewModelFactory | None = None,
+        *,
+        staged: bool = False,
     ):
         """
         Initialize MainWindow.
@@ -103,6 +114,8 @@ class MainWindow(QtWidgets.QMainWindow):
         Args:
             viewmodel_factory: Optional factory for creating ViewModels.
                               If None, uses the default factory.
+            staged: Leave the UI unbuilt; the caller drives :meth:`build_stages`
+                    (one chunk per event-loop turn, e.g. behind the splash).
         """
         super().__init__()
         
@@ -111,6 +124,7 @@ class MainWindow(QtWidgets.QMainWindow):
         
         # Port ViewModels (one per port)
         self._port_viewmodels: dict[int, ComPortViewModel] = {}
+        self._session_recorder: SessionRecorder | None = None
         self._port_views: dict[int, PortPanelView] = {}
         self._port_states: dict[int, PortConnectionState] = {}
         self._error_dialogs: list[QtWidgets.QMessageBox] = []
@@ -145,21 +159,46 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # Config-driven features
         self._config_loader = get_config_loader()
+        # Ports come from [ports] port_N_label; numbers are the configured N (gaps
+        # allowed) and keys (lower-case labels) name counters, history and translations
+        port_labels = self._config_loader.get_port_labels()
+        self._port_keys: dict[int, str] = {num: label.lower() for num, label in port_labels}
+        self._port_names: dict[str, str] = {label.lower(): label for _, label in port_labels}
+        # The "1+2" button / combined tab pair up the first two ports
+        self._combo_ports: list[int] = list(self._port_keys)[:2]
+        self._send_buttons: dict[int, QtWidgets.QPushButton] = {}
         self._quick_commands: list[QuickCommand] = self._config_loader.get_quick_commands()
-        
+
+        self._build_stages: Iterator[str] | None = self._iter_build_stages()
+        if not staged:
+            for _ in self.build_stages():
+                pass
+
+    def build_stages(self) -> Iterator[str]:
+        """
+        Build the UI in chunks, yielding the name of each finished chunk.
+
+        Single use: a second call yields nothing.
+        """
+        stages, self._build_stages = self._build_stages, None
+        return stages if stages is not None else iter(())
+
+    def _iter_build_stages(self) -> Iterator[str]:
         # Setup window properties
         self._setup_window()
+        yield "window"
         
         # Setup UI
-        self._setup_ui()
+        yield from self._setup_ui()
         self._setup_menu()
         self._setup_shortcuts()
         self._setup_tray()
+        yield "menu"
         
         # Connect theme changes
         theme_manager.theme_changed.connect(self._on_theme_changed)
         self._theme_signal_connected = True
-        # Theme already applied in main.py, do not apply again
+        # The bootstrap applies the theme once before the window is built
         
         # Connect language changes
         translator.language_changed.connect(self._on_language_changed)
@@ -191,6 +230,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self._stopwatch_status_label.hide()
 
         status_bar.addPermanentWidget(info_widget)
+        yield "status_bar"
     
     def _setup_window(self) -> None:
         """Configure window properties."""
@@ -376,8 +416,8 @@ class MainWindow(QtWidgets.QMainWindow):
                 pass
             self._translator_signal_connected = False
     
-    def _setup_ui(self) -> None:
-        """Initialize main UI components."""
+    def _setup_ui(self) -> Iterator[str]:
+        """Initialize main UI components, one panel per chunk."""
         central_widget = QtWidgets.QWidget()
         main_layout = QtWidgets.QVBoxLayout()
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -391,6 +431,14 @@ class MainWindow(QtWidgets.QMainWindow):
         self._splitter_initialized = False
         self._compact_applied = False
         
+        # CENTER PANEL: Console logs (created first: port panels register their RX mode in it)
+        self._console_panel = ConsolePanelView(
+            config={"port_labels": [self._port_name(key) for key in self._port_keys.values()]}
+        )
+        self._console_panel.setMinimumWidth(Sizes.CENTER_PANEL_MIN_WIDTH)
+        self._console_panel.setObjectName("console_panel")
+        yield "console"
+
         # LEFT PANEL: Port controls
         self._left_panel = self._create_left_panel()
         left_panel = self._left_panel
@@ -398,18 +446,15 @@ class MainWindow(QtWidgets.QMainWindow):
         left_panel.setMaximumWidth(Sizes.LEFT_PANEL_MAX_WIDTH)
         left_panel.setObjectName("left_panel")
         hsplit.addWidget(left_panel)
-        
-        # CENTER PANEL: Console logs
-        self._console_panel = ConsolePanelView()
-        self._console_panel.setMinimumWidth(Sizes.CENTER_PANEL_MIN_WIDTH)
-        self._console_panel.setObjectName("console_panel")
         hsplit.addWidget(self._console_panel)
+        yield "ports"
 
         # RIGHT PANEL: Counters + Quick Blocks
         self._right_panel = self._create_right_panel()
         self._right_panel.setMinimumWidth(Sizes.RIGHT_PANEL_MIN_WIDTH)
         self._right_panel.setObjectName("right_panel")
         hsplit.addWidget(self._right_panel)
+        yield "side_panel"
         
         # Set stretch factors
         hsplit.setStretchFactor(0, 0)  # Left - fixed baseline
@@ -439,6 +484,14 @@ class MainWindow(QtWidgets.QMainWindow):
         # Connect console signals
         self._console_panel.clear_requested.connect(self._clear_all_logs)
         self._console_panel.save_requested.connect(self._save_logs)
+        self._console_panel.tail_filter_requested.connect(self._on_tail_filter_requested)
+        self._console_panel.rx_mode_requested.connect(self._on_rx_mode_requested)
+
+        # Rolling port statistics are polled at a low rate, not pushed per increment
+        self._stats_timer = QTimer(self)
+        self._stats_timer.setInterval(self._config_loader.get_ui_timing()["stats_poll_interval_ms"])
+        self._stats_timer.timeout.connect(self._poll_port_stats)
+        self._stats_timer.start()
 
     def showEvent(self, event: QtGui.QShowEvent) -> None:  # type: ignore[override]
         super().showEvent(event)
@@ -462,12 +515,6 @@ class MainWindow(QtWidgets.QMainWindow):
         layout.setContentsMargins(0, 0, 0, 0)
         
         # Create ViewModels and Views for each port
-        port_ids = [
-            (1, "cpu1"),
-            (2, "cpu2"),
-            (3, "tlm"),
-        ]
-
         ports_wrapper = QtWidgets.QFrame()
         ports_wrapper.setProperty("class", "card")
         ports_wrapper_layout = QtWidgets.QVBoxLayout(ports_wrapper)
@@ -479,8 +526,8 @@ class MainWindow(QtWidgets.QMainWindow):
             Sizes.CARD_MARGIN,
         )
 
-        for port_num, port_key in port_ids:
-            port_label = tr(port_key, port_key.upper())
+        for port_num, port_key in self._port_keys.items():
+            port_label = self._port_name(port_key)
             viewmodel = self._viewmodel_factory.create_port_viewmodel(
                 port_label=port_label,
                 port_number=port_num,
@@ -491,6 +538,9 @@ class MainWindow(QtWidgets.QMainWindow):
             port_view = PortPanelView(viewmodel)
             self._port_views[port_num] = port_view
             ports_wrapper_layout.addWidget(port_view)
+            self._console_panel.set_port_rx_mode(
+                port_label, viewmodel.rx_mode == SerialWorker.RX_MODE_BINARY
+            )
             
             # Connect ViewModel signals to console (using bound methods to avoid lambda closure issues)
             # Use Qt.QueuedConnection for thread-safe handling of high-frequency serial data
@@ -502,6 +552,22 @@ class MainWindow(QtWidgets.QMainWindow):
                 self._make_tx_handler(port_key),
                 type=Qt.QueuedConnection
             )
+            viewmodel.data_bytes_received.connect(
+                self._make_rx_bytes_handler(port_key),
+                type=Qt.QueuedConnection
+            )
+            viewmodel.frames_received.connect(
+                self._make_rx_frames_handler(port_key),
+                type=Qt.QueuedConnection
+            )
+            viewmodel.data_suppressed.connect(
+                self._make_suppressed_handler(port_key),
+                type=Qt.QueuedConnection
+            )
+            viewmodel.tail_filter_stats_changed.connect(
+                self._make_tail_filter_stats_handler(port_key, viewmodel),
+                type=Qt.QueuedConnection
+            )
             viewmodel.error_occurred.connect(
                 self._make_error_handler(port_key, viewmodel),
                 type=Qt.QueuedConnection
@@ -593,9 +659,8 @@ class MainWindow(QtWidgets.QMainWindow):
         buttons_layout.setColumnStretch(0, 1)
         buttons_layout.setColumnStretch(1, 1)
         buttons_layout.setRowStretch(0, 1)
-        buttons_layout.setRowStretch(1, 1)
 
-        # 1+2 button (send to both CPU1 and CPU2)
+        # 1+2 button (send to the first two ports)
         self._btn_combo = QtWidgets.QPushButton(tr("send_to_both", "1+2"))
         self._btn_combo.setMinimumHeight(Sizes.INPUT_MIN_HEIGHT)
         self._btn_combo.setSizePolicy(
@@ -612,50 +677,13 @@ class MainWindow(QtWidgets.QMainWindow):
         self._btn_combo.clicked.connect(lambda: self._send_command(0))
         buttons_layout.addWidget(self._btn_combo, 0, 0)
 
-        # CPU1 button
-        self._btn_cpu1 = QtWidgets.QPushButton(tr("send_to_cpu1", "CPU1"))
-        self._btn_cpu1.setMinimumHeight(Sizes.INPUT_MIN_HEIGHT)
-        self._btn_cpu1.setSizePolicy(
-            QtWidgets.QSizePolicy.Expanding,
-            QtWidgets.QSizePolicy.Fixed,
-        )
-        self._btn_cpu1.setFocusPolicy(QtCore.Qt.NoFocus)
-        self._btn_cpu1.setAccessibleName(tr("btn_cpu1_a11y", "Send to CPU1"))
-        self._btn_cpu1.setAccessibleDescription(tr("btn_cpu1_desc_a11y", "Click to send command to CPU1"))
-        self._register_button(self._btn_cpu1, "secondary")
-        self._btn_cpu1.setProperty("semanticRole", "command_cpu1")
-        self._btn_cpu1.clicked.connect(lambda: self._send_command(1))
-        buttons_layout.addWidget(self._btn_cpu1, 0, 1)
-
-        # CPU2 button
-        self._btn_cpu2 = QtWidgets.QPushButton(tr("send_to_cpu2", "CPU2"))
-        self._btn_cpu2.setMinimumHeight(Sizes.INPUT_MIN_HEIGHT)
-        self._btn_cpu2.setSizePolicy(
-            QtWidgets.QSizePolicy.Expanding,
-            QtWidgets.QSizePolicy.Fixed,
-        )
-        self._btn_cpu2.setFocusPolicy(QtCore.Qt.NoFocus)
-        self._btn_cpu2.setAccessibleName(tr("btn_cpu2_a11y", "Send to CPU2"))
-        self._btn_cpu2.setAccessibleDescription(tr("btn_cpu2_desc_a11y", "Click to send command to CPU2"))
-        self._register_button(self._btn_cpu2, "secondary")
-        self._btn_cpu2.setProperty("semanticRole", "command_cpu2")
-        self._btn_cpu2.clicked.connect(lambda: self._send_command(2))
-        buttons_layout.addWidget(self._btn_cpu2, 1, 0)
-
-        # TLM button
-        self._btn_tlm = QtWidgets.QPushButton(tr("send_to_tlm", "TLM"))
-        self._btn_tlm.setMinimumHeight(Sizes.INPUT_MIN_HEIGHT)
-        self._btn_tlm.setSizePolicy(
-            QtWidgets.QSizePolicy.Expanding,
-            QtWidgets.QSizePolicy.Fixed,
-        )
-        self._btn_tlm.setFocusPolicy(QtCore.Qt.NoFocus)
-        self._btn_tlm.setAccessibleName(tr("btn_tlm_a11y", "Send to TLM"))
-        self._btn_tlm.setAccessibleDescription(tr("btn_tlm_desc_a11y", "Click to send command to TLM"))
-        self._register_button(self._btn_tlm, "secondary")
-        self._btn_tlm.setProperty("semanticRole", "command_tlm")
-        self._btn_tlm.clicked.connect(lambda: self._send_command(3))
-        buttons_layout.addWidget(self._btn_tlm, 1, 1)
+        # One button per port after "1+2", two per row
+        for position, (port_num, port_key) in enumerate(self._port_keys.items(), start=1):
+            button = self._create_send_button(port_num, port_key)
+            self._send_buttons[port_num] = button
+            row, column = divmod(position, 2)
+            buttons_layout.setRowStretch(row, 1)
+            buttons_layout.addWidget(button, row, column)
         
         layout.addLayout(buttons_layout)
         
@@ -724,9 +752,10 @@ class MainWindow(QtWidgets.QMainWindow):
         # Counter labels
         self._counter_labels: dict[str, QtWidgets.QLabel] = {}
         
-        self._counter_ports = ["cpu1", "cpu2", "tlm"]
+        self._counter_ports = list(self._port_keys.values())
 
         self._counter_label_widgets: list[QtWidgets.QLabel] = []
+        self._counter_cards: dict[str, QtWidgets.QFrame] = {}
 
         for port_key in self._counter_ports:
             # Create a card-like container for each port
@@ -741,7 +770,7 @@ class MainWindow(QtWidgets.QMainWindow):
             )
             
             # Port header
-            port_name = tr(port_key, port_key.upper())
+            port_name = self._port_name(port_key)
             port_header = QtWidgets.QLabel(tr("port_label_template", f"{{name}}:", name=port_name))
             port_header.setProperty("translation_key", port_key)
             font = port_header.font()
@@ -774,6 +803,13 @@ class MainWindow(QtWidgets.QMainWindow):
             metrics_row2.addWidget(time_label)
             metrics_row2.addStretch()
             port_card_layout.addLayout(metrics_row2)
+
+            # Metrics row 3: 1 s receive rate (details in the card tooltip)
+            rate_label = QtWidgets.QLabel(
+                tr("rate_label", "Rate: {bytes}/s, {lines} lines/s", bytes=format_byte_rate(0), lines=0)
+            )
+            port_card_layout.addWidget(rate_label)
+            self._counter_cards[port_key] = port_card
             
             # Add card to counters layout
             counters_layout.addWidget(port_card)
@@ -782,6 +818,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self._counter_labels[f"{port_key}_tx"] = tx_label
             self._counter_labels[f"{port_key}_error"] = error_label
             self._counter_labels[f"{port_key}_time"] = time_label
+            self._counter_labels[f"{port_key}_rate"] = rate_label
         
         counters_grp.setLayout(counters_layout)
         layout.addWidget(counters_grp)
@@ -837,12 +874,13 @@ class MainWindow(QtWidgets.QMainWindow):
 
         port_viewmodels = getattr(self, "_port_viewmodels", {}) or {}
 
+        port_nums = {key: num for num, key in self._port_keys.items()}
         for row, port_key in enumerate(self._counter_ports):
             if row >= len(self._counter_label_widgets):
                 continue
 
-            port_num = row + 1
-            port_name = tr(port_key, port_key.upper())
+            port_num = port_nums.get(port_key, 0)
+            port_name = self._port_name(port_key)
             label_widget = self._counter_label_widgets[row]
             label_widget.setText(tr("port_label_template", "{name}:", name=port_name))
 
@@ -865,6 +903,57 @@ class MainWindow(QtWidgets.QMainWindow):
                 error_label.setText(tr("error_label", "Errors: {count}", count=error_count))
             if time_label:
                 time_label.setText(tr("time_label", "Time: {time}s", time=conn_time))
+        self._poll_port_stats()
+
+    def _poll_port_stats(self) -> None:
+        """Refresh rate labels and statistics tooltips from port snapshots."""
+        if not hasattr(self, "_counter_ports") or not self.isVisible():
+            return
+        port_viewmodels = getattr(self, "_port_viewmodels", {}) or {}
+        for row, port_key in enumerate(self._counter_ports):
+            viewmodel = port_viewmodels.get(row + 1)
+            rate_label = self._counter_labels.get(f"{port_key}_rate")
+            if viewmodel is None or rate_label is None:
+                continue
+            snapshot = viewmodel.stats_snapshot()
+            rate_label.setText(tr(
+                "rate_label", "Rate: {bytes}/s, {lines} lines/s",
+                bytes=format_byte_rate(snapshot.bytes_per_second[1]),
+                lines=f"{snapshot.lines_per_second[1]:.0f}",
+            ))
+            card = self._counter_cards.get(port_key)
+            if card is not None:
+                card.setToolTip(self._format_stats_tooltip(snapshot))
+
+    @staticmethod
+    def _format_stats_tooltip(snapshot: PortStatsSnapshot) -> str:
+        def histogram(counts: tuple[int, ...]) -> str:
+            bounds = histogram_bounds(len(counts))
+            parts = []
+            for index, count in enumerate(counts):
+                if not count:
+                    continue
+                low = bounds[index]
+                high = bounds[index + 1] - 1 if index + 1 < len(bounds) else None
+                label = f"{low}+" if high is None else (str(low) if high <= low else f"{low}-{high}")
+                parts.append(f"{label}: {count}")
+            return ", ".join(parts) or "-"
+
+        windows = " / ".join(f"{window}s" for window in WINDOWS)
+        return "\n".join((
+            tr("stats_bytes_rate", "Bytes/s ({windows}): {values}", windows=windows,
+               values=" / ".join(format_byte_rate(snapshot.bytes_per_second[w]) for w in WINDOWS)),
+            tr("stats_lines_rate", "Lines/s ({windows}): {values}", windows=windows,
+               values=" / ".join(f"{snapshot.lines_per_second[w]:.1f}" for w in WINDOWS)),
+            tr("stats_max_burst", "Max burst: {bytes} B, {lines} lines",
+               bytes=snapshot.max_burst_bytes, lines=snapshot.max_burst_lines),
+            tr("stats_errors", "Decode errors: {errors}, dropped lines: {dropped}",
+               errors=snapshot.decode_errors, dropped=snapshot.dropped_lines),
+            tr("stats_gaps", "Line gaps, ms: {histogram}",
+               histogram=histogram(snapshot.gap_histogram_ms)),
+            tr("stats_lengths", "Line lengths, bytes: {histogram}",
+               histogram=histogram(snapshot.line_length_histogram)),
+        ))
 
     def _update_stopwatch_status(self, formatted: str) -> None:
         label = getattr(self, "_stopwatch_status_label", None)
@@ -915,6 +1004,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _toggle_widget_host_window(self) -> None:
         if not hasattr(self, "_widget_host_window") or self._widget_host_window is None:
+            from src.views.widget_host_window import WidgetHostWindow
             self._widget_host_window = WidgetHostWindow(parent=self)
         if self._widget_host_window.isVisible():
             self._widget_host_window.hide()
@@ -966,15 +1056,14 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _resolve_quick_block_ports(self, block) -> list[int]:
         if getattr(block, "send_to_combo", False):
-            return [1, 2]
+            return list(self._combo_ports)
         port_key = (getattr(block, "port", None) or "").lower()
-        mapping = {
-            "cpu1": [1],
-            "cpu2": [2],
-            "tlm": [3],
-            "combo": [1, 2],
-        }
-        return mapping.get(port_key, [1])
+        if port_key == "combo":
+            return list(self._combo_ports)
+        for port_num, key in self._port_keys.items():
+            if key == port_key:
+                return [port_num]
+        return list(self._port_keys)[:1]
     
     def _create_status_group(self) -> QtWidgets.QGroupBox:
         """Legacy status group removed from UI."""
@@ -1106,6 +1195,15 @@ class MainWindow(QtWidgets.QMainWindow):
             self._action_save_logs.triggered.connect(self._save_logs)
             self._file_menu.addAction(self._action_save_logs)
 
+            self._file_menu.addSeparator()
+            self._action_record_session = QtGui.QAction(self)
+            self._action_record_session.setCheckable(True)
+            self._action_record_session.toggled.connect(self._toggle_session_recording)
+            self._file_menu.addAction(self._action_record_session)
+            self._action_replay_session = QtGui.QAction(self)
+            self._action_replay_session.triggered.connect(self._replay_session)
+            self._file_menu.addAction(self._action_replay_session)
+
             self._file_menu.addSeparator()
             self._action_exit = QtGui.QAction(self)
             self._action_exit.setShortcut("Ctrl+Q")
@@ -1154,11 +1252,35 @@ class MainWindow(QtWidgets.QMainWindow):
                 self._scale_menu.addAction(action)
                 self._scale_actions.append((factor, action))
 
+            self._view_menu.addSeparator()
+            profiler = get_sampling_profiler()
+            self._profiler_menu = self._view_menu.addMenu("")
+            self._action_sampling_profiler = QtGui.QAction(self)
+            self._action_sampling_profiler.setCheckable(True)
+            self._action_sampling_profiler.setChecked(profiler.is_running())
+            self._action_sampling_profiler.toggled.connect(self._toggle_sampling_profiler)
+            profiler.running_changed.connect(self._action_sampling_profiler.setChecked)
+            self._profiler_menu.addAction(self._action_sampling_profiler)
+            self._action_export_profile = QtGui.QAction(self)
+            self._action_export_profile.triggered.connect(self._export_sampling_profile)
+            self._profiler_menu.addAction(self._action_export_profile)
+            self._profiler_menu.addSeparator()
+            self._action_record_trace = QtGui.QAction(self)
+            self._action_record_trace.setCheckable(True)
+            self._action_record_trace.setChecked(metrics.tracing)
+            self._action_record_trace.toggled.connect(metrics.set_tracing)
+            self._profiler_menu.addAction(self._action_record_trace)
+            self._action_export_trace = QtGui.QAction(self)
+            self._action_export_trace.triggered.connect(self._export_chrome_trace)
+            self._profiler_menu.addAction(self._action_export_trace)
+
             self._menu_initialized = True
 
         # Retranslate menu titles and actions
         self._file_menu.setTitle(tr("file", "File"))
         self._action_save_logs.setText(tr("save_logs", "Save Logs"))
+        self._action_record_session.setText(tr("record_session", "Record Session..."))
+        self._action_replay_session.setText(tr("replay_session", "Replay Session..."))
         self._action_exit.setText(tr("exit_app", "Exit"))
 
         self._view_menu.setTitle(tr("view", "View"))
@@ -1178,6 +1300,11 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self._action_widget_host.setText(tr("open_widget_host", "Open Widget Host"))
         self._scale_menu.setTitle(tr("scale", "Scale"))
+        self._profiler_menu.setTitle(tr("profiler_menu", "Profiler"))
+        self._action_sampling_profiler.setText(tr("sampling_profiler", "Sampling Profiler"))
+        self._action_export_profile.setText(tr("export_flamegraph", "Export Flame Graph..."))
+        self._action_record_trace.setText(tr("record_trace", "Record Trace"))
+        self._action_export_trace.setText(tr("export_trace", "Export Chrome Trace..."))
 
     # Maximum number of error dialogs to keep
     _MAX_ERROR_DIALOGS = 5
@@ -1215,15 +1342,14 @@ class MainWindow(QtWidgets.QMainWindow):
         shortcut_send_enter = QShortcut(QKeySequence("Ctrl+Enter"), self)
         shortcut_send_enter.activated.connect(self._send_default_command)
         
-        # Port selection shortcuts
-        shortcut_cpu1 = QShortcut(QKeySequence("Ctrl+1"), self)
-        shortcut_cpu1.activated.connect(lambda: self._send_command(1))
-
-        shortcut_cpu2 = QShortcut(QKeySequence("Ctrl+2"), self)
-        shortcut_cpu2.activated.connect(lambda: self._send_command(2))
-
-        shortcut_tlm = QShortcut(QKeySequence("Ctrl+3"), self)
-        shortcut_tlm.activated.connect(lambda: self._send_command(3))
+        # Port selection shortcuts: Ctrl+1..3 for the first three ports, Ctrl+4 is
+        # "1+2", further ports continue at Ctrl+5..9
+        for position, port_num in enumerate(self._port_keys, start=1):
+            digit = position if position < 4 else position + 1
+            if digit > 9:
+                break
+            shortcut_port = QShortcut(QKeySequence(f"Ctrl+{digit}"), self)
+            shortcut_port.activated.connect(lambda num=port_num: self._send_command(num))
 
         shortcut_combo = QShortcut(QKeySequence("Ctrl+4"), self)
         shortcut_combo.activated.connect(lambda: self._send_command(0))
@@ -1263,7 +1389,7 @@ class MainWindow(QtWidgets.QMainWindow):
         Send command to specified port(s).
         
         Args:
-            port_num: Port number (0=all, 1=CPU1, 2=CPU2, 3=TLM)
+            port_num: Port number (0 = "1+2" pair, otherwise the 1-based port)
             command_override: Optional text to send instead of input field
         """
         command = command_override if command_override is not None else self._le_command.text()
@@ -1286,8 +1412,8 @@ class MainWindow(QtWidgets.QMainWindow):
         # Send to port(s)
         send_results: list[bool] = []
         if port_num == 0:
-            # Send to CPU1 and CPU2
-            for num in [1, 2]:
+            # Send to the "1+2" pair
+            for num in self._combo_ports:
                 if num in self._port_viewmodels:
                     send_results.append(self._port_viewmodels[num].send_command(command))
                 else:
@@ -1298,16 +1424,31 @@ class MainWindow(QtWidgets.QMainWindow):
             send_results.append(False)
         return all(send_results) if send_results else False
     
+    def _create_send_button(self, port_num: int, port_key: str) -> QtWidgets.QPushButton:
+        """Create the "send to" button of one port."""
+        port_name = self._port_name(port_key)
+        button = QtWidgets.QPushButton(tr(f"send_to_{port_key}", port_name))
+        button.setMinimumHeight(Sizes.INPUT_MIN_HEIGHT)
+        button.setSizePolicy(
+            QtWidgets.QSizePolicy.Expanding,
+            QtWidgets.QSizePolicy.Fixed,
+        )
+        button.setFocusPolicy(QtCore.Qt.NoFocus)
+        button.setAccessibleName(tr(f"btn_{port_key}_a11y", f"Send to {port_name}"))
+        button.setAccessibleDescription(
+            tr(f"btn_{port_key}_desc_a11y", f"Click to send command to {port_name}")
+        )
+        self._register_button(button, "secondary")
+        button.setProperty("semanticRole", "command_port")
+        button.clicked.connect(lambda: self._send_command(port_num))
+        return button
+
     def _get_buttons_for_port(self, port_num: int) -> list:
         """Get buttons that correspond to the given port number for animation."""
-        buttons = []
-        mapping = {
-            0: [self._btn_combo, self._btn_cpu1, self._btn_cpu2],
-            1: [self._btn_cpu1],
-            2: [self._btn_cpu2],
-            3: [self._btn_tlm],
-        }
-        buttons = mapping.get(port_num, [])
+        if port_num == 0:
+            buttons = [self._btn_combo, *(self._send_buttons.get(num) for num in self._combo_ports)]
+        else:
+            buttons = [self._send_buttons.get(port_num)]
         return [b for b in buttons if b is not None]
     
     def _animate_buttons_flash(self, buttons: list) -> None:
@@ -1383,16 +1524,17 @@ class MainWindow(QtWidgets.QMainWindow):
         QTimer.singleShot(FlashAnimation.FLASH_DURATION_MS, restore_style)
     
     def _send_default_command(self) -> None:
-        """Send command to default port (CPU1)."""
+        """Send command to the default (first) port."""
         self._send_command(1)
     
     def _port_label_for_num(self, port_num: int) -> str:
         if port_num == 0:
             return "combo"
-        return {1: "cpu1", 2: "cpu2", 3: "tlm"}.get(port_num, "unknown")
+        return self._port_keys.get(port_num, "unknown")
 
     def _open_history_dialog(self) -> None:
         if not self._history_dialog:
+            from src.views.command_history_dialog import CommandHistoryDialog
             self._history_dialog = CommandHistoryDialog(self._history_model, self)
             self._history_dialog.command_selected.connect(self._le_command.setText)
         self._history_dialog.show()
@@ -1409,22 +1551,78 @@ class MainWindow(QtWidgets.QMainWindow):
         self._port_states[port_num] = normalized
         self._update_command_controls()
 
+    def _port_name(self, port_key: str) -> str:
+        """Display label of a port: its translation, else the configured label."""
+        return tr(port_key, self._port_names.get(port_key, port_key.upper()))
+
     def _make_rx_handler(self, port_key: str):
         """Create a bound handler for RX data signal to avoid lambda closure issues."""
         def handler(data: str):
-            self._console_panel.append_rx(tr(port_key, port_key.upper()), data)
+            self._console_panel.append_rx(self._port_name(port_key), data)
         return handler
 
     def _make_tx_handler(self, port_key: str):
         """Create a bound handler for TX data signal to avoid lambda closure issues."""
         def handler(data: str):
-            self._console_panel.append_tx(tr(port_key, port_key.upper()), data)
+            self._console_panel.append_tx(self._port_name(port_key), data)
+        return handler
+
+    def _make_suppressed_handler(self, port_key: str):
+        """Create a bound handler for RX lines hidden by the port's tail filter."""
+        def handler(data: str):
+            self._console_panel.record_suppressed(self._port_name(port_key), data)
+        return handler
+
+    def _make_rx_bytes_handler(self, port_key: str):
+        """Create a bound handler for raw RX chunks of a port in binary mode."""
+        def handler(data: bytes, timestamp: float):
+            self._console_panel.append_rx_bytes(self._port_name(port_key), data, timestamp)
+        return handler
+
+    def _make_rx_frames_handler(self, port_key: str):
+        """Create a bound handler for frames cut by the port's frame decoder."""
+        def handler(frames: list, timestamp: float):
+            self._console_panel.append_rx_frames(self._port_name(port_key), frames, timestamp)
         return handler
 
+    def _make_tail_filter_stats_handler(self, port_key: str, viewmodel):
+        """Create a bound handler mirroring tail filter counters in the console tab."""
+        def handler(matched: int, suppressed: int):
+            port_label = self._port_name(port_key)
+            if viewmodel.tail_filter.is_active:
+                self._console_panel.set_tail_filter_stats(port_label, matched, suppressed)
+            else:
+                self._console_panel.clear_tail_filter_stats(port_label)
+        return handler
+
+    def _on_tail_filter_requested(self, port_label: str, action: str, term: str) -> None:
+        """Apply a tail filter change requested from the console context menu."""
+        viewmodel = next(
+            (vm for vm in self._port_viewmodels.values() if vm.port_label == port_label),
+            None,
+        )
+        if viewmodel is None:
+            return
+        if action == "clear":
+            viewmodel.set_tail_filter()
+        elif term:
+            viewmodel.add_tail_filter_term(term, exclude=action == "exclude")
+
+    def _on_rx_mode_requested(self, port_label: str, binary: bool) -> None:
+        """Switch a port between decoded text and raw hexdump display."""
+        viewmodel = next(
+            (vm for vm in self._port_viewmodels.values() if vm.port_label == port_label),
+            None,
+        )
+        if viewmodel is None:
+            return
+        viewmodel.set_rx_mode(SerialWorker.RX_MODE_BINARY if binary else SerialWorker.RX_MODE_TEXT)
+        self._console_panel.set_port_rx_mode(port_label, binary)
+
     def _make_error_handler(self, port_key: str, viewmodel):
         """Create a bound handler for error signal to avoid lambda closure issues."""
         def handler(msg: str):
-            self._handle_port_error(tr(port_key, port_key.upper()), viewmodel, msg)
+            self._handle_port_error(self._port_name(port_key), viewmodel, msg)
         return handler
 
     def _make_send_completed_handler(self, port_num: int):
@@ -1499,23 +1697,22 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _update_command_controls(self) -> None:
         """Enable send buttons only when their ports are connected."""
-        if not hasattr(self, "_btn_cpu1"):
+        if not hasattr(self, "_btn_combo"):
             return
 
-        cpu1_connected = self._port_states.get(1) == PortConnectionState.CONNECTED
-        cpu2_connected = self._port_states.get(2) == PortConnectionState.CONNECTED
-        tlm_connected = self._port_states.get(3) == PortConnectionState.CONNECTED
-        cpu1_connecting = self._port_states.get(1) == PortConnectionState.CONNECTING
-        cpu2_connecting = self._port_states.get(2) == PortConnectionState.CONNECTING
-        tlm_connecting = self._port_states.get(3) == PortConnectionState.CONNECTING
+        connected = {
+            num: self._port_states.get(num) == PortConnectionState.CONNECTED for num in self._port_keys
+        }
+        connecting = {
+            num: self._port_states.get(num) == PortConnectionState.CONNECTING for num in self._port_keys
+        }
 
-        self._apply_command_button_state(self._btn_cpu1, cpu1_connected, cpu1_connecting)
-        self._apply_command_button_state(self._btn_cpu2, cpu2_connected, cpu2_connecting)
-        self._apply_command_button_state(self._btn_tlm, tlm_connected, tlm_connecting)
+        for port_num, button in self._send_buttons.items():
+            self._apply_command_button_state(button, connected[port_num], connecting[port_num])
         self._apply_command_button_state(
             self._btn_combo,
-            cpu1_connected and cpu2_connected,
-            cpu1_connecting or cpu2_connecting,
+            bool(self._combo_ports) and all(connected[num] for num in self._combo_ports),
+            any(connecting[num] for num in self._combo_ports),
         )
 
     def _apply_command_button_state(
@@ -1594,10 +1791,143 @@ class MainWindow(QtWidgets.QMainWindow):
             return
         
         # Delegate to ConsolePanelView's async export
-        # This will show a folder picker and save CPU1.txt, CPU2.txt, TLM.txt
+        # This will show a folder picker and save one <PORT>.txt per port
         self._console_panel.save_logs()
                 
     
+    def _toggle_session_recording(self, checked: bool) -> None:
+        """Start or stop recording every port into one session file."""
+        if not checked:
+            self._stop_session_recording()
+            return
+        default_name = datetime.datetime.now().strftime("session_%Y%m%d_%H%M%S.uartrec")
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self,
+            tr("record_session", "Record Session..."),
+            default_name,
+            tr("session_file_filter", "Session recordings (*.uartrec);;All files (*)"),
+        )
+        if not path:
+            self._action_record_session.setChecked(False)
+            return
+        try:
+            self._session_recorder = SessionRecorder(path)
+        except OSError as exc:
+            self._action_record_session.setChecked(False)
+            self.statusBar().showMessage(tr("session_error", "Session error: {error}", error=exc), 5000)
+            return
+        for viewmodel in self._port_viewmodels.values():
+            viewmodel.set_recorder(self._session_recorder)
+        self.statusBar().showMessage(tr("session_recording_started", "Recording session to {path}", path=path), 3000)
+
+    def _stop_session_recording(self) -> None:
+        recorder = self._session_recorder
+        if recorder is None:
+            return
+        for viewmodel in self._port_viewmodels.values():
+            viewmodel.set_recorder(None)
+        recorder.close()
+        self._session_recorder = None
+        self.statusBar().showMessage(
+            tr("session_recording_stopped", "Session saved: {count} records", count=recorder.records), 3000
+        )
+
+    def _toggle_sampling_profiler(self, checked: bool) -> None:
+        """Start or stop the background stack sampler."""
+        profiler = get_sampling_profiler()
+        if checked == profiler.is_running():
+            return
+        if checked:
+            profiler.reset()
+            profiler.start()
+            self.statusBar().showMessage(
+                tr("profiler_started", "Sampling profiler started ({hz} Hz)", hz=int(profiler.hz)), 3000
+            )
+        else:
+            profiler.stop()
+
+    def _export_sampling_profile(self) -> None:
+        """Save the collected stacks in the folded format read by flame graph tools."""
+        profiler = get_sampling_profiler()
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self,
+            tr("export_flamegraph", "Export Flame Graph..."),
+            str(profiler.default_path()),
+            tr("folded_file_filter", "Folded stacks (*.folded *.txt);;All files (*)"),
+        )
+        if not path:
+            return
+        try:
+            saved = profiler.export(path)
+        except OSError as exc:
+            self.statusBar().showMessage(tr("profiler_export_error", "Profile export failed: {error}", error=exc), 5000)
+            return
+        if saved is None:
+            self.statusBar().showMessage(tr("profiler_no_samples", "No samples collected yet"), 3000)
+            return
+        self.statusBar().showMessage(tr("profiler_exported", "Profile saved: {path}", path=str(saved)), 5000)
+
+    def _export_chrome_trace(self) -> None:
+        """Save recorded RX path spans as Chrome trace-event JSON."""
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self,
+            tr("export_trace", "Export Chrome Trace..."),
+            str(metrics.default_trace_path()),
+            tr("trace_file_filter", "Chrome trace (*.json);;All files (*)"),
+        )
+        if not path:
+            return
+        try:
+            saved = metrics.export_chrome_trace(path)
+        except OSError as exc:
+            self.statusBar().showMessage(tr("profiler_export_error", "Profile export failed: {error}", error=exc), 5000)
+            return
+        if saved is None:
+            self.statusBar().showMessage(tr("trace_no_spans", "No spans recorded; enable Record Trace first"), 3000)
+            return
+        self.statusBar().showMessage(tr("profiler_exported", "Profile saved: {path}", path=str(saved)), 5000)
+
+    def _replay_session(self) -> None:
+        """Replay a recorded session into the disconnected ports."""
+        path, _ = QtWidgets.QFileDialog.getOpenFileName(
+            self,
+            tr("replay_session", "Replay Session..."),
+            "",
+            tr("session_file_filter", "Session recordings (*.uartrec);;All files (*)"),
+        )
+        if not path:
+            return
+        speeds = {"1x": 1.0, "2x": 2.0, "10x": 10.0, tr("replay_speed_max", "As fast as possible"): 0.0}
+        choice, ok = QtWidgets.QInputDialog.getItem(
+            self, tr("replay_session", "Replay Session..."), tr("replay_speed", "Speed:"),
+            list(speeds), 0, False,
+        )
+        if not ok:
+            return
+        try:
+            recorded = SessionReader(path).ports
+        except (OSError, ValueError) as exc:
+            self.statusBar().showMessage(tr("session_error", "Session error: {error}", error=exc), 5000)
+            return
+
+        # Match recorded ports by label, otherwise in order
+        viewmodels = [self._port_viewmodels[num] for num in sorted(self._port_viewmodels)]
+        by_label = {label.casefold(): label for label in recorded}
+        if by_label.keys() & {vm.port_label.casefold() for vm in viewmodels}:
+            sources = [by_label.get(vm.port_label.casefold()) for vm in viewmodels]
+        else:
+            sources = recorded[:len(viewmodels)]
+        clock_start = time.monotonic() + 0.2  # common origin keeps the ports in step
+        started = 0
+        for viewmodel, source in zip(viewmodels, sources):
+            if source is not None and viewmodel.start_replay(
+                path, speeds[choice], source_label=source, clock_start=clock_start
+            ):
+                started += 1
+        self.statusBar().showMessage(
+            tr("session_replay_started", "Replaying {count} ports from {path}", count=started, path=path), 3000
+        )
+
     def _update_icons_on_theme_change(self) -> None:
         """Update all theme-aware icons when theme changes."""
         icon_cache = IconCache()
@@ -1610,11 +1940,9 @@ class MainWindow(QtWidgets.QMainWindow):
         """Handle theme change."""
         self.statusBar().showMessage(tr("status_theme_changed", f"Theme: {theme}"), 2000)
         
-        # Update icons for theme-aware widgets
+        # Update icons for theme-aware widgets; views queue their repolish
+        # into the shared StyleRefresher, which runs once on the next turn
         self._update_icons_on_theme_change()
-        # Process events to ensure icons are updated
-        from PySide6.QtWidgets import QApplication
-        QApplication.processEvents()
         # Re-apply theme-specific properties to the whole widget tree
         self._apply_theme_to_hierarchy()
         # Re-apply Windows 11 visual effects (Mica, corner radius)
@@ -1626,15 +1954,9 @@ class MainWindow(QtWidgets.QMainWindow):
         self.setWindowTitle(tr("app_name", "UART Control"))
         
         # Update static texts
-        port_ids = [
-            (1, "cpu1"),
-            (2, "cpu2"),
-            (3, "tlm"),
-        ]
-
-        for port_num, port_key in port_ids:
+        for port_num, port_key in self._port_keys.items():
             if port_num in self._port_viewmodels and port_num in self._port_views:
-                new_label = tr(port_key, port_key.upper())
+                new_label = self._port_name(port_key)
                 self._port_viewmodels[port_num].set_port_label(new_label)
                 self._port_views[port_num].set_port_label(new_label)
 
@@ -1653,9 +1975,9 @@ class MainWindow(QtWidgets.QMainWindow):
         self._le_command.setPlaceholderText(tr("enter_command", "Enter command..."))
         self._update_stopwatch_group_title()
         self._btn_combo.setText(tr("send_to_both", "1+2"))
-        self._btn_cpu1.setText(tr("send_to_cpu1", "CPU1"))
-        self._btn_cpu2.setText(tr("send_to_cpu2", "CPU2"))
-        self._btn_tlm.setText(tr("send_to_tlm", "TLM"))
+        for port_num, button in self._send_buttons.items():
+            port_key = self._port_keys[port_num]
+            button.setText(tr(f"send_to_{port_key}", self._port_name(port_key)))
 
         current_lang = translator.get_language()
         for lang, action in self._language_actions.items():
@@ -1696,6 +2018,7 @@ class MainWindow(QtWidgets.QMainWindow):
         # Shutdown all port ViewModels
         for viewmodel in self._port_viewmodels.values():
             viewmodel.shutdown()
+        self._stop_session_recording()
         
         # Give threads time to finish
         self._wait_for_threads()
@@ -1802,13 +2125,13 @@ class MainWindow(QtWidgets.QMainWindow):
                 self._toggle_window_visibility
             )
             
-            # Ctrl+Alt+1 - Send to CPU1
+            # Ctrl+Alt+1 - Send to the first port
             self._hotkey_manager.register_hotkey(
                 VK.NUM1, MOD_CONTROL | MOD_ALT,
                 lambda: self._send_command(1)
             )
             
-            # Ctrl+Alt+2 - Send to CPU2
+            # Ctrl+Alt+2 - Send to the second port
             self._hotkey_manager.register_hotkey(
                 VK.NUM2, MOD_CONTROL | MOD_ALT,
                 lambda: self._send_command(2)
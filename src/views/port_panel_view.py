@@ -8,6 +8,7 @@ from PySide6 import QtWidgets, QtCore, QtGui
 from PySide6.QtCore import Signal, Qt, QTimer
 
 from src.utils.translator import tr, translator
+from src.utils import get_style_refresher
 from src.utils.theme_manager import theme_manager
 from src.styles.constants import Fonts, Sizes, SerialConfig, SerialPorts, Timing
 from src.viewmodels.com_port_viewmodel import ComPortViewModel
@@ -519,11 +520,8 @@ class PortPanelView(QtWidgets.QFrame):
 
     def _apply_theme_to_button(self, button: QtWidgets.QPushButton) -> None:
         theme_class = "dark" if theme_manager.is_dark_theme() else "light"
-        button.setProperty("themeClass", theme_class)
-        # Use unpolish + polish for correct style update
-        button.style().unpolish(button)
-        button.style().polish(button)
-        button.update()
+        # Repolished in the shared deferred pass, and only if the class changed
+        get_style_refresher().set_theme_class(button, theme_class)
 
     def _refresh_widget_style(self, widget: QtWidgets.QWidget) -> None:
         widget.update()
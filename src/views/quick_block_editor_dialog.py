@@ -6,10 +6,20 @@ import uuid
 
 from PySide6 import QtWidgets, QtCore, QtGui
 
+from src.styles.constants import Sizes
+from src.utils.config_loader import config_loader
 from src.utils.quick_blocks_repository import QuickBlock, QuickGroup
 from src.utils.translator import tr, translator
 
 
+def _quick_block_ports() -> list[tuple[str, str]]:
+    """``(key, label)`` of every port a quick block may target, plus "combo" for two or more."""
+    ports = [(label.lower(), label) for _, label in config_loader.get_port_labels()]
+    if len(ports) >= 2:
+        ports.append(("combo", "1+2"))
+    return ports
+
+
 class QuickBlockEditorDialog(QtWidgets.QDialog):
     """Modal dialog used to create or edit Quick Blocks."""
 
@@ -65,13 +75,15 @@ class QuickBlockEditorDialog(QtWidgets.QDialog):
         self._group_label = QtWidgets.QLabel()
         form.addRow(self._group_label, group_wrapper)
 
+        # Filled with the configured ports by _retranslate
         self._port_combo = QtWidgets.QComboBox()
-        self._port_combo.addItems(["cpu1", "cpu2", "tlm", "combo"])
         self._port_label = QtWidgets.QLabel()
         form.addRow(self._port_label, self._port_combo)
 
         self._send_combo_chk = QtWidgets.QCheckBox()
-        self._send_combo_chk.setChecked(True)
+        has_combo = len(config_loader.get_port_labels()) >= 2
+        self._send_combo_chk.setChecked(has_combo)
+        self._send_combo_chk.setEnabled(has_combo)
         form.addRow("", self._send_combo_chk)
 
         self._mode_checkbox = QtWidgets.QCheckBox()
@@ -121,12 +133,10 @@ class QuickBlockEditorDialog(QtWidgets.QDialog):
         self._title_label.setText(tr("name_label", "Name:"))
         self._group_label.setText(tr("group_label", "Group:"))
         self._port_label.setText(tr("port", "Port:"))
+        current_port = self._port_combo.currentData()
         self._port_combo.clear()
-        current_port = self._port_combo.currentText()
-        self._port_combo.clear()
-        ports = ["cpu1", "cpu2", "tlm", "combo"]
-        for port_key in ports:
-            self._port_combo.addItem(tr(port_key, port_key.upper()), port_key)
+        for port_key, port_label in _quick_block_ports():
+            self._port_combo.addItem(tr(port_key, port_label), port_key)
         idx = self._port_combo.findData(current_port)
         if idx >= 0:
             self._port_combo.setCurrentIndex(idx)
@@ -179,10 +189,9 @@ class QuickBlockEditorDialog(QtWidgets.QDialog):
             0,
         )
         self._group_combo.setCurrentIndex(index)
-        if block.port:
-            port_index = self._port_combo.findText(block.port)
-            if port_index >= 0:
-                self._port_combo.setCurrentIndex(port_index)
+        # Unknown (e.g. no longer configured) ports fall back to the first port
+        port_index = self._port_combo.findData((block.port or "").lower())
+        self._port_combo.setCurrentIndex(max(port_index, 0))
         self._send_combo_chk.setChecked(block.send_to_combo)
         self._mode_checkbox.setChecked(block.mode != "single")
         self._command_on.setPlainText(block.command_on)
@@ -243,7 +252,7 @@ class QuickBlockEditorDialog(QtWidgets.QDialog):
             order=self._editing_block.order if self._editing_block else 0,
             mode="dual" if has_off else "single",
             icon=self._editing_block.icon if self._editing_block else None,
-            port=self._port_combo.currentText(),
+            port=self._port_combo.currentData(),
             hotkey=self._hotkey_edit.keySequence().toString().strip() or None,
         )
 
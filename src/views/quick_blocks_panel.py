@@ -10,7 +10,6 @@ from src.utils.icon_cache import get_icon_cache
 from src.utils.quick_blocks_repository import QuickBlock, QuickBlocksRepository
 from src.utils.theme_manager import theme_manager
 from src.utils.translator import tr, translator
-from src.views.quick_block_editor_dialog import QuickBlockEditorDialog
 from src.views.quick_blocks_delegate import QuickBlocksDelegate
 from src.views.quick_blocks_model import (
     QuickBlockItemType,
@@ -393,6 +392,8 @@ class QuickBlocksPanel(QtWidgets.QWidget):
                 self._shortcut_dispatcher.rebuild(reset_overrides=True)
 
     def _open_editor(self, *, groups: list, block: QuickBlock | None = None) -> QuickBlock | None:
+        from src.views.quick_block_editor_dialog import QuickBlockEditorDialog
+
         dialog = QuickBlockEditorDialog(self, groups=groups, block=block)
         dialog.set_hotkey_validator(self._validate_hotkey)
         if dialog.exec() == QtWidgets.QDialog.Accepted:
@@ -430,6 +431,8 @@ class QuickBlocksPanel(QtWidgets.QWidget):
             port=block.port,
             hotkey=block.hotkey,
         )
+        from src.views.quick_block_editor_dialog import QuickBlockEditorDialog
+
         dialog = QuickBlockEditorDialog(self, groups=groups, block=block_clone)
         dialog.set_hotkey_validator(self._validate_hotkey)
         dialog._title_edit.setReadOnly(True)
@@ -479,6 +482,8 @@ class _QuickBlockShortcutDispatcher(QtCore.QObject):
         self._shortcuts: list[QtWidgets.QShortcut] = []
         self._overrides: dict[str, str] = {}
         self._default_shortcuts = config_loader.get_quick_block_shortcuts()
+        port_labels = config_loader.get_port_labels()
+        self._default_port_key = port_labels[0][1].lower() if port_labels else ""
 
     def cleanup(self) -> None:
         for shortcut in self._shortcuts:
@@ -508,5 +513,5 @@ class _QuickBlockShortcutDispatcher(QtCore.QObject):
     def _resolve_shortcut(self, block: QuickBlock) -> str | None:
         if block.hotkey:
             return block.hotkey
-        port_key = (block.port or "").lower() or "cpu1"
+        port_key = (block.port or "").lower() or self._default_port_key
         return self._default_shortcuts.get(port_key)
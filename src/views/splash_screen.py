@@ -2,14 +2,18 @@ from PySide6.QtWidgets import (
     QWidget, QLabel, QVBoxLayout, QProgressBar, 
     QGraphicsDropShadowEffect
 )
-from PySide6.QtCore import Qt, QTimer, QElapsedTimer, QObject, Signal
+from PySide6.QtCore import Qt, QObject, Signal
 from PySide6.QtGui import QPixmap, QColor
 import os
+from typing import TYPE_CHECKING
 
 from src.utils.translator import tr, translator
 from src.utils.theme_manager import theme_manager
 from src.styles.constants import Fonts, Sizes
 
+if TYPE_CHECKING:
+    from src.bootstrap.staged_loader import StagedLoader
+
 
 class ModernSplashScreen(QWidget):
     """Modern splash screen with progress bar"""
@@ -185,45 +189,34 @@ class ModernSplashScreen(QWidget):
 
 
 class SplashController(QObject):
-    """Controller for splash screen management"""
+    """Mirrors a :class:`StagedLoader` on the splash screen and reports when it is done."""
     
     finished = Signal()
     
-    def __init__(self, splash: ModernSplashScreen, duration_ms: int = 3000):
+    def __init__(self, splash: ModernSplashScreen, loader: "StagedLoader"):
         super().__init__()
         self._splash = splash
-        self._duration_ms = max(1000, duration_ms)
-        self._elapsed_ms = 0
-        self._elapsed = QElapsedTimer()
-        self._timer = QTimer()
-        self._timer.timeout.connect(self._tick)
+        self._loader = loader
+        self._finished = False
+        loader.progress.connect(self._on_progress)
+        loader.finished.connect(self.complete)
+        splash.update_progress(loader.percent)
     
     def start(self):
-        """Start loading timer"""
-        self._elapsed.restart()
-        self._timer.start(30)  # Update every 30ms
-    
-    def stop(self):
-        """Stop timer"""
-        self._timer.stop()
+        """Run the loader's remaining stages"""
+        self._loader.start()
     
-    def _tick(self):
-        """Update progress on each timer tick"""
-        self._elapsed_ms = self._elapsed.elapsed()
-        ratio = min(1.0, self._elapsed_ms / self._duration_ms)
-        progress = int(ratio * 100)
-        self._splash.update_progress(progress)
-        
-        if ratio >= 1.0:
-            self._timer.stop()
-            self.finished.emit()
+    def _on_progress(self, percent: int, message: str):
+        self._splash.update_progress(percent, message)
     
     def complete(self):
-        """Instant completion of loading"""
-        self._timer.stop()
+        """Loading is done: show 100% and hand over to the main window"""
+        if self._finished:
+            return
+        self._finished = True
         self._splash.update_progress(100)
         self.finished.emit()
     
     def is_finished(self) -> bool:
         """Check if loading is complete"""
-        return self._elapsed_ms >= self._duration_ms
+        return self._finished
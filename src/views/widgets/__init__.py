@@ -1,10 +1,19 @@
-"""Utility widgets shared across view modules."""
+"""Utility widgets shared across view modules (resolved lazily on first access)."""
 
-from .skeletons import ShimmerPlaceholder, SkeletonPanelPlaceholder  # noqa: F401
-from .stopwatch_widget import StopwatchWidget  # noqa: F401
+from __future__ import annotations
 
-__all__ = [
-    "ShimmerPlaceholder",
-    "SkeletonPanelPlaceholder",
-    "StopwatchWidget",
-]
+from typing import TYPE_CHECKING
+
+from src.utils.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:  # pragma: no cover - imported only for typing
+    from .skeletons import ShimmerPlaceholder, SkeletonPanelPlaceholder
+    from .stopwatch_widget import StopwatchWidget
+    from .telemetry_plot_widget import TelemetryPlotWidget
+
+__all__, __getattr__, __dir__ = lazy_exports(__name__, {
+    "ShimmerPlaceholder": ".skeletons",
+    "SkeletonPanelPlaceholder": ".skeletons",
+    "StopwatchWidget": ".stopwatch_widget",
+    "TelemetryPlotWidget": ".telemetry_plot_widget",
+})
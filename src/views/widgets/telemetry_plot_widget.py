@@ -0,0 +1,221 @@
+"""Live telemetry plot with min/max-per-pixel decimation."""
+
+from __future__ import annotations
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+from src.styles.constants import Sizes
+from src.utils.telemetry_decoder import HAS_NUMPY
+from src.utils.translator import tr, translator
+from src.viewmodels.telemetry_plot_viewmodel import (
+    WINDOW_CHOICES,
+    PlotSeries,
+    TelemetryPlotViewModel,
+)
+
+if HAS_NUMPY:
+    import numpy as np
+
+# Repaint budget: one frame per display refresh at 60 Hz
+FRAME_INTERVAL_MS = 16
+
+SERIES_COLORS: tuple[str, ...] = (
+    "#4e9af1", "#f5a623", "#7ed321", "#d0021b", "#bd10e0", "#50e3c2", "#f8e71c", "#9b9b9b",
+)
+
+
+class TelemetryPlotCanvas(QtWidgets.QWidget):
+    """Paints decimated series: one min-max segment per pixel column."""
+
+    def __init__(self, viewmodel: TelemetryPlotViewModel, parent: QtWidgets.QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._viewmodel = viewmodel
+        self.setMinimumHeight(Sizes.INPUT_MIN_HEIGHT * 4)
+        self.setAttribute(QtCore.Qt.WA_OpaquePaintEvent)
+
+    def paintEvent(self, event: QtGui.QPaintEvent) -> None:  # type: ignore[override]
+        painter = QtGui.QPainter(self)
+        painter.fillRect(self.rect(), self.palette().color(QtGui.QPalette.Base))
+        series = self._viewmodel.series(self.width())
+        if series:
+            self._paint_series(painter, series)
+        painter.end()
+
+    def _paint_series(self, painter: QtGui.QPainter, series: list[PlotSeries]) -> None:
+        low = min(float(s.mins.min()) for s in series)
+        high = max(float(s.maxs.max()) for s in series)
+        if high <= low:
+            low, high = low - 1.0, high + 1.0
+        margin = (high - low) * 0.05
+        low, high = low - margin, high + margin
+        height = self.height() - 1
+        scale = height / (high - low)
+
+        text_color = self.palette().color(QtGui.QPalette.Text)
+        painter.setPen(text_color)
+        painter.drawText(4, 12, f"{high:.4g}")
+        painter.drawText(4, height - 2, f"{low:.4g}")
+
+        for index, item in enumerate(series):
+            color = QtGui.QColor(SERIES_COLORS[index % len(SERIES_COLORS)])
+            pen = QtGui.QPen(color)
+            pen.setCosmetic(True)
+            painter.setPen(pen)
+            painter.drawLines(self._column_segments(item, low, scale, height))
+            label = f"{item.name} [{item.unit}]" if item.unit else item.name
+            painter.drawText(self.width() - 8 - painter.fontMetrics().horizontalAdvance(label),
+                             14 + index * 14, label)
+
+    @staticmethod
+    def _column_segments(item: PlotSeries, low: float, scale: float, height: int) -> list:
+        """One vertical segment per pixel column, stretched to touch its neighbour."""
+        tops = height - (item.maxs - low) * scale
+        bottoms = height - (item.mins - low) * scale
+        # Overlap with the previous column so steep edges stay connected
+        if len(tops) > 1:
+            tops[1:] = np.minimum(tops[1:], bottoms[:-1])
+            bottoms[1:] = np.maximum(bottoms[1:], tops[:-1])
+        bottoms = np.maximum(bottoms, tops + 1.0)
+        xs = range(len(tops))
+        return list(map(QtCore.QLineF, xs, tops.tolist(), xs, bottoms.tolist()))
+
+
+class TelemetryPlotWidget(QtWidgets.QWidget):
+    """Widget Host module plotting selected telemetry channels in real time."""
+
+    def __init__(
+        self,
+        viewmodel: TelemetryPlotViewModel,
+        parent: QtWidgets.QWidget | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._viewmodel = viewmodel
+        self._last_revision: int | None = None
+        self._last_size = QtCore.QSize()
+        self.setObjectName("telemetry_plot_widget")
+        self._build_ui()
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(FRAME_INTERVAL_MS)
+        self._timer.timeout.connect(self._on_frame)
+        self._viewmodel.sources_changed.connect(self._populate_sources)
+        self._viewmodel.channels_changed.connect(self._populate_channels)
+        self._populate_sources(self._viewmodel.source_labels)
+        translator.language_changed.connect(self._retranslate_ui)
+        self.destroyed.connect(self._disconnect_translator)
+
+    def _build_ui(self) -> None:
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(Sizes.LAYOUT_SPACING)
+
+        toolbar = QtWidgets.QHBoxLayout()
+        toolbar.setSpacing(Sizes.LAYOUT_SPACING)
+        self._cmb_source = QtWidgets.QComboBox()
+        self._cmb_source.currentTextChanged.connect(self._on_source_selected)
+        self._btn_channels = QtWidgets.QToolButton()
+        self._btn_channels.setPopupMode(QtWidgets.QToolButton.InstantPopup)
+        self._channel_menu = QtWidgets.QMenu(self._btn_channels)
+        self._btn_channels.setMenu(self._channel_menu)
+        self._cmb_window = QtWidgets.QComboBox()
+        for seconds in WINDOW_CHOICES:
+            self._cmb_window.addItem(f"{seconds:g} s", seconds)
+        self._cmb_window.setCurrentIndex(
+            max(0, self._cmb_window.findData(self._viewmodel.window_seconds))
+        )
+        self._cmb_window.currentIndexChanged.connect(self._on_window_selected)
+        toolbar.addWidget(self._cmb_source, 1)
+        toolbar.addWidget(self._btn_channels)
+        toolbar.addWidget(self._cmb_window)
+        layout.addLayout(toolbar)
+
+        self._lbl_placeholder = QtWidgets.QLabel()
+        self._lbl_placeholder.setAlignment(QtCore.Qt.AlignCenter)
+        self._lbl_placeholder.setWordWrap(True)
+        layout.addWidget(self._lbl_placeholder)
+
+        self._canvas = TelemetryPlotCanvas(self._viewmodel, self)
+        layout.addWidget(self._canvas, 1)
+        self._retranslate_ui()
+
+    @property
+    def canvas(self) -> TelemetryPlotCanvas:
+        return self._canvas
+
+    def _populate_sources(self, labels: list) -> None:
+        self._cmb_source.blockSignals(True)
+        self._cmb_source.clear()
+        self._cmb_source.addItems(labels)
+        current = self._viewmodel.source_label
+        if current is not None:
+            self._cmb_source.setCurrentText(current)
+        self._cmb_source.blockSignals(False)
+        self._populate_channels(self._viewmodel.channels)
+        self._update_placeholder()
+
+    def _populate_channels(self, channels: list) -> None:
+        self._channel_menu.clear()
+        selected = set(self._viewmodel.selected_channels)
+        for name in channels:
+            action = self._channel_menu.addAction(name)
+            action.setCheckable(True)
+            action.setChecked(name in selected)
+            action.toggled.connect(
+                lambda checked, channel=name: self._on_channel_toggled(channel, checked)
+            )
+        self._last_revision = None
+
+    def _update_placeholder(self) -> None:
+        if not self._viewmodel.available:
+            text = tr("telemetry_needs_numpy", "Telemetry plotting requires numpy")
+        elif not self._viewmodel.source_labels:
+            text = tr("telemetry_no_source", "No telemetry source: describe frames in telemetry_schema.yaml")
+        else:
+            text = ""
+        self._lbl_placeholder.setText(text)
+        self._lbl_placeholder.setVisible(bool(text))
+        self._canvas.setVisible(not text)
+
+    def _on_source_selected(self, label: str) -> None:
+        self._viewmodel.select_source(label or None)
+
+    def _on_channel_toggled(self, channel: str, checked: bool) -> None:
+        self._viewmodel.set_channel_selected(channel, checked)
+        self._last_revision = None
+
+    def _on_window_selected(self, index: int) -> None:
+        self._viewmodel.set_window_seconds(self._cmb_window.itemData(index))
+        self._last_revision = None
+
+    def _on_frame(self) -> None:
+        # Repaint only when samples arrived or the geometry changed
+        revision = self._viewmodel.revision()
+        size = self._canvas.size()
+        if revision == self._last_revision and size == self._last_size:
+            return
+        self._last_revision = revision
+        self._last_size = size
+        self._canvas.update()
+
+    def showEvent(self, event: QtGui.QShowEvent) -> None:  # type: ignore[override]
+        super().showEvent(event)
+        self._last_revision = None
+        self._timer.start()
+
+    def hideEvent(self, event: QtGui.QHideEvent) -> None:  # type: ignore[override]
+        self._timer.stop()
+        super().hideEvent(event)
+
+    def _retranslate_ui(self) -> None:
+        self._cmb_source.setToolTip(tr("telemetry_source", "Telemetry source port"))
+        self._btn_channels.setText(tr("telemetry_channels", "Channels"))
+        self._cmb_window.setToolTip(tr("telemetry_window", "Time window"))
+        self._update_placeholder()
+
+    def _disconnect_translator(self) -> None:
+        try:
+            translator.language_changed.disconnect(self._retranslate_ui)
+        except (RuntimeError, TypeError):
+            pass
+
+
+__all__ = ["TelemetryPlotCanvas", "TelemetryPlotWidget"]
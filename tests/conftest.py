@@ -31,6 +31,20 @@ def tmp_path(tmp_path_factory):
     return unique_dir
 
 
+@pytest.fixture
+def isolated_config_dir(tmp_path, monkeypatch):
+    """
+    Point the config directory at tmp_path so console history files
+    (console_history_*.bin) are not written into the repository.
+    """
+    from src.utils.paths import get_config_dir
+
+    monkeypatch.setenv("UART_CTRL_CONFIG_DIR", str(tmp_path))
+    get_config_dir.cache_clear()
+    yield tmp_path
+    get_config_dir.cache_clear()
+
+
 @pytest.fixture(scope='session')
 def qapp():
     """
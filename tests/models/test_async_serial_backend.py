@@ -0,0 +1,204 @@
+"""Tests for the asyncio serial backend."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.models.async_serial_backend import AsyncSerialWorker, SerialEventLoop
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "openpty"), reason="needs pseudo terminals")
+
+
+def _wait(qapp, predicate, timeout: float = 3.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        qapp.processEvents()
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+@pytest.fixture
+def event_loop_thread(qapp):
+    loop = SerialEventLoop()
+    yield loop
+    loop.shutdown()
+
+
+@pytest.fixture
+def pty_pair():
+    master, slave = os.openpty()
+    yield master, os.ttyname(slave)
+    os.close(master)
+    os.close(slave)
+
+
+class Recorder:
+    def __init__(self, worker: AsyncSerialWorker) -> None:
+        self.lines: list[str] = []
+        self.status: list[str] = []
+        self.errors: list[str] = []
+        self.finished = 0
+        worker.rx.connect(lambda label, data: self.lines.append(data))
+        worker.status.connect(lambda label, msg: self.status.append(msg))
+        worker.error.connect(lambda label, msg: self.errors.append(msg))
+        worker.finished.connect(self._on_finished)
+
+    def _on_finished(self) -> None:
+        self.finished += 1
+
+
+def _start(event_loop_thread, device, **config):
+    worker = AsyncSerialWorker("CPU1", {"event_loop": event_loop_thread, **config})
+    worker.configure(device, 115200)
+    recorder = Recorder(worker)
+    worker.start()
+    return worker, recorder
+
+
+def test_fd_driven_rx_and_tx(qapp, event_loop_thread, pty_pair):
+    master, device = pty_pair
+    worker, rec = _start(event_loop_thread, device)
+    assert _wait(qapp, lambda: worker.is_connected)
+    assert worker.fd_driven
+    assert worker.isRunning()
+
+    os.write(master, b"".join(f"line {i}\r\n".encode() for i in range(200)))
+    assert _wait(qapp, lambda: len(rec.lines) == 200)
+    assert rec.lines[0] == "line 0\n" and rec.lines[-1] == "line 199\n"
+    # Lines reach Qt in batches, not one queued event per line
+    assert event_loop_thread.batches < event_loop_thread.delivered / 10
+
+    assert worker.write("status")
+    received = bytearray()
+
+    def got_reply() -> bool:
+        try:
+            received.extend(os.read(master, 4096))
+        except BlockingIOError:
+            pass
+        return b"status\r\n" in received
+
+    os.set_blocking(master, False)
+    assert _wait(qapp, got_reply)
+
+    worker.stop()
+    assert not worker.isRunning()
+    assert _wait(qapp, lambda: rec.finished == 1)
+    assert not worker.is_connected
+
+
+def test_missing_device_retries_then_finishes(qapp, event_loop_thread, monkeypatch):
+    monkeypatch.setattr(AsyncSerialWorker, "CONNECTION_RETRY_DELAY", 0.01)
+    worker, rec = _start(event_loop_thread, "/dev/nonexistent-uart")
+    assert _wait(qapp, lambda: rec.finished == 1)
+    assert worker.connection_attempts == AsyncSerialWorker.MAX_CONNECTION_ATTEMPTS
+    assert "3" in rec.errors[-1]
+    assert not worker.isRunning()
+
+
+def test_finished_is_emitted_after_the_worker_stops_running(qapp, event_loop_thread, monkeypatch):
+    monkeypatch.setattr(AsyncSerialWorker, "CONNECTION_RETRY_DELAY", 0.01)
+    worker = AsyncSerialWorker("CPU1", {"event_loop": event_loop_thread})
+    worker.configure("/dev/nonexistent-uart", 115200)
+    running_at_finish: list[bool] = []
+    worker.finished.connect(lambda: running_at_finish.append(worker.isRunning()))
+    worker.start()
+    assert _wait(qapp, lambda: running_at_finish)
+    assert running_at_finish == [False]
+
+
+def test_port_opened_after_timeout_is_closed(qapp, event_loop_thread, monkeypatch):
+    monkeypatch.setattr(AsyncSerialWorker, "CONNECTION_TIMEOUT", 0.05)
+    late_port = Mock()
+    release = threading.Event()
+
+    def slow_open(self):
+        release.wait(2.0)
+        return late_port
+
+    monkeypatch.setattr(AsyncSerialWorker, "_open_connection", slow_open)
+    worker, rec = _start(event_loop_thread, "/dev/slow-uart")
+    assert _wait(qapp, lambda: rec.finished == 1)
+    assert not late_port.close.called
+
+    release.set()
+    assert _wait(qapp, lambda: late_port.close.called)
+    assert not worker.is_connected
+
+
+def test_stop_interrupts_retry_back_off(qapp, event_loop_thread, monkeypatch):
+    monkeypatch.setattr(AsyncSerialWorker, "CONNECTION_RETRY_DELAY", 30.0)
+    worker, rec = _start(event_loop_thread, "/dev/nonexistent-uart")
+    assert _wait(qapp, lambda: worker.connection_attempts == 1 and rec.errors)
+    start = time.monotonic()
+    worker.stop()
+    assert time.monotonic() - start < 1.0
+    assert _wait(qapp, lambda: rec.finished == 1)
+
+
+def test_vanished_device_ends_worker(qapp, event_loop_thread):
+    master, slave = os.openpty()
+    worker, rec = _start(event_loop_thread, os.ttyname(slave))
+    assert _wait(qapp, lambda: worker.is_connected)
+    os.close(master)
+    assert _wait(qapp, lambda: rec.finished == 1)
+    assert rec.errors
+    os.close(slave)
+
+
+def test_many_ports_share_one_thread(qapp, event_loop_thread):
+    pairs = [os.openpty() for _ in range(12)]
+    before = threading.active_count()
+    workers = []
+    try:
+        for index, (master, slave) in enumerate(pairs):
+            worker = AsyncSerialWorker(f"P{index}", {"event_loop": event_loop_thread})
+            worker.configure(os.ttyname(slave), 115200)
+            worker.start()
+            workers.append(worker)
+        assert _wait(qapp, lambda: all(w.is_connected for w in workers))
+        # Opening borrows the default executor briefly; reading needs no thread per port
+        assert threading.active_count() - before <= 1 + min(32, (os.cpu_count() or 1) + 4)
+        lines = []
+        for worker in workers:
+            worker.rx.connect(lambda label, data: lines.append(label))
+        for master, _ in pairs:
+            os.write(master, b"ping\n")
+        assert _wait(qapp, lambda: len(lines) == len(pairs))
+    finally:
+        for worker in workers:
+            worker.stop()
+        for master, slave in pairs:
+            os.close(master)
+            os.close(slave)
+
+
+def test_supervisor_spawns_async_workers(qapp, event_loop_thread, pty_pair):
+    from src.supervisors.serial_supervisor import SerialWorkerSupervisor
+
+    master, device = pty_pair
+    supervisor = SerialWorkerSupervisor("CPU1")
+    lines = []
+    worker = supervisor.spawn_worker(
+        port_name=device,
+        baud_rate=115200,
+        on_rx=lambda label, data: lines.append(data),
+        on_error=lambda *args: None,
+        on_status=lambda *args: None,
+        on_finished=lambda: None,
+        config={"event_loop": event_loop_thread},
+        worker_class=AsyncSerialWorker,
+    )
+    assert isinstance(worker, AsyncSerialWorker)
+    assert _wait(qapp, lambda: worker.is_connected)
+    os.write(master, b"hello\n")
+    assert _wait(qapp, lambda: lines == ["hello\n"])
+    supervisor.stop_worker("CPU1")
+    assert not worker.isRunning()
@@ -90,7 +90,7 @@ class TestGetButtonColors:
         
         assert isinstance(colors, ButtonColors)
         assert colors.command_combo_active is not None
-        assert colors.command_cpu1_active is not None
+        assert colors.command_text_active is not None
     
     def test_get_light_button_colors(self):
         """Test getting light theme button colors."""
@@ -274,6 +274,143 @@ class TestEdgeCases:
         ports = loader.get_ports_config()
         assert isinstance(ports, dict)
 
+    def test_get_serial_backend_falls_back_to_thread(self, tmp_path):
+        """Unknown worker backends fall back to one thread per port."""
+        loader = ConfigLoader()
+        assert loader.get_serial_backend() in ("thread", "asyncio")
+
+        path = tmp_path / "config.ini"
+        path.write_text("[serial]\nworker_backend = AsyncIO \n", encoding="utf-8")
+        assert ConfigLoader(config_path=path).get_serial_backend() == "asyncio"
+        path.write_text("[serial]\nworker_backend = fibers\n", encoding="utf-8")
+        assert ConfigLoader(config_path=path).get_serial_backend() == "thread"
+
+    def test_get_port_labels_any_number_of_ports(self, tmp_path):
+        """Port labels follow port_N_label numbering, not a fixed trio."""
+        path = tmp_path / "config.ini"
+        lines = [f"port_{n}_label = UART{n}" for n in (10, 2, 1, 16)]
+        lines += ["port_3_label = ", "port_1_rx_mode = hex"]
+        path.write_text("[ports]\n" + "\n".join(lines) + "\n", encoding="utf-8")
+        assert ConfigLoader(config_path=path).get_port_labels() == [
+            (1, "UART1"), (2, "UART2"), (10, "UART10"), (16, "UART16"),
+        ]
+
+        path.write_text("[app]\nversion = 1.0\n", encoding="utf-8")
+        assert ConfigLoader(config_path=path).get_port_labels() == [(1, "CPU1"), (2, "CPU2"), (3, "TLM")]
+
+    def test_get_port_labels_keeps_configured_numbers(self, tmp_path):
+        """A gapped config keeps port 5 as N=5 so its port_5_* options apply."""
+        path = tmp_path / "config.ini"
+        path.write_text(
+            "[ports]\nport_1_label = CPU1\nport_2_label = cpu1\nport_5_label = TLM\n"
+            "port_5_rx_mode = hex\n",
+            encoding="utf-8",
+        )
+        loader = ConfigLoader(config_path=path)
+        assert loader.get_port_labels() == [(1, "CPU1"), (5, "TLM")]
+        number, _ = loader.get_port_labels()[-1]
+        assert loader.get_ports_config()[f"port_{number}_rx_mode"] == "hex"
+
+
+class TestConfigSnapshot:
+    """Typed values are built once per snapshot and reloaded on file change."""
+
+    @staticmethod
+    def _write(path, max_items, color="#111111"):
+        path.write_text(
+            f"[ui]\nmax_history_items = {max_items}\n\n[colors.dark]\nrx_text = {color}\n",
+            encoding="utf-8",
+        )
+
+    def test_getters_serve_cached_frozen_values(self, tmp_path):
+        import dataclasses
+
+        path = tmp_path / "config.ini"
+        self._write(path, 7)
+        loader = ConfigLoader(config_path=path)
+
+        colors = loader.get_colors("dark")
+        assert loader.get_colors("dark") is colors
+        assert colors.rx_text == "#111111"
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            colors.rx_text = "#000000"
+        with pytest.raises(TypeError):
+            loader.snapshot.sections["ui"]["max_history_items"] = "1"
+        # Mutable results are copies: callers cannot corrupt the cache
+        loader.get_ports_config()["port_1_label"] = "X"
+        assert "port_1_label" not in loader.get_ports_config()
+
+    def test_font_and_serial_timing_caches_follow_reload(self, monkeypatch):
+        import dataclasses
+
+        from src.models.serial_worker import SerialWorker
+        from src.styles.constants import Fonts
+        from src.utils.config_loader import config_loader as app_config
+
+        fonts = dataclasses.replace(Fonts._fonts(), monospace_size=23)
+        timing = {**app_config.get_serial_timing(), "connection_timeout": 9.5}
+        assert SerialWorker.CONNECTION_TIMEOUT != 9.5
+        monkeypatch.setattr(app_config, "get_fonts", lambda: fonts)
+        monkeypatch.setattr(app_config, "get_serial_timing", lambda: timing)
+        try:
+            app_config.config_changed.emit(app_config.snapshot)
+            assert SerialWorker.CONNECTION_TIMEOUT == 9.5
+            assert Fonts._fonts().monospace_size == 23
+        finally:
+            monkeypatch.undo()
+            app_config.config_changed.emit(app_config.snapshot)
+        assert SerialWorker.CONNECTION_TIMEOUT != 9.5
+
+    def test_reload_on_change_emits_config_changed(self, tmp_path):
+        path = tmp_path / "config.ini"
+        self._write(path, 7)
+        loader = ConfigLoader(config_path=path)
+        received = []
+        loader.config_changed.connect(received.append)
+        assert loader.get_max_history_items() == 7
+        colors = loader.get_colors("dark")
+
+        assert not loader.reload_if_changed()  # untouched file: one stat, nothing else
+        os.utime(path, ns=(1, 1))
+        assert not loader.reload_if_changed()  # touched, same contents
+        assert loader.get_colors("dark") is colors
+
+        self._write(path, 9, "#222222")
+        os.utime(path, ns=(2, 2))
+        assert loader.reload_if_changed()
+        assert received == [loader.snapshot]
+        assert loader.get_max_history_items() == 9
+        assert loader.get_colors("dark").rx_text == "#222222"
+
+    def test_watching_polls_the_file(self, qapp, qtbot, tmp_path):
+        path = tmp_path / "config.ini"
+        self._write(path, 7)
+        loader = ConfigLoader(config_path=path)
+        try:
+            assert loader.start_watching(10)
+            self._write(path, 11)
+            os.utime(path, ns=(3, 3))
+            with qtbot.waitSignal(loader.config_changed, timeout=2000):
+                pass
+            assert loader.get_max_history_items() == 11
+        finally:
+            loader.stop_watching()
+        assert not loader.start_watching(0)
+
+    def test_command_history_follows_config(self, qapp, tmp_path, monkeypatch):
+        from src.utils.config_loader import config_loader
+        from src.viewmodels.command_history_viewmodel import CommandHistoryModel
+
+        monkeypatch.setattr(CommandHistoryModel, "_resolve_storage_path", staticmethod(lambda: tmp_path / "h.json"))
+        model = CommandHistoryModel()
+        for index in range(5):
+            model.add_entry(f"cmd{index}", "CPU1")
+        monkeypatch.setattr(config_loader, "get_max_history_items", lambda: 2)
+        # Called directly: emitting the shared loader's signal would also re-theme the app
+        model._on_config_changed(config_loader.snapshot)
+        assert [entry.command for entry in model.entries()] == ["cmd4", "cmd3"]
+        model.flush()
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
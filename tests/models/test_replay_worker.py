@@ -0,0 +1,84 @@
+"""Unit tests for ReplayWorker session playback."""
+
+import time
+
+import pytest
+
+from src.models.replay_worker import ReplayWorker
+from src.models.worker_events import WorkerEvent
+from src.utils.session_recording import SessionRecorder
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def session(tmp_path):
+    clock = FakeClock()
+    path = tmp_path / "session.uartrec"
+    with SessionRecorder(path, clock=clock) as recorder:
+        for step in range(5):
+            clock.now += 0.05
+            recorder.record_rx("CPU1", f"line {step}\nx".encode())
+            recorder.record_rx("CPU2", b"other\n")
+        recorder.record_tx("CPU1", b"cmd\r\n")
+    return path
+
+
+def _run(worker):
+    lines, statuses, errors, finished = [], [], [], []
+    worker.rx.connect(lambda label, data: lines.append((label, data)))
+    worker.status.connect(lambda label, msg: statuses.append(msg))
+    worker.error.connect(lambda label, msg: errors.append(msg))
+    worker.finished.connect(lambda: finished.append(True))
+    worker.run()
+    return lines, statuses, errors, finished
+
+
+def test_replays_one_port_through_line_splitting(session):
+    worker = ReplayWorker('CPU1', {'session': str(session), 'replay_speed': ReplayWorker.SPEED_MAX})
+    lines, statuses, errors, finished = _run(worker)
+
+    assert errors == []
+    assert finished == [True]
+    assert [status.event for status in statuses] == [
+        WorkerEvent.CONNECTING,
+        WorkerEvent.CONNECTED,
+        WorkerEvent.TX,
+        WorkerEvent.REPLAY_FINISHED,
+        WorkerEvent.DISCONNECTED,
+    ]
+    assert statuses[3].params == {"count": 5}
+    assert [data for _, data in lines] == ["line 0\n"] + [f"xline {i}\n" for i in range(1, 5)]
+    assert {label for label, _ in lines} == {'CPU1'}
+    assert worker.replayed == 5
+    assert worker.stats.snapshot().total_lines == 5
+    assert not worker.restartable
+
+
+def test_replays_another_recorded_port(session):
+    worker = ReplayWorker('TLM', {'session': str(session), 'replay_speed': 0, 'replay_port': 'CPU2'})
+    lines, *_ = _run(worker)
+    assert lines == [('TLM', 'other\n')] * 5
+
+
+def test_paces_records_at_speed(session):
+    worker = ReplayWorker('CPU1', {'session': str(session), 'replay_speed': 5.0, 'read_interval': 0.001})
+    start = time.monotonic()
+    _run(worker)
+    # 0.25 s of recording at 5x
+    assert time.monotonic() - start == pytest.approx(0.05, abs=0.04)
+
+
+def test_missing_recording_is_fatal(tmp_path):
+    worker = ReplayWorker('CPU1', {'session': str(tmp_path / "nope.uartrec")})
+    lines, statuses, errors, finished = _run(worker)
+    assert lines == []
+    assert len(errors) == 1
+    assert finished == [True]
+    assert not worker.restartable
@@ -263,5 +263,151 @@ class TestSerialWorkerEdgeCases:
             finished_mock.emit.assert_called()
 
 
+
+class TestSerialWorkerBinaryMode:
+    """Test the raw-bytes RX mode."""
+
+    def test_rx_mode_from_config(self):
+        assert SerialWorker('CPU1').rx_mode == SerialWorker.RX_MODE_TEXT
+        assert SerialWorker('CPU1', {'rx_mode': 'hex'}).rx_mode == SerialWorker.RX_MODE_BINARY
+        assert SerialWorker('CPU1', {'rx_mode': 'bogus'}).rx_mode == SerialWorker.RX_MODE_TEXT
+
+    def test_binary_read_emits_raw_chunk_without_decoding(self):
+        worker = SerialWorker('CPU1')
+        worker.set_rx_mode('binary')
+        raw, text = [], []
+        worker.rx_bytes.connect(lambda label, data, ts: raw.append((label, data)))
+        worker.rx.connect(lambda label, data: text.append(data))
+
+        ser = Mock()
+        ser.in_waiting = 4
+        ser.read.return_value = b'\x00\xff\n\x80'
+
+        assert worker._process_read(ser) is True
+        assert raw == [('CPU1', b'\x00\xff\n\x80')]
+        assert text == []
+
+    def test_switching_to_binary_drops_partial_text_line(self):
+        worker = SerialWorker('CPU1')
+        lines = []
+        worker.rx.connect(lambda label, data: lines.append(data))
+        worker._handle_rx_chunk(b'partial')
+        worker.set_rx_mode(SerialWorker.RX_MODE_BINARY)
+        assert worker._read_buffer == 'partial'  # cleared by the worker thread, not the caller
+
+        worker.set_rx_mode(SerialWorker.RX_MODE_TEXT)
+        worker._handle_rx_chunk(b'tail\n')
+        assert lines == ['tail\n']
+
+
+class TestSerialWorkerFraming:
+    """Test frame decoders in the read path."""
+
+    def test_framing_from_config_and_invalid_spec(self):
+        assert SerialWorker('TLM', {'framing': 'cobs'}).frame_decoder is not None
+        worker = SerialWorker('TLM')
+        assert worker.frame_decoder is None
+        assert worker.set_framing('nonsense') is False
+        assert worker.frame_decoder is None
+
+    def test_frames_span_reads_and_bypass_line_splitting(self):
+        worker = SerialWorker('TLM', {'framing': 'u8'})
+        frames, text = [], []
+        worker.rx_frames.connect(lambda label, batch, ts: frames.extend(batch))
+        worker.rx.connect(lambda label, data: text.append(data))
+
+        ser = Mock()
+        for chunk in (b'\x03a\n', b'b\x02\x00'):
+            ser.in_waiting = len(chunk)
+            ser.read.return_value = chunk
+            assert worker._process_read(ser) is True
+        assert frames == [b'a\nb']
+        assert text == []
+
+
+class TestSerialWorkerPipelines:
+    """Test RX/TX processor pipelines."""
+
+    def test_rx_pipeline_runs_on_frames(self):
+        import zlib
+
+        worker = SerialWorker('TLM', {'framing': 'u8', 'rx_pipeline': 'zlib'})
+        frames = []
+        worker.rx_frames.connect(lambda label, batch, ts: frames.extend(batch))
+        packed = [zlib.compress(b'one'), zlib.compress(b'two')]
+        chunk = b''.join(bytes([len(p)]) + p for p in packed)
+
+        ser = Mock()
+        ser.in_waiting = len(chunk)
+        ser.read.return_value = chunk
+        assert worker._process_read(ser) is True
+        assert frames == [b'one', b'two']
+        assert worker.pipeline_stats()['rx'][0]['chunks_in'] == 2
+
+    def test_tx_pipeline_transforms_wire_payload(self):
+        worker = SerialWorker('CPU1', {'tx_pipeline': 'crc16:append'})
+        worker._ser = Mock()
+        worker._ser.write.side_effect = len
+        assert worker._send_data(b'123456789') is True
+        worker._ser.write.assert_called_once_with(b'123456789\x31\xc3')
+
+    def test_invalid_pipeline_is_disabled(self):
+        worker = SerialWorker('CPU1')
+        assert worker.set_rx_pipeline('no-such-stage') is False
+        assert worker.rx_pipeline is None
+
+
+
+class TestSerialWorkerStats:
+    """Test rolling statistics fed from the read path."""
+
+    def _read(self, worker, chunk):
+        ser = Mock()
+        ser.in_waiting = len(chunk)
+        ser.read.return_value = chunk
+        assert worker._process_read(ser) is True
+
+    def test_text_reads_count_bytes_lines_and_decode_errors(self):
+        worker = SerialWorker('CPU1')
+        self._read(worker, b'abc\r\nde')
+        self._read(worker, b'f\xff\n')
+
+        snapshot = worker.stats.snapshot()
+        assert snapshot.total_bytes == 10
+        assert snapshot.total_lines == 2
+        assert snapshot.decode_errors == 1
+        assert snapshot.max_burst_lines == 1
+
+    def test_line_lengths_are_counted_in_encoded_bytes(self):
+        from src.utils.port_stats import histogram_bounds
+
+        worker = SerialWorker('CPU1')
+        self._read(worker, 'ééé\n'.encode('utf-8'))
+
+        histogram = worker.stats.snapshot().line_length_histogram
+        bounds = histogram_bounds(len(histogram))
+        assert histogram[bounds.index(4)] == 1  # 6 bytes, not 3 characters
+
+    def test_framed_reads_count_frames_and_malformed_frames(self):
+        worker = SerialWorker('TLM', {'framing': 'cobs'})
+        self._read(worker, b'\x03ab\x00\x05\x00')
+
+        snapshot = worker.stats.snapshot()
+        assert snapshot.total_lines == 1
+        assert snapshot.decode_errors == 1
+
+    def test_oversized_read_counts_dropped_lines(self):
+        worker = SerialWorker('CPU1')
+        self._read(worker, b'x' * SerialWorker.MAX_BUFFER_SIZE + b'a\nb\n')
+        assert worker.stats.snapshot().dropped_lines == 2
+
+    def test_shared_stats_survive_worker_restart(self):
+        first = SerialWorker('CPU1')
+        self._read(first, b'one\n')
+        second = SerialWorker('CPU1', {'stats': first.stats})
+        self._read(second, b'two\n')
+        assert second.stats.snapshot().total_lines == 2
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
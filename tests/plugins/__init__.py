@@ -0,0 +1 @@
+# Plugins tests package
@@ -0,0 +1,123 @@
+"""Tests for the pluggable frame decoders."""
+
+from __future__ import annotations
+
+import struct
+
+import pytest
+
+from src.plugins import DataProcessor, get_plugin_registry
+from src.plugins.framing import (
+    CobsDecoder,
+    DelimiterDecoder,
+    FixedSizeDecoder,
+    FrameDecoder,
+    LengthPrefixDecoder,
+    SlipDecoder,
+    create_frame_decoder,
+)
+
+
+def cobs_encode(payload: bytes) -> bytes:
+    out = bytearray()
+    for block in payload.split(b"\x00"):
+        while len(block) >= 254:
+            out += b"\xff" + block[:254]
+            block = block[254:]
+        out += bytes([len(block) + 1]) + block
+    return bytes(out) + b"\x00"
+
+
+def slip_encode(payload: bytes) -> bytes:
+    return payload.replace(b"\xdb", b"\xdb\xdd").replace(b"\xc0", b"\xdb\xdc") + b"\xc0"
+
+
+def feed_bytewise(decoder: FrameDecoder, stream: bytes) -> list[bytes]:
+    frames: list[bytes] = []
+    for i in range(len(stream)):
+        frames += decoder.feed(stream[i:i + 1])
+    return frames
+
+
+def test_builtin_decoders_are_registered_processors():
+    registry = get_plugin_registry()
+    for name in ("slip", "cobs", "length_prefix", "fixed_size", "delimiter"):
+        decoder_class = registry.get_processor(name)
+        assert decoder_class is not None and issubclass(decoder_class, DataProcessor)
+
+
+def test_slip_unescapes_and_survives_split_chunks():
+    payloads = [b"\xc0\xdb\x01", b"plain", b"\xdb\xdd\xdc"]
+    stream = b"\xc0" + b"".join(slip_encode(p) for p in payloads)
+    assert SlipDecoder().feed(stream) == payloads
+    assert feed_bytewise(SlipDecoder(), stream) == payloads
+
+
+def test_cobs_round_trip_including_long_zero_free_runs():
+    payloads = [b"\x00", b"\x11\x00\x22\x00", bytes(range(1, 256)) * 2, b""]
+    stream = b"".join(cobs_encode(p) for p in payloads)
+    decoder = CobsDecoder()
+    # The empty payload encodes to b"\x01": a frame of its own
+    assert decoder.feed(stream) == payloads
+    assert feed_bytewise(CobsDecoder(), stream) == payloads
+
+
+def test_cobs_drops_corrupt_frame():
+    decoder = CobsDecoder()
+    assert decoder.feed(b"\x05ab\x00" + cobs_encode(b"ok")) == [b"ok"]
+    assert decoder.dropped == 1
+
+
+@pytest.mark.parametrize("spec,fmt", [
+    ("u8", "<B"), ("u16le", "<H"), ("u16be", ">H"), ("u32le", "<I"), ("u32be", ">I"),
+])
+def test_length_prefix_formats(spec, fmt):
+    payloads = [b"abc", b"", b"x" * 200]
+    stream = b"".join(struct.pack(fmt, len(p)) + p for p in payloads)
+    decoder = create_frame_decoder(spec)
+    assert isinstance(decoder, LengthPrefixDecoder)
+    assert feed_bytewise(decoder, stream) == payloads
+    assert decoder.pending == 0
+
+
+def test_length_prefix_oversized_header_drops_backlog():
+    decoder = LengthPrefixDecoder(2, "big", max_frame_size=16)
+    assert decoder.feed(b"\xff\xff garbage") == []
+    assert decoder.dropped == 1 and decoder.pending == 0
+    assert decoder.feed(b"\x00\x02hi") == [b"hi"]
+
+
+def test_fixed_size_and_delimiter_keep_partial_data():
+    fixed = create_frame_decoder("fixed_size:4")
+    assert fixed.feed(b"abcdefghij") == [b"abcd", b"efgh"]
+    assert fixed.pending == 2
+    assert fixed.feed(b"kl") == [b"ijkl"]
+
+    delimited = create_frame_decoder("delimiter:0d0a")
+    assert isinstance(delimited, DelimiterDecoder)
+    assert delimited.feed(b"one\r\ntwo\r") == [b"one"]
+    assert delimited.feed(b"\n") == [b"two"]
+
+
+def test_delimiter_overflow_without_terminator_is_dropped():
+    decoder = DelimiterDecoder(b"\n", max_frame_size=8)
+    assert decoder.feed(b"0123456789") == []
+    assert decoder.dropped == 1 and decoder.pending == 0
+
+
+def test_process_and_reset_follow_data_processor_contract():
+    decoder = FixedSizeDecoder(2)
+    assert decoder.process(b"abcde") == b"abcd"
+    decoder.reset()
+    assert decoder.pending == 0
+
+
+@pytest.mark.parametrize("spec", ["", "none", "line", None])
+def test_no_framing_specs(spec):
+    assert create_frame_decoder(spec) is None
+
+
+@pytest.mark.parametrize("spec", ["bogus", "u24le", "fixed_size", "slip:extra"])
+def test_invalid_specs_raise(spec):
+    with pytest.raises(ValueError):
+        create_frame_decoder(spec)
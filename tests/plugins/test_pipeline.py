@@ -0,0 +1,109 @@
+"""Tests for the DataProcessor pipeline engine and built-in processors."""
+
+from __future__ import annotations
+
+import zlib
+
+import pytest
+
+from src.plugins import DataProcessor
+from src.plugins.framing import CobsDecoder
+from src.plugins.pipeline import PipelineStage, ProcessorPipeline, create_processor
+from src.plugins.processors import Crc16Processor, Crc32Processor, ZlibProcessor
+
+
+class Upper(DataProcessor):
+    thread_safe = True
+
+    def process(self, data: bytes) -> bytes:
+        return data.upper()
+
+    def reset(self) -> None:
+        pass
+
+
+def with_crc32(payload: bytes) -> bytes:
+    return payload + zlib.crc32(payload).to_bytes(4, "little")
+
+
+def test_stages_run_in_order_and_count_per_batch():
+    pipeline = ProcessorPipeline([
+        PipelineStage("zlib", ZlibProcessor()),
+        PipelineStage("upper", Upper()),
+    ])
+    out = pipeline.run([zlib.compress(b"abc"), zlib.compress(b"de")])
+
+    assert out == [b"ABC", b"DE"]
+    zlib_stats, upper_stats = pipeline.stats()
+    assert zlib_stats["name"] == "zlib"
+    assert zlib_stats["batches"] == 1
+    assert zlib_stats["chunks_in"] == 2 and zlib_stats["chunks_out"] == 2
+    assert zlib_stats["bytes_out"] == 5
+    assert upper_stats["total_ms"] >= 0.0
+
+
+def test_rejected_chunks_are_dropped_and_later_stages_skipped():
+    crc = Crc32Processor()
+    upper = PipelineStage("upper", Upper())
+    pipeline = ProcessorPipeline([PipelineStage("crc32", crc), upper])
+
+    assert pipeline.run([with_crc32(b"ok"), b"bad!crc!"]) == [b"OK"]
+    assert crc.errors == 1
+    assert pipeline.run([b"bad!crc!"]) == []
+    assert upper.stats.batches == 1
+
+
+def test_spec_builds_framer_checksum_and_pooled_stage():
+    pipeline = ProcessorPipeline.from_spec("cobs, crc32, zlib@pool")
+    assert [stage.name for stage in pipeline.stages] == ["cobs", "crc32", "zlib"]
+    assert [stage.threaded for stage in pipeline.stages] == [False, False, True]
+
+    payloads = [f"sample {i}".encode() * 20 for i in range(8)]
+    stream = bytearray()
+    for payload in payloads:
+        framed = with_crc32(zlib.compress(payload))
+        stream += b"".join(bytes([len(b) + 1]) + b for b in framed.split(b"\x00")) + b"\x00"
+    # Split across two reads: the framer keeps state between batches
+    half = len(stream) // 2
+    out = pipeline.run([bytes(stream[:half])]) + pipeline.run([bytes(stream[half:])])
+    assert out == payloads
+
+
+def test_pool_requires_thread_safe_processor():
+    with pytest.raises(ValueError):
+        PipelineStage("cobs", CobsDecoder(), threaded=True)
+    with pytest.raises(ValueError):
+        ProcessorPipeline.from_spec("slip@pool")
+
+
+def test_pooled_stage_counts_every_rejected_chunk():
+    pipeline = ProcessorPipeline.from_spec("crc32@pool")
+    crc = pipeline.stages[0].processor
+    for _ in range(20):
+        assert pipeline.run([b"bad!crc!"] * 64) == []
+    assert crc.errors == 20 * 64
+    crc.reset()
+    assert crc.errors == 0
+
+
+@pytest.mark.parametrize("spec", ["", " , ", None])
+def test_empty_spec_means_no_pipeline(spec):
+    assert ProcessorPipeline.from_spec(spec) is None
+
+
+def test_unknown_processor_and_bad_arguments():
+    with pytest.raises(ValueError):
+        create_processor("rot13")
+    with pytest.raises(ValueError):
+        create_processor("crc32:sometimes")
+
+
+def test_tx_direction_processors_round_trip():
+    append16 = create_processor("crc16:append")
+    assert isinstance(append16, Crc16Processor)
+    framed = append16.process(b"123456789")
+    assert framed[-2:] == b"\x31\xc3"  # CRC-16/XMODEM check value
+    assert Crc16Processor().process(framed) == b"123456789"
+
+    deflate = create_processor("zlib:compress")
+    assert ZlibProcessor().process(deflate.process(b"payload")) == b"payload"
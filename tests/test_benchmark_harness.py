@@ -0,0 +1,47 @@
+"""Tests for the regression check of scripts/benchmark.py."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "benchmark.py"
+
+
+@pytest.fixture(scope="module")
+def benchmark():
+    spec = importlib.util.spec_from_file_location("benchmark_script", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module  # dataclasses resolve annotations through it
+    spec.loader.exec_module(module)
+    yield module
+    sys.modules.pop(spec.name, None)
+
+
+def test_regression_uses_per_metric_tolerance_and_slack(benchmark):
+    baseline = {
+        "metrics": {"theme_toggle_ms": 10.0, "console_flush_10k_cpu_ms_per_s": 100.0},
+        "tolerance": {"default": 0.25, "console_flush_10k_cpu_ms_per_s": 0.5},
+        "slack_ms": 2.0,
+    }
+    report = {"metrics": {"theme_toggle_ms": 14.6, "console_flush_10k_cpu_ms_per_s": 151.0, "new_ms": 1.0}}
+
+    rows = {row.metric: row for row in benchmark.compare(report, baseline)}
+
+    assert rows["theme_toggle_ms"].limit == pytest.approx(14.5)
+    assert rows["theme_toggle_ms"].regressed
+    assert rows["console_flush_10k_cpu_ms_per_s"].limit == pytest.approx(152.0)
+    assert not rows["console_flush_10k_cpu_ms_per_s"].regressed
+    assert rows["new_ms"].baseline is None and not rows["new_ms"].regressed  # no baseline yet
+    assert "REGRESSED" in benchmark.format_comparison(list(rows.values()))
+
+
+def test_stored_baseline_covers_every_scenario(benchmark):
+    baseline = json.loads(benchmark.DEFAULT_BASELINE.read_text(encoding="utf-8"))
+    assert set(baseline["scenarios"]) == set(benchmark.SCENARIOS)
+    assert all(benchmark._is_timing(metric) for metric in baseline["metrics"])
+    assert {"startup_first_paint_ms", "search_100k_ms", "export_8mb_ms"} <= set(baseline["metrics"])
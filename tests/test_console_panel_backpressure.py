@@ -9,7 +9,7 @@ from src.views.console_panel_view import ConsolePanelView
 
 
 @pytest.fixture
-def console_panel(qapp):
+def console_panel(qapp, isolated_config_dir):
     panel = ConsolePanelView(config={
         "batch_interval_ms": 10,
         "max_pending_chunks": 5,
@@ -28,7 +28,7 @@ def _drain_events(timeout_ms: int = 50):
 def test_back_pressure_drops_when_queue_exceeds(console_panel):
     port = "CPU1"
     for i in range(20):
-        console_panel.append_log(port, f"<span>{i}</span><br>", f"{i}\n")
+        console_panel.append_log(port, f"{i}\n")
     _drain_events(30)
     dropped = console_panel._dropped_updates.get(port, 0)
     assert dropped > 0
@@ -37,7 +37,7 @@ def test_back_pressure_drops_when_queue_exceeds(console_panel):
 
 def test_flush_timer_batches_updates(console_panel):
     port = "CPU1"
-    console_panel.append_log(port, "<span>A</span><br>", "A\n")
+    console_panel.append_log(port, "A\n")
     assert console_panel._update_timer.isActive()
     _drain_events(30)
     assert console_panel._pending_updates == {}
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import pytest
+
+from src.utils.log_store import LogDirection
+from src.views.console_panel_view import ConsolePanelView
+
+
+@pytest.fixture
+def console_panel(qapp, isolated_config_dir):
+    panel = ConsolePanelView(config={
+        "batch_interval_ms": 10,
+        "max_pending_chunks": 1000,
+        "back_pressure_threshold": 1.0,
+    })
+    panel._chk_time.setChecked(False)
+    yield panel
+    panel.clear_all()
+    panel.deleteLater()
+
+
+def test_binary_chunks_render_as_hexdump_with_running_offset(console_panel):
+    console_panel.append_rx_bytes("CPU1", b"ABCDEFGHIJKLMNOPQR", timestamp=100.0)
+    console_panel.append_rx_bytes("CPU1", b"\x00\xff", timestamp=101.0)
+
+    entries = list(console_panel._log_stores["CPU1"].entries())
+    assert [e.direction for e in entries] == [LogDirection.RX, LogDirection.RX]
+    assert [e.timestamp for e in entries] == [100.0, 101.0]
+    assert entries[0].text.splitlines()[1].startswith("00000010  51 52")
+    assert entries[1].text.startswith("00000012  00 ff")
+
+
+def test_large_chunk_is_split_into_bounded_entries(console_panel):
+    rows = ConsolePanelView.HEX_ROWS_PER_ENTRY
+    console_panel.append_rx_bytes("TLM", bytes(16 * rows * 2 + 1))
+    assert len(console_panel._log_stores["TLM"]) == 3
+
+
+def test_raw_bytes_reach_history_not_hex_text(console_panel):
+    payload = bytes(range(256))
+    console_panel.append_rx_bytes("CPU2", payload)
+    console_panel._flush_pending_updates()
+
+    assert "CPU2" not in console_panel._pending_history
+    raw = console_panel._raw_history_files["CPU2"].read_all_bytes()
+    assert payload in raw
+
+
+def test_frames_render_one_entry_each_from_offset_zero(console_panel):
+    console_panel.append_rx_frames("TLM", [b"\x01\x02", b"", b"abc"], timestamp=5.0)
+
+    texts = [e.text for e in console_panel._log_stores["TLM"].entries()]
+    assert len(texts) == 3
+    assert texts[0].startswith("00000000  01 02")
+    assert texts[2].startswith("00000000  61 62 63")
+    assert console_panel._pending_raw["TLM"] == [b"\x01\x02", b"", b"abc"]
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+from PySide6 import QtCore
+
+from src.views.console_panel_view import ConsolePanelView
+
+
+@pytest.fixture
+def console_panel(qapp, isolated_config_dir):
+    panel = ConsolePanelView(config={
+        "batch_interval_ms": 10,
+        "max_pending_chunks": 1000,
+        "back_pressure_threshold": 1.0,
+        "catch_up_page_lines": 20,
+    })
+    # Bare message text keeps document assertions independent of the clock
+    panel._chk_time.setChecked(False)
+    yield panel
+    panel.deleteLater()
+
+
+def _drain_events(timeout_ms: int = 50):
+    end = time.monotonic() + timeout_ms / 1000
+    while time.monotonic() < end:
+        QtCore.QCoreApplication.processEvents()
+
+
+def _tab_index_for(panel: ConsolePanelView, port_label: str) -> int:
+    return panel._tab_widget.indexOf(panel._view_pages[port_label])
+
+
+def test_hidden_tab_only_accumulates(console_panel):
+    console_panel._tab_widget.setCurrentIndex(0)  # combined tab
+    for i in range(5):
+        console_panel.append_log("TLM", f"tlm-{i}\n")
+    console_panel._flush_pending_updates()
+
+    tlm_edit = console_panel._view_edits["TLM"]
+    assert tlm_edit.document().isEmpty()
+    assert "TLM" in console_panel._stale_views
+    assert len(console_panel._log_stores["TLM"]) == 5
+
+
+def test_visible_tab_renders_each_batch_on_own_line(console_panel):
+    console_panel._tab_widget.setCurrentIndex(_tab_index_for(console_panel, "CPU1"))
+    console_panel.append_log("CPU1", "a\n")
+    console_panel._flush_pending_updates()
+    console_panel.append_log("CPU1", "b\n")
+    console_panel._flush_pending_updates()
+
+    assert console_panel._view_edits["CPU1"].toPlainText().splitlines() == ["a", "b"]
+    assert "CPU1" not in console_panel._stale_views
+
+
+def test_activation_renders_last_screenful_then_pages_in_rest(console_panel):
+    console_panel._tab_widget.setCurrentIndex(0)
+    for i in range(100):
+        console_panel.append_log("CPU2", f"line-{i}\n")
+    console_panel._flush_pending_updates()
+
+    console_panel._tab_widget.setCurrentIndex(_tab_index_for(console_panel, "CPU2"))
+    edit = console_panel._view_edits["CPU2"]
+    first_pass = edit.toPlainText().splitlines()
+    assert first_pass[-1] == "line-99"
+    assert len(first_pass) < 100
+
+    _drain_events(100)
+    assert edit.toPlainText().splitlines() == [f"line-{i}" for i in range(100)]
+    assert "CPU2" not in console_panel._stale_views
+
+
+def test_combined_view_catches_up_when_reactivated(console_panel):
+    console_panel._tab_widget.setCurrentIndex(_tab_index_for(console_panel, "TLM"))
+    console_panel.append_log("CPU1", "hidden\n")
+    console_panel._flush_pending_updates()
+    combined_edit = console_panel._view_edits["combined:CPU1"]
+    assert combined_edit.document().isEmpty()
+
+    console_panel._tab_widget.setCurrentIndex(0)
+    assert "hidden" in combined_edit.toPlainText()
+
+
+def test_search_renders_stale_views(console_panel):
+    console_panel._tab_widget.setCurrentIndex(0)
+    console_panel.append_log("TLM", "needle\n")
+    console_panel._search_text = "needle"
+    console_panel._perform_search()
+
+    assert "TLM" not in console_panel._stale_views
+    assert any(result[0] == "TLM" for result in console_panel._search_results)
+
+
+def test_search_matches_rendered_timestamp_and_source(console_panel):
+    console_panel._chk_time.setChecked(True)
+    console_panel._chk_source.setChecked(True)
+    console_panel._tab_widget.setCurrentIndex(_tab_index_for(console_panel, "CPU1"))
+    console_panel.append_rx("CPU1", "hello world")
+    console_panel._flush_pending_updates()
+    stamp = console_panel._view_edits["CPU1"].toPlainText().split("]")[0].lstrip("[")
+
+    for query in (stamp[:5], "RX(CPU1)", "): hello"):
+        console_panel._search_text = query
+        console_panel._perform_search()
+        assert any(result[0] == "CPU1" for result in console_panel._search_results), query
+
+    console_panel._search_text = "world"
+    console_panel._perform_search()
+    assert {result[0] for result in console_panel._search_results} <= {"CPU1", "COMBINED"}
+
+
+def test_suppressed_lines_reach_history_only(console_panel):
+    console_panel.append_rx("CPU1", "shown")
+    console_panel.record_suppressed("CPU1", "hidden")
+    console_panel._flush_pending_updates()
+
+    assert list(console_panel._log_stores["CPU1"].texts()) == ["shown"]
+    history = console_panel._history_files["CPU1"].read_all()
+    assert history.rstrip().endswith("shown\nhidden")
+
+
+def test_tab_switch_repolishes_only_the_two_changed_pages(console_panel):
+    from src.utils import get_style_refresher
+
+    refresher = get_style_refresher()
+    console_panel._tab_widget.setCurrentIndex(0)
+    refresher.flush()
+
+    console_panel._tab_widget.setCurrentIndex(_tab_index_for(console_panel, "CPU1"))
+    assert refresher.pending_count == 2
+    assert console_panel._view_pages["CPU1"].property("activeTab") == "true"
+    assert refresher.flush() == 2
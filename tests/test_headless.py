@@ -0,0 +1,154 @@
+"""Tests for the headless daemon entry point."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+import uuid
+
+import pytest
+from PySide6 import QtNetwork
+
+from src.bootstrap.headless import HeadlessDaemon, HeadlessPortSpec, parse_port_spec
+from src.main import main
+
+
+def _wait(qapp, predicate, timeout: float = 3.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        qapp.processEvents()
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+class TestPortSpec:
+    def test_parses_label_device_and_baud(self):
+        assert parse_port_spec("CPU1=/dev/ttyUSB0@921600") == HeadlessPortSpec("CPU1", "/dev/ttyUSB0", 921600)
+        assert parse_port_spec("TLM=COM7").baud_rate == 115200
+
+    @pytest.mark.parametrize("text", ["CPU1", "=COM1", "CPU1=", "CPU1=COM1@fast", "CPU1=COM1@0"])
+    def test_rejects_malformed_specs(self, text):
+        with pytest.raises(ValueError):
+            parse_port_spec(text)
+
+    def test_main_without_ports_exits_with_usage_error(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("src.bootstrap.headless.setup_logging", lambda **kwargs: None)
+        assert main(["--headless", "--socket", ""]) == 2
+
+
+def test_profile_command_drives_sampling_profiler(qapp, tmp_path):
+    daemon = HeadlessDaemon([], socket_name=None, history_dir=tmp_path, log_dir=tmp_path)
+    try:
+        assert daemon.handle_command({"cmd": "profile", "action": "start"})["running"] is True
+        assert _wait(qapp, lambda: daemon.handle_command({"cmd": "profile"})["stats"]["samples"] >= 3)
+        reply = daemon.handle_command({"cmd": "profile", "action": "export", "path": str(tmp_path / "p.folded")})
+        assert reply == {"ok": True, "path": str(tmp_path / "p.folded")}
+        assert "MainThread;" in (tmp_path / "p.folded").read_text(encoding="utf-8")
+        assert daemon.handle_command({"cmd": "profile", "action": "stop"})["running"] is False
+        assert daemon.handle_command({"cmd": "profile", "action": "flush"})["ok"] is False
+    finally:
+        daemon.handle_command({"cmd": "profile", "action": "stop"})
+
+
+def test_metrics_and_trace_commands(qapp, tmp_path):
+    from src.utils.metrics import metrics
+
+    daemon = HeadlessDaemon([], socket_name=None, history_dir=tmp_path, log_dir=tmp_path)
+    tracing = metrics.tracing
+    try:
+        assert daemon.handle_command({"cmd": "trace", "action": "start"}) == {"ok": True, "tracing": True}
+        with metrics.span("headless.test"):
+            pass
+        reply = daemon.handle_command({"cmd": "metrics"})
+        assert reply["metrics"]["histograms"]["headless.test"]["count"] >= 1
+        reply = daemon.handle_command({"cmd": "trace", "action": "export", "path": str(tmp_path / "t.json")})
+        assert reply == {"ok": True, "path": str(tmp_path / "t.json")}
+        assert daemon.handle_command({"cmd": "trace", "action": "pause"})["ok"] is False
+    finally:
+        metrics.set_tracing(tracing)
+
+
+@pytest.mark.skipif(not hasattr(os, "openpty"), reason="needs a pseudo terminal")
+class TestHeadlessDaemon:
+    @pytest.fixture(params=["thread", "asyncio"])
+    def pty_daemon(self, request, qapp, tmp_path):
+        master, slave = os.openpty()
+        socket_name = f"uart_ctrl_test_{uuid.uuid4().hex[:8]}"
+        daemon = HeadlessDaemon(
+            [HeadlessPortSpec("CPU1", os.ttyname(slave))],
+            socket_name=socket_name,
+            history_bytes=64 * 1024,
+            history_dir=tmp_path,
+            log_dir=tmp_path,
+            backend=request.param,
+        )
+        assert daemon.start()
+        port = daemon.ports["CPU1"]
+        assert _wait(qapp, lambda: port.is_connected)
+        yield daemon, master, tmp_path
+        daemon.stop()
+        os.close(master)
+        os.close(slave)
+
+    def test_rx_goes_to_history_and_rotating_log(self, qapp, pty_daemon):
+        daemon, master, tmp_path = pty_daemon
+        os.write(master, b"boot ok\r\nvoltage=3.3\r\n")
+        history = daemon.ports["CPU1"].history
+        assert _wait(qapp, lambda: b"voltage=3.3" in history.read_all_bytes())
+
+        reply = daemon.handle_command({"cmd": "tail", "port": "CPU1", "bytes": 12})
+        assert reply == {"ok": True, "data": "voltage=3.3\n"}
+        daemon.stop()
+        assert "boot ok" in (tmp_path / "rx_cpu1.log").read_text(encoding="utf-8")
+
+    def test_control_socket_round_trip(self, qapp, pty_daemon):
+        daemon, master, _ = pty_daemon
+        client = QtNetwork.QLocalSocket()
+        client.connectToServer(daemon.server_name)
+        assert client.waitForConnected(1000)
+
+        replies: list[dict] = []
+
+        def request(*commands: dict) -> None:
+            client.write(b"".join(json.dumps(c).encode() + b"\n" for c in commands))
+            client.flush()
+            expected = len(replies) + len(commands)
+            assert _wait(qapp, lambda: _read_replies(client, replies) >= expected)
+
+        request({"cmd": "ping"}, {"cmd": "ports"})
+        assert replies[0]["pid"] == os.getpid()
+        assert replies[1]["ports"][0]["label"] == "CPU1"
+        assert replies[1]["ports"][0]["connected"] is True
+
+        request({"cmd": "send", "port": "CPU1", "data": "reset"})
+        assert replies[-1] == {"ok": True}
+        received = bytearray()
+        assert _wait(qapp, lambda: received.extend(_read_available(master)) or b"reset\r\n" in received)
+
+        client.write(b"not json\n")
+        request({"cmd": "send", "port": "CPU9", "data": "x"})
+        assert replies[-2]["ok"] is False and "invalid JSON" in replies[-2]["error"]
+        assert replies[-1] == {"ok": False, "error": "unknown port 'CPU9'"}
+
+        request({"cmd": "quit"})
+        assert _wait(qapp, lambda: not daemon.ports["CPU1"].is_connected)
+        client.abort()
+
+
+def _read_replies(client: QtNetwork.QLocalSocket, replies: list[dict]) -> int:
+    while client.canReadLine():
+        replies.append(json.loads(bytes(client.readLine().data())))
+    return len(replies)
+
+
+def _read_available(fd: int) -> bytes:
+    import select
+
+    chunks = b""
+    while select.select([fd], [], [], 0)[0]:
+        chunks += os.read(fd, 4096)
+    return chunks
@@ -12,7 +12,7 @@ from collections import deque
 from unittest.mock import MagicMock, patch
 
 import pytest
-from PySide6 import QtCore
+from PySide6 import QtCore, QtGui
 
 from src.viewmodels.com_port_viewmodel import ComPortViewModel
 from src.models.serial_worker import SerialWorker
@@ -279,6 +279,55 @@ def test_concurrent_logging_performance(memory_tracking):
         pass
 
 
+@pytest.mark.perf
+def test_columnar_log_store_memory_per_line(memory_tracking):
+    """
+    Compare bytes per line of the columnar store against the previous layout
+    (panel HTML deque + viewmodel HTML/plain/lowercase deques).
+    """
+    import html as html_lib
+    from src.utils.log_store import ColumnarLogStore, LogDirection
+
+    lines = 10000
+
+    def make_line(i: int) -> str:
+        return f"T={i * 7 % 1000:04d} V={i * 13 % 997} status OK seq {i}"
+
+    def make_html(text: str) -> str:
+        return (
+            "<div style='white-space:pre-wrap; margin:0 0 0.25em 0'>"
+            "<span style='color:#808080'>[12:00:01]</span> "
+            f"<span style='color:#00aa00'>{html_lib.escape(text)}</span></div>"
+        )
+
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    panel_html = deque(maxlen=lines)
+    vm_html = deque(maxlen=lines)
+    vm_plain = deque(maxlen=lines)
+    vm_lower = deque(maxlen=lines)
+    for i in range(lines):
+        text = make_line(i)
+        panel_html.append(make_html(text))
+        vm_html.append(make_html(text))
+        vm_plain.append(text)
+        vm_lower.append(text.lower())
+    legacy_per_line = (tracemalloc.get_traced_memory()[0] - before) / lines
+    del panel_html, vm_html, vm_plain, vm_lower
+
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    store = ColumnarLogStore(lines)
+    for i in range(lines):
+        store.append(make_line(i), LogDirection.RX)
+    store_per_line = (tracemalloc.get_traced_memory()[0] - before) / lines
+
+    print(f"\n=== Log store memory ===")
+    print(f"Legacy: {legacy_per_line:.0f} B/line, columnar: {store_per_line:.0f} B/line")
+
+    assert legacy_per_line / store_per_line >= 3.0
+
+
 # CPU profiling helper (can be run with pytest --profile)
 @pytest.mark.perf
 def test_cpu_profiling():
@@ -318,3 +367,629 @@ def test_cpu_profiling():
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-m", "perf"])
+
+
+@pytest.mark.perf
+def test_hexdump_throughput_covers_921600_baud():
+    """Hexdump formatting must keep up with a saturated 921600 baud link (~92 KB/s)."""
+    from src.utils.hexdump import hexdump_rows
+
+    chunk = bytes(range(256)) * 16  # 4 KB read
+    chunks = 256  # 1 MB total
+    start = time.perf_counter()
+    rows = 0
+    for i in range(chunks):
+        rows += len(hexdump_rows(chunk, i * len(chunk)))
+    elapsed = time.perf_counter() - start
+
+    throughput = chunks * len(chunk) / elapsed
+    print(f"\nHexdump: {throughput / 1024:.0f} KB/s ({rows} rows in {elapsed * 1000:.1f} ms)")
+    assert rows == chunks * len(chunk) // 16
+    assert throughput > 92_160 * 5
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("spec", ["slip", "cobs", "u16le", "fixed_size:64", "delimiter:0a"])
+def test_frame_decoder_throughput(spec):
+    """Each frame decoder must sustain well above a saturated 921600 baud link."""
+    from src.plugins.framing import create_frame_decoder
+
+    payload = bytes((i * 37 + 11) % 256 for i in range(62))
+    if spec == "slip":
+        frame = payload.replace(b"\xdb", b"\xdb\xdd").replace(b"\xc0", b"\xdb\xdc") + b"\xc0"
+    elif spec == "cobs":
+        frame = b"".join(bytes([len(b) + 1]) + b for b in payload.split(b"\x00")) + b"\x00"
+    elif spec == "u16le":
+        frame = len(payload).to_bytes(2, "little") + payload
+    elif spec == "delimiter:0a":
+        frame = payload.replace(b"\n", b"") + b"\n"
+    else:
+        frame = payload + b"\x00\x00"
+    stream = frame * 16384  # ~1 MB
+    reads = [stream[i:i + 4096] for i in range(0, len(stream), 4096)]
+
+    decoder = create_frame_decoder(spec)
+    start = time.perf_counter()
+    count = sum(len(decoder.feed(chunk)) for chunk in reads)
+    elapsed = time.perf_counter() - start
+
+    throughput = len(stream) / elapsed
+    print(f"\n{spec}: {throughput / 1e6:.1f} MB/s, {count / elapsed:,.0f} frames/s")
+    assert count >= 16383
+    assert decoder.dropped == 0
+    assert throughput > 92_160 * 5
+
+
+@pytest.mark.perf
+def test_pipeline_batch_overhead():
+    """Running a chain over a batch must cost far less than one call per chunk through Qt."""
+    import zlib
+
+    from src.plugins.pipeline import ProcessorPipeline
+
+    payload = b"T=0123 V=4567 status OK " * 4
+    framed = payload + zlib.crc32(payload).to_bytes(4, "little")
+    batch = [framed] * 64
+    pipeline = ProcessorPipeline.from_spec("crc32, crc16:append, crc16")
+
+    iterations = 500
+    start = time.perf_counter()
+    for _ in range(iterations):
+        out = pipeline.run(batch)
+    elapsed = time.perf_counter() - start
+
+    per_chunk_us = elapsed / (iterations * len(batch)) * 1e6
+    print(f"\nPipeline: {per_chunk_us:.2f} us/chunk over 3 stages")
+    for stage in pipeline.stats():
+        print(f"  {stage['name']}: avg {stage['avg_batch_us']:.1f} us/batch")
+    assert out == [payload] * 64
+    assert per_chunk_us < 20
+
+
+@pytest.mark.perf
+def test_telemetry_decode_throughput():
+    """Batch decoding must offer millions of samples per second of headroom."""
+    np = pytest.importorskip("numpy")
+    import struct
+
+    from src.utils.telemetry_decoder import TelemetryDecoder, TelemetryRing
+    from src.utils.telemetry_schema import TelemetrySchemaModel
+
+    schema = TelemetrySchemaModel.model_validate({
+        "id": "bench",
+        "port": "TLM",
+        "fields": [
+            {"name": "seq", "type": "u16"},
+            {"name": "uptime", "type": "u32"},
+            {"name": "a", "type": "f32"},
+            {"name": "b", "type": "f32"},
+            {"name": "c", "type": "i16"},
+        ],
+    })
+    decoder = TelemetryDecoder(schema)
+    ring = TelemetryRing(decoder.dtype, 100_000)
+    frames = [struct.pack("<HIffh", i, i * 10, 1.5, -2.5, i % 100) for i in range(1024)]
+
+    batches = 200
+    start = time.perf_counter()
+    for i in range(batches):
+        ring.append(decoder.decode(frames), float(i))
+    elapsed = time.perf_counter() - start
+
+    rate = batches * len(frames) / elapsed
+    print(f"\nTelemetry decode: {rate / 1e6:.2f} M samples/s")
+    assert ring.total == batches * len(frames)
+    assert rate > 1_000_000
+
+
+@pytest.mark.perf
+def test_telemetry_plot_frame_time_at_10khz(qapp):
+    """A 10 s window of 10 kHz data (100k samples, 2 channels) must render within a 60 fps frame."""
+    np = pytest.importorskip("numpy")
+    from src.utils.telemetry_decoder import TelemetryRing
+    from src.utils.telemetry_hub import TelemetryHub, TelemetrySource
+    from src.viewmodels.telemetry_plot_viewmodel import TelemetryPlotViewModel
+    from src.views.widgets.telemetry_plot_widget import TelemetryPlotWidget
+
+    dtype = np.dtype([("a", "<f4"), ("b", "<f4")])
+    ring = TelemetryRing(dtype, 200_000)
+    samples = np.zeros(100_000, dtype=dtype)
+    samples["a"] = np.sin(np.arange(100_000) / 100.0)
+    samples["b"] = np.random.default_rng(1).normal(size=100_000)
+    for chunk in range(100):
+        ring.append(samples[chunk * 1000:(chunk + 1) * 1000], chunk * 0.1)
+
+    hub = TelemetryHub()
+    hub.register_source(TelemetrySource("TLM", ring))
+    vm = TelemetryPlotViewModel(hub=hub, window_seconds=10.0)
+    vm.set_channel_selected("b", True)
+    widget = TelemetryPlotWidget(vm)
+    widget.resize(1280, 300)
+    canvas = widget.canvas
+    canvas.resize(1280, 260)
+    image = QtGui.QImage(canvas.size(), QtGui.QImage.Format_ARGB32_Premultiplied)
+
+    frames = 30
+    start = time.perf_counter()
+    for _ in range(frames):
+        canvas.render(image)
+    frame_ms = (time.perf_counter() - start) / frames * 1000
+
+    print(f"\nTelemetry plot: {frame_ms:.2f} ms/frame (100k samples x 2 channels, 1280 px)")
+    assert frame_ms < 16.7
+    widget.deleteLater()
+
+
+@pytest.mark.perf
+def test_port_stats_update_cost():
+    """Per-read stats accounting must stay in the low microseconds at high line rates."""
+    from src.utils.port_stats import PortStats
+
+    stats = PortStats()
+    lengths = [40] * 8
+    reads = 100_000
+    start = time.perf_counter()
+    for _ in range(reads):
+        stats.record_rx(328, lengths)
+    elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(100):
+        snapshot = stats.snapshot()
+    snapshot_us = (time.perf_counter() - start) / 100 * 1e6
+
+    per_read_us = elapsed / reads * 1e6
+    print(f"\nPort stats: {per_read_us:.2f} us/read (8 lines), snapshot {snapshot_us:.0f} us")
+    assert snapshot.total_lines == reads * len(lengths)
+    assert per_read_us < 10
+    assert snapshot_us < 2000
+
+
+@pytest.mark.perf
+def test_counter_signal_coalescing_under_load(qapp):
+    """A 10k lines/s stream must refresh counter labels at most once per coalescing tick."""
+    from PySide6 import QtWidgets
+
+    vm = ComPortViewModel("CPU1", 1)
+    label = QtWidgets.QLabel()
+    updates = []
+
+    def on_counter(rx_count, tx_count):
+        updates.append(rx_count)
+        label.setText(f"RX: {rx_count}")
+
+    vm.counter_updated.connect(on_counter)
+    interval_s = vm._counter_coalescer.interval_ms / 1000
+    lines = 5000
+    start = time.perf_counter()
+    for i in range(lines):
+        vm._on_data_received("CPU1", "value=42\n")
+        if i % 10 == 0:  # one event-loop turn per 10 lines (1 ms at 10k lines/s)
+            deadline = start + (i + 10) / 10_000
+            while time.perf_counter() < deadline:
+                qapp.processEvents()
+    vm._counter_coalescer.flush()
+    elapsed = time.perf_counter() - start
+
+    print(f"\nCounter updates: {len(updates)} for {lines} lines in {elapsed:.2f}s")
+    assert updates[-1] == lines
+    assert len(updates) <= elapsed / interval_s + 2
+    vm.shutdown()
+
+
+@pytest.mark.perf
+def test_session_record_and_replay_throughput(tmp_path):
+    """Recording must not slow the read loop; max-speed replay must outrun real time by far."""
+    from src.models.replay_worker import ReplayWorker
+    from src.utils.session_recording import SessionRecorder
+
+    path = tmp_path / "bench.uartrec"
+    chunk = b"".join(f"T={i:05d} V=3.30 I=0.12\r\n".encode() for i in range(8))
+    chunks = 20_000
+    start = time.perf_counter()
+    with SessionRecorder(path) as recorder:
+        for _ in range(chunks):
+            recorder.record_rx("CPU1", chunk)
+    record_us = (time.perf_counter() - start) / chunks * 1e6
+
+    worker = ReplayWorker("CPU1", {"session": str(path), "replay_speed": ReplayWorker.SPEED_MAX})
+    lines = []
+    worker.rx.connect(lambda label, data: lines.append(data))
+    start = time.perf_counter()
+    worker.run()
+    replay_s = time.perf_counter() - start
+
+    print(f"\nSession record: {record_us:.2f} us/chunk; replay of {len(lines)} lines in {replay_s:.2f}s")
+    assert len(lines) == chunks * 8
+    assert record_us < 20
+    assert replay_s < 10
+
+
+@pytest.mark.perf
+@pytest.mark.skipif(not os.path.exists("/proc/self/status"), reason="reads VmHWM from procfs")
+def test_headless_startup_time_and_memory(tmp_path):
+    """The headless daemon must start well under a second and use a fraction of the GUI's RAM."""
+    import json
+    import subprocess
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    # The GUI probe writes console history into the config dir
+    env = {**os.environ, "PYTHONPATH": root, "QT_QPA_PLATFORM": "offscreen", "UART_CTRL_CONFIG_DIR": str(tmp_path)}
+    probe = (
+        "import json, re, sys, time\n"
+        "t = time.perf_counter()\n"
+        "{body}\n"
+        "elapsed = time.perf_counter() - t\n"
+        "{teardown}\n"
+        "hwm = int(re.search(r'VmHWM:\\s+(\\d+)', open('/proc/self/status').read()).group(1))\n"
+        "print(json.dumps({{'elapsed': elapsed, 'rss_kb': hwm,"
+        " 'widgets': 'PySide6.QtWidgets' in sys.modules}}))\n"
+    )
+    headless = (
+        "from PySide6 import QtCore\n"
+        "from src.bootstrap.headless import HeadlessDaemon, HeadlessPortSpec\n"
+        "app = QtCore.QCoreApplication([])\n"
+        f"d = HeadlessDaemon([HeadlessPortSpec('CPU1', '/nonexistent')], socket_name=None,"
+        f" history_bytes=1 << 20, history_dir=__import__('pathlib').Path({str(tmp_path)!r}),"
+        f" log_dir=__import__('pathlib').Path({str(tmp_path)!r}))\n"
+        "d.start(); app.processEvents()"
+    )
+    gui = (
+        "from PySide6 import QtWidgets\n"
+        "app = QtWidgets.QApplication([])\n"
+        "from src.views.main_window import MainWindow\n"
+        "w = MainWindow(); w.show(); app.processEvents()"
+    )
+
+    def measure(body: str, teardown: str = "") -> dict:
+        out = subprocess.run([sys.executable, "-c", probe.format(body=body, teardown=teardown)], capture_output=True,
+                             text=True, cwd=root, env=env, timeout=120)
+        assert out.returncode == 0, out.stderr[-2000:]
+        return json.loads(out.stdout.strip().splitlines()[-1])
+
+    daemon = measure(headless, "d.stop()")
+    window = measure(gui)
+    print(f"\nHeadless start {daemon['elapsed'] * 1000:.0f} ms, {daemon['rss_kb'] / 1024:.0f} MB; "
+          f"GUI {window['elapsed'] * 1000:.0f} ms, {window['rss_kb'] / 1024:.0f} MB")
+    assert not daemon["widgets"]
+    assert daemon["elapsed"] < 1.0
+    assert daemon["rss_kb"] < window["rss_kb"] * 0.6
+
+
+@pytest.mark.perf
+@pytest.mark.skipif(not hasattr(os, "openpty"), reason="needs pseudo terminals")
+def test_asyncio_backend_scales_without_thread_per_port(qapp):
+    """32 ports on the asyncio backend: one loop thread, batched Qt delivery, full throughput."""
+    import threading
+
+    from src.models.async_serial_backend import AsyncSerialWorker, SerialEventLoop
+
+    ports, lines_per_port = 32, 500
+    event_loop = SerialEventLoop()
+    pairs = [os.openpty() for _ in range(ports)]
+    baseline_threads = threading.active_count()
+    workers, received = [], [0]
+
+    def on_rx(label, data):
+        received[0] += 1
+
+    try:
+        for index, (_, slave) in enumerate(pairs):
+            worker = AsyncSerialWorker(f"P{index}", {"event_loop": event_loop})
+            worker.configure(os.ttyname(slave), 921600)
+            worker.rx.connect(on_rx)
+            worker.start()
+            workers.append(worker)
+        deadline = time.monotonic() + 5
+        while not all(w.is_connected for w in workers) and time.monotonic() < deadline:
+            qapp.processEvents()
+        time.sleep(0.2)  # let the executor threads used for opening idle out of the measurement
+        steady_threads = threading.active_count() - baseline_threads
+
+        payload = b"".join(f"T={i:05d} V=3.30\n".encode() for i in range(lines_per_port))
+        start = time.perf_counter()
+        for master, _ in pairs:
+            os.write(master, payload)
+        deadline = time.monotonic() + 10
+        while received[0] < ports * lines_per_port and time.monotonic() < deadline:
+            qapp.processEvents()
+        elapsed = time.perf_counter() - start
+    finally:
+        for worker in workers:
+            worker.stop()
+        for master, slave in pairs:
+            os.close(master)
+            os.close(slave)
+        event_loop.shutdown()
+
+    total = ports * lines_per_port
+    print(f"\nasyncio backend: {ports} ports, {total} lines in {elapsed * 1000:.0f} ms, "
+          f"{event_loop.delivered} events in {event_loop.batches} Qt batches, +{steady_threads} threads")
+    assert received[0] == total
+    assert event_loop.batches < event_loop.delivered / 20
+    assert steady_threads < ports / 2
+
+
+@pytest.mark.perf
+@pytest.mark.skipif(not hasattr(os, "openpty"), reason="needs pseudo terminals")
+def test_sixteen_ports_at_115200(qapp, tmp_path, monkeypatch):
+    """16 concurrent ports at 115200 baud: flat per-port creation cost, no lost lines."""
+    from src.utils.mmap_log_history import create_history_for_port
+    from src.views import console_panel_view
+    from src.views.console_panel_view import ConsolePanelView
+
+    monkeypatch.setattr(
+        console_panel_view,
+        "create_history_for_port",
+        lambda label, capacity: create_history_for_port(label, capacity, tmp_path),
+    )
+    history_bytes = 1024 * 1024
+
+    def build_console(count):
+        start = time.perf_counter()
+        view = ConsolePanelView(config={
+            "port_labels": [f"UART{n}" for n in range(1, count + 1)],
+            "history_capacity_bytes": history_bytes,
+        })
+        return view, (time.perf_counter() - start) / count
+
+    build_console(1)[0].deleteLater()  # fonts, icons and styles load once
+    small, per_port_4 = build_console(4)
+    small.deleteLater()
+    console, per_port_16 = build_console(16)
+
+    ports, seconds, baud = 16, 1.0, 115200
+    labels = [f"UART{n}" for n in range(1, ports + 1)]
+    pairs = [os.openpty() for _ in range(ports)]
+    received = [0]
+    viewmodels = []
+    creation = []
+
+    def make_handler(label):
+        def handler(data):
+            received[0] += 1
+            console.append_rx(label, data)
+        return handler
+
+    try:
+        for number, ((_, slave), label) in enumerate(zip(pairs, labels), start=1):
+            start = time.perf_counter()
+            vm = ComPortViewModel(port_label=label, port_number=number)
+            vm.set_port_name(os.ttyname(slave))
+            vm.set_baud_rate(baud)
+            vm.data_received.connect(make_handler(label))
+            creation.append(time.perf_counter() - start)
+            assert vm.connect()
+            viewmodels.append(vm)
+        deadline = time.monotonic() + 5
+        while not all(vm.is_connected for vm in viewmodels) and time.monotonic() < deadline:
+            qapp.processEvents()
+        assert all(vm.is_connected for vm in viewmodels)
+
+        # 10 bits per byte on the wire: pace each port at its real line rate
+        line = b"T=00000 V=3.30 I=0.1\n"
+        lines_per_tick = int(baud / 10 / len(line) / 10)
+        ticks = int(seconds * 10)
+        start = time.perf_counter()
+        for tick in range(ticks):
+            for master, _ in pairs:
+                os.write(master, line * lines_per_tick)
+            next_tick = start + (tick + 1) * 0.1
+            while time.perf_counter() < next_tick:
+                qapp.processEvents()
+        expected = ports * ticks * lines_per_tick
+        deadline = time.monotonic() + 5
+        while received[0] < expected and time.monotonic() < deadline:
+            qapp.processEvents()
+        elapsed = time.perf_counter() - start
+        console._flush_pending_updates()
+        stored = sum(console.get_log_count(label) for label in labels)
+    finally:
+        for vm in viewmodels:
+            vm.shutdown()
+        for master, slave in pairs:
+            os.close(master)
+            os.close(slave)
+        console.deleteLater()
+
+    first, last = sum(creation[:4]) / 4, sum(creation[-4:]) / 4
+    print(f"\n16 ports @ {baud}: {received[0]} lines in {elapsed:.2f} s "
+          f"(wire time {seconds:.1f} s); console {per_port_4 * 1000:.1f} -> {per_port_16 * 1000:.1f} ms/port, "
+          f"view model {first * 1000:.2f} -> {last * 1000:.2f} ms/port")
+    assert received[0] == expected
+    assert stored == expected
+    assert elapsed < seconds * 2
+    # Flat creation cost: the 16th port costs about as much as the 1st
+    assert per_port_16 < per_port_4 * 2 + 0.005
+    assert last < first * 3 + 0.002
+
+
+# Cold-start import budget for `import src.bootstrap.app_bootstrap` (ms, cumulative)
+COLD_IMPORT_BUDGET_MS = 300
+# Modules the bootstrap must not load before the splash is up
+COLD_IMPORT_DEFERRED = (
+    "src.views.main_window",
+    "src.views.command_history_dialog",
+    "src.views.quick_block_editor_dialog",
+    "src.views.widget_host_window",
+    "src.views.stopwatch_window",
+    "src.utils.log_exporter",
+    "pydantic",
+    "yaml",
+    "numpy",
+)
+
+
+def _bootstrap_import_times() -> dict[str, int]:
+    """Cumulative `-X importtime` microseconds per module for a fresh bootstrap import."""
+    import subprocess
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = {**os.environ, "PYTHONPATH": root, "QT_QPA_PLATFORM": "offscreen"}
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.bootstrap.app_bootstrap"],
+        capture_output=True, text=True, cwd=root, env=env, timeout=120,
+    )
+    assert out.returncode == 0, out.stderr[-2000:]
+
+    cumulative_us: dict[str, int] = {}
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line.split(":", 1)[1].split("|"))
+        if cumulative.isdigit():
+            cumulative_us[name] = int(cumulative)
+    return cumulative_us
+
+
+@pytest.mark.perf
+def test_bootstrap_defers_heavy_imports():
+    """Importing the bootstrap leaves the main window, dialogs and heavy libraries for later."""
+    cumulative_us = _bootstrap_import_times()
+    loaded = sorted(name for name in COLD_IMPORT_DEFERRED if name in cumulative_us)
+    assert not loaded, f"imported eagerly: {loaded}"
+
+
+@pytest.mark.perf
+@pytest.mark.skipif(
+    not os.environ.get("UART_CTRL_TIMING_TESTS"),
+    reason="wall-clock import budget depends on the host; set UART_CTRL_TIMING_TESTS=1",
+)
+def test_bootstrap_cold_import_budget():
+    """`-X importtime` of the bootstrap stays within budget."""
+    cumulative_us = _bootstrap_import_times()
+    total_ms = cumulative_us["src.bootstrap.app_bootstrap"] / 1000
+    slowest = sorted(
+        ((us, name) for name, us in cumulative_us.items() if name.startswith("src.")), reverse=True
+    )[:5]
+    print(f"\nCold import of app_bootstrap: {total_ms:.0f} ms; slowest: "
+          + ", ".join(f"{name} {us / 1000:.0f} ms" for us, name in slowest))
+    assert total_ms < COLD_IMPORT_BUDGET_MS
+
+
+# Median light<->dark toggle with the main window and every secondary window open (ms)
+THEME_TOGGLE_BUDGET_MS = 150
+
+
+@pytest.mark.perf
+def test_theme_toggle_latency_with_all_panels_open(qapp, isolated_config_dir):
+    """A theme toggle repolishes only changed widgets, in one pass, without pumping events."""
+    from src.utils import get_style_refresher
+    from src.utils.theme_manager import theme_manager
+    from src.views.main_window import MainWindow
+
+    window = MainWindow()
+    window.show()
+    window._toggle_widget_host_window()
+    window._toggle_stopwatch_window()
+    window._open_history_dialog()
+    refresher = get_style_refresher()
+    passes: list[int] = []
+    refresher.flushed.connect(lambda count, _ms: passes.append(count))
+    original_theme = theme_manager.get_theme()
+    pumped: list[int] = []
+    original_process_events = QtCore.QCoreApplication.processEvents
+
+    def toggle(theme: str) -> float:
+        start = time.perf_counter()
+        theme_manager.set_theme(theme)
+        refresher.flush()
+        original_process_events()  # the repaint the toggle triggers
+        return (time.perf_counter() - start) * 1000
+
+    try:
+        toggle("light")
+        toggle("dark")  # warm caches for both themes
+        QtCore.QCoreApplication.processEvents = staticmethod(lambda *a: pumped.append(1))
+        passes.clear()
+        timings = [toggle(theme) for theme in ("light", "dark") * 5]
+        QtCore.QCoreApplication.processEvents = original_process_events
+        repeat_passes = len(passes)
+        toggle("dark")  # same theme again: nothing to repolish
+        timings.sort()
+        median = timings[len(timings) // 2]
+        print(f"\nTheme toggle: median {median:.1f} ms, max {timings[-1]:.1f} ms, "
+              f"{sum(passes[:repeat_passes]) / max(repeat_passes, 1):.0f} widgets/pass")
+        assert not pumped
+        assert repeat_passes == 10
+        assert len(passes) == repeat_passes  # the redundant toggle queued nothing
+        assert median < THEME_TOGGLE_BUDGET_MS
+    finally:
+        QtCore.QCoreApplication.processEvents = original_process_events
+        theme_manager.set_theme(original_theme)
+        refresher.flush()
+        for viewmodel in window._port_viewmodels.values():
+            viewmodel.shutdown()
+        for child in (window._widget_host_window, window._stopwatch_window, window._history_dialog):
+            child.close()
+        window.close()
+        window.deleteLater()
+
+
+SAMPLING_OVERHEAD_BUDGET = 0.02  # sampler CPU time / wall time at 100 Hz
+
+
+@pytest.mark.perf
+def test_sampling_profiler_overhead_at_100_hz(qapp):
+    """The always-on sampler must stay well under 2% CPU with busy worker threads."""
+    import threading
+
+    from src.utils.sampling_profiler import SamplingProfiler
+
+    stop = threading.Event()
+
+    def worker(depth: int) -> None:
+        if depth:
+            worker(depth - 1)
+            return
+        while not stop.is_set():
+            sum(range(500))
+            time.sleep(0.0005)
+
+    threads = [threading.Thread(target=worker, args=(30,), daemon=True) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    profiler = SamplingProfiler(hz=100)
+    try:
+        profiler.start()
+        time.sleep(1.5)
+        profiler.stop()
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    stats = profiler.stats()
+    print(f"\nSampling profiler: {stats.samples} samples, {stats.stacks} stacks, "
+          f"{stats.overhead * 100:.2f}% CPU, {stats.cpu_s / max(stats.samples, 1) * 1e6:.0f} us/sample")
+    assert stats.samples >= 100
+    assert stats.overhead < SAMPLING_OVERHEAD_BUDGET
+
+
+SPAN_RECORD_BUDGET_NS = 2000  # per recorded span, tracing on
+
+
+@pytest.mark.perf
+def test_metrics_span_cost_on_rx_hot_path():
+    """Every RX line records two spans (emit, viewmodel); keep each well under the line budget."""
+    import threading
+
+    from src.utils.metrics import MetricsRegistry
+
+    registry = MetricsRegistry(tracing=True)
+    histogram = registry.histogram("serial.emit")
+    rounds = 50_000
+
+    def run() -> float:
+        start = time.perf_counter_ns()
+        for _ in range(rounds):
+            histogram.record_since(time.perf_counter_ns())
+        return (time.perf_counter_ns() - start) / rounds
+
+    per_span = min(run() for _ in range(3))
+    worker = threading.Thread(target=run)
+    worker.start()
+    worker.join()
+    print(f"\nMetrics span: {per_span:.0f} ns per record_since (tracing on)")
+    assert registry.snapshot().histograms["serial.emit"].count == rounds * 4
+    assert per_span < SPAN_RECORD_BUDGET_NS
@@ -25,3 +25,28 @@ def test_toolbar_labels_update_on_resize(panel, qtbot):
     assert panel._btn_add.text()
 
 
+
+
+def _port_items(dialog):
+    combo = dialog._port_combo
+    return [combo.itemData(i) for i in range(combo.count())]
+
+
+def test_editor_ports_follow_config(qtbot, monkeypatch):
+    from src.utils.config_loader import config_loader
+    from src.utils.quick_blocks_repository import QuickBlock
+    from src.views.quick_block_editor_dialog import QuickBlockEditorDialog
+
+    monkeypatch.setattr(config_loader, "get_port_labels", lambda: [(1, "UART1"), (5, "GPS")])
+    block = QuickBlock(id="b", title="t", command_on="on", port="cpu1")
+    dialog = QuickBlockEditorDialog(groups=[], block=block)
+    qtbot.addWidget(dialog)
+    assert _port_items(dialog) == ["uart1", "gps", "combo"]
+    # A block routed to a port that is no longer configured lands on the first one
+    assert dialog.result_block().port == "uart1"
+
+    monkeypatch.setattr(config_loader, "get_port_labels", lambda: [(3, "GPS")])
+    dialog = QuickBlockEditorDialog(groups=[])
+    qtbot.addWidget(dialog)
+    assert _port_items(dialog) == ["gps"]
+    assert not dialog._send_combo_chk.isChecked()
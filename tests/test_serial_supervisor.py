@@ -55,6 +55,10 @@ class DummyWorker(QtCore.QObject):
     def wait(self, _: int) -> None:
         return None
 
+    @property
+    def restartable(self) -> bool:
+        return not self.fatal_error
+
     def emit_heartbeat(self, timestamp: float | None = None) -> None:
         self.heartbeat.emit(self._port_label, timestamp or time.monotonic())
 
@@ -0,0 +1,125 @@
+"""Tests for the staged startup loader and the splash controller driving it."""
+
+import json
+
+import pytest
+
+from src.bootstrap.staged_loader import StagedLoader
+
+
+def _chunked(log, name, count):
+    def work():
+        for index in range(count):
+            log.append(f"{name}{index}")
+            yield index
+    return work
+
+
+def test_stages_run_in_order_one_chunk_per_step(qapp):
+    log = []
+    loader = StagedLoader()
+    loader.add_stage("a", "A", lambda: log.append("a"))
+    loader.add_stage("b", "B", _chunked(log, "b", 3))
+    loader.add_stage("c", "C", lambda: log.append("c"))
+    progress = []
+    loader.progress.connect(lambda percent, message: progress.append((percent, message)))
+
+    assert loader.step()
+    assert log == ["a"]
+    assert loader.step()
+    assert log == ["a", "b0"]
+    while loader.step():
+        pass
+
+    assert log == ["a", "b0", "b1", "b2", "c"]
+    assert set(loader.timings) == {"a", "b", "c"}
+    assert loader.is_finished and loader.percent == 100
+    percents = [percent for percent, _ in progress]
+    assert percents == sorted(percents)
+    assert progress[1][1] == "B"
+    assert not loader.step()
+
+
+def test_progress_is_weighted_by_previous_run(qapp, tmp_path):
+    profile = tmp_path / "startup_profile.json"
+    profile.write_text(json.dumps({"cheap": 0.01, "costly": 0.09}))
+    loader = StagedLoader(profile)
+    loader.add_stage("cheap", "", lambda: None)
+    loader.add_stage("costly", "", lambda: None)
+
+    loader.step()
+    assert loader.percent == 10
+    while loader.step():
+        pass
+
+    saved = json.loads(profile.read_text())
+    assert set(saved) == {"cheap", "costly"}
+    assert all(value < 0.09 for value in saved.values())
+
+
+def test_unreadable_profile_falls_back_to_equal_weights(qapp, tmp_path):
+    profile = tmp_path / "startup_profile.json"
+    profile.write_text("not json")
+    loader = StagedLoader(profile)
+    loader.add_stage("a", "", lambda: None)
+    loader.add_stage("b", "", lambda: None)
+    loader.step()
+    assert loader.percent == 50
+
+
+def test_failing_stage_stops_loading_and_reports_error(qapp, tmp_path):
+    log = []
+    profile = tmp_path / "startup_profile.json"
+    loader = StagedLoader(profile)
+    loader.add_stage("a", "A", lambda: log.append("a"))
+    loader.add_stage("broken", "B", lambda: 1 / 0)
+    loader.add_stage("c", "C", lambda: log.append("c"))
+    failures, finished = [], []
+    loader.failed.connect(lambda stage, error: failures.append((stage, error)))
+    loader.finished.connect(lambda: finished.append(True))
+
+    assert loader.step()
+    assert not loader.step()
+
+    assert failures == [("broken", "division by zero")]
+    assert loader.error == "division by zero"
+    assert loader.is_finished and not finished
+    assert not loader.step()
+    assert log == ["a"]
+    assert not profile.exists()
+
+
+def test_splash_closes_as_soon_as_loading_finishes(qapp, qtbot):
+    from src.views.splash_screen import ModernSplashScreen, SplashController
+
+    log = []
+    loader = StagedLoader()
+    loader.add_stage("work", "Working", _chunked(log, "w", 5))
+    splash = ModernSplashScreen()
+    qtbot.addWidget(splash)
+    controller = SplashController(splash, loader)
+
+    with qtbot.waitSignal(controller.finished, timeout=2000):
+        controller.start()
+
+    assert log == [f"w{index}" for index in range(5)]
+    assert controller.is_finished()
+    assert splash.progress.value() == 100
+
+
+@pytest.mark.usefixtures("qapp", "isolated_config_dir")
+def test_main_window_builds_in_chunks():
+    from src.views.main_window import MainWindow
+
+    window = MainWindow(staged=True)
+    assert window._console_panel is None
+    try:
+        stages = list(window.build_stages())
+        assert stages[0] == "window" and stages[-1] == "status_bar"
+        assert {"console", "ports", "side_panel"} <= set(stages)
+        assert window._console_panel is not None
+        assert list(window.build_stages()) == []
+    finally:
+        for viewmodel in window._port_viewmodels.values():
+            viewmodel.shutdown()
+        window.deleteLater()
@@ -43,3 +43,20 @@ def test_stopwatch_modules_exist():
     assert hasattr(stopwatch_viewmodel, 'StopwatchViewModel')
     assert hasattr(stopwatch_widget, 'StopwatchWidget')
     assert hasattr(stopwatch_window, 'StopwatchWindow')
+
+
+def test_packages_export_names_lazily():
+    import src.views
+    import src.viewmodels
+    from src.views.main_window import MainWindow
+    from src.viewmodels.factory import ViewModelFactory
+
+    assert 'MainWindow' in dir(src.views)
+    assert src.views.MainWindow is MainWindow
+    assert src.viewmodels.ViewModelFactory is ViewModelFactory
+    try:
+        src.views.NoSuchView
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("unknown names must raise AttributeError")
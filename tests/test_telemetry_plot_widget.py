@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import struct
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from PySide6 import QtGui  # noqa: E402
+
+from src.utils.telemetry_decoder import TelemetryDecoder, TelemetryRing  # noqa: E402
+from src.utils.telemetry_hub import TelemetryHub, TelemetrySource  # noqa: E402
+from src.utils.telemetry_schema import TelemetrySchemaModel  # noqa: E402
+from src.viewmodels.telemetry_plot_viewmodel import TelemetryPlotViewModel  # noqa: E402
+from src.viewmodels.widget_modules import MODULE_ADAPTERS  # noqa: E402
+from src.views.widgets.telemetry_plot_widget import TelemetryPlotWidget  # noqa: E402
+
+
+@pytest.fixture
+def telemetry():
+    schema = TelemetrySchemaModel.model_validate({
+        "id": "t",
+        "port": "TLM",
+        "fields": [{"name": "a", "type": "f32", "unit": "V"}, {"name": "b", "type": "i16"}],
+    })
+    decoder = TelemetryDecoder(schema)
+    ring = TelemetryRing(decoder.dtype, 10_000)
+    hub = TelemetryHub()
+    hub.register_source(TelemetrySource("TLM", ring, schema.units))
+    return hub, decoder, ring
+
+
+def _feed(decoder, ring, start: int, count: int, rate: float = 1000.0):
+    for i in range(start, start + count, 100):
+        frames = [struct.pack("<fh", np.sin(j / 50), j % 7) for j in range(i, i + 100)]
+        ring.append(decoder.decode(frames), (i + 100) / rate)
+
+
+def test_viewmodel_tracks_sources_and_decimates_window(qapp, telemetry):
+    hub, decoder, ring = telemetry
+    vm = TelemetryPlotViewModel(hub=hub, window_seconds=1.0)
+    assert vm.source_label == "TLM"
+    assert vm.selected_channels == ["a"]
+
+    _feed(decoder, ring, 0, 5000)
+    vm.set_channel_selected("b", True)
+    series = vm.series(200)
+    assert [s.name for s in series] == ["a", "b"]
+    assert series[0].unit == "V"
+    assert len(series[0].mins) == 200
+    assert float(series[1].maxs.max()) == 6.0
+
+    hub.unregister_source("TLM")
+    assert vm.source_label is None
+    assert vm.series(200) == []
+
+
+def test_widget_repaints_only_on_new_samples(qapp, telemetry):
+    hub, decoder, ring = telemetry
+    widget = TelemetryPlotWidget(TelemetryPlotViewModel(hub=hub))
+    widget.resize(400, 200)
+    _feed(decoder, ring, 0, 1000)
+
+    image = widget.canvas.grab().toImage()
+    background = widget.canvas.palette().color(QtGui.QPalette.Base).rgb()
+    painted = sum(
+        image.pixel(x, y) != background
+        for x in range(0, image.width(), 7) for y in range(0, image.height(), 3)
+    )
+    assert painted > 0
+
+    widget._on_frame()
+    revision = widget._last_revision
+    widget._on_frame()
+    assert widget._last_revision == revision == ring.total
+    widget.deleteLater()
+
+
+def test_module_registered_with_widget_host():
+    adapter = MODULE_ADAPTERS["telemetry_plot"]({"id": "telemetry_plot"})
+    descriptor = adapter.build()
+    assert descriptor.module_id == "telemetry_plot"
+    assert descriptor.viewmodel_factory is not None
@@ -32,11 +32,11 @@ def test_main_viewmodel_cache_and_filter():
 
     html1 = "<span>hello</span><br>"
     plain1 = vm.strip_html(html1)
-    vm.cache_log_line('cpu1', html1, plain1)
+    vm.cache_log_line('cpu1', plain1)
 
     html2 = "<span>world</span><br>"
     plain2 = vm.strip_html(html2)
-    vm.cache_log_line('cpu1', html2, plain2)
+    vm.cache_log_line('cpu1', plain2)
 
     # No filter
     content = vm.filter_cache('cpu1', '')
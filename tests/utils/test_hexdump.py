@@ -0,0 +1,28 @@
+"""Tests for the hexdump renderer used by the binary RX mode."""
+
+from __future__ import annotations
+
+from src.utils.hexdump import hexdump, hexdump_rows
+
+
+def test_full_row_layout():
+    rows = hexdump_rows(bytes(range(0x41, 0x51)))
+    assert rows == [
+        "00000000  41 42 43 44 45 46 47 48 49 4a 4b 4c 4d 4e 4f 50  |ABCDEFGHIJKLMNOP|"
+    ]
+
+
+def test_partial_row_is_padded_and_offset_applied():
+    rows = hexdump_rows(b"\x00\x01ab\xff", offset=0x20)
+    assert rows[0].startswith("00000020  00 01 61 62 ff ")
+    assert rows[0].endswith("|..ab.|")
+    # Hex column keeps the same width so the ASCII column stays aligned
+    assert rows[0].index("|") == hexdump_rows(bytes(16))[0].index("|")
+
+
+def test_multiple_rows_and_joined_dump():
+    data = bytes(40)
+    rows = hexdump_rows(data)
+    assert [row[:8] for row in rows] == ["00000000", "00000010", "00000020"]
+    assert hexdump(data) == "\n".join(rows)
+    assert hexdump_rows(b"") == []
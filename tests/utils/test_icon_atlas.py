@@ -0,0 +1,121 @@
+"""Tests for the persistent icon raster cache and its background preloader."""
+
+from __future__ import annotations
+
+import os
+import threading
+
+from PySide6.QtGui import QColor, QImage
+
+from src.utils.icon_atlas import ICON_SIZES, IconAtlas, IconPreloader, file_fingerprint
+
+SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24">'
+    '<rect width="24" height="24" fill="#ff0000"/></svg>'
+)
+
+
+def _png(path, size=128):
+    image = QImage(size, size, QImage.Format.Format_ARGB32)
+    image.fill(QColor("#00ff00"))
+    assert image.save(str(path), "PNG")
+    return path
+
+
+def test_svg_and_bitmap_are_rendered_once_then_loaded(qapp, tmp_path):
+    svg = tmp_path / "square.svg"
+    svg.write_text(SVG, encoding="utf-8")
+    bitmap = _png(tmp_path / "big.png", 300)
+    atlas = IconAtlas(tmp_path / "cache")
+
+    svg_images = atlas.images("square", "dark", str(svg), 2.0)
+    assert [image.width() for image in svg_images] == [size * 2 for size in ICON_SIZES]
+    assert all(image.devicePixelRatio() == 2.0 for image in svg_images)
+    assert svg_images[0].pixelColor(4, 4) == QColor("#ff0000")
+    bitmap_images = atlas.images("big", "dark", str(bitmap), 1.0)
+    assert bitmap_images[-1].width() == 256  # native size kept, capped
+    rendered = atlas.rendered
+
+    restarted = IconAtlas(tmp_path / "cache")
+    assert len(restarted.images("square", "dark", str(svg), 2.0)) == len(ICON_SIZES)
+    assert (restarted.rendered, restarted.loaded) == (0, len(ICON_SIZES))
+    assert rendered == len(svg_images) + len(bitmap_images)
+
+
+def test_changed_source_is_rerendered_and_stale_pngs_removed(qapp, tmp_path):
+    source = _png(tmp_path / "icon.png", 64)
+    cache_dir = tmp_path / "cache"
+    atlas = IconAtlas(cache_dir)
+    atlas.images("icon", "light", str(source), 1.0)
+    before = sorted(p.name for p in cache_dir.glob("*.png"))
+    fingerprint = file_fingerprint(source)
+
+    _png(source, 32)
+    os.utime(source, ns=(1, 1))
+    assert file_fingerprint(source) != fingerprint
+    atlas.images("icon", "light", str(source), 1.0)
+    after = sorted(p.name for p in cache_dir.glob("*.png"))
+
+    assert len(after) == len(before)
+    assert not set(before) & set(after)
+
+
+def test_preloader_rasterizes_off_the_gui_thread(qapp, qtbot, tmp_path):
+    svg = tmp_path / "square.svg"
+    svg.write_text(SVG, encoding="utf-8")
+    atlas = IconAtlas(tmp_path / "cache")
+    preloader = IconPreloader(atlas)
+    worker_threads: list[int] = []
+    original = atlas.images
+    atlas.images = lambda *args: worker_threads.append(threading.get_ident()) or original(*args)
+    received: list[tuple[str, str, int, int]] = []
+    preloader.rasterized.connect(
+        lambda name, theme, images: received.append((name, theme, len(images), threading.get_ident()))
+    )
+
+    with qtbot.waitSignal(preloader.finished, timeout=5000):
+        assert preloader.start([("square", "light", str(svg)), ("square", "dark", str(svg))], 1.0)
+
+    main = threading.get_ident()
+    assert worker_threads and main not in worker_threads
+    assert [(name, theme, count) for name, theme, count, _ in received] == [
+        ("square", "light", len(ICON_SIZES)),
+        ("square", "dark", len(ICON_SIZES)),
+    ]
+    assert all(thread == main for *_, thread in received)
+
+
+def test_icon_cache_preloads_both_themes(qapp, qtbot):
+    from src.utils.icon_cache import get_icon_cache
+
+    cache = get_icon_cache()
+    names = cache.available_icons()
+    assert "trash" in names
+    for name in names:
+        cache._icon_cache.pop(name, None)
+
+    assert cache.preload_async(names)
+    qtbot.waitUntil(
+        lambda: all({"light", "dark"} <= set(cache._icon_cache.get(name, {})) for name in names),
+        timeout=5000,
+    )
+    assert not cache.get_explicit("trash", "dark").isNull()
+    assert cache.get_explicit("trash", "light").availableSizes()
+
+
+def test_mirror_fingerprint_uses_stat_only(qapp, tmp_path, monkeypatch):
+    from src.utils.icon_cache import get_icon_cache
+
+    cache = get_icon_cache()
+    (tmp_path / "dark").mkdir()
+    icon = tmp_path / "dark" / "a.ico"
+    icon.write_bytes(b"x" * 10)
+    first = cache._directory_fingerprint(tmp_path)
+
+    def no_reads(*_args, **_kwargs):
+        raise AssertionError("icon contents must not be read")
+
+    monkeypatch.setattr("builtins.open", no_reads)
+    assert cache._directory_fingerprint(tmp_path) == first
+    os.utime(icon, ns=(1, 1))
+    assert cache._directory_fingerprint(tmp_path) != first
@@ -0,0 +1,41 @@
+"""Tests for lazy package exports."""
+
+from __future__ import annotations
+
+import sys
+import types
+
+import pytest
+
+from src.utils.lazy_exports import lazy_exports
+
+
+@pytest.fixture
+def fake_package(monkeypatch):
+    package = types.ModuleType("fake_lazy_pkg")
+    package.__path__ = []
+    monkeypatch.setitem(sys.modules, "fake_lazy_pkg", package)
+    package.__all__, package.__getattr__, package.__dir__ = lazy_exports(
+        "fake_lazy_pkg", {"dumps": "json", "Missing": "json"}
+    )
+    return package
+
+
+def test_resolves_on_first_access_and_caches(fake_package):
+    import json
+
+    assert "dumps" not in vars(fake_package)
+    assert fake_package.dumps is json.dumps
+    assert vars(fake_package)["dumps"] is json.dumps
+
+
+def test_unknown_names_raise_attribute_error(fake_package):
+    with pytest.raises(AttributeError, match="no attribute 'nope'"):
+        fake_package.nope
+    with pytest.raises(AttributeError):
+        fake_package.Missing
+
+
+def test_all_and_dir_list_exports(fake_package):
+    assert fake_package.__all__ == ["dumps", "Missing"]
+    assert {"dumps", "Missing"} <= set(dir(fake_package))
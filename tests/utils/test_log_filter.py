@@ -0,0 +1,125 @@
+"""Tests for the compiled multi-term log filter."""
+
+from __future__ import annotations
+
+import time
+
+from src.utils.log_filter import IncrementalFilter, LogFilter
+from src.utils.log_store import ColumnarLogStore, LogDirection
+
+RX, TX, SYS = LogDirection.RX, LogDirection.TX, LogDirection.SYS
+
+
+def _matches(query: str, text: str, direction: LogDirection = RX, timestamp: float = 0.0, now: float = 0.0) -> bool:
+    return LogFilter.compile(query, now=now).matches(text, direction, timestamp)
+
+
+def test_empty_query_matches_everything():
+    log_filter = LogFilter.compile("   ")
+    assert log_filter.matches_everything
+    assert log_filter.matches("anything", TX, 0.0)
+
+
+def test_implicit_and_or_and_not_terms():
+    assert _matches("error timeout", "ERROR: read timeout")
+    assert not _matches("error timeout", "error: crc")
+    assert _matches("crc OR timeout", "bad crc")
+    assert _matches("crc | timeout", "timeout")
+    assert not _matches("error -debug", "error debug dump")
+    assert not _matches("error NOT debug", "error debug dump")
+    assert _matches("error NOT debug", "error in frame")
+
+
+def test_quoted_phrase_and_regex_terms():
+    assert _matches('"link up"', "eth0 link up")
+    assert not _matches('"link up"', "link is up")
+    assert _matches(r"/crc=\d+/", "frame crc=42")
+    assert _matches(r"re:^T=\d{4}", "T=0042 V=1")
+    assert not _matches(r"re:^T=\d{4}", "X T=0042")
+
+
+def test_backreferences_in_or_terms_keep_their_groups():
+    assert _matches(r"re:(a)\1 OR re:(b)\1", "bb")
+    assert _matches(r"re:(a)\1 OR re:(b)\1", "aa")
+    assert not _matches(r"re:(a)\1 OR re:(b)\1", "ab")
+
+
+def test_invalid_regex_degrades_to_literal():
+    assert _matches("re:[unclosed", "value re:[unclosed here")
+    assert not _matches("re:[unclosed", "value")
+
+
+def test_direction_predicates():
+    assert _matches("dir:tx", "AT", TX)
+    assert not _matches("dir:tx", "AT", RX)
+    assert _matches("dir:rx,sys", "boot", SYS)
+    assert _matches("-dir:rx", "AT", TX)
+    assert not _matches("dir:rx dir:tx", "AT", TX)
+
+
+def test_time_predicates_relative_and_clock():
+    now = time.mktime((2024, 5, 1, 12, 0, 0, 0, 0, -1))
+    assert _matches("since:5m", "x", timestamp=now - 60, now=now)
+    assert not _matches("since:5m", "x", timestamp=now - 600, now=now)
+    assert _matches("until:11:30", "x", timestamp=now - 3600, now=now)
+    assert not _matches("until:11:30", "x", timestamp=now, now=now)
+    assert _matches("since:11:00 until:11:59:59 error", "error", timestamp=now - 1800, now=now)
+
+
+def test_empty_or_clauses_do_not_match_everything():
+    for query in ("error OR", "error |", "OR error", "error OR OR warn", "error || | warn"):
+        assert not LogFilter.compile(query).matches_everything, query
+        assert not _matches(query, "ok"), query
+        assert _matches(query, "error"), query
+    assert _matches("error OR OR warn", "warn")
+    assert LogFilter.compile("OR").matches_everything
+    assert LogFilter.compile("| OR").matches_everything
+
+
+def test_relative_time_filter_is_resolved_on_each_update():
+    store = ColumnarLogStore(8)
+    store.append("old", timestamp=1000.0)
+    store.append("new", timestamp=1200.0)
+    live = IncrementalFilter(store, LogFilter.compile("since:5m", now=1250.0), lambda entry: entry.text + ";")
+    assert LogFilter.compile("since:5m").relative
+    assert not LogFilter.compile("since:12:00").relative
+    assert live.update(now=1250.0) == 2
+    assert live.text() == "old;new;"
+    assert live.update(now=1350.0) == 1
+    assert live.text() == "new;"
+
+
+def test_incremental_filter_tests_only_new_rows_and_follows_eviction():
+    store = ColumnarLogStore(4)
+    calls: list[int] = []
+
+    def counting_filter(query: str) -> LogFilter:
+        compiled = LogFilter.compile(query)
+        original = compiled.matches
+
+        class _Counting:
+            query = compiled.query
+            relative = compiled.relative
+
+            def __call__(self, entry):
+                calls.append(entry.seq)
+                return original(entry.text, entry.direction, entry.timestamp)
+
+        return _Counting()  # type: ignore[return-value]
+
+    live = IncrementalFilter(store, counting_filter("ok"), lambda entry: entry.text + ";")
+    store.append("ok 1")
+    store.append("fail 2")
+    assert live.update() == 1
+    assert live.text() == "ok 1;"
+
+    store.append("ok 3")
+    assert live.update() == 1
+    assert calls == [0, 1, 2]
+    assert live.text() == "ok 1;ok 3;"
+
+    for i in range(4, 7):
+        store.append(f"ok {i}")
+    live.update()
+    assert list(live.matched_seqs()) == [2, 3, 4, 5]
+    assert live.text() == "ok 3;ok 4;ok 5;ok 6;"
@@ -0,0 +1,78 @@
+"""Tests for the columnar in-memory log store."""
+
+from __future__ import annotations
+
+import re
+
+import pytest
+
+from src.utils.log_store import ColumnarLogStore, LogDirection
+
+
+def test_append_returns_sequence_numbers_and_preserves_columns():
+    store = ColumnarLogStore(4)
+    first = store.append("hello", LogDirection.RX, timestamp=10.0)
+    second = store.append("world", LogDirection.TX, timestamp=11.5)
+
+    assert (first, second) == (0, 1)
+    entry = store.get(second)
+    assert entry.text == "world"
+    assert entry.direction is LogDirection.TX
+    assert entry.timestamp == 11.5
+    assert [e.text for e in store.entries()] == ["hello", "world"]
+
+
+def test_ring_evicts_oldest_rows_and_keeps_sequence_numbers():
+    store = ColumnarLogStore(3)
+    for i in range(5):
+        store.append(f"line-{i}")
+
+    assert len(store) == 3
+    assert store.first_seq == 2
+    assert store.get(1) is None
+    assert store.get(4).text == "line-4"
+    assert list(store.texts()) == ["line-2", "line-3", "line-4"]
+    assert [e.seq for e in store.entries(3)] == [3, 4]
+    assert [e.text for e in store.select([0, 2, 4])] == ["line-2", "line-4"]
+
+
+def test_repeated_lines_share_string_table_slots():
+    store = ColumnarLogStore(4)
+    for _ in range(3):
+        store.append("OK")
+    store.append("ERR")
+    assert store.unique_texts == 2
+
+    # Evict all "OK" rows: their table slot must be released
+    for _ in range(3):
+        store.append("ERR")
+    assert store.unique_texts == 1
+    assert list(store.texts()) == ["ERR"] * 4
+
+
+def test_search_matches_substring_case_insensitive_and_regex():
+    store = ColumnarLogStore(10)
+    store.append("Temperature 21")
+    store.append("pressure 1013")
+    store.append("TEMPERATURE 22")
+
+    assert store.search("temperature") == [0, 2]
+    assert store.search(re.compile(r"\d{4}")) == [1]
+    assert store.search("humidity") == []
+
+
+def test_clear_and_text_export():
+    store = ColumnarLogStore(5)
+    store.append("a")
+    store.append("b")
+    assert store.to_text() == "a\nb\n"
+
+    store.clear()
+    assert len(store) == 0
+    assert store.to_text() == ""
+    assert store.append("c") == 2
+
+
+def test_capacity_must_be_positive():
+    with pytest.raises(ValueError):
+        ColumnarLogStore(0)
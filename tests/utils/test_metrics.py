@@ -0,0 +1,183 @@
+"""Tests for the metrics registry, its histograms and Chrome trace export."""
+
+from __future__ import annotations
+
+import json
+import random
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.utils import metrics as metrics_module
+from src.utils.metrics import MetricsRegistry, bucket_bounds, bucket_index
+
+RX_STAGES = (
+    "serial.read",
+    "serial.frame",
+    "serial.emit",
+    "viewmodel.rx",
+    "console.format",
+    "console.flush",
+    "console.history_append",
+)
+
+
+def _spans_named(path, name):
+    return [event for event in json.loads(path.read_text(encoding="utf-8"))["traceEvents"]
+            if event["ph"] == "X" and event["name"] == name]
+
+
+def test_buckets_are_contiguous_and_bounded():
+    previous_high = -1
+    for index in range(bucket_index(1 << 40) + 1):
+        low, high = bucket_bounds(index)
+        assert low == previous_high + 1 and high >= low
+        assert (high - low + 1) / low <= 1 / 16 if low >= 16 else high == low
+        previous_high = high
+    for value in (0, 1, 15, 16, 17, 31, 32, 1000, 123_456_789, (1 << 40) + 5):
+        low, high = bucket_bounds(bucket_index(value))
+        assert low <= value <= high
+
+
+def test_histogram_merges_per_thread_shards():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("stage")
+    values = [random.Random(seed).randrange(1, 10_000_000) for seed in range(4000)]
+
+    def record(chunk: list[int]) -> None:
+        for value in chunk:
+            histogram.record(value)
+
+    threads = [threading.Thread(target=record, args=(values[i::4],)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    snapshot = registry.snapshot().histograms["stage"]
+    assert snapshot.count == len(values) and snapshot.total == sum(values)
+    assert (snapshot.min, snapshot.max) == (min(values), max(values))
+    ordered = sorted(values)
+    for q in (50, 90, 99):
+        exact = ordered[round(len(ordered) * q / 100) - 1]
+        assert exact <= snapshot.percentile(q) <= exact * 1.0625 + 1
+    assert registry.histogram("stage") is histogram
+
+
+def test_counters_gauges_and_reset():
+    registry = MetricsRegistry()
+    counter = registry.counter("lines")
+    threads = [threading.Thread(target=lambda: [counter.add() for _ in range(1000)]) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    counter.add(5)
+    registry.gauge("pending").set(7)
+
+    snapshot = registry.snapshot().to_dict()
+    assert snapshot["counters"] == {"lines": 3005}
+    assert snapshot["gauges"] == {"pending": 7}
+    registry.reset()
+    assert registry.snapshot().counters == {"lines": 0}
+
+
+def test_disabled_registry_records_nothing():
+    registry = MetricsRegistry(enabled=False, tracing=True)
+    with registry.span("stage"):
+        pass
+    assert registry.snapshot().histograms["stage"].count == 0
+    assert registry.export_chrome_trace() is None
+
+
+def test_chrome_trace_export(tmp_path):
+    registry = MetricsRegistry(tracing=True, trace_capacity=3, output_dir=tmp_path)
+    assert registry.export_chrome_trace() is None
+    histogram = registry.histogram("serial.read")
+    for _ in range(5):
+        with histogram.time():
+            time.sleep(0.001)
+    worker = threading.Thread(target=lambda: registry.span("console.flush").__enter__().__exit__(), name="flusher")
+    worker.start()
+    worker.join()
+
+    path = registry.export_chrome_trace()
+    assert path is not None and path.parent == tmp_path
+    document = json.loads(path.read_text(encoding="utf-8"))
+    spans = [event for event in document["traceEvents"] if event["ph"] == "X"]
+    names = {event["args"]["name"] for event in document["traceEvents"] if event["ph"] == "M"}
+    assert [event["name"] for event in spans].count("serial.read") == 3  # ring of 3 per thread
+    assert {"MainThread", "flusher"} <= names
+    assert all(event["dur"] >= 1000 for event in spans if event["name"] == "serial.read")
+    assert spans[0]["cat"] == "serial"
+    assert document["otherData"]["histograms"]["serial.read"]["count"] == 5
+
+
+def test_trace_keeps_spans_of_successive_threads_apart(monkeypatch):
+    # A thread started after another one ended often reuses its ident
+    monkeypatch.setattr(metrics_module, "_get_ident", lambda: 1)
+    registry = MetricsRegistry(tracing=True)
+    for name in ("CPU1Worker", "CPU2Worker"):
+        worker = threading.Thread(
+            target=lambda: registry.span("serial.frame").__enter__().__exit__(), name=name
+        )
+        worker.start()
+        worker.join()
+
+    events = registry.trace_events()
+    tids = {event["args"]["name"]: event["tid"] for event in events if event["ph"] == "M"}
+    assert set(tids) == {"CPU1Worker", "CPU2Worker"}
+    assert tids["CPU1Worker"] != tids["CPU2Worker"]
+    assert sorted(event["tid"] for event in events if event["ph"] == "X") == sorted(tids.values())
+
+
+def test_rx_path_records_every_stage(qapp, tmp_path, isolated_config_dir):
+    from src.models.serial_worker import SerialWorker
+    from src.utils.metrics import metrics
+    from src.utils.mmap_log_history import create_history_for_port
+    from src.viewmodels.com_port_viewmodel import ComPortViewModel
+    from src.views.console_panel_view import ConsolePanelView
+
+    panel = ConsolePanelView()
+    panel._history_files["CPU1"] = create_history_for_port("CPU1", 64 * 1024, tmp_path)
+    viewmodel = ComPortViewModel("CPU1", 1)
+    worker = SerialWorker("CPU1")
+    worker.rx.connect(viewmodel._on_data_received)
+    viewmodel.data_received.connect(lambda data: panel.append_rx("CPU1", data))
+    ser = Mock()
+    ser.in_waiting = 12
+    ser.read.return_value = b"boot\r\nready\r\n"
+
+    tracing = metrics.tracing
+    metrics.reset()
+    metrics.set_tracing(True)
+    try:
+        assert worker._process_read(ser) is True
+        panel._flush_pending_updates()
+        path = metrics.export_chrome_trace(tmp_path / "trace.json")
+    finally:
+        metrics.set_tracing(tracing)
+        panel.deleteLater()
+
+    histograms = metrics.snapshot().histograms
+    missing = [stage for stage in RX_STAGES if histograms[stage].count == 0]
+    assert not missing
+    assert histograms["serial.emit"].count == 2  # one per line
+    # Emits (and the directly connected view model) are not part of the frame span
+    assert histograms["viewmodel.rx"].count and not any(
+        frame["ts"] <= emit["ts"] < frame["ts"] + frame["dur"]
+        for frame in _spans_named(path, "serial.frame")
+        for emit in _spans_named(path, "serial.emit")
+    )
+    traced = {event["name"] for event in json.loads(path.read_text(encoding="utf-8"))["traceEvents"]}
+    assert set(RX_STAGES) <= traced
+
+
+@pytest.mark.parametrize(("text", "expected"), [("yes", True), ("off", False), ("maybe", True)])
+def test_metrics_config_parses_booleans(text, expected):
+    from src.utils.config_loader import config_loader
+
+    assert config_loader._get_bool({"enabled": f"{text}  # comment"}, "enabled", True) is expected
+    assert config_loader.get_metrics_config().trace_capacity > 0
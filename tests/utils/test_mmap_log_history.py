@@ -50,3 +50,13 @@ def test_history_wraps_and_discards_old_data(tmp_path):
     assert "line-11" in data
     assert "line-10" in data
     assert "line-0" not in data
+
+
+def test_history_appends_raw_bytes_verbatim(tmp_path):
+    history = MemoryMappedLogHistory("CPU1_raw", 1024)
+    try:
+        history.append_bytes(b"\x00\x01\xfe\xff")
+        history.append_bytes(b"\x80")
+        assert history.read_all_bytes().rstrip(b"\x00").endswith(b"\x01\xfe\xff\x80")
+    finally:
+        history.close()
@@ -0,0 +1,29 @@
+"""Tests for min/max-per-pixel plot decimation."""
+
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.utils.plot_decimation import minmax_decimate  # noqa: E402
+
+
+def test_buckets_keep_extremes_of_each_run():
+    values = np.arange(100, dtype=np.float64)
+    values[37] = 1000.0
+    values[62] = -5.0
+    mins, maxs = minmax_decimate(values, 10)
+
+    assert len(mins) == len(maxs) == 10
+    assert maxs[3] == 1000.0
+    assert mins[6] == -5.0
+    assert mins[0] == 0.0 and maxs[-1] == 99.0
+
+
+def test_short_input_is_passed_through():
+    values = np.array([3, 1, 2])
+    mins, maxs = minmax_decimate(values, 10)
+    assert mins.tolist() == maxs.tolist() == [3, 1, 2]
+    assert len(minmax_decimate(values[:0], 10)[0]) == 0
+    assert len(minmax_decimate(values, 0)[1]) == 0
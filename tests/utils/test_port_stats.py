@@ -0,0 +1,98 @@
+"""Tests for the rolling per-port statistics engine."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.utils.port_stats import (
+    GAP_BUCKETS,
+    PortStats,
+    format_byte_rate,
+    histogram_bounds,
+)
+
+
+class FakeClock:
+    def __init__(self, start: float = 1000.0) -> None:
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_windowed_rates_use_completed_buckets():
+    clock = FakeClock()
+    stats = PortStats(clock)
+    # 100 bytes / 1 line every 100 ms for 20 s
+    for _ in range(200):
+        stats.record_rx(100, [99])
+        clock.now += 0.1
+
+    snapshot = stats.snapshot()
+    assert snapshot.bytes_per_second[1] == pytest.approx(1000.0)
+    assert snapshot.bytes_per_second[10] == pytest.approx(1000.0)
+    # Less than a minute elapsed: the 60 s window covers what was seen
+    assert snapshot.bytes_per_second[60] == pytest.approx(1000.0)
+    assert snapshot.lines_per_second[1] == pytest.approx(10.0)
+    assert snapshot.total_bytes == 20_000 and snapshot.total_lines == 200
+
+
+def test_idle_time_ages_out_of_short_windows():
+    clock = FakeClock()
+    stats = PortStats(clock)
+    for _ in range(100):
+        stats.record_rx(50)
+        clock.now += 0.1
+    clock.now += 5.0
+
+    snapshot = stats.snapshot()
+    assert snapshot.bytes_per_second[1] == 0.0
+    # Last 10 s: 5 s of traffic (2500 bytes) and 5 s of silence
+    assert snapshot.bytes_per_second[10] == pytest.approx(250.0)
+
+    clock.now += 120.0  # longer than the ring: everything is cleared
+    assert stats.snapshot().bytes_per_second[60] == 0.0
+    assert stats.snapshot().total_bytes == 5000
+
+
+def test_gap_and_length_histograms():
+    clock = FakeClock()
+    stats = PortStats(clock)
+    stats.record_rx(10, [0, 3, 300])
+    clock.now += 0.005  # 5 ms -> bucket 3 (4-7 ms)
+    stats.record_rx(10, [1])
+
+    snapshot = stats.snapshot()
+    assert snapshot.gap_histogram_ms[0] == 2  # lines sharing one read
+    assert snapshot.gap_histogram_ms[3] == 1
+    assert sum(snapshot.gap_histogram_ms) == 3
+    assert snapshot.line_length_histogram[0] == 1
+    assert snapshot.line_length_histogram[1] == 1
+    assert snapshot.line_length_histogram[2] == 1
+    assert snapshot.line_length_histogram[9] == 1  # 256-511
+    assert snapshot.max_burst_lines == 3
+
+
+def test_errors_drops_bursts_and_reset():
+    stats = PortStats(FakeClock())
+    stats.record_rx(4096)
+    stats.record_rx(10)
+    stats.record_decode_errors(2)
+    stats.record_dropped_lines()
+
+    snapshot = stats.snapshot()
+    assert snapshot.max_burst_bytes == 4096
+    assert snapshot.decode_errors == 2 and snapshot.dropped_lines == 1
+
+    stats.reset()
+    snapshot = stats.snapshot()
+    assert snapshot.total_bytes == 0 and snapshot.decode_errors == 0
+    assert snapshot.bytes_per_second == {1: 0.0, 10: 0.0, 60: 0.0}
+
+
+def test_helpers():
+    bounds = histogram_bounds(GAP_BUCKETS)
+    assert bounds[:5] == (0, 1, 2, 4, 8) and len(bounds) == GAP_BUCKETS
+    assert format_byte_rate(512) == "512 B"
+    assert format_byte_rate(12.5 * 1024) == "12.5 KB"
+    assert format_byte_rate(3 * 1024 * 1024) == "3.0 MB"
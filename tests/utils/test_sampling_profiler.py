@@ -0,0 +1,142 @@
+"""Tests for the continuous sampling profiler."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from PySide6 import QtCore
+
+from src.utils.sampling_profiler import (
+    OTHER_FRAME,
+    TRUNCATED_FRAME,
+    SamplingProfiler,
+    label_current_thread,
+)
+
+
+def _busy_marker(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(200))
+
+
+def _nested(depth: int, stop: threading.Event) -> None:
+    if depth:
+        _nested(depth - 1, stop)
+    else:
+        stop.wait()
+
+
+def _run_labelled(name: str, target, stop: threading.Event) -> None:
+    label_current_thread(name)
+    target(stop)
+
+
+class _LabelledQThread(QtCore.QThread):
+    def __init__(self, stop: threading.Event) -> None:
+        super().__init__()
+        self._stop = stop
+
+    def run(self) -> None:
+        _run_labelled("SerialWorker-COM9", _busy_marker, self._stop)
+
+
+def test_samples_every_thread_and_names_labelled_ones(qapp, tmp_path):
+    stop = threading.Event()
+    worker = _LabelledQThread(stop)
+    plain = threading.Thread(target=_run_labelled, args=("ignored", _busy_marker, stop), name="plain")
+    worker.start()
+    plain.start()
+    profiler = SamplingProfiler(hz=200, output_dir=tmp_path)
+    try:
+        for _ in range(20):
+            profiler.sample()
+            time.sleep(0.002)
+    finally:
+        stop.set()
+        worker.wait()
+        plain.join()
+
+    folded = profiler.folded()
+    worker_stacks = [stack for stack in folded if stack.startswith("SerialWorker-COM9;")]
+    assert any("_busy_marker (tests/utils/test_sampling_profiler.py:" in stack for stack in worker_stacks)
+    assert any(stack.startswith("plain;") for stack in folded)
+    assert not any(stack.startswith("ignored;") for stack in folded)
+    assert any(stack.startswith("MainThread;") for stack in folded)
+    # Root first, leaf last
+    main_stack = next(stack for stack in folded if "test_samples_every_thread" in stack)
+    assert main_stack.split(";")[-1].startswith("SamplingProfiler.sample (src/utils/sampling_profiler.py:")
+    assert profiler.stats().samples == 20
+
+
+def test_export_writes_folded_lines(qapp, qtbot, tmp_path):
+    profiler = SamplingProfiler(output_dir=tmp_path)
+    assert profiler.export() is None  # nothing sampled yet
+    profiler.sample()
+    profiler.sample()
+
+    with qtbot.waitSignal(profiler.exported, timeout=1000) as blocker:
+        path = profiler.export()
+    assert path is not None and path.parent == tmp_path and path.suffix == ".folded"
+    assert blocker.args == [str(path)]
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines
+    for line in lines:
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) > 0 and stack.split(";")[0]
+    assert sum(int(line.rsplit(" ", 1)[1]) for line in lines) == sum(profiler.folded().values())
+
+
+def test_memory_is_bounded_by_stacks_and_depth(qapp):
+    stop = threading.Event()
+    worker = threading.Thread(target=_nested, args=(50, stop), name="deep", daemon=True)
+    worker.start()
+    time.sleep(0.05)
+    shallow = SamplingProfiler(max_depth=8)
+    bounded = SamplingProfiler(max_stacks=1)
+    try:
+        shallow.sample()
+        bounded.sample()
+        bounded.sample()
+    finally:
+        stop.set()
+        worker.join()
+
+    deep = [stack.split(";") for stack in shallow.folded() if stack.startswith("deep;")]
+    assert len(deep) == 1
+    assert deep[0][1] == TRUNCATED_FRAME and len(deep[0]) == 2 + 8
+    assert deep[0][2].startswith("_nested (tests/utils/test_sampling_profiler.py:")
+
+    stats = bounded.stats()
+    assert stats.dropped > 0
+    kept = [stack for stack in bounded.folded() if not stack.endswith(f";{OTHER_FRAME}")]
+    assert len(kept) == 1
+    assert stats.stacks == 1 + sum(stack.endswith(f";{OTHER_FRAME}") for stack in bounded.folded())
+
+
+def test_background_thread_start_stop_and_reset(qapp, qtbot):
+    profiler = SamplingProfiler(hz=500)
+    with qtbot.waitSignal(profiler.running_changed, timeout=1000) as blocker:
+        assert profiler.start()
+    assert blocker.args == [True]
+    assert not profiler.start()
+    qtbot.waitUntil(lambda: profiler.stats().samples >= 5, timeout=2000)
+    profiler.stop()
+    assert not profiler.is_running()
+
+    stats = profiler.stats()
+    assert stats.elapsed_s > 0 and stats.cpu_s >= 0
+    assert not any(stack.startswith("sampling-profiler;") for stack in profiler.folded())
+    profiler.reset()
+    assert profiler.stats().samples == 0 and profiler.folded() == {}
+
+
+def test_config_and_service_registration():
+    from src.utils import get_sampling_profiler
+    from src.utils.config_loader import config_loader
+
+    config = config_loader.get_profiling_config()
+    profiler = get_sampling_profiler()
+    assert profiler is get_sampling_profiler()
+    assert profiler.hz == config.sampling_hz
+    assert not config.sampling_autostart
@@ -0,0 +1,95 @@
+"""Tests for the multi-port session recording format."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.utils.session_recording import (
+    INDEX_INTERVAL,
+    RecordKind,
+    SessionReader,
+    SessionRecorder,
+)
+
+
+class FakeClock:
+    def __init__(self, start: float = 500.0) -> None:
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _record_two_ports(path, clock):
+    recorder = SessionRecorder(path, clock=clock)
+    for step in range(50):
+        clock.now += 0.1
+        recorder.record_rx("CPU1", f"a{step}\n".encode())
+        if step % 10 == 0:
+            recorder.record_rx("TLM", bytes([step]))
+            recorder.record_tx("CPU1", b"ping\r\n")
+    return recorder
+
+
+def test_round_trip_keeps_order_ports_and_timestamps(tmp_path):
+    clock = FakeClock()
+    path = tmp_path / "s.uartrec"
+    with _record_two_ports(path, clock) as recorder:
+        pass
+    assert recorder.closed
+    assert recorder.records == 60
+
+    reader = SessionReader(path)
+    assert reader.indexed
+    assert reader.ports == ["CPU1", "TLM"]
+    records = list(reader.records())
+    assert len(records) == 60
+    assert records[0].port_label == "CPU1" and records[0].data == b"a0\n"
+    assert records[0].timestamp == pytest.approx(0.1)
+    assert [r.timestamp for r in records] == sorted(r.timestamp for r in records)
+    assert reader.duration == pytest.approx(5.0)
+
+
+def test_filters_by_port_kind_and_start(tmp_path):
+    clock = FakeClock()
+    path = tmp_path / "s.uartrec"
+    _record_two_ports(path, clock).close()
+    reader = SessionReader(path)
+
+    tlm = list(reader.records(ports={"TLM"}))
+    assert [r.data for r in tlm] == [bytes([0]), bytes([10]), bytes([20]), bytes([30]), bytes([40])]
+    tx = list(reader.records(kinds={RecordKind.TX}))
+    assert len(tx) == 5 and all(r.data == b"ping\r\n" for r in tx)
+    later = list(reader.records(3.0 + INDEX_INTERVAL / 2, ports={"CPU1"}, kinds={RecordKind.RX}))
+    assert later[0].data == b"a34\n"
+
+
+def test_unclosed_recording_is_scanned(tmp_path):
+    clock = FakeClock()
+    path = tmp_path / "s.uartrec"
+    recorder = _record_two_ports(path, clock)
+    recorder._file.flush()
+    # Simulate a crash: a half-written record at the end and no index
+    with open(path, "ab") as fh:
+        fh.write(b"\x01\x00\x00")
+
+    reader = SessionReader(path)
+    assert not reader.indexed
+    assert reader.ports == ["CPU1", "TLM"]
+    assert len(list(reader.records())) == 60
+
+
+def test_records_after_close_are_ignored(tmp_path):
+    recorder = SessionRecorder(tmp_path / "s.uartrec", clock=FakeClock())
+    recorder.close()
+    recorder.record_rx("CPU1", b"late")
+    recorder.close()
+    assert recorder.records == 0
+    assert list(SessionReader(recorder.path).records()) == []
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "log.txt"
+    path.write_bytes(b"hello world, not a recording")
+    with pytest.raises(ValueError):
+        SessionReader(path)
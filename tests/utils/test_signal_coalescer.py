@@ -0,0 +1,55 @@
+"""Tests for the shared counter-signal coalescer."""
+
+from __future__ import annotations
+
+from src.utils.signal_coalescer import SignalCoalescer
+
+
+def test_publishers_run_once_per_tick(qtbot):
+    coalescer = SignalCoalescer(interval_ms=20)
+    calls: list[str] = []
+    publish_a = lambda: calls.append("a")  # noqa: E731
+    publish_b = lambda: calls.append("b")  # noqa: E731
+
+    for _ in range(1000):
+        coalescer.mark_dirty(publish_a)
+    coalescer.mark_dirty(publish_b)
+    assert calls == []
+
+    qtbot.waitUntil(lambda: len(calls) == 2, timeout=1000)
+    assert calls == ["a", "b"]
+    assert not coalescer.is_pending(publish_a)
+
+
+def test_bound_methods_are_deduplicated_and_discardable(qapp):
+    class Counter:
+        def __init__(self) -> None:
+            self.published = 0
+
+        def publish(self) -> None:
+            self.published += 1
+
+    coalescer = SignalCoalescer(interval_ms=1000)
+    counter = Counter()
+    coalescer.mark_dirty(counter.publish)
+    coalescer.mark_dirty(counter.publish)
+    coalescer.flush()
+    assert counter.published == 1
+
+    coalescer.mark_dirty(counter.publish)
+    coalescer.discard(counter.publish)
+    coalescer.flush()
+    assert counter.published == 1
+
+
+def test_flush_survives_deleted_owner(qapp):
+    coalescer = SignalCoalescer()
+    calls = []
+
+    def deleted() -> None:
+        raise RuntimeError("Internal C++ object already deleted.")
+
+    coalescer.mark_dirty(deleted)
+    coalescer.mark_dirty(lambda: calls.append(1))
+    coalescer.flush()
+    assert calls == [1]
@@ -0,0 +1,64 @@
+"""Tests for the batched theme repolish engine."""
+
+from __future__ import annotations
+
+from PySide6 import QtWidgets
+
+from src.utils.style_refresh import StyleRefresher
+
+
+def test_unchanged_theme_class_is_not_scheduled(qapp):
+    refresher = StyleRefresher()
+    widget = QtWidgets.QPushButton()
+    widget.setProperty("themeClass", "dark")
+
+    assert not refresher.set_theme_class(widget, "dark")
+    assert refresher.pending_count == 0
+    assert refresher.set_theme_class(widget, "light")
+    assert widget.property("themeClass") == "light"
+    assert refresher.pending_count == 1
+    widget.deleteLater()
+
+
+def test_requests_coalesce_into_one_deferred_pass(qapp, qtbot):
+    refresher = StyleRefresher()
+    window = QtWidgets.QWidget()
+    qtbot.addWidget(window)
+    layout = QtWidgets.QVBoxLayout(window)
+    buttons = [QtWidgets.QPushButton(str(i)) for i in range(20)]
+    for button in buttons:
+        layout.addWidget(button)
+    window.show()
+
+    passes: list[int] = []
+    refresher.flushed.connect(lambda count, _ms: passes.append(count))
+    updates_during_pass: list[bool] = []
+    original_polish = window.style().polish
+
+    for theme in ("light", "dark"):
+        for button in buttons:
+            refresher.set_theme_class(button, theme)
+            refresher.schedule(button)  # duplicates collapse
+    assert passes == []  # nothing happens synchronously
+
+    style = window.style()
+    try:
+        style.polish = lambda w: (updates_during_pass.append(window.updatesEnabled()), original_polish(w))
+        qtbot.waitUntil(lambda: passes == [20], timeout=1000)
+    finally:
+        del style.polish
+    assert window.updatesEnabled()
+    assert updates_during_pass and not any(updates_during_pass)
+
+
+def test_deleted_widgets_are_skipped(qapp):
+    refresher = StyleRefresher()
+    keep = QtWidgets.QLabel()
+    gone = QtWidgets.QLabel()
+    refresher.set_theme_class(keep, "dark")
+    refresher.set_theme_class(gone, "dark")
+    from shiboken6 import delete
+
+    delete(gone)
+    assert refresher.flush() == 1
+    assert refresher.flush() == 0
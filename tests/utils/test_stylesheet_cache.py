@@ -0,0 +1,89 @@
+"""Tests for the compiled stylesheet cache and its use by ThemeManager."""
+
+from __future__ import annotations
+
+import os
+
+from src.utils.stylesheet_cache import StylesheetCache, source_fingerprint, stylesheet_key
+
+
+def test_key_changes_with_each_input(tmp_path):
+    qss = tmp_path / "app.qss"
+    qss.write_text("QWidget {}", encoding="utf-8")
+    source = source_fingerprint(qss)
+    base = stylesheet_key(source, "dark", 1.0, ("#fff",))
+
+    assert stylesheet_key(source, "dark", 1.0, ("#fff",)) == base
+    assert stylesheet_key(source, "light", 1.0, ("#fff",)) != base
+    assert stylesheet_key(source, "dark", 1.25, ("#fff",)) != base
+    assert stylesheet_key(source, "dark", 1.0, ("#000",)) != base
+
+    qss.write_text("QWidget { color: red; }", encoding="utf-8")
+    os.utime(qss, ns=(1, 1))
+    assert stylesheet_key(source_fingerprint(qss), "dark", 1.0, ("#fff",)) != base
+
+
+def test_compiled_stylesheet_survives_restart(tmp_path):
+    cache = StylesheetCache(tmp_path)
+    assert cache.get("k") is None
+    cache.put("k", "QWidget { color: red; }")
+    assert cache.get("k") == "QWidget { color: red; }"
+
+    restarted = StylesheetCache(tmp_path)
+    assert restarted.get("k") == "QWidget { color: red; }"
+    assert (restarted.hits, restarted.misses) == (1, 0)
+
+
+def test_memory_only_cache_without_directory():
+    cache = StylesheetCache()
+    cache.put("k", "css")
+    assert cache.get("k") == "css"
+    cache.clear()
+    assert cache.get("k") is None
+
+
+def test_theme_switch_reuses_compiled_stylesheet(qapp, tmp_path, monkeypatch):
+    from src.utils.theme_manager import theme_manager
+
+    monkeypatch.setattr(theme_manager, "_compiled_stylesheets", StylesheetCache(tmp_path))
+    loads: list[int] = []
+    original_load = theme_manager._load_stylesheet
+    monkeypatch.setattr(theme_manager, "_load_stylesheet", lambda: loads.append(1) or original_load())
+    previous_theme = theme_manager.get_theme()
+    previous_scale = theme_manager._scale_factor
+    try:
+        for theme in ("light", "dark", "light", "dark"):
+            theme_manager.set_theme(theme)
+        assert len(loads) <= 2  # one compile per effective theme, then cache hits
+
+        theme_manager.set_scale_factor(1.5)
+        scaled = qapp.styleSheet()
+        theme_manager.set_scale_factor(1.0)
+        unscaled = qapp.styleSheet()
+        assert unscaled != scaled
+        compiled = len(loads)
+
+        theme_manager.set_scale_factor(1.5)
+        assert qapp.styleSheet() == scaled
+        theme_manager.apply_theme(force=True)
+        assert len(loads) == compiled  # no template reads or formatting after warm-up
+    finally:
+        theme_manager.set_scale_factor(previous_scale)
+        theme_manager.set_theme(previous_theme)
+
+
+def test_unchanged_stylesheet_is_not_reapplied(qapp):
+    from src.utils.theme_manager import ThemeManager, theme_manager
+
+    theme_manager.apply_theme(force=True)
+    applied: list[str] = []
+
+    class _App:
+        def styleSheet(self) -> str:
+            return qapp.styleSheet()
+
+        def setStyleSheet(self, css: str) -> None:
+            applied.append(css)
+
+    ThemeManager._apply_stylesheet(theme_manager, _App())
+    assert applied == []
@@ -0,0 +1,58 @@
+"""Tests for persistent live tail filters."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.utils import tail_filter as tail_filter_module
+from src.utils.tail_filter import TailFilter, load_tail_filter, save_tail_filter
+
+
+@pytest.fixture
+def settings_path(tmp_path, monkeypatch):
+    path = tmp_path / "tail_filters.json"
+    monkeypatch.setattr(tail_filter_module, "get_config_file", lambda name: path)
+    return path
+
+
+def test_inactive_filter_accepts_everything():
+    tail_filter = TailFilter()
+    assert not tail_filter.is_active
+    assert tail_filter.accepts("anything")
+
+
+def test_include_and_exclude_terms_update_counters():
+    tail_filter = TailFilter(include=("temp", r"/^V=\d+/"), exclude=("debug",))
+
+    assert tail_filter.accepts("TEMP=21")
+    assert tail_filter.accepts("V=3300")
+    assert not tail_filter.accepts("temp debug dump")
+    assert not tail_filter.accepts("heartbeat")
+    assert (tail_filter.matched, tail_filter.suppressed) == (2, 2)
+
+    tail_filter.reset_counters()
+    assert (tail_filter.matched, tail_filter.suppressed) == (0, 0)
+
+
+def test_inline_flag_regex_keeps_other_regex_terms_working():
+    # "(?s)" cannot be joined with another term, so each term is matched on its own
+    tail_filter = TailFilter(include=(r"/(?s)^ERR.+/", r"re:^V=\d+$"))
+
+    assert tail_filter.accepts("err: overflow")
+    assert tail_filter.accepts("V=3300")
+    assert not tail_filter.accepts(r"^V=\d+$")
+    assert not tail_filter.accepts("V=high")
+
+
+def test_filters_persist_per_port(settings_path):
+    save_tail_filter("port1", TailFilter(exclude=("noise",)))
+    save_tail_filter("port2", TailFilter(include=("ok",)))
+
+    restored = load_tail_filter("port1")
+    assert restored.exclude == ("noise",)
+    assert load_tail_filter("port2").include == ("ok",)
+    assert not load_tail_filter("port3").is_active
+
+    save_tail_filter("port1", TailFilter())
+    assert not load_tail_filter("port1").is_active
+    assert load_tail_filter("port2").is_active
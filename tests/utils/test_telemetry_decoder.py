@@ -0,0 +1,127 @@
+"""Tests for telemetry schemas, the vectorised decoder and the column ring."""
+
+from __future__ import annotations
+
+import os
+import struct
+
+import pytest
+
+from src.exceptions import ConfigurationError
+from src.utils.telemetry_schema import (
+    TelemetrySchemaModel,
+    find_schema_for_port,
+    load_telemetry_schemas,
+)
+
+np = pytest.importorskip("numpy")
+
+from src.utils.telemetry_decoder import TelemetryDecoder, TelemetryRing  # noqa: E402
+
+
+def make_schema(**overrides) -> TelemetrySchemaModel:
+    data = {
+        "id": "tlm",
+        "port": "TLM",
+        "fields": [
+            {"name": "seq", "type": "u16"},
+            {"name": "temp", "type": "f32", "unit": "C"},
+            {"type": "pad", "size": 1},
+            {"name": "flags", "type": "u8"},
+        ],
+    }
+    data.update(overrides)
+    return TelemetrySchemaModel.model_validate(data)
+
+
+def pack(seq: int, temp: float, flags: int, order: str = "<") -> bytes:
+    return struct.pack(f"{order}Hfxb", seq, temp, flags)
+
+
+def test_layout_resolves_sequential_and_explicit_offsets():
+    schema = make_schema(fields=[
+        {"name": "a", "type": "u8"},
+        {"name": "b", "type": "u32", "offset": 4},
+        {"name": "c", "type": "i16"},
+    ])
+    assert schema.layout() == [("a", "u8", 0), ("b", "u32", 4), ("c", "i16", 8)]
+    assert schema.itemsize == 10
+    assert make_schema(frame_size=16).itemsize == 16
+
+
+@pytest.mark.parametrize("fields", [
+    [{"name": "x", "type": "u8"}, {"name": "x", "type": "u16"}],
+    [{"type": "pad"}],
+    [{"type": "u8"}],
+])
+def test_invalid_schemas_are_rejected(fields):
+    with pytest.raises(ValueError):
+        make_schema(fields=fields)
+
+
+def test_load_and_find_schema(tmp_path):
+    path = tmp_path / "telemetry_schema.yaml"
+    assert load_telemetry_schemas(path) == []
+    path.write_text(
+        "schemas:\n"
+        "  - {id: disabled, port: TLM, enabled: false, fields: [{name: a, type: u8}]}\n"
+        "  - {id: active, port: tlm, fields: [{name: a, type: u8}]}\n",
+        encoding="utf-8",
+    )
+    schemas = load_telemetry_schemas(path)
+    assert find_schema_for_port(schemas, "TLM").id == "active"
+    assert find_schema_for_port(schemas, "CPU1") is None
+
+    path.write_text("schemas: [{id: broken}]\n", encoding="utf-8")
+    with pytest.raises(ConfigurationError):
+        load_telemetry_schemas(path)
+
+
+def test_schemas_are_parsed_once_per_file_change(tmp_path, monkeypatch):
+    from src.utils import telemetry_schema as schema_module
+
+    path = tmp_path / "telemetry_schema.yaml"
+    path.write_text("schemas: [{id: a, port: TLM, fields: [{name: a, type: u8}]}]\n", encoding="utf-8")
+    parses = []
+    original = schema_module.yaml.safe_load
+    monkeypatch.setattr(schema_module.yaml, "safe_load", lambda fh: parses.append(1) or original(fh))
+
+    first = load_telemetry_schemas(path)
+    assert load_telemetry_schemas(path) == first
+    assert len(parses) == 1
+
+    path.write_text("schemas: [{id: b, port: CPU1, fields: [{name: a, type: u8}]}]\n", encoding="utf-8")
+    os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1_000_000))
+    assert [schema.id for schema in load_telemetry_schemas(path)] == ["b"]
+    assert len(parses) == 2
+
+
+@pytest.mark.parametrize("byteorder,order", [("little", "<"), ("big", ">")])
+def test_decode_batch_with_structured_dtype(byteorder, order):
+    decoder = TelemetryDecoder(make_schema(byteorder=byteorder))
+    frames = [pack(i, i * 0.5, -i, order) for i in range(5)]
+    records = decoder.decode(frames + [b"short"])
+
+    assert decoder.rejected == 1
+    assert records["seq"].tolist() == [0, 1, 2, 3, 4]
+    assert records["temp"].tolist() == [0.0, 0.5, 1.0, 1.5, 2.0]
+    assert records["flags"].tolist() == [0, 255, 254, 253, 252]
+    assert len(decoder.decode_buffer(b"".join(frames) + b"xx")) == 5
+
+
+def test_ring_wraps_and_returns_chronological_columns():
+    decoder = TelemetryDecoder(make_schema())
+    ring = TelemetryRing(decoder.dtype, capacity=4)
+    ring.append(decoder.decode([pack(i, 0.0, 0) for i in range(3)]), timestamp=1.0)
+    ring.append(decoder.decode([pack(i, 0.0, 0) for i in range(3, 6)]), timestamp=2.0)
+
+    assert len(ring) == 4 and ring.total == 6
+    assert ring.column("seq").tolist() == [2, 3, 4, 5]
+    assert ring.column("seq", last=2).tolist() == [4, 5]
+    assert ring.times().tolist() == [1.0, 2.0, 2.0, 2.0]
+    assert ring.column("seq").dtype.isnative
+
+    ring.append(decoder.decode([pack(i, 0.0, 0) for i in range(10, 20)]), timestamp=3.0)
+    assert ring.column("seq").tolist() == [16, 17, 18, 19]
+    ring.clear()
+    assert len(ring) == 0 and ring.column("seq").size == 0
@@ -0,0 +1,62 @@
+"""Tests for the precompiled translation tables and worker status events."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.translations.catalog import CATALOG, Template, compile_strings
+from src.translations.strings import STRINGS
+
+
+def test_tables_are_frozen_and_complete():
+    for code in ("ru", "en"):
+        table = CATALOG[code]
+        assert table.texts.keys() == table.templates.keys()
+        assert len(table.texts) == sum(code in entry for entry in STRINGS.values())
+        with pytest.raises(TypeError):
+            table.texts["app_name"] = "changed"  # type: ignore[index]
+    assert CATALOG["en"].texts["worker_tx_message"] == "TX: {data}"
+
+
+def test_language_switch_selects_precompiled_table():
+    from src.utils.translator import Translator
+
+    translator = Translator(default_language="ru_RU")
+    assert translator.translations is CATALOG["ru"].texts
+    translator.set_language("en_US")
+    assert translator.translations is CATALOG["en"].texts
+    assert translator.templates is CATALOG["en"].templates
+
+
+@pytest.mark.parametrize(
+    ("text", "values", "expected"),
+    [
+        ("TX: {data}", {"data": "ping"}, "TX: ping"),
+        ("TX: {data}", {}, "TX: {data}"),
+        ("TX: {data}", {"other": 1}, "TX: {data}"),  # missing field: text as is
+        ("{error.args[0]}!", {"error": ValueError("boom")}, "boom!"),
+        ("plain {{braces}}", {"unused": 1}, "plain {braces}"),
+        ("plain {{braces}}", {}, "plain {{braces}}"),
+        ("broken {", {"x": 1}, "broken {"),
+    ],
+)
+def test_template_matches_str_format_fallbacks(text, values, expected):
+    assert Template(text).format(values) == expected
+
+
+def test_compile_skips_malformed_entries():
+    compiled = compile_strings({"a": {"en": "A", "ru": "А"}, "b": "not a dict", "c": {"en": "C"}})
+    assert dict(compiled["en"].texts) == {"a": "A", "c": "C"}
+    assert dict(compiled["ru"].texts) == {"a": "А"}
+
+
+def test_worker_status_is_translated_when_shown(monkeypatch):
+    from src.models.worker_events import WorkerEvent, WorkerStatus
+    from src.utils.translator import translator
+
+    status = WorkerStatus(WorkerEvent.CONNECTED, {"port_name": "COM3"})
+    # Swap tables directly: set_language() would also retranslate live widgets
+    monkeypatch.setattr(translator, "templates", CATALOG["en"].templates)
+    assert str(status) == "Connected to COM3"
+    monkeypatch.setattr(translator, "templates", CATALOG["ru"].templates)
+    assert str(status) == "Подключено к COM3"
@@ -463,3 +463,140 @@ class TestEdgeCases:
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
+
+
+class TestTailFilter:
+    """Test live tail filtering in the RX path."""
+
+    def test_suppressed_lines_skip_display_but_are_reported(self, qapp, tmp_path, monkeypatch):
+        """Test hidden lines are emitted as suppressed and counted."""
+        from src.utils import tail_filter as tail_filter_module
+        from src.viewmodels.com_port_viewmodel import ComPortViewModel
+
+        monkeypatch.setattr(tail_filter_module, "get_config_file", lambda name: tmp_path / name)
+        vm = ComPortViewModel("CPU1", 1)
+        shown, hidden, stats = [], [], []
+        vm.data_received.connect(shown.append)
+        vm.data_suppressed.connect(hidden.append)
+        vm.tail_filter_stats_changed.connect(lambda m, s: stats.append((m, s)))
+
+        vm.add_tail_filter_term("noise")
+        for line in ("value=1", "noise 1", "value=2"):
+            vm._on_data_received("CPU1", line)
+
+        assert shown == ["value=1", "value=2"]
+        assert hidden == ["noise 1"]
+        assert stats == [(0, 0)]  # per-line stats wait for the coalescer tick
+        vm._counter_coalescer.flush()
+        assert stats == [(0, 0), (2, 1)]
+        assert vm.rx_count == 3
+        assert ComPortViewModel("CPU1", 1).tail_filter.exclude == ("noise",)
+
+        vm.set_tail_filter()
+        vm._on_data_received("CPU1", "noise 2")
+        assert shown[-1] == "noise 2"
+        vm.shutdown()
+
+
+class TestTelemetryDecoding:
+    """Test frames decoded into the telemetry ring."""
+
+    def test_frames_fill_telemetry_ring(self, qapp, tmp_path, monkeypatch):
+        pytest.importorskip("numpy")
+        import struct
+        from src.utils import telemetry_schema as schema_module
+        from src.viewmodels.com_port_viewmodel import ComPortViewModel
+
+        (tmp_path / "telemetry_schema.yaml").write_text(
+            "schemas:\n"
+            "  - id: t\n"
+            "    port: TLM\n"
+            "    fields: [{name: seq, type: u16}, {name: value, type: f32}]\n",
+            encoding="utf-8",
+        )
+        monkeypatch.setattr(schema_module, "get_config_file", lambda name: tmp_path / name)
+        vm = ComPortViewModel("TLM", 3)
+        updates = []
+        vm.telemetry_updated.connect(updates.append)
+
+        frames = [struct.pack("<Hf", i, i * 2.0) for i in range(4)]
+        vm._on_frames_received("TLM", frames, 100.0)
+
+        assert updates == [4]
+        assert vm.telemetry.column("value").tolist() == [0.0, 2.0, 4.0, 6.0]
+        assert ComPortViewModel("CPU1", 1).telemetry is None
+        vm.shutdown()
+
+
+class TestPortStatistics:
+    """Test rolling statistics shared with the worker."""
+
+    def test_stats_are_passed_to_worker_and_cleared_with_counters(self, qapp):
+        from src.viewmodels.com_port_viewmodel import ComPortViewModel
+
+        vm = ComPortViewModel("CPU1", 1)
+        assert vm._worker_config['stats'] is vm.stats
+
+        vm.stats.record_rx(64, [30, 30])
+        assert vm.stats_snapshot().total_lines == 2
+        vm.clear_counters()
+        assert vm.stats_snapshot().total_bytes == 0
+        vm.shutdown()
+
+
+class TestCounterCoalescing:
+    """Test rate-limited counter_updated emission."""
+
+    def test_rx_burst_publishes_exact_counts_once(self, qapp):
+        from src.viewmodels.com_port_viewmodel import ComPortViewModel
+
+        vm = ComPortViewModel("CPU1", 1)
+        updates = []
+        vm.counter_updated.connect(lambda rx, tx: updates.append((rx, tx)))
+
+        for i in range(1000):
+            vm._on_data_received("CPU1", f"line {i}\n")
+        vm._on_frames_received("CPU1", [b"a", b"b"], 0.0)
+        assert updates == []
+        assert vm.rx_count == 1002
+
+        vm._counter_coalescer.flush()
+        assert updates == [(1002, 0)]
+
+        vm.clear_counters()
+        assert updates[-1] == (0, 0)
+        vm.shutdown()
+
+
+class TestSessionRecordingAndReplay:
+    """Test recorder hand-off and replay worker spawning."""
+
+    def test_recorder_is_passed_to_worker_config(self, qapp, tmp_path):
+        from src.viewmodels.com_port_viewmodel import ComPortViewModel
+        from src.utils.session_recording import SessionRecorder
+
+        vm = ComPortViewModel("CPU1", 1)
+        with SessionRecorder(tmp_path / "s.uartrec") as recorder:
+            vm.set_recorder(recorder)
+            assert vm.recorder is recorder
+            assert vm._worker_config['recorder'] is recorder
+            vm.set_recorder(None)
+        assert vm._worker_config['recorder'] is None
+        vm.shutdown()
+
+    def test_start_replay_spawns_replay_worker(self, qapp, tmp_path):
+        from src.viewmodels.com_port_viewmodel import ComPortViewModel, PortConnectionState
+        from src.models.replay_worker import ReplayWorker
+
+        vm = ComPortViewModel("CPU1", 1)
+        with patch.object(vm._supervisor, "spawn_worker") as spawn:
+            assert vm.start_replay(str(tmp_path / "s.uartrec"), 2.0, source_label="CPU2") is True
+        kwargs = spawn.call_args.kwargs
+        assert kwargs["worker_class"] is ReplayWorker
+        config = kwargs["config"]
+        assert config["replay_speed"] == 2.0
+        assert config["replay_port"] == "CPU2"
+        assert config["recorder"] is None
+        assert vm.state == PortConnectionState.CONNECTING
+        assert vm.start_replay(str(tmp_path / "s.uartrec")) is False
+        vm.shutdown()
@@ -206,28 +206,28 @@ class TestCacheManagement:
         """Test caching a log line."""
         vm = MainViewModel()
         
-        vm.cache_log_line('cpu1', '<span>test</span>', 'test')
+        vm.cache_log_line('cpu1', 'test')
         
-        assert 'cpu1' in vm.log_cache
-        assert len(vm.log_cache['cpu1']['html']) == 1
+        assert 'cpu1' in vm.log_stores
+        assert len(vm.log_stores['cpu1']) == 1
     
     def test_clear_cache(self):
         """Test clearing cache."""
         vm = MainViewModel()
         
-        vm.cache_log_line('cpu1', '<span>test</span>', 'test')
+        vm.cache_log_line('cpu1', 'test')
         vm.clear_cache()
         
-        assert len(vm.log_cache) == 0
+        assert len(vm.log_stores) == 0
     
     def test_cache_multiple_lines(self):
         """Test caching multiple lines."""
         vm = MainViewModel()
         
         for i in range(5):
-            vm.cache_log_line('cpu1', f'<span>{i}</span>', str(i))
+            vm.cache_log_line('cpu1', str(i))
         
-        assert len(vm.log_cache['cpu1']['html']) == 5
+        assert len(vm.log_stores['cpu1']) == 5
     
     def test_cache_limit(self):
         """Test cache respects MAX_CACHE_LINES limit."""
@@ -235,10 +235,10 @@ class TestCacheManagement:
         
         # Add more lines than the limit
         for i in range(vm.MAX_CACHE_LINES + 100):
-            vm.cache_log_line('cpu1', f'<span>{i}</span>', str(i))
+            vm.cache_log_line('cpu1', str(i))
         
         # Should be limited
-        assert len(vm.log_cache['cpu1']['html']) <= vm.MAX_CACHE_LINES
+        assert len(vm.log_stores['cpu1']) <= vm.MAX_CACHE_LINES
 
 
 class TestFilterCache:
@@ -248,8 +248,8 @@ class TestFilterCache:
         """Test filtering with empty query returns all."""
         vm = MainViewModel()
         
-        vm.cache_log_line('cpu1', '<span>hello</span>', 'hello')
-        vm.cache_log_line('cpu1', '<span>world</span>', 'world')
+        vm.cache_log_line('cpu1', 'hello')
+        vm.cache_log_line('cpu1', 'world')
         
         result = vm.filter_cache('cpu1', '')
         
@@ -260,8 +260,8 @@ class TestFilterCache:
         """Test filtering with matching query."""
         vm = MainViewModel()
         
-        vm.cache_log_line('cpu1', '<span>hello</span>', 'hello')
-        vm.cache_log_line('cpu1', '<span>world</span>', 'world')
+        vm.cache_log_line('cpu1', 'hello')
+        vm.cache_log_line('cpu1', 'world')
         
         result = vm.filter_cache('cpu1', 'hello')
         
@@ -272,8 +272,8 @@ class TestFilterCache:
         """Test filtering is case insensitive."""
         vm = MainViewModel()
         
-        vm.cache_log_line('cpu1', '<span>Hello</span>', 'Hello')
-        vm.cache_log_line('cpu1', '<span>WORLD</span>', 'WORLD')
+        vm.cache_log_line('cpu1', 'Hello')
+        vm.cache_log_line('cpu1', 'WORLD')
         
         result = vm.filter_cache('cpu1', 'hello')
         
@@ -291,7 +291,7 @@ class TestFilterCache:
         """Test filtering with no matches."""
         vm = MainViewModel()
         
-        vm.cache_log_line('cpu1', '<span>hello</span>', 'hello')
+        vm.cache_log_line('cpu1', 'hello')
         
         result = vm.filter_cache('cpu1', 'xyz')
         
@@ -399,6 +399,54 @@ class TestCounters:
         
         assert count == 0
 
+    def test_counter_signal_is_coalesced(self, qapp):
+        """Many increments publish one exact snapshot on the next tick."""
+        vm = MainViewModel()
+        snapshots = []
+        vm.counters_changed.connect(snapshots.append)
+
+        for _ in range(500):
+            vm.increment_rx(1)
+        vm.increment_tx(3)
+        assert snapshots == []
+
+        vm._counter_coalescer.flush()
+        assert snapshots == [MainViewModel.CounterSnapshot((500, 0, 0), (0, 0, 1))]
+
+        vm.clear_counters()
+        assert snapshots[-1].rx_counts == (0, 0, 0)
+
+    def test_counters_follow_port_numbers(self):
+        """Counters are sized to the port collection and keep values on resize."""
+        vm = MainViewModel()
+        vm.increment_rx(2)
+        vm.set_port_numbers(range(1, 17))
+
+        assert vm.port_count == 16
+        assert vm.increment_rx(16) == 1
+        assert vm.get_rx_count(2) == 1
+        assert vm.increment_tx(17) == 0
+
+        vm.set_port_numbers([1])
+        assert vm.rx_counts == [0]
+        vm.clear_counters()
+        assert vm.tx_counts == [0]
+
+    def test_counters_are_keyed_by_configured_port_number(self, monkeypatch):
+        """A gapped config (ports 1, 2, 5) still counts port 5."""
+        from src.utils.config_loader import config_loader
+
+        monkeypatch.setattr(
+            config_loader, "get_port_labels", lambda: [(1, "CPU1"), (2, "CPU2"), (5, "TLM")]
+        )
+        vm = MainViewModel()
+
+        assert vm.increment_rx(5) == 1
+        assert vm.increment_tx(5) == 1
+        assert vm.get_rx_count(5) == 1 and vm.get_tx_count(5) == 1
+        assert vm.increment_rx(3) == 0
+        assert vm.rx_counts == [0, 0, 1]
+
 
 class TestEdgeCases:
     """Test edge cases."""
@@ -440,3 +488,55 @@ class TestEdgeCases:
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
+
+
+class TestFilterQueries:
+    """Test multi-term and incremental filtering in filter_cache."""
+
+    def test_filter_cache_boolean_and_direction_terms(self):
+        """Test OR/NOT terms combined with a direction predicate."""
+        from src.utils.log_store import LogDirection
+
+        vm = MainViewModel()
+        vm.cache_log_line('cpu1', 'temp=21', LogDirection.RX)
+        vm.cache_log_line('cpu1', 'AT+TEMP?', LogDirection.TX)
+        vm.cache_log_line('cpu1', 'pressure=1013', LogDirection.RX)
+
+        result = vm.filter_cache('cpu1', 'temp -dir:tx OR pressure')
+
+        assert 'temp=21' in result
+        assert 'pressure=1013' in result
+        assert 'AT+TEMP?' not in result
+
+    def test_filter_cache_appends_new_lines_to_live_result(self):
+        """Test repeated query picks up lines cached after the first call."""
+        vm = MainViewModel()
+        vm.cache_log_line('cpu1', 'error 1')
+        assert 'error 1' in vm.filter_cache('cpu1', 'error')
+
+        vm.cache_log_line('cpu1', 'ok 2')
+        vm.cache_log_line('cpu1', 'error 3')
+        result = vm.filter_cache('cpu1', 'error')
+
+        assert 'error 1' in result and 'error 3' in result
+        assert 'ok 2' not in result
+
+    def test_filter_cache_reads_injected_console_stores(self, qapp, isolated_config_dir):
+        """Test filter_cache filters the console panel's own stores, not a copy."""
+        from src.views.console_panel_view import ConsolePanelView
+
+        panel = ConsolePanelView()
+        try:
+            vm = MainViewModel(log_stores=panel.log_stores)
+            panel.append_rx('CPU1', 'temp=21')
+            panel.append_tx('CPU1', 'AT+TEMP?')
+            panel.append_rx('CPU1', 'ok')
+
+            result = vm.filter_cache('CPU1', 'temp -dir:tx')
+            assert 'temp=21' in result and 'ok' not in result and 'AT+TEMP?' not in result
+
+            vm.clear_cache()
+            assert vm.log_stores is panel.log_stores
+            assert 'CPU1' in panel.log_stores and len(panel.log_stores['CPU1']) == 0
+        finally:
+            panel.deleteLater()